@@ -1,9 +1,6 @@
 import streamlit as st
 import os
-import tempfile
-from src.audio_analyzer import analyze_audio_file, display_results
 import pandas as pd
-from src.pages.batch_analysis import batch_analyze_page
 
 # Page configuration
 st.set_page_config(
@@ -29,7 +26,15 @@ page = st.sidebar.selectbox(
     help="Select the type of speech analysis you want to perform"
 )
 
+if st.sidebar.button("🧹 Clear cached results", help="Analysis results are cached per file content and parameters"):
+    from src.utils.analysis_cache import clear_caches
+    clear_caches()
+    st.sidebar.success("✅ Cache cleared")
+
+# Pages and analyzers are imported only when used, so the first render does not
+# wait for pydub, librosa, matplotlib, plotly or the API SDKs to load
 if page == "Batch Analysis":
+    from src.pages.batch_analysis import batch_analyze_page
     batch_analyze_page()
 elif page == "Pause Analysis":
     from src.pages.pause_page import pause_analysis_page
@@ -73,16 +78,9 @@ else:  # Volume & Velocity
         if st.button("Start Analysis", type="primary"):
             with st.spinner("Analyzing audio file..."):
                 try:
-                    # Save uploaded file to temporary location
-                    with tempfile.NamedTemporaryFile(delete=False, suffix=f".{uploaded_file.name.split('.')[-1]}") as tmp_file:
-                        tmp_file.write(uploaded_file.getvalue())
-                        temp_path = tmp_file.name
-
-                    # Run analysis
-                    result = analyze_audio_file(temp_path)
-
-                    # Clean up temp file
-                    os.unlink(temp_path)
+                    # Run analysis (cached per file content)
+                    from src.utils.analysis_cache import run_cached_analysis
+                    result = run_cached_analysis("volume_velocity", uploaded_file)
 
                     # Store result in session state
                     st.session_state['analysis_result'] = result
@@ -5,6 +5,16 @@ load_dotenv()
 
 # OpenAI API Configuration
 OPENAI_API_KEY = os.getenv("OPENAI_API_KEY")
+# Default OpenAI transcription backend (see src/transcribers/registry.py)
+OPENAI_TRANSCRIPTION_MODEL = os.getenv("OPENAI_TRANSCRIPTION_MODEL", "whisper-1")
+
+# Optional API endpoint overrides (e.g. the local mock transcription server)
+OPENAI_BASE_URL = os.getenv("OPENAI_BASE_URL") or None
+DEEPGRAM_BASE_URL = os.getenv("DEEPGRAM_BASE_URL") or None
+
+# Deepgram REST transcription (pooled HTTP session, streamed uploads)
+DEEPGRAM_API_URL = "https://api.deepgram.com"
+DEEPGRAM_TIMEOUT_SECONDS = float(os.getenv("DEEPGRAM_TIMEOUT_SECONDS", "300"))
 
 # Audio processing settings
 FRAME_MS = 50
@@ -19,4 +29,67 @@ VELOCITY_SLOW_THRESHOLD = 2.0
 VELOCITY_FAST_THRESHOLD = 3.5
 
 # Filled pauses (Vietnamese)
-FILLED_PAUSES = ["uh", "um", "erm", "ah", "uhm", "mmm", "huh", "ờ", "à"]
\ No newline at end of file
+FILLED_PAUSES = ["uh", "um", "erm", "ah", "uhm", "mmm", "huh", "ờ", "à"]
+
+# Watch-folder daemon settings
+WATCH_POLL_SECONDS = float(os.getenv("WATCH_POLL_SECONDS", "2.0"))
+WATCH_SETTLE_SECONDS = float(os.getenv("WATCH_SETTLE_SECONDS", "5.0"))
+WATCH_MAX_WORKERS = int(os.getenv("WATCH_MAX_WORKERS", "3"))
+WATCH_MAX_PENDING = int(os.getenv("WATCH_MAX_PENDING", "12"))
+WATCH_MAX_ATTEMPTS = int(os.getenv("WATCH_MAX_ATTEMPTS", "3"))
+WATCH_RETRY_BACKOFF_SEC = float(os.getenv("WATCH_RETRY_BACKOFF_SEC", "60"))  # wait before retrying a failed file, doubled per attempt
+INGEST_DB_PATH = os.getenv("INGEST_DB_PATH", "ingest.db")
+
+# Local HTTP job API settings
+JOB_API_HOST = os.getenv("JOB_API_HOST", "127.0.0.1")
+JOB_API_PORT = int(os.getenv("JOB_API_PORT", "8765"))
+JOB_API_WORKERS = int(os.getenv("JOB_API_WORKERS", "4"))
+JOB_API_MAX_UPLOAD_MB = int(os.getenv("JOB_API_MAX_UPLOAD_MB", "100"))
+JOB_API_MAX_FINISHED_JOBS = int(os.getenv("JOB_API_MAX_FINISHED_JOBS", "1000"))
+JOB_API_MAX_PENDING = int(os.getenv("JOB_API_MAX_PENDING", "16"))  # queued jobs (each holds its upload in memory)
+
+# Resumable batch job journal
+JOB_JOURNAL_PATH = os.getenv("JOB_JOURNAL_PATH", "batch_jobs.db")
+
+# Two-stage batches (API transcription feeding ForceAlign alignment)
+PIPELINE_PREFETCH_WORKERS = int(os.getenv("PIPELINE_PREFETCH_WORKERS", "4"))  # concurrent transcription requests
+PIPELINE_QUEUE_SIZE = int(os.getenv("PIPELINE_QUEUE_SIZE", "4"))  # transcribed files waiting for alignment
+PIPELINE_ANALYSIS_WORKERS = int(os.getenv("PIPELINE_ANALYSIS_WORKERS", "2"))  # concurrent alignments
+PIPELINE_PREFETCH_RETRIES = int(os.getenv("PIPELINE_PREFETCH_RETRIES", "2"))  # retries of transient API errors
+PIPELINE_RETRY_BACKOFF_SEC = float(os.getenv("PIPELINE_RETRY_BACKOFF_SEC", "1.0"))  # doubled after each retry
+
+# Queryable result store
+RESULT_STORE_PATH = os.getenv("RESULT_STORE_PATH", "analysis_results.db")
+
+# Streamlit result cache (single-file pages)
+ANALYSIS_CACHE_MAX_ENTRIES = int(os.getenv("ANALYSIS_CACHE_MAX_ENTRIES", "32"))
+ANALYSIS_CACHE_TTL_SECONDS = int(os.getenv("ANALYSIS_CACHE_TTL_SECONDS", "3600"))
+
+# Offline analyzer benchmarks
+BENCHMARK_BASELINE_PATH = os.getenv("BENCHMARK_BASELINE_PATH", "benchmark_baseline.json")
+BENCHMARK_TOLERANCE = float(os.getenv("BENCHMARK_TOLERANCE", "0.25"))
+
+# Opt-in per-stage memory profiling (tracemalloc + RSS sampling)
+MEMORY_PROFILING = os.getenv("MEMORY_PROFILING", "0").lower() in ("1", "true", "yes")
+MEMORY_SAMPLE_INTERVAL_MS = float(os.getenv("MEMORY_SAMPLE_INTERVAL_MS", "20"))
+MEMORY_REPORT_DIR = os.getenv("MEMORY_REPORT_DIR", "memory_reports")
+
+# Shared per-file frame features (base block length; must divide FRAME_MS)
+FEATURE_HOP_MS = int(os.getenv("FEATURE_HOP_MS", "5"))
+
+# Local voice-activity detection (energy + zero-crossing + spectral flatness)
+VAD_FRAME_MS = 25
+VAD_HOP_MS = 10
+VAD_ENERGY_MARGIN_DB = 12.0      # above the estimated noise floor
+VAD_MIN_ENERGY_DB = -55.0        # frames quieter than this are never speech
+VAD_FLATNESS_MAX = 0.4           # noise is spectrally flat (white noise ~0.56), voiced speech is not
+VAD_ZCR_MAX = 0.25               # zero crossings per sample
+VAD_HANGOVER_MS = 200            # speech is held this long after the last speech frame
+VAD_ONSET_PAD_MS = 50            # and starts this much before the first one
+VAD_MIN_SPEECH_MS = 100
+
+# Silence trimming before transcription upload (off by default)
+TRIM_SILENCE = os.getenv("TRIM_SILENCE", "0").lower() in ("1", "true", "yes")
+TRIM_MIN_SILENCE_SEC = float(os.getenv("TRIM_MIN_SILENCE_SEC", "1.0"))  # shorter gaps are kept
+TRIM_KEEP_SEC = 0.25          # silence left on each side of a cut
+TRIM_MIN_SAVING = 0.10        # upload the original if trimming would remove less than this fraction
@@ -0,0 +1,129 @@
+"""
+Offline micro-benchmarks for the analyzer hot paths.
+
+Generates synthetic speech-like audio with known silences, stubs out the
+transcription APIs and times each stage. Results are compared with a stored
+baseline and regressions are flagged (exit code 1).
+
+Usage:
+    python scripts/benchmark_analyzers.py --update-baseline          # record a baseline
+    python scripts/benchmark_analyzers.py --durations 10 60          # compare against it
+    python scripts/benchmark_analyzers.py --sample-rate 44100 --channels 2
+"""
+
+import argparse
+import io
+import os
+import sys
+import tempfile
+from contextlib import redirect_stdout
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import pandas as pd
+
+from config import BENCHMARK_BASELINE_PATH, BENCHMARK_TOLERANCE, OPENAI_TRANSCRIPTION_MODEL
+from src.analyzers.pause_word_analyzer import detect_pauses_between_words, match_pauses_to_words
+from src.analyzers.speech_boundary_detector import detect_speech_boundaries
+from src.analyzers.stretch_analyzer import analyze_stretch, count_syllables, update_stretch_classification
+from src.analyzers.volume_analyzer import analyze_volume
+from src.transcribers.registry import TranscriberBackend, backend_override, get_backend
+from src.utils.benchmarking import STATUS_REGRESSION, compare_to_baseline, load_baseline, save_baseline, time_callable
+from src.utils.frame_features import get_frame_features
+from src.utils.resources import get_cmu_dict
+from src.utils.synthetic_audio import generate_speech_like, synthetic_words, write_wav
+
+def stub_transcribers(words):
+    """Replace the default transcriber backend with one returning fixed word timestamps."""
+    default = get_backend(OPENAI_TRANSCRIPTION_MODEL)
+    stub = TranscriberBackend(default.name, "Synthetic stub", default.provider,
+                              lambda audio, **options: [dict(w) for w in words], local=True)
+    return backend_override(stub)
+
+
+def benchmark_cases(audio_path, silences, words):
+    """Name -> zero-argument callable for one synthetic file."""
+    pause_intervals = [(start, end) for start, end in silences[1:-1]]
+    word_texts = [w["word"] for w in words]
+    stretch_table = pd.DataFrame({"Stretch Score": [0.1 + (i % 7) * 0.08 for i in range(len(words) * 20)],
+                                  "Classification": "Normal"})
+
+    return {
+        "analyze_volume": lambda: analyze_volume(audio_path),
+        "detect_speech_boundaries": lambda: detect_speech_boundaries(audio_path),
+        # A fresh path per call, so each run pays the decode and block pass the analyzers do
+        "silent_ranges": lambda: get_frame_features(audio_path).silent_ranges(300, -40),
+        "match_pauses_to_words": lambda: match_pauses_to_words(words, pause_intervals),
+        "detect_pauses_between_words": lambda: detect_pauses_between_words(audio_path, -40.0, 300.0),
+        "count_syllables": lambda: [count_syllables(w) for w in word_texts],
+        "update_stretch_classification": lambda: update_stretch_classification(stretch_table, 0.38),
+        "analyze_stretch": lambda: analyze_stretch(audio_path, stretch_threshold=0.38, method="openai"),
+    }
+
+
+def run(durations, sample_rate, channels, repeat, only=None):
+    get_cmu_dict()  # load once outside the timed region
+    results = {}
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        for duration in durations:
+            samples, silences = generate_speech_like(duration, sample_rate, channels)
+            audio_path = write_wav(os.path.join(tmp_dir, f"synthetic_{duration}s.wav"), samples, sample_rate)
+            words = synthetic_words(duration, silences)
+            label = f"{duration:g}s@{sample_rate}Hz/{channels}ch"
+
+            with stub_transcribers(words):
+                for name, func in benchmark_cases(audio_path, silences, words).items():
+                    if only and name not in only:
+                        continue
+                    # Keep the analyzers' debug prints out of the report
+                    with redirect_stdout(io.StringIO()):
+                        stats = time_callable(func, repeat=repeat)
+                    results[f"{name}[{label}]"] = stats
+                    print(f"  {name:<32} {label:<18} {stats['median_ms']:>10.2f} ms", flush=True)
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Offline analyzer micro-benchmarks")
+    parser.add_argument("--durations", type=float, nargs="+", default=[10.0, 60.0], help="Synthetic file lengths (s)")
+    parser.add_argument("--sample-rate", type=int, default=16000)
+    parser.add_argument("--channels", type=int, default=1)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--only", nargs="+", help="Run only these benchmark names")
+    parser.add_argument("--baseline", default=BENCHMARK_BASELINE_PATH)
+    parser.add_argument("--tolerance", type=float, default=BENCHMARK_TOLERANCE, help="Allowed fractional slowdown")
+    parser.add_argument("--update-baseline", action="store_true", help="Write these results as the new baseline")
+    args = parser.parse_args()
+
+    print("⏱️ Running analyzer benchmarks...")
+    results = run(args.durations, args.sample_rate, args.channels, args.repeat, args.only)
+
+    if args.update_baseline:
+        save_baseline(args.baseline, results)
+        print(f"\n💾 Baseline written to {args.baseline}")
+        return
+
+    baseline = load_baseline(args.baseline)
+    if not baseline:
+        print(f"\nℹ️ No baseline at {args.baseline}; run with --update-baseline to record one")
+        return
+
+    rows = compare_to_baseline(results, baseline, tolerance=args.tolerance)
+    print(f"\n{'benchmark':<60} {'baseline':>10} {'current':>10} {'ratio':>7}  status")
+    for row in rows:
+        baseline_ms = f"{row['baseline_ms']:.2f}" if row["baseline_ms"] is not None else "-"
+        ratio = f"{row['ratio']:.2f}" if row["ratio"] is not None else "-"
+        flag = "❌" if row["status"] == STATUS_REGRESSION else ""
+        print(f"{row['name']:<60} {baseline_ms:>10} {row['current_ms']:>10.2f} {ratio:>7}  {row['status']} {flag}")
+
+    regressions = [row for row in rows if row["status"] == STATUS_REGRESSION]
+    if regressions:
+        print(f"\n❌ {len(regressions)} regression(s) beyond {args.tolerance:.0%}")
+        sys.exit(1)
+    print("\n✅ No regressions")
+
+
+if __name__ == "__main__":
+    main()
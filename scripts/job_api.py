@@ -0,0 +1,58 @@
+"""
+Run the local HTTP job API so other tools can call the analyzers programmatically.
+
+Usage:
+    python scripts/job_api.py --port 8765 --workers 4
+
+    curl -X POST --data-binary @talk.mp3 "http://127.0.0.1:8765/jobs?analysis=pause&filename=talk.mp3&silence_db=-40"
+    curl http://127.0.0.1:8765/jobs/<job_id>
+    curl http://127.0.0.1:8765/jobs/<job_id>/result
+"""
+
+import argparse
+import sys
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from config import JOB_API_HOST, JOB_API_MAX_PENDING, JOB_API_PORT, JOB_API_WORKERS
+from src.services.job_api import JobManager, create_server
+from src.utils.resources import warm_up_resources
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Local HTTP job API for speech analysis")
+    parser.add_argument("--host", default=JOB_API_HOST)
+    parser.add_argument("--port", type=int, default=JOB_API_PORT)
+    parser.add_argument("--workers", type=int, default=JOB_API_WORKERS)
+    parser.add_argument("--max-pending", type=int, default=JOB_API_MAX_PENDING, help="Queued jobs before new ones get 503")
+    parser.add_argument("--skip-forcealign", action="store_true", help="Do not load the ForceAlign backend at startup")
+    args = parser.parse_args()
+
+    print("🔄 Loading shared resources...")
+    resources = warm_up_resources(include_forcealign=not args.skip_forcealign)
+    for name, ready in resources.items():
+        print(f"   {'✅' if ready else '⚠️'} {name}")
+
+    # Import analyzer modules once so the first request does not pay for it
+    import src.audio_analyzer  # noqa: F401
+    import src.analyzers.pause_word_analyzer  # noqa: F401
+    import src.analyzers.stretch_analyzer  # noqa: F401
+
+    job_manager = JobManager(max_workers=args.workers, max_pending=args.max_pending)
+    job_manager.resources = resources
+    server = create_server(args.host, args.port, job_manager)
+
+    print(f"🚀 Job API listening on http://{args.host}:{args.port} ({args.workers} workers)")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        print("\n🛑 Shutting down...")
+    finally:
+        server.server_close()
+        job_manager.shutdown()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,121 @@
+"""
+End-to-end batch throughput test against the mock transcription server (no real API calls).
+
+Generates synthetic recordings, runs them through the same journaled batch runner the
+Streamlit batch page uses, and reports throughput, per-file latency and error counts.
+
+Usage:
+    python scripts/load_test.py --files 40 --workers 4 --analysis pause
+    python scripts/load_test.py --files 40 --workers 8 --rate-limit-prob 0.1 --max-concurrent 6
+    python scripts/load_test.py --server-url http://127.0.0.1:8766   # use an already running mock
+    python scripts/load_test.py --files 5 --workers 1 --duration 600 --memory   # per-stage memory report
+"""
+
+import argparse
+import os
+import statistics
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.services.mock_transcription import MockProfile, create_mock_server
+from src.utils.synthetic_audio import generate_speech_like, write_wav
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Offline batch throughput test using the mock transcription server")
+    parser.add_argument("--files", type=int, default=20)
+    parser.add_argument("--duration", type=float, default=20.0, help="Seconds of synthetic audio per file")
+    parser.add_argument("--workers", type=int, default=3, help="Files analyzed concurrently")
+    parser.add_argument("--analysis", choices=["volume_velocity", "pause", "stretch"], default="stretch")
+    parser.add_argument("--server-url", help="Existing mock server base URL (default: start one in-process)")
+    parser.add_argument("--latency-ms", type=float, default=300.0)
+    parser.add_argument("--latency-sigma", type=float, default=0.4)
+    parser.add_argument("--rate-limit-prob", type=float, default=0.0)
+    parser.add_argument("--failure-prob", type=float, default=0.0)
+    parser.add_argument("--max-concurrent", type=int, default=None)
+    parser.add_argument("--memory", action="store_true",
+                        help="Profile per-stage memory and write a batch report (use --workers 1 for clean attribution)")
+    args = parser.parse_args()
+
+    server = None
+    if args.server_url:
+        base_url = args.server_url.rstrip("/")
+    else:
+        profile = MockProfile(latency_ms=args.latency_ms, latency_sigma=args.latency_sigma,
+                              rate_limit_prob=args.rate_limit_prob, failure_prob=args.failure_prob,
+                              max_concurrent=args.max_concurrent)
+        server = create_mock_server("127.0.0.1", 0, profile)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        base_url = f"http://127.0.0.1:{server.server_address[1]}"
+
+    # Must be set before config (and the transcribers) are imported
+    os.environ["OPENAI_API_KEY"] = os.environ.get("OPENAI_API_KEY") or "mock"
+    os.environ["OPENAI_BASE_URL"] = f"{base_url}/v1"
+    os.environ["DEEPGRAM_API_KEY"] = os.environ.get("DEEPGRAM_API_KEY") or "mock"
+    os.environ["DEEPGRAM_BASE_URL"] = base_url
+
+    from src.services.batch_runner import run_journaled_batch
+    from src.services.runners import ANALYSIS_RUNNERS
+    from src.storage.job_journal import JobJournal
+    from src.utils.hashing import file_sha256
+    from src.utils.memory_profiling import memory_profiling
+
+    runner = ANALYSIS_RUNNERS[args.analysis]
+    latencies = []
+    latency_lock = threading.Lock()
+
+    def analyze_item(path):
+        start = time.perf_counter()
+        try:
+            return runner(path)
+        finally:
+            with latency_lock:
+                latencies.append(time.perf_counter() - start)
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        items = []
+        for i in range(args.files):
+            samples, _ = generate_speech_like(args.duration, seed=i)
+            path = write_wav(os.path.join(tmp_dir, f"load_{i:03d}.wav"), samples, 16000)
+            items.append((file_sha256(path), os.path.basename(path), path))
+
+        journal = JobJournal(os.path.join(tmp_dir, "load_test_jobs.db"))
+        print(f"🚀 {args.files} files x {args.duration:g}s, {args.workers} workers, analysis={args.analysis}, mock={base_url}")
+
+        started = time.perf_counter()
+        with memory_profiling(args.memory):
+            batch = run_journaled_batch(journal, args.analysis, {}, items, analyze_item, max_workers=args.workers)
+        elapsed = time.perf_counter() - started
+        journal.close()
+
+    failures = [outcome for outcome in batch["outcomes"] if outcome["error"]]
+    print("\n" + "=" * 60)
+    print(f"⏱️ Wall time:      {elapsed:.2f}s")
+    print(f"📈 Throughput:     {args.files / elapsed:.2f} files/s ({args.files * args.duration / elapsed:.1f} audio-s/s)")
+    if latencies:
+        ordered = sorted(latencies)
+        p95 = ordered[min(len(ordered) - 1, int(0.95 * len(ordered)))]
+        print(f"📊 Per-file:       p50 {statistics.median(ordered):.2f}s  p95 {p95:.2f}s  max {ordered[-1]:.2f}s")
+    print(f"❌ Failed files:   {len(failures)}")
+    for outcome in failures[:5]:
+        print(f"   - {outcome['filename']}: {outcome['error']}")
+    if "memory_report" in batch:
+        report = batch["memory_report"]
+        print(f"🧠 Memory:         max heap peak {report['max_heap_peak_mb']} MB, max RSS peak {report['max_rss_peak_mb']} MB")
+        for stage in report["stages"][:5]:
+            print(f"   - {stage['stage']}: heap peak {stage['heap_peak_mb_max']} MB ({stage['worst_file']})")
+        print(f"   report: {batch['memory_report_path']}")
+    if server is not None:
+        print(f"🧪 Mock server:    {server.snapshot_stats()}")
+        server.shutdown()
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()
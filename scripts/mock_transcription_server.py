@@ -0,0 +1,61 @@
+"""
+Run a local stand-in for the OpenAI and Deepgram transcription APIs.
+
+Usage:
+    python scripts/mock_transcription_server.py --port 8766 --latency-ms 400 --rate-limit-prob 0.05
+
+    # then, in another shell
+    export OPENAI_API_KEY=mock OPENAI_BASE_URL=http://127.0.0.1:8766/v1
+    export DEEPGRAM_API_KEY=mock DEEPGRAM_BASE_URL=http://127.0.0.1:8766
+    streamlit run app.py
+"""
+
+import argparse
+import sys
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.services.mock_transcription import MockProfile, create_mock_server
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Mock OpenAI/Deepgram transcription server")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8766)
+    parser.add_argument("--latency-ms", type=float, default=300.0, help="Median per-request latency")
+    parser.add_argument("--latency-sigma", type=float, default=0.4, help="Log-normal latency spread (0 = constant)")
+    parser.add_argument("--per-audio-second-ms", type=float, default=20.0, help="Extra latency per second of audio")
+    parser.add_argument("--rate-limit-prob", type=float, default=0.0, help="Probability of a random 429")
+    parser.add_argument("--failure-prob", type=float, default=0.0, help="Probability of a 500")
+    parser.add_argument("--max-concurrent", type=int, default=None, help="In-flight requests above this get 429")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--verbose", action="store_true", help="Log every request")
+    args = parser.parse_args()
+
+    profile = MockProfile(
+        latency_ms=args.latency_ms,
+        latency_sigma=args.latency_sigma,
+        per_audio_second_ms=args.per_audio_second_ms,
+        rate_limit_prob=args.rate_limit_prob,
+        failure_prob=args.failure_prob,
+        max_concurrent=args.max_concurrent,
+        seed=args.seed
+    )
+    server = create_mock_server(args.host, args.port, profile, verbose=args.verbose)
+    host, port = server.server_address[:2]
+    print(f"🧪 Mock transcription server on http://{host}:{port}")
+    print(f"   OPENAI_BASE_URL=http://{host}:{port}/v1  DEEPGRAM_BASE_URL=http://{host}:{port}")
+
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        print("\n🛑 Stopping mock server")
+    finally:
+        print(f"📊 {server.snapshot_stats()}")
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,45 @@
+"""
+Run one analysis on one file and print where the time went, stage by stage.
+
+Usage:
+    python scripts/trace_analysis.py talk.mp3 --analysis stretch --param method=deepgram_forcealign
+    python scripts/trace_analysis.py long_talk.mp3 --analysis pause --memory
+"""
+
+import argparse
+import sys
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.services.runners import ANALYSIS_RUNNERS, parse_analysis_params, result_error, result_succeeded
+from src.utils.memory_profiling import memory_profiling
+from src.utils.tracing import TIMINGS_KEY, format_timings
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Print a per-stage timing breakdown for one analysis")
+    parser.add_argument("audio_file", help="Audio file to analyze")
+    parser.add_argument("--analysis", choices=sorted(ANALYSIS_RUNNERS), default="volume_velocity")
+    parser.add_argument("--param", action="append", default=[], metavar="NAME=VALUE",
+                        help="Analysis parameter, may be repeated (e.g. --param silence_db=-40)")
+    parser.add_argument("--memory", action="store_true", help="Also record heap and RSS usage per stage")
+    args = parser.parse_args()
+
+    raw_params = dict(item.split("=", 1) for item in args.param)
+    params = parse_analysis_params(args.analysis, raw_params)
+
+    with memory_profiling(args.memory):
+        result = ANALYSIS_RUNNERS[args.analysis](args.audio_file, **params)
+
+    print("\n" + "=" * 60)
+    print(f"⏱️ STAGE TIMINGS - {args.analysis}: {args.audio_file}")
+    print("=" * 60)
+    print(format_timings(result.get(TIMINGS_KEY)))
+    if not result_succeeded(result):
+        print(f"\n❌ Analysis failed: {result_error(result)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,56 @@
+"""
+Run the watch-folder daemon: analyze recordings as they land in a directory.
+
+Usage:
+    python scripts/watch_folder.py /shared/recordings --analysis pause --workers 3
+"""
+
+import argparse
+import json
+import sys
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from config import INGEST_DB_PATH, RESULT_STORE_PATH, WATCH_MAX_PENDING, WATCH_MAX_WORKERS, WATCH_POLL_SECONDS, WATCH_SETTLE_SECONDS
+from src.services.watch_folder import ANALYSIS_RUNNERS, WatchFolderDaemon
+from src.storage.result_store import ResultStore
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Watch a directory and analyze new audio files")
+    parser.add_argument("watch_dir", help="Directory to watch for finished recordings")
+    parser.add_argument("--analysis", choices=sorted(ANALYSIS_RUNNERS), default="volume_velocity")
+    parser.add_argument("--params", default="{}", help='JSON analysis parameters, e.g. \'{"silence_db": -40}\'')
+    parser.add_argument("--db", default=INGEST_DB_PATH, help="SQLite ledger path")
+    parser.add_argument("--results-db", default=RESULT_STORE_PATH, help="Queryable result store path")
+    parser.add_argument("--workers", type=int, default=WATCH_MAX_WORKERS)
+    parser.add_argument("--max-pending", type=int, default=WATCH_MAX_PENDING)
+    parser.add_argument("--poll", type=float, default=WATCH_POLL_SECONDS, help="Seconds between scans")
+    parser.add_argument("--settle", type=float, default=WATCH_SETTLE_SECONDS, help="Seconds a file must stay unchanged")
+    args = parser.parse_args()
+
+    daemon = WatchFolderDaemon(
+        args.watch_dir,
+        analysis=args.analysis,
+        analysis_params=json.loads(args.params),
+        db_path=args.db,
+        max_workers=args.workers,
+        max_pending=args.max_pending,
+        poll_seconds=args.poll,
+        settle_seconds=args.settle,
+        result_store=ResultStore(args.results_db),
+    )
+
+    try:
+        daemon.run_forever()
+    except KeyboardInterrupt:
+        print("\n🛑 Stopping - waiting for in-flight files to finish...")
+    finally:
+        daemon.stop()
+        print("👋 Watch-folder daemon stopped")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,38 +1,103 @@
 import os
 import pandas as pd
-import matplotlib.pyplot as plt
-from pydub import AudioSegment
-from pydub.silence import detect_silence
-from src.transcribers.openai_transcriber import transcribe_with_openai_timestamps
+from config import TARGET_SAMPLE_RATE, TRIM_SILENCE
+from src.transcribers.registry import BackendUnavailable, select_backend
+from src.transcribers.silence_trimming import prepare_upload, transcribe_upload
 import numpy as np
 from typing import Dict, List, Tuple
 import io
 import base64
-
+from src.utils.audio_input import AudioInput, AudioSource
+from src.utils.frame_features import get_frame_features, load_mono
+from src.utils.tracing import span, traced
+from src.utils.numeric import round_values
+from src.utils.word_table import WordTable
+
+def _adjacent_pauses(gap_starts: np.ndarray, gap_ends: np.ndarray,
+                     pause_starts: np.ndarray, pause_ends: np.ndarray) -> np.ndarray:
+    """
+    Duration of the first pause lying within each gap (0.1s slack at both ends),
+    NaN where none does. Pauses must be sorted and non-overlapping, so their ends
+    are sorted too: the first pause starting after a gap opens has the earliest
+    end, and if it overruns the gap every later pause does as well.
+    """
+    durations = np.full(len(gap_starts), np.nan)
+    if len(pause_starts) == 0:
+        return durations
+    first = np.searchsorted(pause_starts, gap_starts - 0.1, side="left")
+    candidate = np.minimum(first, len(pause_starts) - 1)
+    inside = (first < len(pause_starts)) & (pause_ends[candidate] <= gap_ends + 0.1)
+    durations[inside] = round_values(pause_ends[candidate[inside]] - pause_starts[candidate[inside]], 2)
+    return durations
+
+def _pause_labels(durations: np.ndarray) -> np.ndarray:
+    labels = np.full(len(durations), "-", dtype=object)
+    found = ~np.isnan(durations)
+    labels[found] = [f"{duration}s" for duration in durations[found].tolist()]
+    return labels
+
+def match_pauses_to_words(words_data, pause_intervals: List[Tuple[float, float]]) -> pd.DataFrame:
+    """
+    Build the word/pause table: which pause (if any) falls right before and after each word.
+
+    Args:
+        words_data: WordTable (or a list of word dicts)
+        pause_intervals: Non-overlapping (start, end) pauses in seconds
+
+    Returns:
+        DataFrame with one row per word
+    """
+    words = WordTable.coerce(words_data)
+    pauses = np.asarray(sorted(pause_intervals), dtype=np.float64).reshape(-1, 2)
+    pause_starts, pause_ends = pauses[:, 0], pauses[:, 1]
+
+    # Gap between word i and word i + 1; the first word has no pause before, the last none after
+    gaps = _adjacent_pauses(words.end[:-1], words.start[1:], pause_starts, pause_ends)
+    pause_before = np.concatenate(([np.nan], gaps)) if len(words) else gaps
+    pause_after = np.concatenate((gaps, [np.nan])) if len(words) else gaps
+    has_pause = ~np.isnan(pause_before) | ~np.isnan(pause_after)
+
+    return pd.DataFrame({
+        "Word #": np.arange(1, len(words) + 1),
+        "Word": words.tokens,
+        "Word Start": round_values(words.start, 2),
+        "Word End": round_values(words.end, 2),
+        "Pause Before": _pause_labels(pause_before),
+        "Pause After": _pause_labels(pause_after),
+        "Has Pause": np.where(has_pause, "Yes", "No")
+    })
+
+@traced("detect_pauses_between_words")
 def detect_pauses_between_words(
-    file_path: str,
+    file_path: AudioInput,
     silence_thresh_db: float = -40.0,
     min_pause_ms: float = 100.0,
+    trim_silence: bool = TRIM_SILENCE,
 ) -> Dict:
     """Detect pauses and get word timestamps to show pauses between specific words."""
+    source = AudioSource.of(file_path)
 
     # Step 1: Get word-level timestamps using OpenAI Whisper
     print("🎤 Getting word timestamps from Whisper...")
-    words_data = transcribe_with_openai_timestamps(file_path)
+    # (optionally uploading only the speech; timestamps come back on the original timeline)
+    upload, offsets = prepare_upload(source, trim=trim_silence)
+    try:
+        backend = select_backend(word_timestamps=True, file_mb=upload.size_bytes / 1e6)
+    except BackendUnavailable as e:
+        return {"success": False, "error": str(e)}
+    words_data = transcribe_upload(backend.transcribe, upload, offsets)
 
     if not words_data:
         return {"success": False, "error": "Failed to get word timestamps"}
 
-    # Step 2: Detect pauses using pydub
-    print("⏸️ Detecting pauses with pydub...")
-    audio = AudioSegment.from_file(file_path)
+    # Step 2: Detect pauses from the shared block energies (pydub detect_silence semantics)
+    print("⏸️ Detecting pauses...")
+    with span("decode"):
+        features = get_frame_features(source)
 
     # Detect all silence
-    all_silent_ranges = detect_silence(
-        audio,
-        min_silence_len=int(min_pause_ms),
-        silence_thresh=int(silence_thresh_db)
-    )
+    with span("detect_silence"):
+        all_silent_ranges = features.silent_ranges(int(min_pause_ms), int(silence_thresh_db))
 
     # Remove first and last silence (beginning/end)
     if len(all_silent_ranges) > 2:
@@ -49,56 +114,8 @@ def detect_pauses_between_words(
 
     # Step 3: Match pauses with words
     print("🔍 Matching pauses with words...")
-    word_pause_data = []
-
-    for i, word_info in enumerate(words_data):
-        word = word_info["word"]
-        word_start = word_info["start"]
-        word_end = word_info["end"]
-
-        # Check for pause BEFORE this word
-        pause_before = None
-        if i > 0:  # Not the first word
-            prev_word_end = words_data[i-1]["end"]
-            # Find any pause that overlaps with gap before this word
-            for pause_start, pause_end in pause_intervals:
-                # Check if pause is between previous word end and current word start
-                if (pause_start >= prev_word_end - 0.1 and
-                    pause_end <= word_start + 0.1):
-                    pause_duration = pause_end - pause_start
-                    pause_before = {
-                        "start": pause_start,
-                        "end": pause_end,
-                        "duration": round(pause_duration, 2)
-                    }
-                    break
-
-        # Check for pause AFTER this word
-        pause_after = None
-        if i < len(words_data) - 1:  # Not the last word
-            next_word_start = words_data[i+1]["start"]
-            # Find any pause that overlaps with gap after this word
-            for pause_start, pause_end in pause_intervals:
-                # Check if pause is between current word end and next word start
-                if (pause_start >= word_end - 0.1 and
-                    pause_end <= next_word_start + 0.1):
-                    pause_duration = pause_end - pause_start
-                    pause_after = {
-                        "start": pause_start,
-                        "end": pause_end,
-                        "duration": round(pause_duration, 2)
-                    }
-                    break
-
-        word_pause_data.append({
-            "Word #": i + 1,
-            "Word": word,
-            "Word Start": round(word_start, 2),
-            "Word End": round(word_end, 2),
-            "Pause Before": f"{pause_before['duration']}s" if pause_before else "-",
-            "Pause After": f"{pause_after['duration']}s" if pause_after else "-",
-            "Has Pause": "Yes" if (pause_before or pause_after) else "No"
-        })
+    with span("match_words"):
+        word_pause_data = match_pauses_to_words(words_data, pause_intervals)
 
     return {
         "success": True,
@@ -106,23 +123,22 @@ def detect_pauses_between_words(
         "pause_intervals": pause_intervals,
         "total_words": len(words_data),
         "total_pauses": len(pause_intervals),
-        "audio_duration": len(audio) / 1000.0
+        "audio_duration": features.duration
     }
 
-def create_pause_word_plot(words_data: List, pause_intervals: List, file_path: str) -> str:
+def create_pause_word_plot(words_data: List, pause_intervals: List, file_path: AudioInput) -> str:
     """Create a timeline plot showing words and pauses."""
+    import matplotlib.pyplot as plt
 
-    # Load audio for waveform
-    audio = AudioSegment.from_file(file_path)
-    audio_data = np.array(audio.get_array_of_samples())
-    if audio.channels == 2:
-        audio_data = audio_data.reshape((-1, 2)).mean(axis=1)
+    # Waveform from the mono samples the pause detection already decoded
+    audio_data = load_mono(file_path)
 
     # Normalize audio data
-    if len(audio_data) > 0:
-        audio_data = audio_data.astype(np.float32) / np.max(np.abs(audio_data))
+    peak = np.max(np.abs(audio_data)) if len(audio_data) else 0.0
+    if peak > 0:
+        audio_data = audio_data.astype(np.float32) / peak
 
-    duration = len(audio) / 1000.0
+    duration = len(audio_data) / TARGET_SAMPLE_RATE
     t = np.linspace(0, duration, num=len(audio_data))
 
     # Match the original pause_waveform.png format exactly
@@ -154,32 +170,35 @@ def create_pause_word_plot(words_data: List, pause_intervals: List, file_path: s
 
     return img_base64
 
-def analyze_pause_with_words(file_path: str, silence_db: float = -40.0, min_pause_sec: float = 0.10):
+@traced("analyze_pause")
+def analyze_pause_with_words(file_path: AudioInput, silence_db: float = -40.0, min_pause_sec: float = 0.10,
+                             trim_silence: bool = TRIM_SILENCE):
     """Main function to analyze pauses and show which words they occur around."""
+    file_path = AudioSource.of(file_path)
 
     try:
         # Convert to milliseconds for pydub
         min_pause_ms = min_pause_sec * 1000
 
         # Detect pauses and match with words
-        result = detect_pauses_between_words(file_path, silence_db, min_pause_ms)
+        result = detect_pauses_between_words(file_path, silence_db, min_pause_ms, trim_silence=trim_silence)
 
         if not result["success"]:
             return result
 
-        # Create DataFrame
-        df = pd.DataFrame(result["word_pause_table"])
+        df = result["word_pause_table"]
 
         # Create visualization
-        plot_img = create_pause_word_plot(result["word_pause_table"],
-                                        result["pause_intervals"],
-                                        file_path)
+        with span("plot"):
+            plot_img = create_pause_word_plot(result["word_pause_table"],
+                                            result["pause_intervals"],
+                                            file_path)
 
         # Summary statistics
-        words_with_pauses = len([w for w in result["word_pause_table"] if w["Has Pause"] == "Yes"])
+        words_with_pauses = int((df["Has Pause"] == "Yes").sum())
 
         # Get full transcript
-        transcript = " ".join([w["Word"] for w in result["word_pause_table"]])
+        transcript = " ".join(df["Word"].tolist())
 
         return {
             "success": True,
@@ -3,18 +3,22 @@ Speech boundary detection using audio energy analysis.
 More accurate than relying on transcription timestamps alone.
 """
 
-import librosa
 import numpy as np
-from typing import Tuple, Dict, Any
+from typing import Tuple, Dict, Any, Optional
 
-def detect_speech_boundaries(audio_path: str,
+from src.utils.audio_input import AudioInput
+from src.utils.frame_features import get_frame_features, select_percentile
+from src.utils.tracing import span, traced
+
+@traced("detect_speech_boundaries")
+def detect_speech_boundaries(audio_path: AudioInput,
                            energy_percentile: float = 20,
                            min_speech_duration: float = 0.1) -> Dict[str, Any]:
     """
     Detect actual speech boundaries using audio energy analysis.
 
     Args:
-        audio_path (str): Path to audio file
+        audio_path: Audio file path, bytes, file-like object or DecodedAudio
         energy_percentile (float): Percentile threshold for speech detection (default: 20)
         min_speech_duration (float): Minimum duration for speech segments (default: 0.1s)
 
@@ -22,20 +26,27 @@ def detect_speech_boundaries(audio_path: str,
         Dict containing speech start, end, duration, and confidence metrics
     """
     try:
-        # Load audio
-        y, sr = librosa.load(audio_path, sr=None)
-        duration_seconds = len(y) / sr
+        # Load audio (block energies shared with the other analyzers of this source)
+        with span("decode"):
+            features = get_frame_features(audio_path)
+        duration_seconds = features.duration
+
+        # Calculate RMS energy in small frames: 25ms frames, 10ms hop
+        with span("rms"):
+            rms = features.frame_rms(25, 10)
 
-        # Calculate RMS energy in small frames
-        frame_length = int(0.025 * sr)  # 25ms frames
-        hop_length = int(0.010 * sr)    # 10ms hop
-        rms = librosa.feature.rms(y=y, frame_length=frame_length, hop_length=hop_length)[0]
+        # Frame centre times
+        times = features.frame_times(25, 10)
 
-        # Convert frame indices to time
-        times = librosa.frames_to_time(np.arange(len(rms)), sr=sr, hop_length=hop_length)
+        if not len(rms):
+            return {
+                "success": False,
+                "error": "No speech detected in audio file",
+                "total_duration": float(duration_seconds)
+            }
 
         # Find speech boundaries using energy threshold
-        energy_threshold = np.percentile(rms, energy_percentile)
+        energy_threshold = select_percentile(rms, energy_percentile)
         speech_frames = rms > energy_threshold
 
         if np.any(speech_frames):
@@ -145,12 +156,16 @@ def get_corrected_speech_timing(transcription_words: list,
         "confidence": speech_boundaries["confidence_metrics"]
     }
 
-def analyze_timing_accuracy(audio_path: str, transcription_words: list) -> Dict[str, Any]:
+def analyze_timing_accuracy(audio_path: AudioInput, transcription_words: list,
+                            boundaries: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
     """
     Comprehensive timing analysis comparing transcription vs energy-based detection.
+    `boundaries` is a detect_speech_boundaries() result computed earlier (e.g.
+    while the transcript was being fetched); it is detected here when omitted.
     """
     # Get speech boundaries
-    boundaries = detect_speech_boundaries(audio_path)
+    if boundaries is None:
+        boundaries = detect_speech_boundaries(audio_path)
 
     if not boundaries["success"]:
         return boundaries
@@ -1,21 +1,15 @@
+import concurrent.futures
+import numpy as np
 import pandas as pd
-import nltk
-from nltk.corpus import cmudict
-from src.transcribers.openai_transcriber import transcribe_with_openai_timestamps
+from config import TRIM_SILENCE
+from src.transcribers.registry import backend_name, select_backend
+from src.transcribers.silence_trimming import prepare_upload, transcribe_upload
+from src.utils.audio_input import AudioInput, AudioSource
+from src.utils.resources import get_cmu_dict
+from src.utils.tracing import span, submit_in_context, traced
+from src.utils.numeric import round_values
 import re
-from typing import List, Dict, Any
-
-# Download required NLTK data
-try:
-    nltk.data.find('corpora/cmudict')
-except LookupError:
-    nltk.download('cmudict')
-
-# Load CMU dictionary for syllable counting
-try:
-    cmu_dict = cmudict.dict()
-except:
-    cmu_dict = {}
+from typing import Dict, Any, Optional
 
 def count_syllables(word: str) -> int:
     """Count syllables in a word using CMU pronunciation dictionary."""
@@ -26,6 +20,7 @@ def count_syllables(word: str) -> int:
     if not word:
         return 1
 
+    cmu_dict = get_cmu_dict()
     if word in cmu_dict:
         # Count vowel sounds (marked with digits in CMU dict)
         pronunciations = cmu_dict[word]
@@ -62,41 +57,43 @@ def classify_stretch(stretch_score: float, threshold: float) -> str:
     else:
         return "Normal"
 
+def classify_stretch_scores(stretch_scores: np.ndarray, threshold: float) -> np.ndarray:
+    """classify_stretch for an array of scores."""
+    return np.where(np.asarray(stretch_scores) >= threshold, "Stretched", "Normal").astype(object)
+
 def get_stretch_color(stretch_type: str) -> str:
     """Get color for stretch classification."""
     # Stretched = Green, Normal = Red
     return "#4ecdc4" if stretch_type == "Stretched" else "#ff6b6b"
 
-def analyze_stretch(file_path: str, stretch_threshold: float = 0.3, model: str = None, method: str = "openai") -> Dict[str, Any]:
-    """Analyze speech stretch using word-level timestamps and syllable counting."""
+@traced("analyze_stretch")
+def analyze_stretch(file_path: AudioInput, stretch_threshold: float = 0.3, model: str = None, method: str = "openai",
+                    trim_silence: bool = TRIM_SILENCE, transcript: Optional[str] = None) -> Dict[str, Any]:
+    """
+    Analyze speech stretch using word-level timestamps and syllable counting.
+    With trim_silence, transcription runs on the speech-only audio and the word
+    timestamps are mapped back to the original timeline. A transcript fetched
+    earlier (hybrid methods in a pipelined batch) skips the API step, so only
+    the ForceAlign alignment runs here. Energy boundary detection needs no
+    transcript, so it runs on a worker thread while the transcriber works.
+    """
+    # Read uploads once; the transcriber and boundary detection share the source
+    file_path = AudioSource.of(file_path)
+
+    from src.analyzers.speech_boundary_detector import analyze_timing_accuracy, detect_speech_boundaries
+    executor = concurrent.futures.ThreadPoolExecutor(max_workers=1, thread_name_prefix="stretch-boundaries")
+    boundaries_future = submit_in_context(executor, detect_speech_boundaries, file_path)
+    # Lets the submitted detection finish without blocking an early error return
+    executor.shutdown(wait=False)
     try:
-        # Get word-level timestamps using selected method
-        if method == "forcealign":
-            from src.transcribers.forcealign_transcriber import transcribe_with_forcealign_timestamps
-            words_data = transcribe_with_forcealign_timestamps(file_path)
-        elif method == "whisper_forcealign":
-            from src.transcribers.deepgram_transcriber import whisper_forcealign_hybrid_timestamps
-            hybrid_result = whisper_forcealign_hybrid_timestamps(file_path)
-            if hybrid_result["success"]:
-                words_data = hybrid_result["word_timestamps"]
-            else:
-                return {
-                    "success": False,
-                    "error": hybrid_result["error"]
-                }
-        elif method == "deepgram_forcealign":
-            from src.transcribers.deepgram_transcriber import hybrid_deepgram_forcealign_timestamps
-            hybrid_result = hybrid_deepgram_forcealign_timestamps(file_path)
-            if hybrid_result["success"]:
-                words_data = hybrid_result["word_timestamps"]
-            else:
-                return {
-                    "success": False,
-                    "error": hybrid_result["error"]
-                }
-        else:
-            # Default to OpenAI method
-            words_data = transcribe_with_openai_timestamps(file_path, model=model)
+        # Route to a backend that returns word timestamps before any API call is made
+        # (BackendUnavailable / TranscriptionFailed become the error result below)
+        # (sized on what is uploaded: the speech-only FLAC when trimming pays off)
+        upload, offsets = prepare_upload(file_path, trim=trim_silence)
+        backend = select_backend(backend_name(method, model), word_timestamps=True,
+                                 file_mb=upload.size_bytes / 1e6)
+        known_transcript = {"transcript": transcript} if transcript is not None else {}
+        words_data = transcribe_upload(backend.transcribe, upload, offsets, **known_transcript)
 
         if not words_data:
             return {
@@ -106,12 +103,11 @@ def analyze_stretch(file_path: str, stretch_threshold: float = 0.3, model: str =
 
         # Filter out filled pauses and non-alphabetic words (like velocity analyzer)
         from config import FILLED_PAUSES
-        clean_words_data = [w for w in words_data if w["word"] not in FILLED_PAUSES and w["word"].isalpha()]
+        clean_words_data = words_data[~words_data.isin(FILLED_PAUSES) & words_data.token_mask(str.isalpha)]
 
         # Use energy-based speech detection for more accurate timing
-        from src.analyzers.speech_boundary_detector import analyze_timing_accuracy
-
-        timing_analysis = analyze_timing_accuracy(file_path, words_data)
+        with span("timing_analysis"):
+            timing_analysis = analyze_timing_accuracy(file_path, words_data, boundaries=boundaries_future.result())
 
         if timing_analysis["success"] and timing_analysis["recommendation"]["use_corrected_timing"]:
             # Use corrected timing based on energy analysis
@@ -125,8 +121,8 @@ def analyze_stretch(file_path: str, stretch_threshold: float = 0.3, model: str =
         else:
             # Fallback to transcription timing (like velocity analyzer)
             if clean_words_data:
-                real_start_time = clean_words_data[0]["start"]  # First real word start
-                real_end_time = clean_words_data[-1]["end"]     # Last real word end
+                real_start_time = float(clean_words_data.start[0])  # First real word start
+                real_end_time = float(clean_words_data.end[-1])     # Last real word end
                 real_speech_duration = real_end_time - real_start_time
                 timing_method = "transcription_based"
             else:
@@ -137,41 +133,23 @@ def analyze_stretch(file_path: str, stretch_threshold: float = 0.3, model: str =
 
             print(f"🎯 Using transcription timing: {real_start_time:.3f}s - {real_end_time:.3f}s ({real_speech_duration:.3f}s)")
 
-        # Process each word (including filled pauses for completeness)
-        processed_words = []
-        total_syllables = 0
-
-        for i, word_info in enumerate(words_data):
-            word = word_info["word"]
-            start = word_info["start"]
-            end = word_info["end"]
-            duration = end - start
-
-            # Clean word for syllable counting
-            clean_word_text = clean_word(word)
-            syllables = count_syllables(clean_word_text)
-
-            # Calculate stretch score (duration per syllable)
-            stretch_score = duration / syllables if syllables > 0 else 0
-
-            # Classify as stretched or normal
-            stretch_type = classify_stretch(stretch_score, stretch_threshold)
-
-            processed_words.append({
-                "Word #": i + 1,
-                "Word": word,
-                "Start": round(start, 2),
-                "End": round(end, 2),
-                "Duration": round(duration, 2),
-                "Syllables": syllables,
-                "Stretch Score": round(stretch_score, 3),
-                "Classification": stretch_type
-            })
-
-            total_syllables += syllables
-
-        # Create DataFrame
-        df = pd.DataFrame(processed_words)
+        # Score every word (including filled pauses for completeness); syllables
+        # are counted once per distinct token
+        syllables = words_data.map_tokens(lambda token: count_syllables(clean_word(token)), dtype=np.int64)
+        durations = words_data.duration
+        stretch_scores = np.divide(durations, syllables, out=np.zeros_like(durations), where=syllables > 0)
+        total_syllables = int(syllables.sum())
+
+        df = pd.DataFrame({
+            "Word #": np.arange(1, len(words_data) + 1),
+            "Word": words_data.tokens,
+            "Start": round_values(words_data.start, 2),
+            "End": round_values(words_data.end, 2),
+            "Duration": round_values(durations, 2),
+            "Syllables": syllables,
+            "Stretch Score": round_values(stretch_scores, 3),
+            "Classification": classify_stretch_scores(stretch_scores, stretch_threshold)
+        })
 
         # Calculate summary statistics
         if len(df) > 0:
@@ -198,7 +176,7 @@ def analyze_stretch(file_path: str, stretch_threshold: float = 0.3, model: str =
             }
 
             # Get full transcript
-            transcript = " ".join([word["Word"] for word in processed_words])
+            transcript = words_data.text()
 
         else:
             summary = {
@@ -223,7 +201,8 @@ def analyze_stretch(file_path: str, stretch_threshold: float = 0.3, model: str =
             "parameters_used": {
                 "stretch_threshold": stretch_threshold,
                 "analysis_method": method,
-                "transcription_model": model if method == "openai" else "N/A",
+                "transcription_model": backend.name if method == "openai" else "N/A",
+                "transcriber": backend.name,
                 "timing_method": timing_method
             }
         }
@@ -241,9 +220,7 @@ def update_stretch_classification(df: pd.DataFrame, new_threshold: float) -> pd.
 
     # Update classification column
     df_copy = df.copy()
-    df_copy["Classification"] = df_copy["Stretch Score"].apply(
-        lambda x: classify_stretch(x, new_threshold)
-    )
+    df_copy["Classification"] = classify_stretch_scores(df_copy["Stretch Score"].to_numpy(), new_threshold)
 
     return df_copy
 
@@ -1,26 +1,37 @@
-from src.transcribers.openai_transcriber import transcribe_with_openai_timestamps
-from config import FILLED_PAUSES, VELOCITY_SLOW_THRESHOLD, VELOCITY_FAST_THRESHOLD
+from src.transcribers.registry import select_backend
+from src.transcribers.silence_trimming import prepare_upload, transcribe_upload
+from config import FILLED_PAUSES, TRIM_SILENCE, VELOCITY_SLOW_THRESHOLD, VELOCITY_FAST_THRESHOLD
+from src.utils.audio_input import AudioSource
+from src.utils.tracing import traced
 
-def analyze_velocity(file_path):
+@traced("analyze_velocity")
+def analyze_velocity(file_path, trim_silence=TRIM_SILENCE):
     """
     Analyze speech velocity using OpenAI Whisper API
     Returns velocity metrics including WPS, WPM, and classification
+
+    With trim_silence, long silences are cut before upload and the word
+    timestamps are mapped back to the original timeline.
     """
     print(f"🎙️ Velocity Analysis: Using OpenAI Whisper API for transcription")
+    file_path = AudioSource.of(file_path)
 
     try:
-        # Transcribe using OpenAI API
-        words = transcribe_with_openai_timestamps(file_path)
+        # Transcribe with a backend that returns word timestamps (OpenAI Whisper by default)
+        # (sized on what is uploaded: the speech-only FLAC when trimming pays off)
+        upload, offsets = prepare_upload(file_path, trim=trim_silence)
+        backend = select_backend(word_timestamps=True, file_mb=upload.size_bytes / 1e6)
+        words = transcribe_upload(backend.transcribe, upload, offsets)
 
         # Debug: Print transcript and timing info
+        transcript = words.text()
         if words:
-            transcript = " ".join([w["word"] for w in words])
             print(f"📝 Transcript: {transcript}")
             print(f"⏱️ Total words detected: {len(words)}")
-            if len(words) > 0:
-                print(f"⏱️ First word: '{words[0]['word']}' at {words[0]['start']:.2f}s - {words[0]['end']:.2f}s")
-                if len(words) > 1:
-                    print(f"⏱️ Last word: '{words[-1]['word']}' at {words[-1]['start']:.2f}s - {words[-1]['end']:.2f}s")
+            first, last = words[0], words[-1]
+            print(f"⏱️ First word: '{first['word']}' at {first['start']:.2f}s - {first['end']:.2f}s")
+            if len(words) > 1:
+                print(f"⏱️ Last word: '{last['word']}' at {last['start']:.2f}s - {last['end']:.2f}s")
             print(f"⏱️ Audio file: {file_path}")
         else:
             print("⚠️ No words detected in transcription")
@@ -44,34 +55,37 @@ def analyze_velocity(file_path):
                 }
             }
 
-        clean_words = [w for w in words if w["word"] not in FILLED_PAUSES and w["word"].isalpha()]
+        # Filled pauses and non-alphabetic tokens, checked once per distinct token
+        filled_mask = words.isin(FILLED_PAUSES)
+        clean_mask = ~filled_mask & words.token_mask(str.isalpha)
+        clean_words = words[clean_mask]
 
         # Debug: Show filled pauses vs clean words
-        filled_pauses = [w["word"] for w in words if w["word"] in FILLED_PAUSES]
+        filled_pauses = words.tokens[filled_mask].tolist()
         print(f"🔍 Filled pauses found: {filled_pauses}")
         print(f"🔍 Clean words count: {len(clean_words)} out of {len(words)} total words")
 
         if not clean_words:
             return {
-                "transcript": " ".join([w["word"] for w in words]),
-                "filled_pauses": [w["word"] for w in words if w["word"] in FILLED_PAUSES],
+                "transcript": transcript,
+                "filled_pauses": filled_pauses,
                 "word_count_total": len(words),
                 "word_count_clean": 0,
                 "duration_spoken": 0.0,
-                "real_start_time": words[0]["start"] if words else 0.0,
-                "real_end_time": words[-1]["end"] if words else 0.0,
+                "real_start_time": float(words.start[0]),
+                "real_end_time": float(words.end[-1]),
                 "wps": 0.0,
                 "wpm": 0.0,
                 "velocity_level": "All filled pauses",
                 "detailed_explanation": {
-                    "time_calculation": f"Time from {round(words[0]['start'], 2)} to {round(words[-1]['end'], 2)} seconds" if words else "Unknown",
+                    "time_calculation": f"Time from {round(float(words.start[0]), 2)} to {round(float(words.end[-1]), 2)} seconds",
                     "word_calculation": f"Total words: {len(words)} (all filled pauses) | Valid words: 0",
                     "velocity_calculation": "Cannot calculate velocity - no valid words"
                 }
             }
 
-        real_start = clean_words[0]["start"]
-        real_end = clean_words[-1]["end"]
+        real_start = float(clean_words.start[0])
+        real_end = float(clean_words.end[-1])
         duration_spoken = real_end - real_start
 
         # Debug: Show timing calculation details
@@ -95,8 +109,8 @@ def analyze_velocity(file_path):
             level = "Normal"
 
         return {
-            "transcript": " ".join([w["word"] for w in words]),
-            "filled_pauses": [w["word"] for w in words if w["word"] in FILLED_PAUSES],
+            "transcript": transcript,
+            "filled_pauses": filled_pauses,
             "word_count_total": len(words),
             "word_count_clean": word_count,
             "duration_spoken": round(duration_spoken, 2),
@@ -0,0 +1,225 @@
+"""
+Voice activity detection - NumPy-only speech/non-speech segmentation
+Frames (VAD_FRAME_MS long every VAD_HOP_MS) are classified from three features
+computed in one streaming pass over the decoded audio:
+
+- energy (dBFS) against a threshold adapted to the file's noise floor
+- zero-crossing rate, low for voiced speech
+- spectral flatness in the speech band, high for noise
+
+A frame is speech when it is loud enough and either tonal (low flatness) or
+low-ZCR. Decisions are smoothed with a hangover (and a short onset pad), then
+runs shorter than VAD_MIN_SPEECH_MS are dropped. The result is a VoiceActivity
+that the analyzers can query for speech/non-speech time cheaply.
+"""
+
+from typing import Any, Dict, List, Tuple
+
+import numpy as np
+
+from config import (TARGET_SAMPLE_RATE, VAD_ENERGY_MARGIN_DB, VAD_FLATNESS_MAX, VAD_FRAME_MS, VAD_HANGOVER_MS,
+                    VAD_HOP_MS, VAD_MIN_ENERGY_DB, VAD_MIN_SPEECH_MS, VAD_ONSET_PAD_MS, VAD_ZCR_MAX)
+from src.utils.audio_input import AudioInput, AudioSource
+from src.utils.frame_features import iter_mono_chunks, select_percentile
+from src.utils.tracing import span
+
+# Band the flatness is measured in (Hz)
+SPEECH_BAND = (100, 4000)
+# Frames whose features are computed at once (bounds the FFT working set)
+_FRAME_BATCH = 4096
+# Energy floor for digital silence (dBFS)
+_SILENCE_DB = -120.0
+
+
+class VoiceActivity:
+    """
+    Speech segments of one file.
+
+    Attributes:
+        starts (np.ndarray): Segment start times in seconds, ascending
+        ends (np.ndarray): Segment end times in seconds
+        duration (float): Length of the audio in seconds
+    """
+
+    __slots__ = ("starts", "ends", "duration")
+
+    def __init__(self, starts: np.ndarray, ends: np.ndarray, duration: float):
+        self.starts = np.asarray(starts, dtype=np.float64)
+        self.ends = np.asarray(ends, dtype=np.float64)
+        self.duration = float(duration)
+
+    @property
+    def segments(self) -> List[Tuple[float, float]]:
+        return [(float(start), float(end)) for start, end in zip(self.starts, self.ends)]
+
+    @property
+    def speech_duration(self) -> float:
+        return float(np.sum(self.ends - self.starts))
+
+    @property
+    def speech_ratio(self) -> float:
+        return self.speech_duration / self.duration if self.duration else 0.0
+
+    def is_speech(self, times):
+        """Whether each time (seconds; scalar or array) falls inside a speech segment."""
+        times = np.asarray(times, dtype=np.float64)
+        if len(self.starts):
+            index = np.searchsorted(self.starts, times, side="right") - 1
+            inside = (index >= 0) & (times < self.ends[np.maximum(index, 0)])
+        else:
+            inside = np.zeros(times.shape, dtype=bool)
+        return bool(inside) if inside.ndim == 0 else inside
+
+    def speech_overlap(self, start: float, end: float) -> float:
+        """Seconds of speech inside [start, end]."""
+        overlap = np.minimum(self.ends, end) - np.maximum(self.starts, start)
+        return float(np.sum(overlap[overlap > 0]))
+
+    def non_speech(self, min_duration: float = 0.0) -> List[Tuple[float, float]]:
+        """Gaps between speech segments (including leading/trailing) at least min_duration long."""
+        gap_starts = np.concatenate(([0.0], self.ends))
+        gap_ends = np.concatenate((self.starts, [self.duration]))
+        keep = (gap_ends - gap_starts) >= max(min_duration, 1e-9)
+        return [(float(start), float(end)) for start, end in zip(gap_starts[keep], gap_ends[keep])]
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "segments": [{"start": round(start, 3), "end": round(end, 3)} for start, end in self.segments],
+            "speech_duration": round(self.speech_duration, 3),
+            "total_duration": round(self.duration, 3),
+            "speech_ratio": round(self.speech_ratio, 4),
+        }
+
+
+def _frame_features(frames: np.ndarray, window: np.ndarray, band: slice) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Energy (dBFS), zero-crossing rate and speech-band spectral flatness of each frame (row)."""
+    rms = np.sqrt(np.einsum("ij,ij->i", frames, frames) / frames.shape[1])
+    energy_db = np.full(len(frames), _SILENCE_DB)
+    np.log10(rms, out=energy_db, where=rms > 0)
+    energy_db[rms > 0] *= 20
+
+    signs = np.signbit(frames)
+    zcr = np.count_nonzero(signs[:, 1:] != signs[:, :-1], axis=1) / frames.shape[1]
+
+    power = np.abs(np.fft.rfft(frames * window, axis=1)[:, band]) ** 2 + 1e-12
+    flatness = np.exp(np.mean(np.log(power), axis=1)) / np.mean(power, axis=1)
+    return energy_db, zcr, flatness
+
+
+def compute_vad_features(source: AudioInput, frame_ms: int = VAD_FRAME_MS,
+                         hop_ms: int = VAD_HOP_MS) -> Tuple[np.ndarray, np.ndarray, np.ndarray, float]:
+    """
+    Per-frame features in one pass over the decoded audio.
+
+    Returns:
+        tuple: (energy_db, zcr, flatness, duration_sec); frame i starts at i * hop_ms
+    """
+    frame_len = TARGET_SAMPLE_RATE * frame_ms // 1000
+    hop_len = TARGET_SAMPLE_RATE * hop_ms // 1000
+    n_fft = 1 << (frame_len - 1).bit_length()
+    window = np.hanning(frame_len)
+    hz_per_bin = TARGET_SAMPLE_RATE / n_fft
+    band = slice(int(np.ceil(SPEECH_BAND[0] / hz_per_bin)), int(SPEECH_BAND[1] / hz_per_bin) + 1)
+
+    energy, zcr, flatness = [], [], []
+    carry = np.zeros(0)
+    n_samples = 0
+    for chunk in iter_mono_chunks(source):
+        n_samples += len(chunk)
+        buffer = np.concatenate((carry, chunk))
+        if len(buffer) < frame_len:
+            carry = buffer
+            continue
+        n_frames = 1 + (len(buffer) - frame_len) // hop_len
+        frames = np.lib.stride_tricks.sliding_window_view(buffer, frame_len)[::hop_len][:n_frames]
+        for start in range(0, n_frames, _FRAME_BATCH):
+            batch = _frame_features(frames[start:start + _FRAME_BATCH], window, band)
+            for values, out in zip(batch, (energy, zcr, flatness)):
+                out.append(values)
+        carry = buffer[n_frames * hop_len:]
+
+    if not energy:
+        return np.zeros(0), np.zeros(0), np.zeros(0), n_samples / TARGET_SAMPLE_RATE
+    return np.concatenate(energy), np.concatenate(zcr), np.concatenate(flatness), n_samples / TARGET_SAMPLE_RATE
+
+
+def energy_threshold(energy_db: np.ndarray, margin_db: float = VAD_ENERGY_MARGIN_DB,
+                     min_energy_db: float = VAD_MIN_ENERGY_DB) -> float:
+    """
+    Speech energy threshold: VAD_ENERGY_MARGIN_DB above the noise floor (10th
+    percentile of non-silent frames), capped 6 dB under the loud (95th percentile)
+    level so a file with no pauses is not rejected, never below min_energy_db.
+    """
+    audible = energy_db[energy_db > _SILENCE_DB]
+    if not len(audible):
+        return min_energy_db
+    noise_floor = select_percentile(audible, 10)
+    loud = select_percentile(audible, 95)
+    return max(min_energy_db, min(noise_floor + margin_db, loud - 6.0))
+
+
+def smooth_decisions(speech: np.ndarray, hangover_frames: int, onset_frames: int) -> np.ndarray:
+    """Hold speech for hangover_frames after (and onset_frames before) every speech frame."""
+    if not speech.any():
+        return speech
+    index = np.arange(len(speech))
+    last_speech = np.maximum.accumulate(np.where(speech, index, -len(speech) - hangover_frames))
+    next_speech = np.minimum.accumulate(np.where(speech, index, 2 * len(speech) + onset_frames)[::-1])[::-1]
+    return (index - last_speech <= hangover_frames) | (next_speech - index <= onset_frames)
+
+
+def detect_voice_activity(source: AudioInput,
+                          frame_ms: int = VAD_FRAME_MS,
+                          hop_ms: int = VAD_HOP_MS,
+                          energy_margin_db: float = VAD_ENERGY_MARGIN_DB,
+                          min_energy_db: float = VAD_MIN_ENERGY_DB,
+                          flatness_max: float = VAD_FLATNESS_MAX,
+                          zcr_max: float = VAD_ZCR_MAX,
+                          hangover_ms: int = VAD_HANGOVER_MS,
+                          onset_pad_ms: int = VAD_ONSET_PAD_MS,
+                          min_speech_ms: int = VAD_MIN_SPEECH_MS) -> VoiceActivity:
+    """
+    Speech segments of an audio source. The result is memoized on the AudioSource
+    per parameter set, so analyzers sharing a source share one detection.
+
+    Args:
+        source: Audio file path, bytes, file-like object, DecodedAudio or AudioSource
+        frame_ms (int): Analysis frame length
+        hop_ms (int): Frame step
+        energy_margin_db (float): Threshold above the estimated noise floor
+        min_energy_db (float): Absolute energy floor for speech (dBFS)
+        flatness_max (float): Spectral flatness below which a frame counts as tonal
+        zcr_max (float): Zero-crossing rate below which a frame counts as voiced
+        hangover_ms (int): Speech held after the last speech frame
+        onset_pad_ms (int): Speech started before the first speech frame
+        min_speech_ms (int): Shorter speech runs are dropped
+
+    Returns:
+        VoiceActivity: Speech segments and the audio duration
+    """
+    params = (frame_ms, hop_ms, energy_margin_db, min_energy_db, flatness_max, zcr_max,
+              hangover_ms, onset_pad_ms, min_speech_ms)
+    source = AudioSource.of(source)
+    with source.memo_lock:
+        memo = source.memo.setdefault("voice_activity", {})
+        if params in memo:
+            return memo[params]
+
+    with span("voice_activity"):
+        energy_db, zcr, flatness, duration = compute_vad_features(source, frame_ms, hop_ms)
+
+        threshold = energy_threshold(energy_db, energy_margin_db, min_energy_db)
+        raw = (energy_db > threshold) & ((flatness < flatness_max) | (zcr < zcr_max))
+        speech = smooth_decisions(raw, hangover_ms // hop_ms, onset_pad_ms // hop_ms)
+
+        # Runs of speech frames -> [start, end) frame indices
+        edges = np.diff(np.concatenate(([0], speech.astype(np.int8), [0])))
+        run_starts, run_ends = np.flatnonzero(edges == 1), np.flatnonzero(edges == -1)
+        starts = run_starts * hop_ms / 1000.0
+        ends = np.minimum((run_ends - 1) * hop_ms / 1000.0 + frame_ms / 1000.0, duration)
+        keep = (ends - starts) * 1000.0 >= min_speech_ms
+        activity = VoiceActivity(starts[keep], ends[keep], duration)
+
+    with source.memo_lock:
+        source.memo["voice_activity"][params] = activity
+    return activity
@@ -1,47 +1,51 @@
-from pydub import AudioSegment
 import numpy as np
 import os
-from config import FRAME_MS, TARGET_SAMPLE_RATE, VOLUME_TARGET_MIN, VOLUME_TARGET_MAX
+from config import FRAME_MS, VOLUME_TARGET_MIN, VOLUME_TARGET_MAX
+from src.utils.frame_features import get_frame_features
+from src.utils.frame_series import FrameSeries
+from src.utils.volume_histogram import VolumeHistogram
+from src.utils.tracing import span, traced
 
 # Add ffmpeg to PATH if needed
 ffmpeg_path = r"C:\Users\gensh\OneDrive\Máy tính\ffmpeg-7.1.1-essentials_build\ffmpeg-7.1.1-essentials_build\bin"
 if ffmpeg_path not in os.environ.get("PATH", ""):
     os.environ["PATH"] += f";{ffmpeg_path}"
 
+@traced("analyze_volume")
 def analyze_volume(file_path):
     """
     Analyze volume characteristics of audio file
-    Returns volume metrics including min/max/avg and target coverage
+    Returns volume metrics including min/max/avg and target coverage;
+    frame_values is a compact FrameSeries (see src/utils/frame_series.py) and
+    histogram a mergeable VolumeHistogram used for batch-wide summaries
     """
     try:
-        # Load and normalize audio
-        sound = AudioSegment.from_file(file_path)
-        sound = sound.set_channels(1).set_frame_rate(TARGET_SAMPLE_RATE)
+        # Decode to mono 16 kHz block energies, shared with the other analyzers of this source
+        # (file_path may also be bytes, a file-like object or decoded audio)
+        with span("decode"):
+            features = get_frame_features(file_path)
 
         frame_len = FRAME_MS
-        num_frames = len(sound) // frame_len
-        all_dbfs = []
+        num_frames = features.duration_ms // frame_len
 
-        # Process each frame
-        for i in range(num_frames):
-            frame = sound[i * frame_len:(i + 1) * frame_len]
-            rms = frame.rms
-            if rms > 0:
-                dbfs = 20 * np.log10(rms / 32768)
-                all_dbfs.append(dbfs)
+        # Per-frame dBFS from the block energies (silent frames stay NaN and keep their time slot)
+        with span("frame_rms", frames=num_frames):
+            frame_dbfs = features.frame_dbfs(frame_len)
 
-        if not all_dbfs:
+        series = FrameSeries.from_dbfs(frame_dbfs, frame_len)
+        all_dbfs = frame_dbfs[~np.isnan(frame_dbfs)]
+
+        if not len(all_dbfs):
             return {
                 "volume_min": -100.0,
                 "volume_max": -100.0,
                 "volume_avg": -100.0,
                 "volume_range": 0.0,
-                "frame_values": [],
+                "frame_values": series,
                 "coverage_vs_target": 0.0,
                 "error": "No audio frames detected"
             }
 
-        all_dbfs = np.array(all_dbfs)
         volume_min = float(np.min(all_dbfs))
         volume_max = float(np.max(all_dbfs))
         volume_avg = float(np.mean(all_dbfs))
@@ -56,7 +60,8 @@ def analyze_volume(file_path):
             "volume_max": round(volume_max, 2),
             "volume_avg": round(volume_avg, 2),
             "volume_range": round(volume_range, 2),
-            "frame_values": [round(v, 2) for v in all_dbfs.tolist()],
+            "frame_values": series,
+            "histogram": VolumeHistogram.from_values(series),
             "coverage_vs_target": round(coverage, 2)
         }
 
@@ -1,19 +1,29 @@
 import concurrent.futures
+from config import TRIM_SILENCE
 from src.analyzers.volume_analyzer import analyze_volume
 from src.analyzers.velocity_analyzer import analyze_velocity
+from src.utils.audio_input import AudioSource
+from src.utils.tracing import TIMINGS_KEY, format_timings, submit_in_context, traced
 
-def analyze_audio_file(file_path):
+@traced("analyze_audio_file")
+def analyze_audio_file(file_path, trim_silence=TRIM_SILENCE):
     """
     Analyze audio file for both volume and velocity simultaneously
     Returns combined results from both analyses
+
+    file_path may be a path, bytes, a file-like object or decoded audio; it is
+    read once and shared by both analyses. trim_silence is passed to the velocity
+    analysis (speech-only upload).
     """
+    source = AudioSource.of(file_path)
+    file_path = str(source)
     print(f"🔄 Starting analysis for: {file_path}")
 
     # Run volume and velocity analysis in parallel
     with concurrent.futures.ThreadPoolExecutor() as executor:
         # Submit both analyses
-        volume_future = executor.submit(analyze_volume, file_path)
-        velocity_future = executor.submit(analyze_velocity, file_path)
+        volume_future = submit_in_context(executor, analyze_volume, source)
+        velocity_future = submit_in_context(executor, analyze_velocity, source, trim_silence)
 
         # Get results
         volume_result = volume_future.result()
@@ -76,4 +86,9 @@ def display_results(result):
     print(f"   Volume Analysis: {'✅ Success' if status['volume_success'] else '❌ Failed'}")
     print(f"   Velocity Analysis: {'✅ Success' if status['velocity_success'] else '❌ Failed'}")
     print(f"   Overall: {'✅ Success' if status['overall_success'] else '❌ Partial/Failed'}")
+
+    # Stage timings
+    if TIMINGS_KEY in result:
+        print("\n⏱️ STAGE TIMINGS:")
+        print(format_timings(result[TIMINGS_KEY]))
     print("="*60)
\ No newline at end of file
@@ -1,21 +1,26 @@
 import streamlit as st
 import os
-import tempfile
 import pandas as pd
 from src.audio_analyzer import analyze_audio_file
 from src.analyzers.pause_word_analyzer import analyze_pause_with_words
 from src.analyzers.stretch_analyzer import analyze_stretch
-import concurrent.futures
 from threading import Lock
-from src.utils.volume_scoring import calculate_volume_score, create_results_table_data
-import numpy as np
-import plotly.graph_objects as go
+from src.utils.volume_scoring import create_results_table_data, score_volume_results, volume_recommendations
+from src.utils.hashing import bytes_sha256
+from src.utils.audio_input import AudioSource
+from src.transcribers.registry import STRETCH_METHODS, get_backend, list_backends
+from src.utils.volume_histogram import VolumeHistogram, histogram_for
+from src.storage.job_journal import get_job_journal
+from src.storage.result_store import get_result_store
+from src.storage.batch_export import PYARROW_AVAILABLE, export_batch_zip
+from src.services.batch_runner import run_journaled_batch
 from src.utils.visualizations import (
     plot_volume_histogram_individual,
     plot_velocity_gauge,
     plot_velocity_metrics_table,
     create_volume_summary_chart,
-    create_combined_metrics_overview
+    create_combined_metrics_overview,
+    show_stage_timings
 )
 
 # Thread-safe counter for progress
@@ -67,7 +72,7 @@ def batch_analyze_page():
 
         analysis_method = st.sidebar.selectbox(
             "Analysis Method",
-            options=["OpenAI Whisper", "ForceAlign", "Whisper + ForceAlign (Hybrid)", "Deepgram + ForceAlign (Hybrid)"],
+            options=list(STRETCH_METHODS),
             index=0,
             help="Choose the method for word-level timing analysis"
         )
@@ -82,10 +87,22 @@ def batch_analyze_page():
             else:
                 st.sidebar.success("✅ API Key loaded from .env")
 
-            transcription_model = st.sidebar.selectbox("Transcription Model", ["whisper-1", "gpt-4o-transcribe"], index=0)
+            transcription_model = st.sidebar.selectbox(
+                "Transcription Model", [backend.name for backend in list_backends() if backend.provider == "openai"], index=0)
 
-            if transcription_model == "gpt-4o-transcribe":
-                st.sidebar.warning("⚠️ Will auto-switch to whisper-1 for word timestamps")
+            if not get_backend(transcription_model).word_timestamps:
+                st.sidebar.warning("⚠️ No word timestamps; routed to an OpenAI model that has them")
+
+        elif analysis_method == "Deepgram (Native Word Timings)":
+            # Deepgram's own word timings - no local model
+            transcription_model = None
+
+            if not os.getenv("DEEPGRAM_API_KEY"):
+                st.sidebar.error("❌ Deepgram API Key not found")
+                st.error("❌ Deepgram API Key required for Deepgram method. Please set DEEPGRAM_API_KEY in your .env file.")
+                return
+            else:
+                st.sidebar.success("✅ Deepgram API Key loaded")
 
         elif analysis_method == "Deepgram + ForceAlign (Hybrid)":
             # Hybrid method - needs both Deepgram and ForceAlign
@@ -109,13 +126,13 @@ def batch_analyze_page():
                 st.error("❌ ForceAlign not available. Please install it with: pip install forcealign")
                 return
 
-            # Check Deepgram SDK
+            # Check Deepgram client
             from src.transcribers.deepgram_transcriber import check_deepgram_availability
             if check_deepgram_availability():
-                st.sidebar.success("✅ Deepgram SDK is available")
+                st.sidebar.success("✅ Deepgram client is available")
             else:
-                st.sidebar.error("❌ Deepgram SDK not installed")
-                st.error("❌ Deepgram SDK not available. Please install it with: pip install deepgram-sdk")
+                st.sidebar.error("❌ Deepgram client not installed")
+                st.error("❌ Deepgram client not available. Please install it with: pip install requests")
                 return
 
             st.sidebar.info("🎯 Best of both: Deepgram transcription + ForceAlign timing!")
@@ -176,6 +193,19 @@ def batch_analyze_page():
             for i, file in enumerate(uploaded_files, 1):
                 st.write(f"{i}. {file.name} ({file.size/1024:.1f} KB)")
 
+        # Checkpointed jobs - re-running the same files and settings resumes them
+        recent_jobs = get_job_journal().list_jobs(limit=10)
+        if recent_jobs:
+            with st.expander("🗂️ Recent Batch Jobs (resumable)"):
+                st.caption("Re-uploading files with the same settings resumes their work: files completed by any earlier job are skipped and failed files are retried.")
+                st.dataframe(pd.DataFrame([{
+                    "Job": job['job_id'],
+                    "Analysis": job['analysis'],
+                    "Status": job['status'],
+                    "Done": f"{job['done_files']}/{job['total_files']}",
+                    "Failed": job['failed_files']
+                } for job in recent_jobs]), use_container_width=True, hide_index=True)
+
         # Analysis button
         if st.button("🚀 Start Batch Analysis", type="primary"):
             if analysis_type == "Volume & Velocity":
@@ -183,15 +213,44 @@ def batch_analyze_page():
             elif analysis_type == "Pause Analysis":
                 analyze_batch_pause(uploaded_files, silence_db, min_pause_sec)
             elif analysis_type == "Stretch Analysis":
-                if analysis_method == "ForceAlign":
-                    method = "forcealign"
-                elif analysis_method == "Deepgram + ForceAlign (Hybrid)":
-                    method = "deepgram_forcealign"
-                elif analysis_method == "Whisper + ForceAlign (Hybrid)":
-                    method = "whisper_forcealign"
-                else:
-                    method = "openai"
-                analyze_batch_stretch(uploaded_files, stretch_threshold, transcription_model, method)
+                analyze_batch_stretch(uploaded_files, stretch_threshold, transcription_model, STRETCH_METHODS[analysis_method])
+
+def _audio_source(uploaded_file):
+    """In-memory audio source for an upload (analyzers read it without a temp file)."""
+    return AudioSource(data=uploaded_file.getvalue(), name=uploaded_file.name)
+
+def _journal_items(uploaded_files):
+    """(content hash, filename, uploaded file) triples identifying each file in the job journal"""
+    return [(bytes_sha256(file.getvalue()), file.name, file) for file in uploaded_files]
+
+def _show_resume_info(batch_run):
+    """Tell the user how much of the batch was restored from the job journal"""
+    st.session_state['batch_job_id'] = batch_run['job_id']
+    # Identifies this batch's results (journal results of a job/file never change once done)
+    st.session_state['batch_results_key'] = (batch_run['job_id'], tuple(
+        (outcome['file_hash'], outcome['error'] is None) for outcome in batch_run['outcomes']
+    ))
+    if batch_run['skipped']:
+        st.info(f"♻️ Job `{batch_run['job_id']}`: {batch_run['skipped']} file(s) already completed were loaded from the checkpoint journal (no re-analysis).")
+    if 'memory_report' in batch_run:
+        _show_memory_report(batch_run)
+
+def _show_memory_report(batch_run):
+    """Per-stage memory summary recorded when MEMORY_PROFILING is enabled"""
+    report = batch_run['memory_report']
+    with st.expander("🧠 Memory Profile", expanded=False):
+        if not report['profiled_files']:
+            st.info("No newly analyzed files were profiled in this run")
+            return
+        col1, col2 = st.columns(2)
+        col1.metric("Max heap peak", f"{report['max_heap_peak_mb']:.1f} MB")
+        if report['max_rss_peak_mb'] is not None:
+            col2.metric("Max RSS peak", f"{report['max_rss_peak_mb']:.1f} MB")
+        st.write("**Stages (largest heap peak first)**")
+        st.dataframe(pd.DataFrame(report['stages']), use_container_width=True, hide_index=True)
+        st.write("**Files**")
+        st.dataframe(pd.DataFrame(report['files']), use_container_width=True, hide_index=True)
+        st.caption(f"Report saved to `{batch_run['memory_report_path']}`")
 
 def analyze_batch_files(uploaded_files, analysis_type):
     """Process multiple files and display results"""
@@ -201,48 +260,32 @@ def analyze_batch_files(uploaded_files, analysis_type):
     status_text = st.empty()
 
     results = []
-    temp_files = []
 
     try:
-        # Save all files to temp directory first
-        status_text.text("📁 Preparing files...")
-        for i, file in enumerate(uploaded_files):
-            with tempfile.NamedTemporaryFile(delete=False, suffix=f".{file.name.split('.')[-1]}") as tmp_file:
-                tmp_file.write(file.getvalue())
-                temp_files.append((tmp_file.name, file.name))
-            progress_bar.progress((i + 1) / (len(uploaded_files) * 2))
-
-        # Analyze files in parallel
         status_text.text("🔄 Analyzing files...")
 
-        def analyze_single_file(file_info):
-            temp_path, original_name = file_info
-            result = analyze_audio_file(temp_path)
-            result['original_filename'] = original_name
-            return result
-
-        # Use ThreadPoolExecutor for parallel processing
-        with concurrent.futures.ThreadPoolExecutor(max_workers=3) as executor:
-            future_to_file = {executor.submit(analyze_single_file, file_info): file_info[1] for file_info in temp_files}
-
-            completed = 0
-            for future in concurrent.futures.as_completed(future_to_file):
-                filename = future_to_file[future]
-                try:
-                    result = future.result()
-                    results.append(result)
-                    completed += 1
-                    progress_bar.progress(0.5 + (completed / len(temp_files)) * 0.5)
-                    status_text.text(f"✅ Completed: {filename}")
-                except Exception as e:
-                    st.error(f"❌ Error analyzing {filename}: {str(e)}")
-
-        # Clean up temp files
-        for temp_path, _ in temp_files:
-            try:
-                os.unlink(temp_path)
-            except:
-                pass
+        def analyze_single_file(uploaded_file):
+            return analyze_audio_file(_audio_source(uploaded_file))
+
+        def on_progress(completed, total, filename, from_checkpoint):
+            progress_bar.progress(completed / total)
+            status_text.text(f"{'♻️ Restored' if from_checkpoint else '✅ Completed'}: {filename}")
+
+        # Analyze in parallel, checkpointing each file in the job journal
+        batch_run = run_journaled_batch(
+            get_job_journal(), "volume_velocity", {}, _journal_items(uploaded_files),
+            analyze_single_file, max_workers=3, progress_callback=on_progress,
+            result_store=get_result_store()
+        )
+        _show_resume_info(batch_run)
+
+        for outcome in batch_run['outcomes']:
+            if outcome['result'] is None:
+                st.error(f"❌ Error analyzing {outcome['filename']}: {outcome['error']}")
+                continue
+            result = dict(outcome['result'])
+            result['original_filename'] = outcome['filename']
+            results.append(result)
 
         # Display results
         display_batch_results(results)
@@ -252,12 +295,6 @@ def analyze_batch_files(uploaded_files, analysis_type):
 
     except Exception as e:
         st.error(f"❌ Batch analysis failed: {str(e)}")
-        # Clean up on error
-        for temp_path, _ in temp_files:
-            try:
-                os.unlink(temp_path)
-            except:
-                pass
 
 def display_batch_results(results):
     """Display comprehensive batch analysis results"""
@@ -279,30 +316,34 @@ def display_batch_results(results):
         success_rate = (len(successful_analyses) / len(results)) * 100 if results else 0
         st.metric("Success Rate", f"{success_rate:.1f}%")
 
+    # Score every file's volume once; the table and the file details below reuse these arrays
+    volume_files = [r for r in results if 'error' not in r['volume_analysis']]
+    volume_scores = score_volume_results([r['volume_analysis'] for r in volume_files]) if volume_files else {}
+    for i, result in enumerate(volume_files):
+        volume = result['volume_analysis']
+        result['volume_analysis'] = dict(
+            volume,
+            score=float(volume_scores['score'][i]),
+            grade=volume_scores['grade'][i],
+            status=volume_scores['status'][i],
+            recommendations=volume_recommendations(volume['volume_avg'], volume['coverage_vs_target'], volume['volume_range'])
+        )
+
     # Detailed results tables
     if successful_analyses:
 
-        # Process files and apply volume scoring
-        for result in successful_analyses:
-            if 'error' not in result['volume_analysis']:
-                scored_volume = calculate_volume_score(result['volume_analysis'])
-                result['volume_analysis'] = scored_volume  # Update with scored version
-
         # Volume Results Table (SBF Style)
         st.subheader("📋 Bảng kết quả chi tiết Volume")
 
         # Prepare data for SBF-style table
-        volume_results = []
-        file_labels = []
-
-        for result in successful_analyses:
-            if 'error' not in result['volume_analysis']:
-                volume_results.append(result['volume_analysis'])
-                file_labels.append(result['original_filename'])
+        table_rows = [i for i, result in enumerate(volume_files) if result['analysis_status']['overall_success']]
+        volume_results = [volume_files[i]['volume_analysis'] for i in table_rows]
+        file_labels = [volume_files[i]['original_filename'] for i in table_rows]
 
         if volume_results:
-            # Create table data with scoring
-            table_data = create_results_table_data(volume_results, file_labels)
+            # Create table data from the scores computed above
+            table_scores = {key: values[table_rows] for key, values in volume_scores.items()}
+            table_data = create_results_table_data(volume_results, file_labels, scores=table_scores)
             results_df = pd.DataFrame(table_data)
 
             # Style the dataframe like SBF
@@ -326,43 +367,36 @@ def display_batch_results(results):
             )
 
             # === OVERALL SUMMARY (SBF Style) ===
-            all_frame_values = []
-            for result in volume_results:
-                all_frame_values.extend(result["frame_values"])
+            # Merge per-file histogram sketches instead of concatenating every frame
+            merged_histogram = VolumeHistogram.merge_all(histogram_for(result) for result in volume_results)
 
-            if all_frame_values:
-                Q1 = np.percentile(all_frame_values, 25)
-                Q3 = np.percentile(all_frame_values, 75)
+            if merged_histogram.total:
+                Q1 = merged_histogram.quantile(0.25)
+                Q3 = merged_histogram.quantile(0.75)
                 IQR = Q3 - Q1
-                valid_values = [v for v in all_frame_values if Q1 - 1.5 * IQR <= v <= Q3 + 1.5 * IQR]
-
-                overall_result = {
-                    "volume_min": min(valid_values),
-                    "volume_max": max(valid_values),
-                    "volume_avg": np.mean(valid_values),
-                    "volume_range": max(valid_values) - min(valid_values),
-                    "frame_values": valid_values,
-                    "coverage_vs_target": sum(-30 <= v <= -10 for v in valid_values) / len(valid_values) * 100
-                }
+                overall_result = merged_histogram.clip(Q1 - 1.5 * IQR, Q3 + 1.5 * IQR).volume_summary()
 
-                overall_scored = calculate_volume_score(overall_result)
+                overall_scores = score_volume_results([overall_result])
+                overall_recommendations = volume_recommendations(overall_result['volume_avg'],
+                                                                 overall_result['coverage_vs_target'],
+                                                                 overall_result['volume_range'])
 
                 st.subheader("📊 Tổng kết chung cho tất cả file")
                 col1, col2, col3, col4 = st.columns(4)
 
                 with col1:
-                    st.metric("📈 Điểm tổng", f"{overall_scored['score']:.1f}/100")
+                    st.metric("📈 Điểm tổng", f"{overall_scores['score'][0]:.1f}/100")
                 with col2:
-                    st.metric("🎯 Xếp loại", overall_scored['grade'].split()[1])
+                    st.metric("🎯 Xếp loại", overall_scores['grade'][0].split()[1])
                 with col3:
-                    st.metric("📊 Coverage", f"{overall_scored['coverage_vs_target']:.1f}%")
+                    st.metric("📊 Coverage", f"{overall_result['coverage_vs_target']:.1f}%")
                 with col4:
-                    st.metric("🔊 Trạng thái", overall_scored['comparison']['user_vs_normal'])
+                    st.metric("🔊 Trạng thái", overall_scores['user_vs_normal'][0])
 
                 # Recommendations
-                if overall_scored['recommendations']:
+                if overall_recommendations:
                     st.subheader("💡 Nhận xét và gợi ý cải thiện")
-                    for rec in overall_scored['recommendations']:
+                    for rec in overall_recommendations:
                         st.info(rec)
 
         # Velocity Results Table (SBF Style)
@@ -434,11 +468,6 @@ def display_batch_results(results):
                     if 'error' in volume:
                         st.error(f"Error: {volume['error']}")
                     else:
-                        # Apply volume scoring if not already applied
-                        if 'score' not in volume:
-                            volume = calculate_volume_score(volume)
-                            result['volume_analysis'] = volume
-
                         st.write(f"- Min/Max/Avg: {volume['volume_min']}/{volume['volume_max']}/{volume['volume_avg']} dBFS")
                         st.write(f"- Range: {volume['volume_range']} dBFS")
                         st.write(f"- Target Coverage: {volume['coverage_vs_target']}%")
@@ -476,7 +505,7 @@ def display_batch_results(results):
                 st.write("**📈 Visualizations:**")
 
                 # Create tabs for different visualizations
-                viz_tab1, viz_tab2, viz_tab3 = st.tabs(["Volume Chart", "Velocity Gauge", "Detailed Metrics"])
+                viz_tab1, viz_tab2, viz_tab3, viz_tab4 = st.tabs(["Volume Chart", "Velocity Gauge", "Detailed Metrics", "Stage Timings"])
 
                 with viz_tab1:
                     # Volume histogram for this file
@@ -502,6 +531,10 @@ def display_batch_results(results):
                     else:
                         st.warning("Velocity metrics not available")
 
+                with viz_tab4:
+                    # Where the time went for this file
+                    show_stage_timings(result)
+
         # Summary visualizations
         st.subheader("📈 Summary Visualizations")
 
@@ -533,11 +566,34 @@ def display_batch_results(results):
                 st.write("**Export Analysis Results**")
                 if st.button("📊 Download Comprehensive Results as CSV"):
                     create_export_csv(successful_analyses)
+                show_columnar_export("volume_velocity", [(r['original_filename'], r) for r in successful_analyses])
         else:
             # Fallback export option
             st.subheader("📥 Export Results")
             if st.button("📊 Download Results as CSV"):
                 create_export_csv(successful_analyses)
+            show_columnar_export("volume_velocity", [(r['original_filename'], r) for r in successful_analyses])
+
+def show_columnar_export(analysis, file_results):
+    """Download button for the batch as Parquet datasets (summary, words, frames)"""
+    if not PYARROW_AVAILABLE:
+        st.caption("Install pyarrow to also download the batch as Parquet datasets.")
+        return
+
+    # Built once per batch result set, not on every rerun of the results page
+    export_key = (analysis, st.session_state.get('batch_results_key'))
+    cached = st.session_state.get('columnar_export')
+    if cached is None or cached[0] != export_key or export_key[1] is None:
+        cached = (export_key, export_batch_zip(analysis, file_results))
+        st.session_state['columnar_export'] = cached
+
+    st.download_button(
+        label="📦 Download Parquet Datasets",
+        data=cached[1],
+        file_name=f"{analysis}_batch_{len(file_results)}_files.zip",
+        mime="application/zip",
+        help="Typed, compressed summary and word/frame-level tables for pandas, Polars, DuckDB or Spark"
+    )
 
 def create_export_csv(results):
     """Create downloadable CSV with all results"""
@@ -590,34 +646,33 @@ def analyze_batch_pause(uploaded_files, silence_db, min_pause_sec):
     status_text = st.empty()
     results = []
 
-    for i, uploaded_file in enumerate(uploaded_files):
+    def analyze_single_file(uploaded_file):
         status_text.text(f"Processing {uploaded_file.name}...")
-        progress_bar.progress((i + 1) / len(uploaded_files))
-
-        try:
-            # Save uploaded file to temporary location
-            with tempfile.NamedTemporaryFile(delete=False, suffix=f".{uploaded_file.name.split('.')[-1]}") as tmp_file:
-                tmp_file.write(uploaded_file.getvalue())
-                temp_path = tmp_file.name
-
-            # Run analysis
-            result = analyze_pause_with_words(temp_path, silence_db=silence_db, min_pause_sec=min_pause_sec)
-
-            # Add filename to result
-            result['original_filename'] = uploaded_file.name
+        return analyze_pause_with_words(_audio_source(uploaded_file), silence_db=silence_db, min_pause_sec=min_pause_sec)
 
-            # Clean up temp file
-            os.unlink(temp_path)
+    def on_progress(completed, total, filename, from_checkpoint):
+        progress_bar.progress(completed / total)
 
-            # Store full result (not just summary)
-            results.append(result)
+    batch_run = run_journaled_batch(
+        get_job_journal(), "pause", {"silence_db": silence_db, "min_pause_sec": min_pause_sec},
+        _journal_items(uploaded_files), analyze_single_file, progress_callback=on_progress,
+        result_store=get_result_store()
+    )
+    _show_resume_info(batch_run)
 
-        except Exception as e:
+    for outcome in batch_run['outcomes']:
+        if outcome['result'] is None:
             results.append({
-                "original_filename": uploaded_file.name,
+                "original_filename": outcome['filename'],
                 "success": False,
-                "error": str(e)
+                "error": outcome['error']
             })
+            continue
+
+        # Store full result (not just summary)
+        result = dict(outcome['result'])
+        result['original_filename'] = outcome['filename']
+        results.append(result)
 
     status_text.text("✅ Batch pause analysis completed!")
     progress_bar.progress(1.0)
@@ -759,6 +814,9 @@ def display_batch_pause_results(results, silence_db, min_pause_sec):
                         st.info(f"**Moderate pause frequency ({pause_ratio:.1f}% of words)** - Some words have pauses, which is normal in conversational speech.")
                     else:
                         st.success(f"**Low pause frequency ({pause_ratio:.1f}% of words)** - Few words have pauses, indicating fluent speech.")
+
+                    st.write("**⏱️ Stage Timings**")
+                    show_stage_timings(result)
             else:
                 with st.expander(f"📄 {filename} ❌"):
                     st.error(f"Analysis failed: {result.get('error', 'Unknown error')}")
@@ -781,6 +839,7 @@ def display_batch_pause_results(results, silence_db, min_pause_sec):
         st.subheader("📥 Export Results")
         if st.button("📊 Download Comprehensive Pause Results CSV"):
             create_pause_export_csv(successful_results)
+        show_columnar_export("pause", [(r['original_filename'], r) for r in successful_results])
 
     else:
         st.error("No successful analyses to display. Please check your files and parameters.")
@@ -841,66 +900,67 @@ def analyze_batch_stretch(uploaded_files, stretch_threshold, transcription_model
     results = []
     detailed_results = []  # Store full analysis results
 
-    for i, uploaded_file in enumerate(uploaded_files):
-        status_text.text(f"Processing {uploaded_file.name}...")
-        progress_bar.progress((i + 1) / len(uploaded_files))
-
-        try:
-            # Save uploaded file to temporary location
-            with tempfile.NamedTemporaryFile(delete=False, suffix=f".{uploaded_file.name.split('.')[-1]}") as tmp_file:
-                tmp_file.write(uploaded_file.getvalue())
-                temp_path = tmp_file.name
-
-            # Run analysis with selected method
-            result = analyze_stretch(temp_path, stretch_threshold=stretch_threshold, model=transcription_model, method=method)
-
-            # Clean up temp file
-            os.unlink(temp_path)
-
-            # Store result
-            if result['success']:
-                # Summary for table
-                results.append({
-                    "File": uploaded_file.name,
-                    "Total Words": result['summary']['total_words'],
-                    "Stretched Words": result['summary']['stretched_words'],
-                    "Stretch %": f"{result['summary']['stretch_percentage']}%",
-                    "Avg Stretch Score": f"{result['summary']['avg_stretch_score']} sec/syl",
-                    "Status": "✅ Success"
-                })
-                # Full result for detailed view
-                detailed_results.append({
-                    "filename": uploaded_file.name,
-                    "result": result,
-                    "success": True
-                })
-            else:
-                results.append({
-                    "File": uploaded_file.name,
-                    "Total Words": 0,
-                    "Stretched Words": 0,
-                    "Stretch %": "N/A",
-                    "Avg Stretch Score": "N/A",
-                    "Status": f"❌ Error: {result.get('error', 'Unknown error')}"
-                })
-                detailed_results.append({
-                    "filename": uploaded_file.name,
-                    "result": result,
-                    "success": False
-                })
+    # Hybrid methods run as a pipeline: API transcripts are fetched ahead while
+    # earlier files are aligned, instead of each file waiting on the network in turn
+    from src.transcribers.deepgram_transcriber import HYBRID_TRANSCRIPT_STAGES
+    from src.transcribers.forcealign_transcriber import warm_up_forcealign
+    prefetch = HYBRID_TRANSCRIPT_STAGES.get(method)
+
+    def analyze_single_file(source, prefetched=None):
+        # Run analysis with selected method (files whose transcript failed never get here)
+        transcript = prefetched["transcript"] if prefetched else None
+        return analyze_stretch(source, stretch_threshold=stretch_threshold, model=transcription_model, method=method,
+                               transcript=transcript)
+
+    def on_progress(completed, total, filename, from_checkpoint):
+        progress_bar.progress(completed / total)
+        status_text.text(f"Processed {filename} ({completed}/{total})")
+
+    items = [(file_hash, filename, _audio_source(uploaded_file))
+             for file_hash, filename, uploaded_file in _journal_items(uploaded_files)]
+    batch_run = run_journaled_batch(
+        get_job_journal(), "stretch",
+        {"stretch_threshold": stretch_threshold, "model": transcription_model, "method": method},
+        items, analyze_single_file, progress_callback=on_progress,
+        result_store=get_result_store(), prefetch=prefetch,
+        warmup=warm_up_forcealign if prefetch else None
+    )
+    _show_resume_info(batch_run)
+
+    for outcome in batch_run['outcomes']:
+        filename = outcome['filename']
+        result = outcome['result']
 
-        except Exception as e:
+        # Store result
+        if result is not None and result['success']:
+            # Summary for table
             results.append({
-                "File": uploaded_file.name,
+                "File": filename,
+                "Total Words": result['summary']['total_words'],
+                "Stretched Words": result['summary']['stretched_words'],
+                "Stretch %": f"{result['summary']['stretch_percentage']}%",
+                "Avg Stretch Score": f"{result['summary']['avg_stretch_score']} sec/syl",
+                "Status": "✅ Success"
+            })
+            # Full result for detailed view
+            detailed_results.append({
+                "filename": filename,
+                "result": result,
+                "success": True
+            })
+        else:
+            error = outcome['error'] or 'Unknown error'
+            results.append({
+                "File": filename,
                 "Total Words": 0,
                 "Stretched Words": 0,
                 "Stretch %": "N/A",
                 "Avg Stretch Score": "N/A",
-                "Status": f"❌ Error: {str(e)}"
+                "Status": f"❌ Error: {error}"
             })
             detailed_results.append({
-                "filename": uploaded_file.name,
-                "result": {"error": str(e)},
+                "filename": filename,
+                "result": result if result is not None else {"error": error},
                 "success": False
             })
 
@@ -923,6 +983,7 @@ def analyze_batch_stretch(uploaded_files, stretch_threshold, transcription_model
         file_name="stretch_batch_summary.csv",
         mime="text/csv"
     )
+    show_columnar_export("stretch", [(d['filename'], d['result']) for d in detailed_results if d['success']])
 
     # Detailed results for each file
     st.markdown("---")
@@ -973,6 +1034,7 @@ def display_individual_stretch_results(filename, result, stretch_threshold):
 
     if len(word_table) > 0:
         # Create interactive plot
+        import plotly.graph_objects as go
         fig = go.Figure()
 
         # Stretched = Green (#4ecdc4), Normal = Red (#ff6b6b)
@@ -1067,5 +1129,9 @@ def display_individual_stretch_results(filename, result, stretch_threshold):
     if result.get('transcript'):
         st.text_area("Full transcript:", result['transcript'], height=100, key=f"transcript_{filename}")
 
+    # Stage timings
+    st.subheader("⏱️ Stage Timings")
+    show_stage_timings(result)
+
 if __name__ == "__main__":
     batch_analyze_page()
\ No newline at end of file
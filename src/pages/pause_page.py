@@ -1,9 +1,9 @@
 import streamlit as st
-import os
-import tempfile
 import pandas as pd
 import base64
-from src.analyzers.pause_word_analyzer import analyze_pause_with_words
+from config import TRIM_SILENCE
+from src.utils.analysis_cache import run_cached_analysis
+from src.utils.visualizations import show_stage_timings
 
 def pause_analysis_page():
     """Streamlit page for pause analysis with dynamic controls."""
@@ -42,6 +42,12 @@ def pause_analysis_page():
         help="Minimum duration for a segment to be classified as a pause"
     )
 
+    trim_silence = st.sidebar.checkbox(
+        "✂️ Trim long silences before transcription",
+        value=TRIM_SILENCE,
+        help="Upload only the speech (silences over TRIM_MIN_SILENCE_SEC are cut); word times are mapped back"
+    )
+
     # File upload
     st.header("📁 Upload Audio File")
     uploaded_file = st.file_uploader(
@@ -59,27 +65,22 @@ def pause_analysis_page():
         params_changed = ('prev_silence_db' not in st.session_state or
                          'prev_min_pause_sec' not in st.session_state or
                          st.session_state['prev_silence_db'] != silence_db or
-                         st.session_state['prev_min_pause_sec'] != min_pause_sec)
+                         st.session_state['prev_min_pause_sec'] != min_pause_sec or
+                         st.session_state.get('prev_trim_silence') != trim_silence)
 
         if file_changed or params_changed or st.button("🔄 Analyze Pauses", type="primary"):
             with st.spinner("Analyzing pauses..."):
                 try:
-                    # Save uploaded file to temporary location
-                    with tempfile.NamedTemporaryFile(delete=False, suffix=f".{uploaded_file.name.split('.')[-1]}") as tmp_file:
-                        tmp_file.write(uploaded_file.getvalue())
-                        temp_path = tmp_file.name
-
-                    # Run pause analysis with current parameters
-                    result = analyze_pause_with_words(temp_path, silence_db=silence_db, min_pause_sec=min_pause_sec)
-
-                    # Clean up temp file
-                    os.unlink(temp_path)
+                    # Run pause analysis with current parameters (cached per file content + parameters)
+                    result = run_cached_analysis("pause", uploaded_file, silence_db=silence_db, min_pause_sec=min_pause_sec,
+                                                 trim_silence=trim_silence)
 
                     # Store results and parameters in session state
                     st.session_state['pause_result'] = result
                     st.session_state['uploaded_file_name'] = uploaded_file.name
                     st.session_state['prev_silence_db'] = silence_db
                     st.session_state['prev_min_pause_sec'] = min_pause_sec
+                    st.session_state['prev_trim_silence'] = trim_silence
 
                     if result['success']:
                         st.success("✅ Pause analysis completed!")
@@ -141,6 +142,10 @@ def pause_analysis_page():
             else:
                 st.success(f"**Low pause frequency ({pause_ratio:.1f}% of words)** - Few words have pauses, indicating fluent speech.")
 
+            # Where the analysis time went
+            with st.expander("⏱️ Stage Timings"):
+                show_stage_timings(result)
+
             # Tips for parameter adjustment
             with st.expander("💡 Tips for Parameter Adjustment"):
                 st.markdown("""
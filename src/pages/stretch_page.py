@@ -1,10 +1,11 @@
 import streamlit as st
 import os
-import tempfile
 import pandas as pd
-import plotly.express as px
-import plotly.graph_objects as go
-from src.analyzers.stretch_analyzer import analyze_stretch, update_stretch_classification, get_stretch_statistics
+from src.analyzers.stretch_analyzer import update_stretch_classification, get_stretch_statistics
+from config import TRIM_SILENCE
+from src.transcribers.registry import STRETCH_METHODS, get_backend, list_backends
+from src.utils.analysis_cache import run_cached_analysis
+from src.utils.visualizations import show_stage_timings
 
 def stretch_analysis_page():
     """Streamlit page for stretch analysis with dynamic controls."""
@@ -32,10 +33,11 @@ def stretch_analysis_page():
 
     analysis_method = st.sidebar.selectbox(
         "Analysis Method",
-        options=["OpenAI Whisper", "ForceAlign", "Whisper + ForceAlign (Hybrid)", "Deepgram + ForceAlign (Hybrid)"],
+        options=list(STRETCH_METHODS),
         index=0,
         help="Choose the method for word-level timing analysis"
     )
+    method = STRETCH_METHODS[analysis_method]
 
     # Show detailed method comparison
     with st.sidebar.expander("📊 Compare Methods"):
@@ -74,16 +76,16 @@ def stretch_analysis_page():
         # Model selection for OpenAI
         transcription_model = st.sidebar.selectbox(
             "Transcription Model",
-            options=["whisper-1", "gpt-4o-transcribe"],
+            options=[backend.name for backend in list_backends() if backend.provider == "openai"],
             index=0,  # Default to whisper-1
             help="whisper-1: Supports word timestamps (required for stretch analysis)\ngpt-4o-transcribe: Better accuracy but no word timestamps"
         )
 
         # Show model info
-        if transcription_model == "gpt-4o-transcribe":
-            st.sidebar.warning("⚠️ GPT-4o-transcribe doesn't support word timestamps. Will auto-switch to whisper-1 for stretch analysis.")
+        if not get_backend(transcription_model).word_timestamps:
+            st.sidebar.warning(f"⚠️ {transcription_model} doesn't return word timestamps. Stretch analysis is routed to an OpenAI model that does.")
         else:
-            st.sidebar.success("✅ Whisper-1 supports word timestamps for stretch analysis.")
+            st.sidebar.success(f"✅ {transcription_model} supports word timestamps for stretch analysis.")
 
     elif analysis_method == "Whisper + ForceAlign (Hybrid)":
         # Whisper+ForceAlign hybrid - needs both OpenAI and ForceAlign
@@ -109,6 +111,32 @@ def stretch_analysis_page():
 
         st.sidebar.info("🎯 Best combo: Whisper accuracy + ForceAlign precision!")
 
+    elif analysis_method == "Deepgram (Native Word Timings)":
+        # Deepgram's own word timings - one API call, no local model
+        transcription_model = None
+
+        if not os.getenv("DEEPGRAM_API_KEY"):
+            st.sidebar.error("❌ Deepgram API Key not found")
+            st.sidebar.info("💡 Set DEEPGRAM_API_KEY in .env file")
+            st.error("❌ Deepgram API Key required for Deepgram method. Please set DEEPGRAM_API_KEY in your .env file.")
+            st.stop()
+        else:
+            st.sidebar.success("✅ Deepgram API Key loaded")
+
+        refine_timings = st.sidebar.checkbox(
+            "🎯 Refine word timing with ForceAlign",
+            value=False,
+            help="Re-time Deepgram's transcript with ForceAlign (slower, runs a local model)"
+        )
+        if refine_timings:
+            if not check_forcealign_availability():
+                st.sidebar.markdown(install_forcealign_instructions())
+                st.error("❌ ForceAlign not available. Please install it with: pip install forcealign")
+                st.stop()
+            method = STRETCH_METHODS["Deepgram + ForceAlign (Hybrid)"]
+        else:
+            st.sidebar.info("⚡ Uses Deepgram's word timestamps directly - no local model inference")
+
     elif analysis_method == "Deepgram + ForceAlign (Hybrid)":
         # Hybrid method - needs both Deepgram and ForceAlign
         transcription_model = None
@@ -132,14 +160,14 @@ def stretch_analysis_page():
             st.error("❌ ForceAlign not available. Please install it with: pip install forcealign")
             st.stop()
 
-        # Check Deepgram SDK
+        # Check Deepgram client
         from src.transcribers.deepgram_transcriber import check_deepgram_availability, install_deepgram_instructions
         if check_deepgram_availability():
-            st.sidebar.success("✅ Deepgram SDK is available")
+            st.sidebar.success("✅ Deepgram client is available")
         else:
-            st.sidebar.error("❌ Deepgram SDK not installed")
+            st.sidebar.error("❌ Deepgram client not installed")
             st.sidebar.markdown(install_deepgram_instructions())
-            st.error("❌ Deepgram SDK not available. Please install it with: pip install deepgram-sdk")
+            st.error("❌ Deepgram client not available. Please install it with: pip install requests")
             st.stop()
 
         st.sidebar.info("🎯 Best of both worlds: Deepgram transcription + ForceAlign timing!")
@@ -168,6 +196,12 @@ def stretch_analysis_page():
         help="Recommended: 0.3-0.4s for normal speech analysis. Words above this threshold are 'Stretched'"
     )
 
+    trim_silence = st.sidebar.checkbox(
+        "✂️ Trim long silences before transcription",
+        value=TRIM_SILENCE,
+        help="Upload only the speech (silences over TRIM_MIN_SILENCE_SEC are cut); word times are mapped back"
+    )
+
     # File upload
     st.header("📁 Upload Audio File")
     uploaded_file = st.file_uploader(
@@ -185,25 +219,9 @@ def stretch_analysis_page():
         if file_changed or st.button("🔄 Analyze Speech Stretch", type="primary"):
             with st.spinner("Transcribing and analyzing speech stretch..."):
                 try:
-                    # Save uploaded file to temporary location
-                    with tempfile.NamedTemporaryFile(delete=False, suffix=f".{uploaded_file.name.split('.')[-1]}") as tmp_file:
-                        tmp_file.write(uploaded_file.getvalue())
-                        temp_path = tmp_file.name
-
                     # Run stretch analysis with selected method and model
-                    if analysis_method == "ForceAlign":
-                        method = "forcealign"
-                    elif analysis_method == "Deepgram + ForceAlign (Hybrid)":
-                        method = "deepgram_forcealign"
-                    elif analysis_method == "Whisper + ForceAlign (Hybrid)":
-                        method = "whisper_forcealign"
-                    else:
-                        method = "openai"
-
-                    result = analyze_stretch(temp_path, stretch_threshold=stretch_threshold, model=transcription_model, method=method)
-
-                    # Clean up temp file
-                    os.unlink(temp_path)
+                    result = run_cached_analysis("stretch", uploaded_file, stretch_threshold=stretch_threshold,
+                                                 model=transcription_model, method=method, trim_silence=trim_silence)
 
                     # Store results in session state
                     st.session_state['stretch_result'] = result
@@ -300,6 +318,7 @@ def stretch_analysis_page():
 
             if len(current_table) > 0:
                 # Create interactive plot with Plotly
+                import plotly.graph_objects as go
                 fig = go.Figure()
 
                 # Color points based on classification
@@ -430,6 +449,10 @@ def stretch_analysis_page():
                     top_stretched = stretched_words.nlargest(5, 'Stretch Score')[['Word', 'Stretch Score', 'Duration', 'Syllables']]
                     st.dataframe(top_stretched, use_container_width=True)
 
+            # Where the analysis time went
+            with st.expander("⏱️ Stage Timings"):
+                show_stage_timings(result)
+
             # Tips for parameter adjustment
             with st.expander("💡 Research-Based Threshold Guide"):
                 st.markdown("""
@@ -0,0 +1 @@
+"""Long-running service modules"""
@@ -0,0 +1,333 @@
+"""
+Journaled batch runner - run an analysis over many files with per-file checkpoints.
+Files completed in an earlier (crashed or interrupted) run, or by any earlier job
+with the same analysis and parameters, are loaded from the journal instead of
+being analyzed again; failed files are retried.
+
+With a `prefetch` stage the batch runs as a two-stage pipeline: prefetch workers
+(e.g. API transcription) feed a bounded queue that the analysis workers (e.g.
+ForceAlign alignment) drain, so network waits and CPU work overlap across files.
+A failed prefetch is retried only for transient errors and otherwise becomes the
+file's result, so the analysis never repeats a paid API call.
+"""
+
+import concurrent.futures
+import os
+import queue
+import threading
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+from config import (MEMORY_REPORT_DIR, PIPELINE_ANALYSIS_WORKERS, PIPELINE_PREFETCH_RETRIES, PIPELINE_PREFETCH_WORKERS,
+                    PIPELINE_QUEUE_SIZE, PIPELINE_RETRY_BACKOFF_SEC)
+from src.services.runners import is_transient_error, result_error, result_succeeded
+from src.storage.job_journal import FILE_DONE, JobJournal
+from src.storage.result_store import ResultStore
+from src.utils import memory_profiling
+
+
+def run_journaled_batch(journal: JobJournal,
+                        analysis: str,
+                        params: Dict[str, Any],
+                        items: List[Tuple[str, str, Any]],
+                        analyze_item: Callable[[Any], Dict[str, Any]],
+                        max_workers: Optional[int] = None,
+                        progress_callback: Optional[Callable[[int, int, str, bool], None]] = None,
+                        result_store: Optional[ResultStore] = None,
+                        prefetch: Optional[Callable[[Any], Any]] = None,
+                        prefetch_workers: int = PIPELINE_PREFETCH_WORKERS,
+                        queue_size: int = PIPELINE_QUEUE_SIZE,
+                        prefetch_retries: int = PIPELINE_PREFETCH_RETRIES,
+                        retry_backoff_sec: float = PIPELINE_RETRY_BACKOFF_SEC,
+                        warmup: Optional[Callable[[], Any]] = None) -> Dict[str, Any]:
+    """
+    Analyze a batch of files, checkpointing every file in the job journal.
+
+    Args:
+        journal: JobJournal used for checkpoints
+        analysis (str): Analysis type name (part of the job identity)
+        params (dict): Analysis parameters (part of the job identity)
+        items: List of (file_hash, filename, payload); payload is passed to analyze_item
+        analyze_item: Callable running the analysis for one payload
+        max_workers (int): Files analyzed concurrently (default 1, or
+            PIPELINE_ANALYSIS_WORKERS with a prefetch stage)
+        progress_callback: Called as (completed, total, filename, from_checkpoint)
+            from the calling thread, so it may safely update UI elements
+        result_store: Optional ResultStore receiving every newly completed result
+        prefetch: Optional first stage run on prefetch_workers threads; its value is
+            passed on as analyze_item(payload, prefetched). If it raises or returns a
+            failed result dict, that failure becomes the file's outcome
+        prefetch_workers (int): Concurrent prefetch calls
+        queue_size (int): Prefetched files that may wait for an analysis worker
+        prefetch_retries (int): Retries of a prefetch failing with a transient error
+        retry_backoff_sec (float): Wait before the first retry (doubled for each further one)
+        warmup: Optional callable loading the analysis stage's models; with a prefetch
+            stage it runs while the first files are fetched, before any analysis starts
+
+    Returns:
+        dict: job_id, resumed flag, skipped count and per-item outcomes in input order.
+        Each outcome has filename, file_hash, result (None on exception), error and from_checkpoint.
+        With memory profiling enabled, also memory_report and memory_report_path
+        (the report is written to MEMORY_REPORT_DIR).
+    """
+    job_id, resumed = journal.open_job(analysis, params, [(file_hash, filename) for file_hash, filename, _ in items])
+    states = journal.file_states(job_id)
+
+    # One analysis per unique content, even if the same file was uploaded twice
+    unique_items = {}
+    for file_hash, filename, payload in items:
+        unique_items.setdefault(file_hash, (filename, payload))
+
+    outcomes_by_hash: Dict[str, Dict[str, Any]] = {}
+    to_run = []
+    total = len(unique_items)
+    completed = 0
+
+    for file_hash, (filename, payload) in unique_items.items():
+        stored = None
+        if states.get(file_hash, {}).get("status") == FILE_DONE:
+            stored = journal.load_result(job_id, file_hash)
+        if stored is None:
+            # Completed by another job with the same analysis and parameters
+            stored = journal.load_completed(file_hash, analysis, params)
+            if stored is not None:
+                journal.mark_done(job_id, file_hash, stored)
+        if stored is not None:
+            outcomes_by_hash[file_hash] = {"result": stored, "error": None, "from_checkpoint": True}
+            completed += 1
+            if progress_callback:
+                progress_callback(completed, total, filename, True)
+            continue
+        to_run.append((file_hash, filename, payload))
+
+    skipped = completed
+
+    filenames = {file_hash: filename for file_hash, (filename, _) in unique_items.items()}
+
+    def fail_one(file_hash: str, result: Optional[Dict[str, Any]], error: str) -> Dict[str, Any]:
+        journal.mark_failed(job_id, file_hash, error)
+        return {"result": result, "error": error, "from_checkpoint": False}
+
+    def run_one(file_hash: str, payload: Any, *prefetched: Any) -> Dict[str, Any]:
+        journal.mark_processing(job_id, file_hash)
+        try:
+            result = analyze_item(payload, *prefetched)
+        except Exception as e:
+            return fail_one(file_hash, None, str(e))
+
+        if result_succeeded(result):
+            journal.mark_done(job_id, file_hash, result)
+            if result_store is not None:
+                result_store.save_result(file_hash, filenames[file_hash], analysis, params, result)
+            return {"result": result, "error": None, "from_checkpoint": False}
+
+        return fail_one(file_hash, result, result_error(result))
+
+    if max_workers is None:
+        max_workers = PIPELINE_ANALYSIS_WORKERS if prefetch is not None else 1
+
+    if prefetch is not None and to_run:
+        stages = _PipelineStages(prefetch, run_one, fail_one, prefetch_retries, retry_backoff_sec, warmup)
+        for file_hash, filename, outcome in _run_pipeline(to_run, stages, prefetch_workers, max_workers, queue_size):
+            outcomes_by_hash[file_hash] = outcome
+            completed += 1
+            if progress_callback:
+                progress_callback(completed, total, filename, False)
+    elif max_workers > 1 and len(to_run) > 1:
+        with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+            future_to_item = {executor.submit(run_one, file_hash, payload): (file_hash, filename)
+                              for file_hash, filename, payload in to_run}
+            for future in concurrent.futures.as_completed(future_to_item):
+                file_hash, filename = future_to_item[future]
+                outcomes_by_hash[file_hash] = future.result()
+                completed += 1
+                if progress_callback:
+                    progress_callback(completed, total, filename, False)
+    else:
+        for file_hash, filename, payload in to_run:
+            outcomes_by_hash[file_hash] = run_one(file_hash, payload)
+            completed += 1
+            if progress_callback:
+                progress_callback(completed, total, filename, False)
+
+    journal.finish_job(job_id)
+
+    outcomes = [
+        dict(outcomes_by_hash[file_hash], filename=filename, file_hash=file_hash)
+        for file_hash, filename, _ in items
+    ]
+    batch = {
+        "job_id": job_id,
+        "resumed": resumed,
+        "skipped": skipped,
+        "outcomes": outcomes
+    }
+    if memory_profiling.is_enabled():
+        report = memory_profiling.batch_memory_report(outcomes)
+        report.update(job_id=job_id, analysis=analysis, params=params)
+        batch["memory_report"] = report
+        batch["memory_report_path"] = memory_profiling.write_memory_report(
+            os.path.join(MEMORY_REPORT_DIR, f"memory_{job_id}.json"), report
+        )
+    return batch
+
+
+_DONE = object()
+
+# Poll interval of pipeline threads waiting on a queue, so they notice a stopped pipeline
+_POLL_SEC = 0.1
+
+
+class _PipelineStages:
+    """The per-file callables of a pipeline and the prefetch retry policy."""
+
+    def __init__(self, prefetch: Callable[[Any], Any], run_one: Callable[..., Dict[str, Any]],
+                 fail_one: Callable[[str, Optional[Dict[str, Any]], str], Dict[str, Any]],
+                 retries: int, backoff_sec: float, warmup: Optional[Callable[[], Any]]):
+        self.prefetch = prefetch
+        self.run_one = run_one
+        self.fail_one = fail_one
+        self.retries = retries
+        self.backoff_sec = backoff_sec
+        self.warmup = warmup
+
+    def fetch(self, filename: str, payload: Any, stop: threading.Event) -> Tuple[bool, Any, Optional[str]]:
+        """
+        Run the prefetch with retries for transient errors.
+
+        Returns:
+            (ok, value, error) - value is the prefetched value, or the failed result
+            dict (None if the prefetch raised)
+        """
+        attempt = 0
+        while True:
+            try:
+                value = self.prefetch(payload)
+            except Exception as e:
+                value, error = None, str(e)
+            else:
+                if not isinstance(value, dict) or result_succeeded(value):
+                    return True, value, None
+                error = result_error(value)
+
+            if attempt >= self.retries or not is_transient_error(error):
+                return False, value, error
+            delay = self.backoff_sec * 2 ** attempt
+            attempt += 1
+            print(f"⚠️ Prefetch failed for {filename} ({error}), retry {attempt}/{self.retries} in {delay:.1f}s")
+            if stop.wait(delay):
+                return False, value, error
+
+
+def _put(q: queue.Queue, item: Any, stop: threading.Event) -> bool:
+    """Put into a bounded queue unless the pipeline stops first."""
+    while not stop.is_set():
+        try:
+            q.put(item, timeout=_POLL_SEC)
+            return True
+        except queue.Full:
+            continue
+    return False
+
+
+def _get(q: queue.Queue, stop: threading.Event) -> Any:
+    """Next queue item, or _DONE once the pipeline stops."""
+    while not stop.is_set():
+        try:
+            return q.get(timeout=_POLL_SEC)
+        except queue.Empty:
+            continue
+    return _DONE
+
+
+def _run_pipeline(to_run: List[Tuple[str, str, Any]],
+                  stages: _PipelineStages,
+                  prefetch_workers: int,
+                  analysis_workers: int,
+                  queue_size: int) -> Iterator[Tuple[str, str, Dict[str, Any]]]:
+    """
+    Run prefetch -> bounded queue -> run_one over the items, yielding
+    (file_hash, filename, outcome) in completion order on the calling thread.
+    Prefetch workers block while the queue is full, so at most queue_size files
+    are fetched ahead of the analysis workers. Files whose prefetch failed skip the
+    queue. Every thread is joined before this returns or raises.
+    """
+    pending = queue.Queue()
+    for item in to_run:
+        pending.put(item)
+    ready = queue.Queue(maxsize=max(1, queue_size))
+    finished = queue.Queue()
+    stop = threading.Event()
+    warmed = threading.Event()
+
+    def warm():
+        try:
+            stages.warmup()
+        except Exception as e:
+            print(f"⚠️ Warm-up failed, the first analysis loads its models itself: {e}")
+        finally:
+            warmed.set()
+
+    def fetch():
+        while not stop.is_set():
+            try:
+                file_hash, filename, payload = pending.get_nowait()
+            except queue.Empty:
+                return
+            ok, value, error = stages.fetch(filename, payload, stop)
+            if ok:
+                if not _put(ready, (file_hash, filename, payload, value), stop):
+                    return
+                continue
+            try:
+                finished.put((file_hash, filename, stages.fail_one(file_hash, value, error)))
+            except Exception as e:
+                finished.put((file_hash, filename, e))
+
+    def analyze():
+        while not warmed.wait(_POLL_SEC):
+            if stop.is_set():
+                return
+        while True:
+            item = _get(ready, stop)
+            if item is _DONE:
+                return
+            file_hash, filename, payload, prefetched = item
+            try:
+                finished.put((file_hash, filename, stages.run_one(file_hash, payload, prefetched)))
+            except Exception as e:
+                # Journal/store failures are re-raised on the calling thread
+                finished.put((file_hash, filename, e))
+
+    fetchers = [threading.Thread(target=fetch, name=f"batch-prefetch-{i}", daemon=True)
+                for i in range(max(1, min(prefetch_workers, len(to_run))))]
+    analyzers = [threading.Thread(target=analyze, name=f"batch-analyze-{i}", daemon=True)
+                 for i in range(max(1, min(analysis_workers, len(to_run))))]
+    threads = []
+    if stages.warmup is not None:
+        threads.append(threading.Thread(target=warm, name="batch-warmup", daemon=True))
+    else:
+        warmed.set()
+
+    def close_queue():
+        for thread in fetchers:
+            thread.join()
+        for _ in analyzers:
+            if not _put(ready, _DONE, stop):
+                return
+
+    # The closer joins the fetchers, so it must start after them
+    threads += fetchers + analyzers + [threading.Thread(target=close_queue, name="batch-prefetch-close", daemon=True)]
+    for thread in threads:
+        thread.start()
+
+    try:
+        for _ in to_run:
+            file_hash, filename, outcome = finished.get()
+            if isinstance(outcome, Exception):
+                raise outcome
+            yield file_hash, filename, outcome
+    finally:
+        # Also reached when a stage raises or the caller stops iterating
+        stop.set()
+        for thread in threads:
+            thread.join()
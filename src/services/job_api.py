@@ -0,0 +1,235 @@
+"""
+Local HTTP job API in front of the analyzers.
+
+Endpoints:
+    POST /jobs?analysis=<type>&filename=<name>&<param>=<value>   body: raw audio bytes
+         -> 202 {"job_id": ..., "status": "queued"}
+         -> 503 when max_pending jobs are already waiting (retry later)
+    GET  /jobs/<job_id>          -> job status
+    GET  /jobs/<job_id>/result   -> analysis result (409 until the job has finished)
+    GET  /health                 -> worker and resource status
+
+Jobs run on one shared worker pool; heavy resources are loaded once at startup.
+"""
+
+import json
+import os
+import threading
+import time
+import uuid
+import concurrent.futures
+from collections import OrderedDict
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, Optional
+from urllib.parse import parse_qsl, urlparse
+
+from config import JOB_API_MAX_FINISHED_JOBS, JOB_API_MAX_PENDING, JOB_API_MAX_UPLOAD_MB, JOB_API_WORKERS
+from src.services.runners import ANALYSIS_RUNNERS, parse_analysis_params, result_error, result_succeeded
+from src.utils.audio_input import AudioSource
+from src.utils.serialization import to_jsonable
+
+JOB_QUEUED = "queued"
+JOB_RUNNING = "running"
+JOB_SUCCEEDED = "succeeded"
+JOB_FAILED = "failed"
+
+# Seconds a client is asked to wait after a 503
+RETRY_AFTER_SECONDS = 5
+
+
+class QueueFullError(Exception):
+    """Raised by JobManager.submit when max_pending jobs are already queued."""
+
+
+class JobManager:
+    """
+    Track analysis jobs and run them on a shared thread pool. A queued job holds
+    its upload in memory, so at most `max_pending` jobs may wait for a worker.
+    """
+
+    def __init__(self, max_workers: int = JOB_API_WORKERS, max_finished_jobs: int = JOB_API_MAX_FINISHED_JOBS,
+                 max_pending: int = JOB_API_MAX_PENDING):
+        self.max_workers = max_workers
+        self.max_finished_jobs = max_finished_jobs
+        self.max_pending = max_pending
+        self._pending = 0
+        self._executor = concurrent.futures.ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="job-api")
+        self._jobs: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.resources: Dict[str, bool] = {}
+
+    def submit(self, analysis: str, audio_bytes: bytes, filename: str, params: Dict[str, Any]) -> str:
+        """
+        Queue a job and return its id.
+
+        Raises:
+            QueueFullError: max_pending jobs are already waiting for a worker
+        """
+        job_id = uuid.uuid4().hex
+        job = {
+            "job_id": job_id,
+            "analysis": analysis,
+            "filename": filename,
+            "parameters": params,
+            "status": JOB_QUEUED,
+            "submitted_at": time.time(),
+            "started_at": None,
+            "finished_at": None,
+            "error": None,
+            "result": None
+        }
+        with self._lock:
+            if self._pending >= self.max_pending:
+                raise QueueFullError(f"{self._pending} jobs are already queued; retry later")
+            self._pending += 1
+            self._jobs[job_id] = job
+            self._evict_finished()
+
+        self._executor.submit(self._run_job, job, audio_bytes)
+        return job_id
+
+    def _run_job(self, job: Dict[str, Any], audio_bytes: bytes):
+        with self._lock:
+            self._pending -= 1
+        job["status"] = JOB_RUNNING
+        job["started_at"] = time.time()
+
+        try:
+            # Analyzed from memory; the file name carries the format hint
+            source = AudioSource(data=audio_bytes, name=job["filename"])
+            result = ANALYSIS_RUNNERS[job["analysis"]](source, **job["parameters"])
+            job["result"] = to_jsonable(result)
+            if result_succeeded(result):
+                job["status"] = JOB_SUCCEEDED
+            else:
+                job["status"] = JOB_FAILED
+                job["error"] = result_error(result)
+
+        except Exception as e:
+            job["status"] = JOB_FAILED
+            job["error"] = str(e)
+        finally:
+            job["finished_at"] = time.time()
+
+    def _evict_finished(self):
+        """Drop the oldest finished jobs so memory stays bounded on long-running servers."""
+        finished = [job_id for job_id, job in self._jobs.items() if job["status"] in (JOB_SUCCEEDED, JOB_FAILED)]
+        for job_id in finished[:max(0, len(finished) - self.max_finished_jobs)]:
+            del self._jobs[job_id]
+
+    def get(self, job_id: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            return self._jobs.get(job_id)
+
+    def status(self, job_id: str) -> Optional[Dict[str, Any]]:
+        job = self.get(job_id)
+        if job is None:
+            return None
+        return {key: value for key, value in job.items() if key != "result"}
+
+    def counts(self) -> Dict[str, int]:
+        with self._lock:
+            counts = {JOB_QUEUED: 0, JOB_RUNNING: 0, JOB_SUCCEEDED: 0, JOB_FAILED: 0}
+            for job in self._jobs.values():
+                counts[job["status"]] += 1
+            return counts
+
+    def shutdown(self, wait: bool = True):
+        self._executor.shutdown(wait=wait)
+
+
+class JobAPIHandler(BaseHTTPRequestHandler):
+    """Request handler; the JobManager is reached through `self.server.job_manager`."""
+
+    server_version = "SpeechAnalyticsJobAPI/1.0"
+
+    def _send_json(self, status: int, payload: Dict[str, Any], headers: Optional[Dict[str, str]] = None):
+        body = json.dumps(payload, ensure_ascii=False, default=str).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_POST(self):
+        url = urlparse(self.path)
+        if url.path.rstrip("/") != "/jobs":
+            self._send_json(404, {"error": "Not found"})
+            return
+
+        query = dict(parse_qsl(url.query))
+        analysis = query.pop("analysis", "volume_velocity")
+        filename = query.pop("filename", None) or self.headers.get("X-Filename") or "upload.wav"
+
+        try:
+            params = parse_analysis_params(analysis, query)
+        except ValueError as e:
+            self._send_json(400, {"error": str(e)})
+            return
+
+        length = int(self.headers.get("Content-Length") or 0)
+        if length <= 0:
+            self._send_json(400, {"error": "Request body must contain the audio file"})
+            return
+        if length > JOB_API_MAX_UPLOAD_MB * 1024 * 1024:
+            self._send_json(413, {"error": f"Audio file exceeds {JOB_API_MAX_UPLOAD_MB} MB limit"})
+            return
+
+        audio_bytes = self.rfile.read(length)
+        try:
+            job_id = self.server.job_manager.submit(analysis, audio_bytes, os.path.basename(filename), params)
+        except QueueFullError as e:
+            self._send_json(503, {"error": str(e)}, headers={"Retry-After": str(RETRY_AFTER_SECONDS)})
+            return
+        self._send_json(202, {"job_id": job_id, "status": JOB_QUEUED})
+
+    def do_GET(self):
+        parts = [part for part in urlparse(self.path).path.split("/") if part]
+        manager = self.server.job_manager
+
+        if parts == ["health"]:
+            self._send_json(200, {
+                "status": "ok",
+                "workers": manager.max_workers,
+                "max_pending": manager.max_pending,
+                "jobs": manager.counts(),
+                "resources": manager.resources,
+                "analyses": sorted(ANALYSIS_RUNNERS)
+            })
+            return
+
+        if len(parts) in (2, 3) and parts[0] == "jobs":
+            job = manager.get(parts[1])
+            if job is None:
+                self._send_json(404, {"error": f"Unknown job: {parts[1]}"})
+                return
+
+            if len(parts) == 2:
+                self._send_json(200, manager.status(parts[1]))
+                return
+
+            if parts[2] == "result":
+                if job["status"] in (JOB_QUEUED, JOB_RUNNING):
+                    self._send_json(409, {"error": "Job has not finished", "status": job["status"]})
+                else:
+                    self._send_json(200, {
+                        "job_id": job["job_id"],
+                        "status": job["status"],
+                        "error": job["error"],
+                        "result": job["result"]
+                    })
+                return
+
+        self._send_json(404, {"error": "Not found"})
+
+    def log_message(self, format, *args):
+        print(f"🌐 {self.address_string()} - {format % args}")
+
+
+def create_server(host: str, port: int, job_manager: JobManager) -> ThreadingHTTPServer:
+    """Create (but do not start) the HTTP server bound to a job manager."""
+    server = ThreadingHTTPServer((host, port), JobAPIHandler)
+    server.job_manager = job_manager
+    return server
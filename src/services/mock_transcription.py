@@ -0,0 +1,285 @@
+"""
+Local mock transcription server for offline load and throughput testing.
+
+Speaks the subset of the two vendor APIs our transcribers use:
+    POST /v1/audio/transcriptions   OpenAI (multipart form, verbose_json with word timestamps)
+    POST /v1/listen                 Deepgram prerecorded (raw audio body)
+    GET  /health, GET /stats        server status and request counters
+
+Word timestamps are deterministic for a given audio file (WAV files get words
+placed around their actual silences). Latency, 429 rate limiting and 5xx failures
+are simulated from a seeded MockProfile.
+
+Point the app at it with OPENAI_BASE_URL=http://127.0.0.1:<port>/v1 and
+DEEPGRAM_BASE_URL=http://127.0.0.1:<port>.
+"""
+
+import email
+import email.policy
+import io
+import json
+import random
+import threading
+import time
+import uuid
+import wave
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import urlparse
+
+import numpy as np
+
+from src.utils.synthetic_audio import synthetic_words
+
+# Assumed byte rate for non-WAV uploads (~128 kbps compressed audio)
+FALLBACK_BYTES_PER_SECOND = 16000
+
+
+class MockProfile:
+    """Simulated vendor behaviour: latency distribution, rate limiting and failures."""
+
+    def __init__(self,
+                 latency_ms: float = 300.0,
+                 latency_sigma: float = 0.4,
+                 per_audio_second_ms: float = 20.0,
+                 rate_limit_prob: float = 0.0,
+                 failure_prob: float = 0.0,
+                 max_concurrent: Optional[int] = None,
+                 seed: int = 0):
+        """
+        Args:
+            latency_ms (float): Median fixed latency per request
+            latency_sigma (float): Log-normal spread of the latency (0 = constant)
+            per_audio_second_ms (float): Extra processing time per second of audio
+            rate_limit_prob (float): Probability of a random 429
+            failure_prob (float): Probability of a 500
+            max_concurrent (int): In-flight requests above this get 429 (None = unlimited)
+            seed (int): Seed for the latency/failure random stream
+        """
+        self.latency_ms = latency_ms
+        self.latency_sigma = latency_sigma
+        self.per_audio_second_ms = per_audio_second_ms
+        self.rate_limit_prob = rate_limit_prob
+        self.failure_prob = failure_prob
+        self.max_concurrent = max_concurrent
+        self.seed = seed
+
+
+def estimate_audio(audio_bytes: bytes, min_silence_sec: float = 0.3) -> Tuple[float, List[Tuple[float, float]]]:
+    """Duration and silent spans of an upload (exact for PCM WAV, estimated otherwise)."""
+    try:
+        with wave.open(io.BytesIO(audio_bytes), "rb") as wav_file:
+            sample_rate = wav_file.getframerate()
+            channels = wav_file.getnchannels()
+            sample_width = wav_file.getsampwidth()
+            frames = wav_file.readframes(wav_file.getnframes())
+    except (wave.Error, EOFError):
+        return len(audio_bytes) / FALLBACK_BYTES_PER_SECOND, []
+
+    if sample_width != 2 or sample_rate <= 0:
+        return len(frames) / max(1, sample_rate * channels * sample_width), []
+
+    samples = np.frombuffer(frames, dtype="<i2").reshape(-1, channels).mean(axis=1)
+    duration = len(samples) / sample_rate
+
+    # 20 ms frames below -50 dBFS count as silence
+    hop = max(1, int(0.02 * sample_rate))
+    usable = len(samples) // hop * hop
+    rms = np.sqrt(np.mean(np.square(samples[:usable].reshape(-1, hop)), axis=1)) / 32768
+    silent = rms < 10 ** (-50 / 20)
+
+    silences = []
+    start = None
+    for i, is_silent in enumerate(np.append(silent, False)):
+        if is_silent and start is None:
+            start = i
+        elif not is_silent and start is not None:
+            if (i - start) * hop / sample_rate >= min_silence_sec:
+                silences.append((start * hop / sample_rate, i * hop / sample_rate))
+            start = None
+    return duration, silences
+
+
+def mock_words(audio_bytes: bytes) -> Tuple[float, List[Dict[str, Any]]]:
+    """Deterministic word timestamps for an upload."""
+    duration, silences = estimate_audio(audio_bytes)
+    return duration, synthetic_words(duration, silences)
+
+
+class MockTranscriptionHandler(BaseHTTPRequestHandler):
+    """Request handler; shared state lives on `self.server` (profile, stats, rng)."""
+
+    server_version = "MockTranscription/1.0"
+    protocol_version = "HTTP/1.1"
+
+    def _send_json(self, status: int, payload: Dict[str, Any], headers: Optional[Dict[str, str]] = None):
+        body = json.dumps(payload).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _read_body(self) -> bytes:
+        length = int(self.headers.get("Content-Length") or 0)
+        return self.rfile.read(length) if length > 0 else b""
+
+    def do_GET(self):
+        path = urlparse(self.path).path.rstrip("/")
+        if path == "/health":
+            self._send_json(200, {"status": "ok"})
+        elif path == "/stats":
+            self._send_json(200, self.server.snapshot_stats())
+        else:
+            self._send_json(404, {"error": "Not found"})
+
+    def do_POST(self):
+        path = urlparse(self.path).path.rstrip("/")
+        body = self._read_body()
+
+        if path == "/v1/audio/transcriptions":
+            vendor = "openai"
+            form = _parse_multipart(self.headers.get("Content-Type", ""), body)
+            audio_bytes = form.get("file", b"")
+        elif path == "/v1/listen":
+            vendor = "deepgram"
+            audio_bytes = body
+        else:
+            self._send_json(404, {"error": "Not found"})
+            return
+
+        self.server.begin_request()
+        try:
+            duration, words = mock_words(audio_bytes)
+            outcome = self.server.decide_outcome()
+            # Rejected requests come back without the per-audio processing time
+            time.sleep(self.server.sample_latency(duration if outcome == 200 else 0.0))
+
+            if outcome == 429:
+                self.server.record("rate_limited")
+                self._send_error(vendor, 429, "Rate limit exceeded (mock)", {"Retry-After": "1"})
+            elif outcome == 500:
+                self.server.record("failed")
+                self._send_error(vendor, 500, "Internal error (mock)")
+            else:
+                self.server.record("succeeded")
+                if vendor == "openai":
+                    self._send_json(200, _openai_response(form, duration, words))
+                else:
+                    self._send_json(200, _deepgram_response(duration, words))
+        finally:
+            self.server.end_request()
+
+    def _send_error(self, vendor: str, status: int, message: str, headers: Optional[Dict[str, str]] = None):
+        if vendor == "openai":
+            error_type = "rate_limit_error" if status == 429 else "server_error"
+            payload = {"error": {"message": message, "type": error_type, "code": status}}
+        else:
+            payload = {"err_code": "TOO_MANY_REQUESTS" if status == 429 else "INTERNAL_SERVER_ERROR",
+                       "err_msg": message, "request_id": uuid.uuid4().hex}
+        self._send_json(status, payload, headers)
+
+    def log_message(self, format, *args):
+        if self.server.verbose:
+            print(f"🧪 {self.address_string()} - {format % args}")
+
+
+def _parse_multipart(content_type: str, body: bytes) -> Dict[str, Any]:
+    """Minimal multipart/form-data parser: text fields as str, file fields as bytes."""
+    message = email.message_from_bytes(
+        f"Content-Type: {content_type}\r\n\r\n".encode("latin-1") + body,
+        policy=email.policy.HTTP
+    )
+    fields: Dict[str, Any] = {}
+    if not message.is_multipart():
+        return fields
+    for part in message.iter_parts():
+        name = part.get_param("name", header="content-disposition")
+        if not name:
+            continue
+        payload = part.get_payload(decode=True) or b""
+        if part.get_filename():
+            fields[name] = payload
+        else:
+            fields.setdefault(name, payload.decode("utf-8", errors="replace"))
+    return fields
+
+
+def _openai_response(form: Dict[str, Any], duration: float, words: List[Dict[str, Any]]) -> Dict[str, Any]:
+    text = " ".join(w["word"] for w in words)
+    response = {"task": "transcribe", "language": form.get("language", "english"), "duration": round(duration, 3), "text": text}
+    if form.get("response_format", "json") == "verbose_json":
+        response["words"] = words
+        response["segments"] = []
+    return response
+
+
+def _deepgram_response(duration: float, words: List[Dict[str, Any]]) -> Dict[str, Any]:
+    text = " ".join(w["word"] for w in words)
+    return {
+        "metadata": {"request_id": uuid.uuid4().hex, "duration": round(duration, 3), "channels": 1, "models": ["mock"]},
+        "results": {"channels": [{"alternatives": [{
+            "transcript": text,
+            "confidence": 0.99,
+            "words": [dict(w, confidence=0.99, punctuated_word=w["word"]) for w in words]
+        }]}]}
+    }
+
+
+class MockTranscriptionServer(ThreadingHTTPServer):
+    """Threaded HTTP server holding the mock profile and request counters."""
+
+    daemon_threads = True
+
+    def __init__(self, address, profile: MockProfile, verbose: bool = False):
+        super().__init__(address, MockTranscriptionHandler)
+        self.profile = profile
+        self.verbose = verbose
+        self._rng = random.Random(profile.seed)
+        self._lock = threading.Lock()
+        self._in_flight = 0
+        self._stats = {"requests": 0, "succeeded": 0, "rate_limited": 0, "failed": 0, "peak_in_flight": 0}
+
+    def begin_request(self):
+        with self._lock:
+            self._in_flight += 1
+            self._stats["requests"] += 1
+            self._stats["peak_in_flight"] = max(self._stats["peak_in_flight"], self._in_flight)
+
+    def end_request(self):
+        with self._lock:
+            self._in_flight -= 1
+
+    def record(self, outcome: str):
+        with self._lock:
+            self._stats[outcome] += 1
+
+    def decide_outcome(self) -> int:
+        profile = self.profile
+        with self._lock:
+            if profile.max_concurrent is not None and self._in_flight > profile.max_concurrent:
+                return 429
+            roll = self._rng.random()
+        if roll < profile.rate_limit_prob:
+            return 429
+        if roll < profile.rate_limit_prob + profile.failure_prob:
+            return 500
+        return 200
+
+    def sample_latency(self, audio_duration: float) -> float:
+        """Seconds to wait for this request."""
+        profile = self.profile
+        with self._lock:
+            factor = self._rng.lognormvariate(0.0, profile.latency_sigma) if profile.latency_sigma > 0 else 1.0
+        return (profile.latency_ms * factor + profile.per_audio_second_ms * audio_duration) / 1000
+
+    def snapshot_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return dict(self._stats, in_flight=self._in_flight)
+
+
+def create_mock_server(host: str, port: int, profile: Optional[MockProfile] = None, verbose: bool = False) -> MockTranscriptionServer:
+    """Create (but do not start) the mock server; port 0 picks a free port."""
+    return MockTranscriptionServer((host, port), profile or MockProfile(), verbose=verbose)
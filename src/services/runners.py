@@ -0,0 +1,97 @@
+"""
+Analysis runners shared by the background services.
+Each runner takes a file path plus keyword parameters and returns the analyzer's result dict.
+"""
+
+import re
+from typing import Any, Callable, Dict
+
+
+def _run_volume_velocity(file_path: str, **params) -> Dict[str, Any]:
+    from src.audio_analyzer import analyze_audio_file
+    return analyze_audio_file(file_path, **params)
+
+
+def _run_pause(file_path: str, silence_db: float = -38.0, min_pause_sec: float = 0.5, **params) -> Dict[str, Any]:
+    from src.analyzers.pause_word_analyzer import analyze_pause_with_words
+    return analyze_pause_with_words(file_path, silence_db=silence_db, min_pause_sec=min_pause_sec, **params)
+
+
+def _run_stretch(file_path: str, stretch_threshold: float = 0.38, model: str = None, method: str = "openai",
+                 **params) -> Dict[str, Any]:
+    from src.analyzers.stretch_analyzer import analyze_stretch
+    return analyze_stretch(file_path, stretch_threshold=stretch_threshold, model=model, method=method, **params)
+
+
+ANALYSIS_RUNNERS: Dict[str, Callable[..., Dict[str, Any]]] = {
+    "volume_velocity": _run_volume_velocity,
+    "pause": _run_pause,
+    "stretch": _run_stretch,
+}
+
+
+def result_succeeded(result: Dict[str, Any]) -> bool:
+    """Normalize the different success flags used by the analyzers."""
+    if "analysis_status" in result:
+        return result["analysis_status"]["overall_success"]
+    return result.get("success", "error" not in result)
+
+
+def result_error(result: Dict[str, Any]) -> str:
+    if "analysis_status" in result:
+        errors = [result[key]["error"] for key in ("volume_analysis", "velocity_analysis") if "error" in result[key]]
+        return "; ".join(errors) or "Unknown error"
+    return result.get("error", "Unknown error")
+
+
+# HTTP 408/429/5xx, timeouts and dropped connections may succeed on retry;
+# bad input, authentication and size errors will not
+_TRANSIENT_ERROR = re.compile(
+    r"\b(?:HTTP|Error code:?)\s*(?:408|429|5\d\d)\b|timed out|timeout|connection|rate limit|"
+    r"temporarily unavailable|overloaded",
+    re.IGNORECASE
+)
+
+
+def is_transient_error(error: str) -> bool:
+    """Whether an error message describes a failure worth retrying."""
+    return bool(_TRANSIENT_ERROR.search(error or ""))
+
+
+def _parse_bool(value: str) -> bool:
+    if isinstance(value, bool):
+        return value
+    lowered = str(value).lower()
+    if lowered not in ("1", "true", "yes", "0", "false", "no"):
+        raise ValueError(f"Not a boolean: {value}")
+    return lowered in ("1", "true", "yes")
+
+
+# Accepted keyword parameters per analysis type, with the function used to parse them
+ANALYSIS_PARAM_TYPES: Dict[str, Dict[str, Callable[[str], Any]]] = {
+    "volume_velocity": {"trim_silence": _parse_bool},
+    "pause": {"silence_db": float, "min_pause_sec": float, "trim_silence": _parse_bool},
+    "stretch": {"stretch_threshold": float, "model": str, "method": str, "trim_silence": _parse_bool},
+}
+
+
+def parse_analysis_params(analysis: str, raw_params: Dict[str, str]) -> Dict[str, Any]:
+    """
+    Validate and convert string parameters (e.g. from a query string).
+
+    Raises:
+        ValueError: Unknown analysis type, unknown parameter or bad value
+    """
+    if analysis not in ANALYSIS_RUNNERS:
+        raise ValueError(f"Unknown analysis type: {analysis}. Choose from {sorted(ANALYSIS_RUNNERS)}")
+
+    allowed = ANALYSIS_PARAM_TYPES[analysis]
+    params = {}
+    for name, value in raw_params.items():
+        if name not in allowed:
+            raise ValueError(f"Unknown parameter for {analysis} analysis: {name}")
+        try:
+            params[name] = allowed[name](value)
+        except (TypeError, ValueError):
+            raise ValueError(f"Invalid value for {name}: {value}")
+    return params
@@ -0,0 +1,220 @@
+"""
+Watch-folder daemon for continuous ingestion.
+Polls a directory, waits until new recordings stop changing, and analyzes them
+on a bounded worker pool. Progress is kept in an SQLite ledger so a restart
+never redoes files that already completed with the same parameters, and failed
+files are retried with backoff instead of on every poll.
+"""
+
+import os
+import threading
+import time
+import concurrent.futures
+from typing import Any, Callable, Dict, Optional
+
+from config import (
+    INGEST_DB_PATH,
+    WATCH_MAX_ATTEMPTS,
+    WATCH_MAX_PENDING,
+    WATCH_MAX_WORKERS,
+    WATCH_POLL_SECONDS,
+    WATCH_RETRY_BACKOFF_SEC,
+    WATCH_SETTLE_SECONDS,
+)
+from src.services.runners import ANALYSIS_RUNNERS, result_error, result_succeeded
+from src.storage.ingest_ledger import IngestLedger, STATUS_DONE, STATUS_FAILED
+from src.storage.result_store import ResultStore, get_result_store, params_hash
+from src.utils.hashing import file_sha256
+
+AUDIO_EXTENSIONS = ('.wav', '.mp3', '.m4a', '.flac')
+
+
+class WatchFolderDaemon:
+    """
+    Poll a directory and analyze finished audio files with bounded concurrency.
+
+    A file is considered finished once its size and mtime stay unchanged for
+    `settle_seconds`. At most `max_workers + max_pending` files are queued at
+    once; anything beyond that stays on disk and is picked up by later scans,
+    so a burst of hundreds of files never spawns unbounded work. A failed file
+    waits `retry_backoff_sec` (doubled after each failure) before it is tried
+    again, up to `max_attempts` times.
+    """
+
+    def __init__(self,
+                 watch_dir: str,
+                 analysis: str = "volume_velocity",
+                 analysis_params: Optional[Dict[str, Any]] = None,
+                 db_path: str = INGEST_DB_PATH,
+                 max_workers: int = WATCH_MAX_WORKERS,
+                 max_pending: int = WATCH_MAX_PENDING,
+                 poll_seconds: float = WATCH_POLL_SECONDS,
+                 settle_seconds: float = WATCH_SETTLE_SECONDS,
+                 max_attempts: int = WATCH_MAX_ATTEMPTS,
+                 retry_backoff_sec: float = WATCH_RETRY_BACKOFF_SEC,
+                 runner: Optional[Callable[..., Dict[str, Any]]] = None,
+                 result_store: Optional[ResultStore] = None):
+        if runner is None and analysis not in ANALYSIS_RUNNERS:
+            raise ValueError(f"Unknown analysis type: {analysis}. Choose from {sorted(ANALYSIS_RUNNERS)}")
+
+        self.watch_dir = watch_dir
+        self.analysis = analysis
+        self.analysis_params = analysis_params or {}
+        self.params_key = params_hash(self.analysis_params)
+        self.poll_seconds = poll_seconds
+        self.settle_seconds = settle_seconds
+        self.max_attempts = max_attempts
+        self.retry_backoff_sec = retry_backoff_sec
+        self.runner = runner or ANALYSIS_RUNNERS[analysis]
+
+        self.ledger = IngestLedger(db_path)
+        self.result_store = result_store if result_store is not None else get_result_store()
+        self._executor = concurrent.futures.ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="watch-folder")
+        self._slots = threading.BoundedSemaphore(max_workers + max_pending)
+        self._state_lock = threading.Lock()
+        self._stop_event = threading.Event()
+
+        # path -> ((size, mtime), time the signature was first seen)
+        self._observed: Dict[str, tuple] = {}
+        # path -> signature of files that need no further work this session
+        self._settled: Dict[str, tuple] = {}
+        # path -> (signature, retry time) of failed files waiting out their backoff
+        self._backoff: Dict[str, tuple] = {}
+        self._in_flight = set()
+
+    def scan_once(self) -> int:
+        """Scan the directory once and queue finished files. Returns the number queued."""
+        now = time.time()
+        seen = set()
+        queued = 0
+
+        with os.scandir(self.watch_dir) as entries:
+            for entry in sorted(entries, key=lambda e: e.name):
+                if entry.name.startswith('.') or not entry.name.lower().endswith(AUDIO_EXTENSIONS):
+                    continue
+                if not entry.is_file():
+                    continue
+
+                path = entry.path
+                seen.add(path)
+                stat = entry.stat()
+                signature = (stat.st_size, stat.st_mtime)
+
+                with self._state_lock:
+                    if path in self._in_flight or self._settled.get(path) == signature:
+                        continue
+                    backoff = self._backoff.get(path)
+                    if backoff and backoff[0] == signature and now < backoff[1]:
+                        continue
+
+                previous = self._observed.get(path)
+                if previous is None or previous[0] != signature:
+                    # New or still being written - wait for it to settle
+                    self._observed[path] = (signature, now)
+                    continue
+                if now - previous[1] < self.settle_seconds or stat.st_size == 0:
+                    continue
+
+                if self.ledger.is_done_signature(path, stat.st_size, stat.st_mtime, self.analysis, self.params_key):
+                    with self._state_lock:
+                        self._settled[path] = signature
+                    continue
+
+                # Backpressure: leave the file on disk until a slot frees up
+                if not self._slots.acquire(blocking=False):
+                    continue
+
+                with self._state_lock:
+                    self._in_flight.add(path)
+                self._executor.submit(self._process_file, path, signature)
+                queued += 1
+
+        for path in list(self._observed):
+            if path not in seen:
+                del self._observed[path]
+                with self._state_lock:
+                    self._backoff.pop(path, None)
+
+        return queued
+
+    def _retry_at(self, attempts: int, last_attempt_at: float) -> float:
+        return last_attempt_at + self.retry_backoff_sec * 2 ** (attempts - 1)
+
+    def _process_file(self, path: str, signature: tuple):
+        size, mtime = signature
+        settled = False
+        retry_at = None
+        sha256 = None
+        try:
+            sha256 = file_sha256(path)
+            entry = self.ledger.get_entry(sha256, self.analysis, self.params_key)
+
+            if entry and entry["status"] == STATUS_DONE:
+                print(f"⏭️ Already analyzed (same content): {path}")
+                settled = True
+                return
+            attempts = entry["attempts"] if entry else 0
+            if entry and entry["status"] == STATUS_FAILED:
+                if attempts >= self.max_attempts:
+                    settled = True
+                    return
+                retry_at = self._retry_at(attempts, entry["last_attempt_at"] or 0.0)
+                if time.time() < retry_at:
+                    return
+
+            started = time.time()
+            retry_at = self._retry_at(attempts + 1, started)
+            self.ledger.mark_processing(sha256, self.analysis, self.params_key, path, size, mtime)
+            print(f"🔄 Analyzing: {path}")
+            result = self.runner(path, **self.analysis_params)
+
+            if result_succeeded(result):
+                self.ledger.mark_done(sha256, self.analysis, self.params_key, result)
+                self.result_store.save_result(sha256, os.path.basename(path), self.analysis, self.analysis_params, result)
+                print(f"✅ Completed: {path}")
+                settled = True
+            else:
+                self.ledger.mark_failed(sha256, self.analysis, self.params_key, result_error(result))
+                print(f"❌ Failed: {path} - {result_error(result)}")
+
+        except Exception as e:
+            print(f"❌ Error processing {path}: {str(e)}")
+            if sha256:
+                self.ledger.mark_failed(sha256, self.analysis, self.params_key, str(e))
+        finally:
+            with self._state_lock:
+                self._in_flight.discard(path)
+                if settled:
+                    self._settled[path] = signature
+                    self._backoff.pop(path, None)
+                elif retry_at is not None:
+                    # Not re-hashed (or retried) by later scans until the backoff expires
+                    self._backoff[path] = (signature, retry_at)
+            self._slots.release()
+
+    def run_forever(self):
+        """Scan until `stop()` is called."""
+        recovered = self.ledger.reset_in_progress()
+        if recovered:
+            print(f"♻️ Re-queued {recovered} file(s) interrupted by a previous run")
+        print(f"👀 Watching {self.watch_dir} for {self.analysis} analysis")
+
+        while not self._stop_event.is_set():
+            try:
+                self.scan_once()
+            except FileNotFoundError:
+                print(f"⚠️ Watch directory not found: {self.watch_dir}")
+            self._stop_event.wait(self.poll_seconds)
+
+    def drain(self):
+        """Block until every queued file has been processed."""
+        while True:
+            with self._state_lock:
+                if not self._in_flight:
+                    return
+            time.sleep(0.05)
+
+    def stop(self, wait: bool = True):
+        self._stop_event.set()
+        self._executor.shutdown(wait=wait)
+        self.ledger.close()
@@ -0,0 +1 @@
+"""Local persistence modules"""
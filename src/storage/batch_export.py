@@ -0,0 +1,155 @@
+"""
+Batch export - Typed, compressed columnar datasets of batch results
+A batch is exported as separate datasets keyed by `filename`:
+
+    summary  one row per file (the result store's summary columns)
+    words    one row per word (pause or stretch word tables, with pause cells as seconds)
+    frames   one row per non-silent volume frame (time_ms, dbfs)
+
+Each dataset is written as Parquet (zstd) or Arrow IPC (zstd), so downstream
+analytics load typed columns directly instead of parsing CSV text. pyarrow is
+optional (pip install pyarrow); the CSV downloads work without it.
+"""
+
+import importlib.util
+import io
+import os
+import zipfile
+from typing import Any, Dict, List, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+
+from src.storage.result_store import extract_summary
+from src.utils.frame_series import FrameSeries
+
+PYARROW_AVAILABLE = importlib.util.find_spec("pyarrow") is not None
+
+# Export format -> file extension
+EXPORT_FORMATS = {"parquet": ".parquet", "arrow": ".arrow"}
+
+# Word table columns (as the analyzers name them) -> export columns
+_PAUSE_WORD_COLUMNS = {"Word #": "word_index", "Word": "word", "Word Start": "word_start", "Word End": "word_end",
+                       "Pause Before": "pause_before", "Pause After": "pause_after", "Has Pause": "has_pause"}
+_STRETCH_WORD_COLUMNS = {"Word #": "word_index", "Word": "word", "Start": "word_start", "End": "word_end",
+                         "Duration": "duration", "Syllables": "syllables", "Stretch Score": "stretch_score",
+                         "Classification": "classification"}
+
+# Repeated strings are stored dictionary-encoded
+_CATEGORY_COLUMNS = ("filename", "word", "classification", "velocity_level")
+
+
+def _pause_seconds(cells: pd.Series) -> pd.Series:
+    """'0.52s' / '-' table cells as float seconds (NaN for no pause)."""
+    return pd.to_numeric(cells.astype(str).str.rstrip("s"), errors="coerce")
+
+
+def _word_frame(analysis: str, result: Dict[str, Any]) -> pd.DataFrame:
+    key, columns = ("word_pause_table", _PAUSE_WORD_COLUMNS) if analysis == "pause" else ("word_table", _STRETCH_WORD_COLUMNS)
+    table = result.get(key)
+    if table is None or not len(table):
+        return pd.DataFrame()
+    table = table if isinstance(table, pd.DataFrame) else pd.DataFrame(table)
+    words = table[[column for column in columns if column in table.columns]].rename(columns=columns)
+    if analysis == "pause":
+        words = words.assign(pause_before=_pause_seconds(words["pause_before"]),
+                             pause_after=_pause_seconds(words["pause_after"]),
+                             has_pause=words["has_pause"] == "Yes")
+    return words
+
+
+def _frame_frame(result: Dict[str, Any]) -> pd.DataFrame:
+    series = result.get("volume_analysis", {}).get("frame_values")
+    # Legacy float lists carry no frame times, so only FrameSeries are exported
+    if not isinstance(series, FrameSeries):
+        return pd.DataFrame()
+    return pd.DataFrame({"time_ms": series.times_ms().astype(np.int32), "dbfs": series.values})
+
+
+def _with_filename(frame: pd.DataFrame, filename: str) -> pd.DataFrame:
+    frame.insert(0, "filename", filename)
+    return frame
+
+
+def _typed(frame: pd.DataFrame) -> pd.DataFrame:
+    for column in _CATEGORY_COLUMNS:
+        if column in frame.columns:
+            frame[column] = frame[column].astype("category")
+    return frame.reset_index(drop=True)
+
+
+def batch_datasets(analysis: str, results: Sequence[Tuple[str, Dict[str, Any]]]) -> Dict[str, pd.DataFrame]:
+    """
+    Split batch results into the summary / words / frames datasets.
+
+    Args:
+        analysis (str): "volume_velocity", "pause" or "stretch"
+        results: (filename, result) pairs of successful analyses
+
+    Returns:
+        dict: Dataset name -> DataFrame (datasets the analysis does not produce are left out)
+    """
+    summary = pd.DataFrame([dict(filename=filename, **extract_summary(analysis, result))
+                            for filename, result in results])
+    datasets = {"summary": _typed(summary)}
+
+    if analysis in ("pause", "stretch"):
+        parts = [_with_filename(_word_frame(analysis, result), filename) for filename, result in results]
+        parts = [part for part in parts if len(part)]
+        if parts:
+            datasets["words"] = _typed(pd.concat(parts, ignore_index=True))
+    elif analysis == "volume_velocity":
+        parts = [_with_filename(_frame_frame(result), filename) for filename, result in results]
+        parts = [part for part in parts if len(part)]
+        if parts:
+            datasets["frames"] = _typed(pd.concat(parts, ignore_index=True))
+    return datasets
+
+
+def _write(frame: pd.DataFrame, target, fmt: str):
+    if fmt == "parquet":
+        frame.to_parquet(target, engine="pyarrow", compression="zstd", index=False)
+    else:
+        frame.to_feather(target, compression="zstd")
+
+
+def write_datasets(datasets: Dict[str, pd.DataFrame], directory: str, fmt: str = "parquet") -> List[str]:
+    """
+    Write each dataset to `directory/<name><ext>`.
+
+    Returns:
+        list: Paths written
+
+    Raises:
+        ValueError: Unknown format
+        ImportError: pyarrow is not installed
+    """
+    if fmt not in EXPORT_FORMATS:
+        raise ValueError(f"Unknown export format: {fmt}. Choose from {sorted(EXPORT_FORMATS)}")
+    os.makedirs(directory, exist_ok=True)
+    paths = []
+    for name, frame in datasets.items():
+        path = os.path.join(directory, name + EXPORT_FORMATS[fmt])
+        _write(frame, path, fmt)
+        paths.append(path)
+    return paths
+
+
+def export_batch_zip(analysis: str, results: Sequence[Tuple[str, Dict[str, Any]]], fmt: str = "parquet") -> bytes:
+    """
+    All datasets of a batch as one zip archive (for a single download).
+
+    Raises:
+        ValueError: Unknown format
+        ImportError: pyarrow is not installed
+    """
+    if fmt not in EXPORT_FORMATS:
+        raise ValueError(f"Unknown export format: {fmt}. Choose from {sorted(EXPORT_FORMATS)}")
+    buffer = io.BytesIO()
+    # The datasets are compressed already, so the archive only stores them
+    with zipfile.ZipFile(buffer, "w", compression=zipfile.ZIP_STORED) as archive:
+        for name, frame in batch_datasets(analysis, results).items():
+            data = io.BytesIO()
+            _write(frame, data, fmt)
+            archive.writestr(f"{analysis}_{name}{EXPORT_FORMATS[fmt]}", data.getvalue())
+    return buffer.getvalue()
@@ -0,0 +1,111 @@
+"""
+Ingest ledger - SQLite record of files picked up by the watch-folder daemon.
+Files are keyed by content hash and analysis parameters, so completed work
+survives restarts and renames but is redone when the parameters change.
+"""
+
+import time
+from typing import Any, Dict, Optional
+
+from src.storage.sqlite_base import SQLiteStore
+from src.utils.serialization import dumps_result
+
+STATUS_PENDING = "pending"
+STATUS_PROCESSING = "processing"
+STATUS_DONE = "done"
+STATUS_FAILED = "failed"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS ingested_files (
+    sha256 TEXT NOT NULL,
+    analysis TEXT NOT NULL,
+    params_key TEXT NOT NULL,
+    path TEXT NOT NULL,
+    size INTEGER NOT NULL,
+    mtime REAL NOT NULL,
+    status TEXT NOT NULL,
+    attempts INTEGER NOT NULL DEFAULT 0,
+    last_attempt_at REAL,
+    result_json TEXT,
+    error TEXT,
+    updated_at REAL NOT NULL,
+    PRIMARY KEY (sha256, analysis, params_key)
+);
+CREATE INDEX IF NOT EXISTS idx_ingested_files_path ON ingested_files (path, size, mtime);
+"""
+
+
+class IngestLedger(SQLiteStore):
+    """Thread-safe SQLite ledger of ingested files and their analysis results."""
+
+    SCHEMA = _SCHEMA
+
+    def is_done_signature(self, path: str, size: int, mtime: float, analysis: str, params_key: str) -> bool:
+        """Cheap check by path/size/mtime so unchanged files are not re-hashed after a restart."""
+        rows = self._execute(
+            "SELECT 1 FROM ingested_files WHERE path = ? AND size = ? AND mtime = ? AND analysis = ? AND params_key = ? AND status = ?",
+            (path, size, mtime, analysis, params_key, STATUS_DONE)
+        )
+        return bool(rows)
+
+    def get_entry(self, sha256: str, analysis: str, params_key: str) -> Optional[Dict[str, Any]]:
+        rows = self._execute(
+            "SELECT path, status, attempts, last_attempt_at, result_json, error FROM ingested_files "
+            "WHERE sha256 = ? AND analysis = ? AND params_key = ?",
+            (sha256, analysis, params_key)
+        )
+        if not rows:
+            return None
+        path, status, attempts, last_attempt_at, result_json, error = rows[0]
+        return {
+            "path": path,
+            "status": status,
+            "attempts": attempts,
+            "last_attempt_at": last_attempt_at,
+            "result_json": result_json,
+            "error": error
+        }
+
+    def mark_processing(self, sha256: str, analysis: str, params_key: str, path: str, size: int, mtime: float):
+        """Claim a file for processing, bump its attempt counter and record the attempt time."""
+        now = time.time()
+        self._execute(
+            """
+            INSERT INTO ingested_files (sha256, analysis, params_key, path, size, mtime, status, attempts, last_attempt_at, updated_at)
+            VALUES (?, ?, ?, ?, ?, ?, ?, 1, ?, ?)
+            ON CONFLICT (sha256, analysis, params_key) DO UPDATE SET
+                path = excluded.path,
+                size = excluded.size,
+                mtime = excluded.mtime,
+                status = excluded.status,
+                attempts = attempts + 1,
+                last_attempt_at = excluded.last_attempt_at,
+                updated_at = excluded.updated_at
+            """,
+            (sha256, analysis, params_key, path, size, mtime, STATUS_PROCESSING, now, now)
+        )
+
+    def mark_done(self, sha256: str, analysis: str, params_key: str, result: Dict[str, Any]):
+        self._execute(
+            "UPDATE ingested_files SET status = ?, result_json = ?, error = NULL, updated_at = ? "
+            "WHERE sha256 = ? AND analysis = ? AND params_key = ?",
+            (STATUS_DONE, dumps_result(result), time.time(), sha256, analysis, params_key)
+        )
+
+    def mark_failed(self, sha256: str, analysis: str, params_key: str, error: str):
+        self._execute(
+            "UPDATE ingested_files SET status = ?, error = ?, updated_at = ? "
+            "WHERE sha256 = ? AND analysis = ? AND params_key = ?",
+            (STATUS_FAILED, error, time.time(), sha256, analysis, params_key)
+        )
+
+    def reset_in_progress(self) -> int:
+        """Return files left in 'processing' by a crashed run to 'pending'."""
+        return self._execute_rowcount(
+            "UPDATE ingested_files SET status = ?, updated_at = ? WHERE status = ?",
+            (STATUS_PENDING, time.time(), STATUS_PROCESSING)
+        )
+
+    def status_counts(self) -> Dict[str, int]:
+        rows = self._execute("SELECT status, COUNT(*) FROM ingested_files GROUP BY status")
+        return {status: count for status, count in rows}
@@ -0,0 +1,205 @@
+"""
+Batch job journal - SQLite checkpoints for resumable batch runs.
+Every file of a batch is tracked by content hash; completed results are stored
+so a resumed batch skips them (and never pays for their transcription again).
+Completed results are also found by (file_hash, analysis, params_key) across
+jobs, so a batch holding a subset or superset of earlier files reuses them too.
+"""
+
+import functools
+import hashlib
+import json
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+from config import JOB_JOURNAL_PATH
+from src.storage.result_store import params_hash
+from src.storage.sqlite_base import SQLiteStore
+from src.utils.serialization import dumps_result, loads_result
+
+FILE_PENDING = "pending"
+FILE_PROCESSING = "processing"
+FILE_DONE = "done"
+FILE_FAILED = "failed"
+
+JOB_RUNNING = "running"
+JOB_COMPLETED = "completed"
+JOB_PARTIAL = "partial"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS batch_jobs (
+    job_id TEXT PRIMARY KEY,
+    analysis TEXT NOT NULL,
+    params_json TEXT NOT NULL,
+    params_key TEXT NOT NULL,
+    status TEXT NOT NULL,
+    total_files INTEGER NOT NULL,
+    created_at REAL NOT NULL,
+    updated_at REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS batch_job_files (
+    job_id TEXT NOT NULL,
+    file_hash TEXT NOT NULL,
+    filename TEXT NOT NULL,
+    status TEXT NOT NULL,
+    attempts INTEGER NOT NULL DEFAULT 0,
+    result_json TEXT,
+    error TEXT,
+    updated_at REAL NOT NULL,
+    PRIMARY KEY (job_id, file_hash)
+);
+CREATE INDEX IF NOT EXISTS idx_batch_jobs_updated ON batch_jobs (updated_at);
+CREATE INDEX IF NOT EXISTS idx_batch_job_files_hash ON batch_job_files (file_hash, status);
+CREATE INDEX IF NOT EXISTS idx_batch_jobs_key ON batch_jobs (analysis, params_key);
+"""
+
+
+def make_job_id(analysis: str, params: Dict[str, Any], file_hashes: List[str]) -> str:
+    """
+    Derive a stable job id from the analysis, its parameters and the file set.
+    Re-uploading the same files with the same settings resumes the same job.
+    """
+    key = json.dumps({
+        "analysis": analysis,
+        "params": params,
+        "files": sorted(set(file_hashes))
+    }, sort_keys=True, default=str)
+    return hashlib.sha256(key.encode("utf-8")).hexdigest()[:16]
+
+
+class JobJournal(SQLiteStore):
+    """Persist batch jobs and per-file state so runs can resume after a crash."""
+
+    SCHEMA = _SCHEMA
+
+    def open_job(self, analysis: str, params: Dict[str, Any], files: List[Tuple[str, str]]) -> Tuple[str, bool]:
+        """
+        Create the job (or find it again) and register its files.
+
+        Args:
+            files: List of (file_hash, filename) pairs
+
+        Returns:
+            (job_id, resumed) - resumed is True if the job already existed
+        """
+        unique_files = dict(files)
+        job_id = make_job_id(analysis, params, list(unique_files))
+        now = time.time()
+
+        with self._lock:
+            existing = self._conn.execute("SELECT 1 FROM batch_jobs WHERE job_id = ?", (job_id,)).fetchone()
+            if existing:
+                self._conn.execute(
+                    "UPDATE batch_jobs SET status = ?, updated_at = ? WHERE job_id = ?",
+                    (JOB_RUNNING, now, job_id)
+                )
+            else:
+                self._conn.execute(
+                    "INSERT INTO batch_jobs (job_id, analysis, params_json, params_key, status, total_files, created_at, updated_at) VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                    (job_id, analysis, json.dumps(params, default=str), params_hash(params), JOB_RUNNING,
+                     len(unique_files), now, now)
+                )
+            self._conn.executemany(
+                "INSERT OR IGNORE INTO batch_job_files (job_id, file_hash, filename, status, updated_at) VALUES (?, ?, ?, ?, ?)",
+                [(job_id, file_hash, filename, FILE_PENDING, now) for file_hash, filename in unique_files.items()]
+            )
+            self._conn.commit()
+
+        return job_id, bool(existing)
+
+    def file_states(self, job_id: str) -> Dict[str, Dict[str, Any]]:
+        rows = self._execute(
+            "SELECT file_hash, filename, status, attempts, error FROM batch_job_files WHERE job_id = ?",
+            (job_id,)
+        )
+        return {
+            file_hash: {"filename": filename, "status": status, "attempts": attempts, "error": error}
+            for file_hash, filename, status, attempts, error in rows
+        }
+
+    def load_result(self, job_id: str, file_hash: str) -> Optional[Dict[str, Any]]:
+        rows = self._execute(
+            "SELECT result_json FROM batch_job_files WHERE job_id = ? AND file_hash = ? AND status = ?",
+            (job_id, file_hash, FILE_DONE)
+        )
+        if not rows or rows[0][0] is None:
+            return None
+        return loads_result(rows[0][0])
+
+    def load_completed(self, file_hash: str, analysis: str, params: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """Latest completed result for this file, analysis and parameters from any job."""
+        rows = self._execute(
+            """
+            SELECT f.result_json FROM batch_job_files f JOIN batch_jobs j ON j.job_id = f.job_id
+            WHERE f.file_hash = ? AND f.status = ? AND f.result_json IS NOT NULL
+              AND j.analysis = ? AND j.params_key = ?
+            ORDER BY f.updated_at DESC LIMIT 1
+            """,
+            (file_hash, FILE_DONE, analysis, params_hash(params))
+        )
+        return loads_result(rows[0][0]) if rows else None
+
+    def mark_processing(self, job_id: str, file_hash: str):
+        self._execute(
+            "UPDATE batch_job_files SET status = ?, attempts = attempts + 1, updated_at = ? WHERE job_id = ? AND file_hash = ?",
+            (FILE_PROCESSING, time.time(), job_id, file_hash)
+        )
+
+    def mark_done(self, job_id: str, file_hash: str, result: Dict[str, Any]):
+        # Keep display-only data (e.g. waveform images) so resumed batches render identically
+        self._execute(
+            "UPDATE batch_job_files SET status = ?, result_json = ?, error = NULL, updated_at = ? WHERE job_id = ? AND file_hash = ?",
+            (FILE_DONE, dumps_result(result, drop_display_keys=False), time.time(), job_id, file_hash)
+        )
+
+    def mark_failed(self, job_id: str, file_hash: str, error: str):
+        self._execute(
+            "UPDATE batch_job_files SET status = ?, error = ?, updated_at = ? WHERE job_id = ? AND file_hash = ?",
+            (FILE_FAILED, error, time.time(), job_id, file_hash)
+        )
+
+    def finish_job(self, job_id: str) -> str:
+        """Mark the job completed, or partial if some files still failed."""
+        rows = self._execute(
+            "SELECT COUNT(*) FROM batch_job_files WHERE job_id = ? AND status != ?",
+            (job_id, FILE_DONE)
+        )
+        status = JOB_COMPLETED if rows[0][0] == 0 else JOB_PARTIAL
+        self._execute(
+            "UPDATE batch_jobs SET status = ?, updated_at = ? WHERE job_id = ?",
+            (status, time.time(), job_id)
+        )
+        return status
+
+    def list_jobs(self, limit: int = 20) -> List[Dict[str, Any]]:
+        """Most recent jobs with per-status file counts."""
+        rows = self._execute(
+            """
+            SELECT j.job_id, j.analysis, j.status, j.total_files, j.updated_at,
+                   SUM(CASE WHEN f.status = 'done' THEN 1 ELSE 0 END),
+                   SUM(CASE WHEN f.status = 'failed' THEN 1 ELSE 0 END)
+            FROM batch_jobs j LEFT JOIN batch_job_files f ON f.job_id = j.job_id
+            GROUP BY j.job_id
+            ORDER BY j.updated_at DESC
+            LIMIT ?
+            """,
+            (limit,)
+        )
+        return [
+            {
+                "job_id": job_id,
+                "analysis": analysis,
+                "status": status,
+                "total_files": total,
+                "updated_at": updated_at,
+                "done_files": done or 0,
+                "failed_files": failed or 0
+            }
+            for job_id, analysis, status, total, updated_at, done, failed in rows
+        ]
+
+
+@functools.lru_cache(maxsize=None)
+def get_job_journal(db_path: str = JOB_JOURNAL_PATH) -> JobJournal:
+    """Process-wide journal instance (one SQLite connection per database file)."""
+    return JobJournal(db_path)
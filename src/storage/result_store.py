@@ -0,0 +1,286 @@
+"""
+Result store - Queryable SQLite store of analysis results.
+Summary metrics are kept as typed columns (one row per analysis run) and word-level
+tables (pause rows, stretch rows) as separate indexed tables, so corpus-wide
+questions such as "average WPS per week" run as plain indexed SQL.
+"""
+
+import functools
+import hashlib
+import json
+import time
+from typing import Any, Dict, List, Optional
+
+import pandas as pd
+
+from config import RESULT_STORE_PATH
+from src.storage.sqlite_base import SQLiteStore
+from src.utils.serialization import to_jsonable
+from src.utils.volume_scoring import VOLUME_COLUMNS, calculate_volume_score, score_volume_batch
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS analysis_results (
+    result_id INTEGER PRIMARY KEY AUTOINCREMENT,
+    file_hash TEXT NOT NULL,
+    filename TEXT,
+    analysis TEXT NOT NULL,
+    params_hash TEXT NOT NULL,
+    params_json TEXT NOT NULL,
+    created_at REAL NOT NULL,
+    success INTEGER NOT NULL,
+    -- volume
+    volume_min REAL,
+    volume_max REAL,
+    volume_avg REAL,
+    volume_range REAL,
+    coverage_vs_target REAL,
+    volume_score REAL,
+    -- velocity
+    word_count_total INTEGER,
+    word_count_clean INTEGER,
+    duration_spoken REAL,
+    wps REAL,
+    wpm REAL,
+    velocity_level TEXT,
+    -- pause
+    total_pauses INTEGER,
+    words_with_pauses INTEGER,
+    audio_duration REAL,
+    -- stretch
+    total_words INTEGER,
+    stretched_words INTEGER,
+    stretch_percentage REAL,
+    avg_stretch_score REAL,
+    overall_stretch REAL,
+    transcript TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_results_file ON analysis_results (file_hash, analysis, params_hash, created_at);
+CREATE INDEX IF NOT EXISTS idx_results_analysis_time ON analysis_results (analysis, created_at, wps);
+
+CREATE TABLE IF NOT EXISTS word_pause_rows (
+    result_id INTEGER NOT NULL REFERENCES analysis_results (result_id) ON DELETE CASCADE,
+    word_index INTEGER NOT NULL,
+    word TEXT NOT NULL,
+    word_start REAL,
+    word_end REAL,
+    pause_before REAL,
+    pause_after REAL,
+    has_pause INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_word_pause_result ON word_pause_rows (result_id);
+
+CREATE TABLE IF NOT EXISTS stretch_rows (
+    result_id INTEGER NOT NULL REFERENCES analysis_results (result_id) ON DELETE CASCADE,
+    word_index INTEGER NOT NULL,
+    word TEXT NOT NULL,
+    word_start REAL,
+    word_end REAL,
+    duration REAL,
+    syllables INTEGER,
+    stretch_score REAL,
+    classification TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_stretch_result ON stretch_rows (result_id);
+CREATE INDEX IF NOT EXISTS idx_stretch_score ON stretch_rows (stretch_score);
+"""
+
+_SUMMARY_COLUMNS = (
+    "volume_min", "volume_max", "volume_avg", "volume_range", "coverage_vs_target", "volume_score",
+    "word_count_total", "word_count_clean", "duration_spoken", "wps", "wpm", "velocity_level",
+    "total_pauses", "words_with_pauses", "audio_duration",
+    "total_words", "stretched_words", "stretch_percentage", "avg_stretch_score", "overall_stretch",
+    "transcript"
+)
+
+
+def params_hash(params: Dict[str, Any]) -> str:
+    """Stable short hash of analysis parameters."""
+    return hashlib.sha256(json.dumps(params, sort_keys=True, default=str).encode("utf-8")).hexdigest()[:16]
+
+
+def _parse_seconds(value) -> Optional[float]:
+    """Pause table cells look like '0.52s' or '-'."""
+    if value is None or value == "-":
+        return None
+    if isinstance(value, (int, float)):
+        return float(value)
+    try:
+        return float(str(value).rstrip("s"))
+    except ValueError:
+        return None
+
+
+def _rows(table) -> List[Dict[str, Any]]:
+    if table is None:
+        return []
+    return to_jsonable(table)
+
+
+def extract_summary(analysis: str, result: Dict[str, Any]) -> Dict[str, Any]:
+    """Flatten an analyzer result into the summary columns of `analysis_results`."""
+    summary: Dict[str, Any] = {}
+
+    if analysis == "volume_velocity":
+        volume = result.get("volume_analysis", {})
+        velocity = result.get("velocity_analysis", {})
+        if volume and "error" not in volume:
+            for key in ("volume_min", "volume_max", "volume_avg", "volume_range", "coverage_vs_target"):
+                summary[key] = volume.get(key)
+            summary["volume_score"] = volume["score"] if "score" in volume else calculate_volume_score(volume)["score"]
+        if velocity and "error" not in velocity:
+            for key in ("word_count_total", "word_count_clean", "duration_spoken", "wps", "wpm", "velocity_level", "transcript"):
+                summary[key] = velocity.get(key)
+
+    elif analysis == "pause":
+        pause_summary = result.get("summary", {})
+        for key in ("total_pauses", "words_with_pauses", "audio_duration", "total_words"):
+            summary[key] = pause_summary.get(key)
+        summary["transcript"] = result.get("transcript")
+
+    elif analysis == "stretch":
+        stretch_summary = result.get("summary", {})
+        for key in ("total_words", "stretched_words", "stretch_percentage", "avg_stretch_score", "overall_stretch"):
+            summary[key] = stretch_summary.get(key)
+        summary["duration_spoken"] = stretch_summary.get("total_speech_duration")
+        summary["transcript"] = result.get("transcript")
+
+    return summary
+
+
+class ResultStore(SQLiteStore):
+    """Persistent, indexed store of per-file metrics and per-word tables."""
+
+    SCHEMA = _SCHEMA
+
+    def __init__(self, db_path: str):
+        super().__init__(db_path)
+        self._conn.execute("PRAGMA foreign_keys=ON")
+
+    def save_result(self,
+                    file_hash: str,
+                    filename: str,
+                    analysis: str,
+                    params: Dict[str, Any],
+                    result: Dict[str, Any],
+                    success: bool = True,
+                    created_at: Optional[float] = None) -> int:
+        """
+        Store one analysis run with its word-level rows.
+
+        Returns:
+            int: result_id of the stored run
+        """
+        summary = to_jsonable(extract_summary(analysis, result))
+        columns = ["file_hash", "filename", "analysis", "params_hash", "params_json", "created_at", "success"]
+        values = [file_hash, filename, analysis, params_hash(params), json.dumps(params, sort_keys=True, default=str),
+                  created_at if created_at is not None else time.time(), int(success)]
+        for column in _SUMMARY_COLUMNS:
+            columns.append(column)
+            values.append(summary.get(column))
+
+        with self._lock:
+            cursor = self._conn.execute(
+                f"INSERT INTO analysis_results ({', '.join(columns)}) VALUES ({', '.join('?' * len(columns))})",
+                values
+            )
+            result_id = cursor.lastrowid
+
+            if analysis == "pause":
+                self._conn.executemany(
+                    "INSERT INTO word_pause_rows VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                    [(result_id, row.get("Word #", i + 1), row.get("Word", ""), row.get("Word Start"), row.get("Word End"),
+                      _parse_seconds(row.get("Pause Before")), _parse_seconds(row.get("Pause After")),
+                      int(row.get("Has Pause") == "Yes"))
+                     for i, row in enumerate(_rows(result.get("word_pause_table")))]
+                )
+            elif analysis == "stretch":
+                self._conn.executemany(
+                    "INSERT INTO stretch_rows VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                    [(result_id, row.get("Word #", i + 1), row.get("Word", ""), row.get("Start"), row.get("End"),
+                      row.get("Duration"), row.get("Syllables"), row.get("Stretch Score"), row.get("Classification"))
+                     for i, row in enumerate(_rows(result.get("word_table")))]
+                )
+
+            self._conn.commit()
+        return result_id
+
+    def query(self, sql: str, params: tuple = ()) -> pd.DataFrame:
+        """Run an ad-hoc read-only query and return a DataFrame."""
+        with self._lock:
+            return pd.read_sql_query(sql, self._conn, params=params)
+
+    def latest_result(self, file_hash: str, analysis: str, params: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """Most recent stored summary for a file/analysis/parameter combination."""
+        df = self.query(
+            """
+            SELECT * FROM analysis_results
+            WHERE file_hash = ? AND analysis = ? AND params_hash = ?
+            ORDER BY created_at DESC LIMIT 1
+            """,
+            (file_hash, analysis, params_hash(params))
+        )
+        return df.iloc[0].to_dict() if len(df) else None
+
+    def average_wps_per_week(self, since: Optional[float] = None) -> pd.DataFrame:
+        """Average speaking speed per ISO-style week across successful velocity analyses."""
+        return self.query(
+            """
+            SELECT strftime('%Y-W%W', created_at, 'unixepoch') AS week,
+                   AVG(wps) AS avg_wps,
+                   COUNT(*) AS files
+            FROM analysis_results
+            WHERE analysis = 'volume_velocity' AND wps IS NOT NULL AND created_at >= ?
+            GROUP BY week
+            ORDER BY week
+            """,
+            (since or 0.0,)
+        )
+
+    def volume_report(self, since: Optional[float] = None) -> pd.DataFrame:
+        """Stored volume metrics re-scored in one vectorized pass (score, grade, status per run)."""
+        df = self.query(
+            f"""
+            SELECT result_id, filename, file_hash, created_at, {', '.join(VOLUME_COLUMNS)}
+            FROM analysis_results
+            WHERE analysis = 'volume_velocity' AND volume_avg IS NOT NULL AND created_at >= ?
+            ORDER BY created_at
+            """,
+            (since or 0.0,)
+        )
+        scores = score_volume_batch(**{column: df[column].to_numpy() for column in VOLUME_COLUMNS})
+        for key in ("score", "grade", "status", "user_vs_normal"):
+            df[key] = scores[key]
+        return df
+
+    def stretched_words(self, min_score: float = 0.5, limit: Optional[int] = None) -> pd.DataFrame:
+        """All words whose stretch score (sec/syllable) is at least `min_score`."""
+        sql = """
+            SELECT r.filename, r.file_hash, r.created_at, s.word_index, s.word,
+                   s.word_start, s.word_end, s.duration, s.syllables, s.stretch_score
+            FROM stretch_rows s JOIN analysis_results r ON r.result_id = s.result_id
+            WHERE s.stretch_score >= ?
+            ORDER BY s.stretch_score DESC
+        """
+        params: tuple = (min_score,)
+        if limit is not None:
+            sql += " LIMIT ?"
+            params += (limit,)
+        return self.query(sql, params)
+
+    def word_pauses(self, min_pause: float = 0.0) -> pd.DataFrame:
+        """Words with a pause before or after them of at least `min_pause` seconds."""
+        return self.query(
+            """
+            SELECT r.filename, r.file_hash, p.word_index, p.word, p.word_start, p.word_end,
+                   p.pause_before, p.pause_after
+            FROM word_pause_rows p JOIN analysis_results r ON r.result_id = p.result_id
+            WHERE p.has_pause = 1 AND MAX(COALESCE(p.pause_before, 0), COALESCE(p.pause_after, 0)) >= ?
+            """,
+            (min_pause,)
+        )
+
+
+@functools.lru_cache(maxsize=None)
+def get_result_store(db_path: str = RESULT_STORE_PATH) -> ResultStore:
+    """Process-wide result store instance."""
+    return ResultStore(db_path)
@@ -0,0 +1,38 @@
+"""
+Shared SQLite plumbing for the local stores (WAL mode, one connection, thread-safe access)
+"""
+
+import sqlite3
+import threading
+
+
+class SQLiteStore:
+    """Base class holding a single thread-safe SQLite connection."""
+
+    SCHEMA = ""
+
+    def __init__(self, db_path: str):
+        self.db_path = db_path
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(db_path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        if self.SCHEMA:
+            self._conn.executescript(self.SCHEMA)
+        self._conn.commit()
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+    def _execute(self, sql: str, params: tuple = ()):
+        with self._lock:
+            cursor = self._conn.execute(sql, params)
+            self._conn.commit()
+            return cursor.fetchall()
+
+    def _execute_rowcount(self, sql: str, params: tuple = ()) -> int:
+        with self._lock:
+            cursor = self._conn.execute(sql, params)
+            self._conn.commit()
+            return cursor.rowcount
@@ -3,79 +3,113 @@ Deepgram integration for high-quality transcription.
 Can be combined with ForceAlign for precise word timing.
 """
 
+import importlib.util
 import os
-import tempfile
-from typing import Dict, Any
-
-try:
-    from deepgram import DeepgramClient, PrerecordedOptions, FileSource
-    DEEPGRAM_AVAILABLE = True
-except ImportError:
-    DEEPGRAM_AVAILABLE = False
+from typing import Dict, Any, List, Optional
+
+from config import DEEPGRAM_API_URL, DEEPGRAM_BASE_URL, DEEPGRAM_TIMEOUT_SECONDS
+from src.utils.audio_input import AudioInput, AudioSource
+from src.utils.resources import get_deepgram_session
+from src.utils.tracing import span, traced
+
+# Deepgram is called over its REST API with `requests` (imported on first use)
+DEEPGRAM_AVAILABLE = importlib.util.find_spec("requests") is not None
+
+# Query parameters of the prerecorded request
+DEEPGRAM_OPTIONS = {
+    "model": "nova-2",  # Latest and most accurate model
+    "smart_format": "true",  # Automatic formatting
+    "punctuate": "true",  # Add punctuation
+    "paragraphs": "false",  # Keep as single paragraph
+    "utterances": "false",  # Don't split by speaker
+    "language": "en-US",  # English
+}
 
 def check_deepgram_availability():
-    """Check if Deepgram SDK is available."""
+    """Check if the Deepgram client dependencies are available."""
     return DEEPGRAM_AVAILABLE
 
 def install_deepgram_instructions():
     """Return installation instructions for Deepgram."""
     return """
-    To use Deepgram, please install the SDK:
+    Deepgram is called over its REST API (the `requests` package):
 
-    pip install deepgram-sdk
+    pip install requests
 
     Then set your API key in .env file:
     DEEPGRAM_API_KEY=your_key_here
     """
 
-def transcribe_with_deepgram(audio_path: str) -> Dict[str, Any]:
+def _listen_url() -> str:
+    return f"{(DEEPGRAM_BASE_URL or DEEPGRAM_API_URL).rstrip('/')}/v1/listen"
+
+def request_deepgram(audio: AudioInput, api_key: str) -> Dict[str, Any]:
     """
-    Get high-quality transcript using Deepgram.
+    POST audio to Deepgram's prerecorded endpoint and return the JSON response.
 
-    Args:
-        audio_path (str): Path to audio file
+    The body is streamed from the file (or the in-memory upload) on the pooled
+    session, so the audio is never copied into a request buffer.
 
-    Returns:
-        Dict: Contains 'success', 'transcript', and optionally 'error'
+    Raises:
+        RuntimeError: Deepgram returned an error status
     """
+    source = AudioSource.of(audio)
+    session = get_deepgram_session(api_key)
+    content_type = f"audio/{source.format}" if source.format else "audio/wav"
+
+    with source.open_binary() as audio_file, span("deepgram_request"):
+        response = session.post(_listen_url(), params=DEEPGRAM_OPTIONS, data=audio_file,
+                                headers={"Content-Type": content_type},
+                                timeout=(10, DEEPGRAM_TIMEOUT_SECONDS))
+    if response.status_code >= 400:
+        try:
+            message = response.json().get("err_msg") or response.text
+        except ValueError:
+            message = response.text
+        raise RuntimeError(f"HTTP {response.status_code}: {message}")
+    return response.json()
+
+def _setup_error() -> Optional[Dict[str, Any]]:
+    """Failed result when the client or the API key is missing, else None."""
     if not DEEPGRAM_AVAILABLE:
         return {
             "success": False,
-            "error": "Deepgram SDK not available. Please install: pip install deepgram-sdk"
+            "error": "Deepgram client not available. Please install: pip install requests"
         }
-
-    # Check API key
-    api_key = os.getenv("DEEPGRAM_API_KEY")
-    if not api_key:
+    if not os.getenv("DEEPGRAM_API_KEY"):
         return {
             "success": False,
             "error": "DEEPGRAM_API_KEY not found in environment variables"
         }
+    return None
+
+def deepgram_words(response: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """Word dicts ('word', 'start', 'end', 'confidence') from a prerecorded response."""
+    alternative = response["results"]["channels"][0]["alternatives"][0]
+    return [{
+        "word": word["word"].lower().strip(),
+        "start": float(word["start"]),
+        "end": float(word["end"]),
+        "confidence": float(word.get("confidence", 1.0))
+    } for word in alternative.get("words") or []]
+
+@traced("transcribe_with_deepgram")
+def transcribe_with_deepgram(audio_path: AudioInput) -> Dict[str, Any]:
+    """
+    Get high-quality transcript using Deepgram.
 
-    try:
-        # Initialize Deepgram client
-        deepgram = DeepgramClient(api_key)
-
-        # Read audio file
-        with open(audio_path, "rb") as file:
-            buffer_data = file.read()
-
-        payload: FileSource = {
-            "buffer": buffer_data,
-        }
+    Args:
+        audio_path: Audio file path, bytes, file-like object or decoded audio
 
-        # Configure transcription options
-        options = PrerecordedOptions(
-            model="nova-2",  # Latest and most accurate model
-            smart_format=True,  # Automatic formatting
-            punctuate=True,  # Add punctuation
-            paragraphs=False,  # Keep as single paragraph
-            utterances=False,  # Don't split by speaker
-            language="en-US",  # English
-        )
+    Returns:
+        Dict: Contains 'success', 'transcript', and optionally 'error'
+    """
+    setup_error = _setup_error()
+    if setup_error:
+        return setup_error
 
-        # Transcribe
-        response = deepgram.listen.prerecorded.v("1").transcribe_file(payload, options)
+    try:
+        response = request_deepgram(audio_path, os.getenv("DEEPGRAM_API_KEY"))
 
         # Extract transcript
         transcript = response["results"]["channels"][0]["alternatives"][0]["transcript"]
@@ -97,98 +131,149 @@ def transcribe_with_deepgram(audio_path: str) -> Dict[str, Any]:
             "error": f"Deepgram transcription failed: {str(e)}"
         }
 
-def hybrid_deepgram_forcealign_timestamps(audio_path: str) -> Dict[str, Any]:
+@traced("deepgram_words")
+def transcribe_with_deepgram_words(audio_path: AudioInput, refine: bool = False) -> Dict[str, Any]:
     """
-    Hybrid approach: Use Deepgram for transcription, ForceAlign for word timing.
+    Word timestamps from one Deepgram request. Deepgram returns per-word start/end
+    and confidence, so no local model runs; with refine=True the Deepgram
+    transcript is re-timed by ForceAlign instead.
 
     Args:
-        audio_path (str): Path to audio file
+        audio_path: Audio file path, bytes, file-like object or decoded audio
+        refine (bool): Replace Deepgram's timings with a ForceAlign pass
 
     Returns:
-        Dict: Contains word timestamps and transcript
+        Dict: Contains 'success', 'word_timestamps', 'transcript', 'method' and optionally 'error'
     """
+    setup_error = _setup_error()
+    if setup_error:
+        return setup_error
+
+    audio_path = AudioSource.of(audio_path)
     try:
-        # Step 1: Get high-quality transcript from Deepgram
-        print("🔄 Getting transcript from Deepgram...")
-        deepgram_result = transcribe_with_deepgram(audio_path)
+        response = request_deepgram(audio_path, os.getenv("DEEPGRAM_API_KEY"))
+        words = deepgram_words(response)
+        transcript = response["results"]["channels"][0]["alternatives"][0]["transcript"].strip()
+    except Exception as e:
+        return {
+            "success": False,
+            "error": f"Deepgram transcription failed: {str(e)}"
+        }
 
-        if not deepgram_result["success"]:
-            return {
-                "success": False,
-                "error": f"Deepgram transcription failed: {deepgram_result['error']}"
-            }
+    if not words or not transcript:
+        return {
+            "success": False,
+            "error": "No speech detected in audio"
+        }
 
-        transcript = deepgram_result["transcript"]
-        print(f"✅ Deepgram transcript: '{transcript}'")
+    if not refine:
+        return {
+            "success": True,
+            "word_timestamps": words,
+            "transcript": transcript,
+            "method": "deepgram"
+        }
 
-        # Step 2: Use ForceAlign for precise word timing with Deepgram transcript
-        print("🔄 Getting word timing from ForceAlign...")
-        from src.transcribers.forcealign_transcriber import transcribe_with_forcealign_timestamps
+    print("🔄 Refining Deepgram word timing with ForceAlign...")
+    return _align_transcript(audio_path, transcript, "deepgram_forcealign_hybrid", "Hybrid transcription failed")
 
-        # Use ForceAlign with the Deepgram transcript
-        word_timestamps = transcribe_with_forcealign_timestamps(audio_path, transcript)
+def _align_transcript(audio_path: AudioSource, transcript: str, method: str, error_prefix: str) -> Dict[str, Any]:
+    """Word timing for a known transcript from ForceAlign, as a hybrid result dict."""
+    try:
+        from src.transcribers.forcealign_transcriber import transcribe_with_forcealign_timestamps
 
         return {
             "success": True,
-            "word_timestamps": word_timestamps,
+            "word_timestamps": transcribe_with_forcealign_timestamps(audio_path, transcript),
             "transcript": transcript,
-            "method": "deepgram_forcealign_hybrid"
+            "method": method
         }
-
     except Exception as e:
         return {
             "success": False,
-            "error": f"Hybrid transcription failed: {str(e)}"
+            "error": f"{error_prefix}: {str(e)}"
         }
 
-def whisper_forcealign_hybrid_timestamps(audio_path: str) -> Dict[str, Any]:
+@traced("deepgram_forcealign_hybrid")
+def hybrid_deepgram_forcealign_timestamps(audio_path: AudioInput, transcript: Optional[str] = None) -> Dict[str, Any]:
     """
-    Hybrid approach: Use OpenAI Whisper for transcription, ForceAlign for word timing.
+    Hybrid approach: Use Deepgram for transcription, ForceAlign for word timing.
 
     Args:
-        audio_path (str): Path to audio file
+        audio_path: Audio file path, bytes, file-like object or decoded audio
+        transcript (str): Deepgram transcript fetched earlier; only the alignment runs
 
     Returns:
         Dict: Contains word timestamps and transcript
     """
+    if transcript is None:
+        return transcribe_with_deepgram_words(audio_path, refine=True)
+    return _align_transcript(AudioSource.of(audio_path), transcript, "deepgram_forcealign_hybrid",
+                             "Hybrid transcription failed")
+
+@traced("whisper_transcript")
+def transcribe_with_whisper(audio_path: AudioInput) -> Dict[str, Any]:
+    """
+    Transcript text from OpenAI Whisper (the first stage of the Whisper hybrid).
+
+    Returns:
+        Dict: Contains 'success', 'transcript', and optionally 'error'
+    """
     try:
-        # Step 1: Get high-quality transcript from OpenAI Whisper
         print("🔄 Getting transcript from OpenAI Whisper...")
         from src.transcribers.openai_transcriber import transcribe_with_openai_timestamps
 
         # Get transcript using Whisper (we'll use transcript, not the timestamps)
         whisper_words = transcribe_with_openai_timestamps(audio_path)
-
-        if not whisper_words:
-            return {
-                "success": False,
-                "error": "Failed to get transcript from OpenAI Whisper"
-            }
-
-        # Extract transcript text
-        transcript = " ".join([w["word"] for w in whisper_words])
-        print(f"✅ Whisper transcript: '{transcript}'")
-
-        # Step 2: Use ForceAlign for precise word timing with Whisper transcript
-        print("🔄 Getting word timing from ForceAlign...")
-        from src.transcribers.forcealign_transcriber import transcribe_with_forcealign_timestamps
-
-        # Use ForceAlign with the Whisper transcript
-        word_timestamps = transcribe_with_forcealign_timestamps(audio_path, transcript)
-
+    except Exception as e:
         return {
-            "success": True,
-            "word_timestamps": word_timestamps,
-            "transcript": transcript,
-            "method": "whisper_forcealign_hybrid"
+            "success": False,
+            "error": f"Whisper+ForceAlign hybrid failed: {str(e)}"
         }
 
-    except Exception as e:
+    if not whisper_words:
         return {
             "success": False,
-            "error": f"Whisper+ForceAlign hybrid failed: {str(e)}"
+            "error": "Failed to get transcript from OpenAI Whisper"
         }
 
+    # Extract transcript text
+    transcript = " ".join([w["word"] for w in whisper_words])
+    print(f"✅ Whisper transcript: '{transcript}'")
+    return {
+        "success": True,
+        "transcript": transcript
+    }
+
+@traced("whisper_forcealign_hybrid")
+def whisper_forcealign_hybrid_timestamps(audio_path: AudioInput, transcript: Optional[str] = None) -> Dict[str, Any]:
+    """
+    Hybrid approach: Use OpenAI Whisper for transcription, ForceAlign for word timing.
+
+    Args:
+        audio_path: Audio file path, bytes, file-like object or decoded audio
+        transcript (str): Whisper transcript fetched earlier; only the alignment runs
+
+    Returns:
+        Dict: Contains word timestamps and transcript
+    """
+    audio_path = AudioSource.of(audio_path)
+    if transcript is None:
+        whisper_result = transcribe_with_whisper(audio_path)
+        if not whisper_result["success"]:
+            return whisper_result
+        transcript = whisper_result["transcript"]
+
+    print("🔄 Getting word timing from ForceAlign...")
+    return _align_transcript(audio_path, transcript, "whisper_forcealign_hybrid", "Whisper+ForceAlign hybrid failed")
+
+# Transcript-only first stage of each hybrid stretch method; a batch can run these
+# ahead of (and concurrently with) the ForceAlign stage, see run_journaled_batch(prefetch=...)
+HYBRID_TRANSCRIPT_STAGES = {
+    "whisper_forcealign": transcribe_with_whisper,
+    "deepgram_forcealign": transcribe_with_deepgram,
+}
+
 def compare_transcription_methods():
     """Compare different transcription approaches."""
     return {
@@ -204,8 +289,8 @@ def compare_transcription_methods():
         },
         "deepgram_only": {
             "pros": ["High accuracy", "Fast API", "Good formatting"],
-            "cons": ["Requires API key", "Costs money", "No word timestamps"],
-            "use_case": "High-quality transcription only"
+            "cons": ["Requires API key", "Costs money", "Word timing less precise than forced alignment"],
+            "use_case": "High-quality transcription with native word timings"
         },
         "whisper_forcealign_hybrid": {
             "pros": ["Whisper's best accuracy", "ForceAlign precise timing", "Industry standard combo"],
@@ -3,17 +3,16 @@ ForceAlign integration for word-level timing without OpenAI API dependency.
 Provides an alternative to OpenAI Whisper for stretch analysis.
 """
 
-import tempfile
-import os
+import importlib.util
 from typing import List, Dict, Any
-import librosa
-import soundfile as sf
 
-try:
-    from forcealign import ForceAlign
-    FORCEALIGN_AVAILABLE = True
-except ImportError:
-    FORCEALIGN_AVAILABLE = False
+import numpy as np
+
+from src.utils.audio_input import AudioInput, AudioSource, DecodedAudio
+from src.utils.tracing import span, traced
+
+# ForceAlign pulls in PyTorch; it is imported on first alignment, not at module import
+FORCEALIGN_AVAILABLE = importlib.util.find_spec("forcealign") is not None
 
 def check_forcealign_availability():
     """Check if ForceAlign is available and provide installation instructions."""
@@ -29,12 +28,16 @@ def install_forcealign_instructions():
     Note: ForceAlign requires PyTorch and may need additional dependencies.
     """
 
-def transcribe_with_forcealign_timestamps(audio_path: str, transcript: str = None) -> List[Dict[str, Any]]:
+@traced("transcribe_with_forcealign")
+def transcribe_with_forcealign_timestamps(audio_path: AudioInput, transcript: str = None) -> List[Dict[str, Any]]:
     """
     Get word-level timestamps using ForceAlign.
 
+    ForceAlign only reads files, so in-memory audio is written to a temporary
+    file for the duration of the alignment.
+
     Args:
-        audio_path (str): Path to audio file
+        audio_path: Audio file path, bytes, file-like object or decoded audio
         transcript (str): Optional transcript. If None, ForceAlign will generate one.
 
     Returns:
@@ -43,34 +46,28 @@ def transcribe_with_forcealign_timestamps(audio_path: str, transcript: str = Non
     if not FORCEALIGN_AVAILABLE:
         raise ImportError("ForceAlign not available. Please install: pip install forcealign")
 
-    try:
-        # Convert audio to supported format if needed
-        temp_wav_path = None
-        if not audio_path.lower().endswith(('.wav', '.mp3')):
-            # Convert to WAV using librosa
-            y, sr = librosa.load(audio_path, sr=None)
-            temp_wav_path = tempfile.NamedTemporaryFile(suffix='.wav', delete=False).name
-            sf.write(temp_wav_path, y, sr)
-            audio_path_for_alignment = temp_wav_path
-        else:
-            audio_path_for_alignment = audio_path
-
-        # Perform forced alignment using correct API
-        if transcript:
-            # Use provided transcript (e.g., from Deepgram)
-            print(f"🎯 Using provided transcript: '{transcript}'")
-            align = ForceAlign(audio_file=audio_path_for_alignment, transcript=transcript)
-        else:
-            # Let ForceAlign generate transcript automatically using Wav2Vec2
-            print("🔄 Generating transcript with ForceAlign's built-in ASR...")
-            align = ForceAlign(audio_file=audio_path_for_alignment)
-
-        # Run inference to get word alignments
-        words = align.inference()
+    from forcealign import ForceAlign
 
-        # Clean up temp file if created
-        if temp_wav_path and os.path.exists(temp_wav_path):
-            os.unlink(temp_wav_path)
+    try:
+        source = AudioSource.of(audio_path)
+        if source.format not in ("wav", "mp3"):
+            # Convert other formats to WAV
+            source = AudioSource(decoded=DecodedAudio(*source.load(sr=None)))
+
+        with source.as_path() as audio_path_for_alignment:
+            # Perform forced alignment using correct API
+            if transcript:
+                # Use provided transcript (e.g., from Deepgram)
+                print(f"🎯 Using provided transcript: '{transcript}'")
+                align = ForceAlign(audio_file=audio_path_for_alignment, transcript=transcript)
+            else:
+                # Let ForceAlign generate transcript automatically using Wav2Vec2
+                print("🔄 Generating transcript with ForceAlign's built-in ASR...")
+                align = ForceAlign(audio_file=audio_path_for_alignment)
+
+            # Run inference to get word alignments
+            with span("forcealign_inference", with_transcript=bool(transcript)):
+                words = align.inference()
 
         # Convert to expected format
         word_timestamps = []
@@ -84,17 +81,36 @@ def transcribe_with_forcealign_timestamps(audio_path: str, transcript: str = Non
         return word_timestamps
 
     except Exception as e:
-        # Clean up temp file if created and error occurred
-        if temp_wav_path and os.path.exists(temp_wav_path):
-            os.unlink(temp_wav_path)
         raise Exception(f"ForceAlign transcription failed: {str(e)}")
 
-def get_forcealign_transcript(audio_path: str) -> str:
+def warm_up_forcealign() -> bool:
+    """
+    Load ForceAlign (PyTorch and the alignment model) by aligning one second of
+    silence, so the first real file of a batch does not pay the start-up cost.
+
+    Returns:
+        bool: True if ForceAlign could be imported
+    """
+    if not FORCEALIGN_AVAILABLE:
+        return False
+    try:
+        importlib.import_module("forcealign")
+    except Exception as e:
+        print(f"⚠️ ForceAlign could not be loaded: {e}")
+        return False
+    try:
+        transcribe_with_forcealign_timestamps(DecodedAudio(np.zeros(16000, dtype=np.float32), 16000), "warm up")
+    except Exception:
+        # Silence may not align; the model is loaded either way
+        pass
+    return True
+
+def get_forcealign_transcript(audio_path: AudioInput) -> str:
     """
     Get full transcript using ForceAlign.
 
     Args:
-        audio_path (str): Path to audio file
+        audio_path: Audio file path, bytes, file-like object or decoded audio
 
     Returns:
         str: Full transcript text
@@ -102,10 +118,13 @@ def get_forcealign_transcript(audio_path: str) -> str:
     if not FORCEALIGN_AVAILABLE:
         raise ImportError("ForceAlign not available. Please install: pip install forcealign")
 
+    from forcealign import ForceAlign
+
     try:
         # Use ForceAlign to generate transcript
-        align = ForceAlign(audio_file=audio_path)
-        words = align.inference()
+        with AudioSource.of(audio_path).as_path() as path:
+            align = ForceAlign(audio_file=path)
+            words = align.inference()
 
         # Get the raw transcript from the align object or construct from words
         if hasattr(align, 'raw_text') and align.raw_text:
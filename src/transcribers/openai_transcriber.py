@@ -1,39 +1,36 @@
-import openai
-import requests
-import json
-from config import OPENAI_API_KEY
+from config import OPENAI_API_KEY, OPENAI_TRANSCRIPTION_MODEL
+from src.utils.audio_input import AudioSource
+from src.utils.resources import get_openai_client
+from src.utils.tracing import span, traced
 
-# Model configuration - easy to switch
-# NOTE: gpt-4o-transcribe currently does NOT support word-level timestamps
-# Use whisper-1 for stretch analysis that requires word timestamps
-TRANSCRIPTION_MODEL = "gpt-4o-transcribe"  # Options: "whisper-1", "gpt-4o-transcribe"
+# Models that return word-level timestamps. Callers needing words are routed to
+# one of these up front by src/transcribers/registry.py.
+WORD_TIMESTAMP_MODELS = ("whisper-1",)
 
+@traced("transcribe_with_openai")
 def transcribe_with_openai_timestamps(file_path, model=None):
     """
     Transcribe audio using OpenAI API with word timestamps
     Returns list of words with start/end times
 
     Args:
-        file_path: Path to audio file
-        model: Model to use ("whisper-1" or "gpt-4o-transcribe"). If None, uses TRANSCRIPTION_MODEL
+        file_path: Audio file path, bytes, file-like object or decoded audio
+        model: Model to use ("whisper-1" or "gpt-4o-transcribe"). If None, uses OPENAI_TRANSCRIPTION_MODEL.
+            Models outside WORD_TIMESTAMP_MODELS return no words; use select_backend() to pick one.
     """
     if not OPENAI_API_KEY:
         raise ValueError("OpenAI API key not found. Please set OPENAI_API_KEY in your environment.")
 
+    source = AudioSource.of(file_path)
+
     # Use provided model or default
-    selected_model = model or TRANSCRIPTION_MODEL
+    selected_model = model or OPENAI_TRANSCRIPTION_MODEL
     print(f"Using transcription model: {selected_model}")
 
-    # Check if model supports word timestamps
-    if selected_model == "gpt-4o-transcribe":
-        print("WARNING: gpt-4o-transcribe does not support word-level timestamps!")
-        print("Automatically switching to whisper-1 for word timestamp support...")
-        selected_model = "whisper-1"
-
-    client = openai.OpenAI(api_key=OPENAI_API_KEY)
+    client = get_openai_client()
 
     try:
-        with open(file_path, 'rb') as audio_file:
+        with source.open_binary() as audio_file:
             # Create transcription request with timestamp support
             transcription_params = {
                 "model": selected_model,
@@ -43,12 +40,14 @@ def transcribe_with_openai_timestamps(file_path, model=None):
             }
 
             # Add word timestamps only for supported models
-            if selected_model == "whisper-1":
+            if selected_model in WORD_TIMESTAMP_MODELS:
                 transcription_params["timestamp_granularities"] = ["word"]
                 print("Added word-level timestamp support")
 
             print(f"Transcription parameters: {transcription_params}")
-            response = client.audio.transcriptions.create(**transcription_params)
+            # Upload plus server-side processing; dominated by network and API wait time
+            with span("openai_request", model=selected_model):
+                response = client.audio.transcriptions.create(**transcription_params)
 
         words = []
 
@@ -112,33 +111,8 @@ def transcribe_with_openai_timestamps(file_path, model=None):
 
     except Exception as e:
         print(f"Error transcribing with {selected_model}: {e}")
-
-        # Auto-fallback to whisper-1 if gpt-4o-transcribe fails
-        if selected_model == "gpt-4o-transcribe":
-            print("Falling back to whisper-1...")
-            try:
-                return transcribe_with_openai_timestamps(file_path, model="whisper-1")
-            except Exception as fallback_error:
-                print(f"Fallback to whisper-1 also failed: {fallback_error}")
-
         return []
 
-def switch_to_whisper():
-    """Helper function to switch to whisper-1 model"""
-    global TRANSCRIPTION_MODEL
-    TRANSCRIPTION_MODEL = "whisper-1"
-    print("Switched to whisper-1 model")
-
-def switch_to_gpt4o():
-    """Helper function to switch to gpt-4o-transcribe model"""
-    global TRANSCRIPTION_MODEL
-    TRANSCRIPTION_MODEL = "gpt-4o-transcribe"
-    print("Switched to gpt-4o-transcribe model")
-
-def get_current_model():
-    """Get current transcription model"""
-    return TRANSCRIPTION_MODEL
-
 def transcribe_with_gpt4o(file_path):
     """
     Test function to transcribe with gpt-4o-transcribe (no word timestamps)
@@ -147,10 +121,10 @@ def transcribe_with_gpt4o(file_path):
     if not OPENAI_API_KEY:
         raise ValueError("OpenAI API key not found. Please set OPENAI_API_KEY in your environment.")
 
-    client = openai.OpenAI(api_key=OPENAI_API_KEY)
+    client = get_openai_client()
 
     try:
-        with open(file_path, 'rb') as audio_file:
+        with AudioSource.of(file_path).open_binary() as audio_file:
             print("Testing gpt-4o-transcribe model...")
             response = client.audio.transcriptions.create(
                 model="gpt-4o-transcribe",
@@ -0,0 +1,249 @@
+"""
+Transcriber registry - Backends and their capabilities, chosen before any call
+Each backend declares what it can do (word timestamps, upload size limit,
+languages) and what it costs (USD per audio minute, typical seconds of latency
+per audio minute). select_backend() routes a request to a backend that can
+serve it up front, so no API call is spent discovering that a model returns no
+word timestamps and no fallback happens at request time.
+
+Backends name their transcribe function by "module:function" and import it on
+first use, which keeps API SDKs and models out of page imports. A new (e.g.
+local) backend is plugged in with register_backend(). Whatever a backend
+function returns (word dicts or a hybrid result dict), transcribe() hands the
+analyzers a WordTable.
+"""
+
+import importlib
+import importlib.util
+import os
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple, Union
+
+from config import OPENAI_TRANSCRIPTION_MODEL
+from src.utils.word_table import WordTable
+
+
+class BackendUnavailable(ValueError):
+    """No registered backend can serve the request (unknown name, missing capability or setup)."""
+
+
+class TranscriptionFailed(RuntimeError):
+    """A backend reported failure (hybrid backends return an error instead of raising)."""
+
+
+class TranscriberBackend:
+    """
+    One way of getting a transcript.
+
+    Attributes:
+        name (str): Registry key (also the stretch `method` for non-OpenAI backends)
+        label (str): Display name
+        provider (str): Who serves it; same-provider backends substitute for each other
+        target (str | callable): "module:function" (imported on first use) or a callable,
+            called as function(audio, **options)
+        word_timestamps (bool): Returns per-word start/end times
+        max_file_mb (float | None): Upload size limit
+        languages (tuple | None): Supported language codes (None = multilingual)
+        cost_per_minute (float): USD per audio minute
+        latency_sec_per_min (float): Typical wall time per audio minute
+        local (bool): Runs on this machine
+        requires_modules (tuple): Importable modules needed
+        requires_env (tuple): Environment variables needed
+        options (dict): Keyword arguments always passed to the target
+    """
+
+    __slots__ = ("name", "label", "provider", "target", "word_timestamps", "max_file_mb", "languages",
+                 "cost_per_minute", "latency_sec_per_min", "local", "requires_modules", "requires_env", "options")
+
+    def __init__(self, name: str, label: str, provider: str, target: Union[str, Callable],
+                 word_timestamps: bool = True,
+                 max_file_mb: Optional[float] = None, languages: Optional[Tuple[str, ...]] = None,
+                 cost_per_minute: float = 0.0, latency_sec_per_min: float = 0.0, local: bool = False,
+                 requires_modules: Tuple[str, ...] = (), requires_env: Tuple[str, ...] = (),
+                 options: Optional[Dict[str, Any]] = None):
+        self.name = name
+        self.label = label
+        self.provider = provider
+        self.target = target
+        self.word_timestamps = word_timestamps
+        self.max_file_mb = max_file_mb
+        self.languages = languages
+        self.cost_per_minute = cost_per_minute
+        self.latency_sec_per_min = latency_sec_per_min
+        self.local = local
+        self.requires_modules = requires_modules
+        self.requires_env = requires_env
+        self.options = options or {}
+
+    def missing_requirements(self) -> List[str]:
+        missing = [f"module {module}" for module in self.requires_modules if importlib.util.find_spec(module) is None]
+        missing += [f"{variable} not set" for variable in self.requires_env if not os.getenv(variable)]
+        return missing
+
+    def is_available(self) -> bool:
+        return not self.missing_requirements()
+
+    def unsupported(self, word_timestamps: bool = False, language: Optional[str] = None,
+                    file_mb: Optional[float] = None) -> List[str]:
+        """Reasons this backend cannot serve a request (empty when it can)."""
+        reasons = []
+        if word_timestamps and not self.word_timestamps:
+            reasons.append("no word timestamps")
+        if language and self.languages is not None and language.split("-")[0] not in self.languages:
+            reasons.append(f"language {language} not supported")
+        if file_mb is not None and self.max_file_mb is not None and file_mb > self.max_file_mb:
+            reasons.append(f"file is {file_mb:.1f} MB, limit {self.max_file_mb:g} MB")
+        return reasons
+
+    def transcribe(self, audio, **options) -> WordTable:
+        """
+        Word timestamps for the audio as a columnar WordTable.
+
+        Raises:
+            TranscriptionFailed: The backend returned an unsuccessful result
+        """
+        function = self.target
+        if isinstance(function, str):
+            module_name, function_name = function.split(":")
+            function = getattr(importlib.import_module(module_name), function_name)
+        result = function(audio, **{**self.options, **options})
+        if isinstance(result, dict):
+            if not result.get("success"):
+                raise TranscriptionFailed(result.get("error", f"{self.label} transcription failed"))
+            result = result.get("word_timestamps")
+        return WordTable.coerce(result)
+
+    def describe(self) -> Dict[str, Any]:
+        return {
+            "name": self.name,
+            "label": self.label,
+            "provider": self.provider,
+            "word_timestamps": self.word_timestamps,
+            "max_file_mb": self.max_file_mb,
+            "languages": list(self.languages) if self.languages else None,
+            "cost_per_minute": self.cost_per_minute,
+            "latency_sec_per_min": self.latency_sec_per_min,
+            "local": self.local,
+            "available": self.is_available(),
+        }
+
+
+_BACKENDS: Dict[str, TranscriberBackend] = {}
+
+
+def register_backend(backend: TranscriberBackend, replace: bool = False) -> TranscriberBackend:
+    """Add a backend to the registry (replace=True to swap out an existing one)."""
+    if backend.name in _BACKENDS and not replace:
+        raise ValueError(f"Transcriber backend already registered: {backend.name}")
+    _BACKENDS[backend.name] = backend
+    return backend
+
+
+def unregister_backend(name: str):
+    _BACKENDS.pop(name, None)
+
+
+@contextmanager
+def backend_override(backend: TranscriberBackend) -> Iterator[TranscriberBackend]:
+    """Temporarily register a backend in place of any of the same name (e.g. a stub in benchmarks)."""
+    previous = _BACKENDS.get(backend.name)
+    _BACKENDS[backend.name] = backend
+    try:
+        yield backend
+    finally:
+        if previous is None:
+            _BACKENDS.pop(backend.name, None)
+        else:
+            _BACKENDS[backend.name] = previous
+
+
+def get_backend(name: str) -> TranscriberBackend:
+    try:
+        return _BACKENDS[name]
+    except KeyError:
+        raise BackendUnavailable(f"Unknown transcriber backend: {name}. Choose from {sorted(_BACKENDS)}")
+
+
+def list_backends(available_only: bool = False) -> List[TranscriberBackend]:
+    return [backend for backend in _BACKENDS.values() if not available_only or backend.is_available()]
+
+
+def backend_name(method: str, model: Optional[str] = None) -> str:
+    """Registry key for a stretch `method` ("openai" picks the OpenAI model backend)."""
+    if method == "openai":
+        return model or OPENAI_TRANSCRIPTION_MODEL
+    return method
+
+
+def select_backend(name: Optional[str] = None, word_timestamps: bool = False, language: Optional[str] = "en",
+                   file_mb: Optional[float] = None) -> TranscriberBackend:
+    """
+    The backend to call for a request. When the requested backend lacks a needed
+    capability, the cheapest (then fastest) available backend of the same provider
+    that has it is used instead; nothing is tried at request time.
+
+    Raises:
+        BackendUnavailable: Unknown backend, missing setup, or no capable substitute
+    """
+    requested = get_backend(name or OPENAI_TRANSCRIPTION_MODEL)
+    problems = requested.unsupported(word_timestamps, language, file_mb)
+    if not problems:
+        missing = requested.missing_requirements()
+        if missing:
+            raise BackendUnavailable(f"{requested.label} is not available: {', '.join(missing)}")
+        return requested
+
+    substitutes = [backend for backend in _BACKENDS.values()
+                   if backend.provider == requested.provider and backend is not requested
+                   and not backend.unsupported(word_timestamps, language, file_mb) and backend.is_available()]
+    if not substitutes:
+        raise BackendUnavailable(f"{requested.label} cannot serve this request: {'; '.join(problems)}")
+
+    chosen = min(substitutes, key=lambda backend: (backend.cost_per_minute, backend.latency_sec_per_min))
+    print(f"↪️ {requested.name} cannot serve this request ({'; '.join(problems)}); using {chosen.name}")
+    return chosen
+
+
+# Stretch page/batch method choices: display label -> stretch method
+STRETCH_METHODS = {
+    "OpenAI Whisper": "openai",
+    "ForceAlign": "forcealign",
+    "Whisper + ForceAlign (Hybrid)": "whisper_forcealign",
+    "Deepgram (Native Word Timings)": "deepgram",
+    "Deepgram + ForceAlign (Hybrid)": "deepgram_forcealign",
+}
+
+# Costs are list prices; latencies are rough figures for planning, not guarantees
+for _backend in (
+    TranscriberBackend(
+        "whisper-1", "OpenAI Whisper (whisper-1)", "openai",
+        "src.transcribers.openai_transcriber:transcribe_with_openai_timestamps",
+        word_timestamps=True, max_file_mb=25, cost_per_minute=0.006, latency_sec_per_min=6.0,
+        requires_modules=("openai",), requires_env=("OPENAI_API_KEY",), options={"model": "whisper-1"}),
+    TranscriberBackend(
+        "gpt-4o-transcribe", "OpenAI gpt-4o-transcribe", "openai",
+        "src.transcribers.openai_transcriber:transcribe_with_openai_timestamps",
+        word_timestamps=False, max_file_mb=25, cost_per_minute=0.006, latency_sec_per_min=5.0,
+        requires_modules=("openai",), requires_env=("OPENAI_API_KEY",), options={"model": "gpt-4o-transcribe"}),
+    TranscriberBackend(
+        "forcealign", "ForceAlign (local Wav2Vec2)", "local",
+        "src.transcribers.forcealign_transcriber:transcribe_with_forcealign_timestamps",
+        word_timestamps=True, languages=("en",), latency_sec_per_min=20.0, local=True,
+        requires_modules=("forcealign",)),
+    TranscriberBackend(
+        "whisper_forcealign", "Whisper + ForceAlign (Hybrid)", "openai+forcealign",
+        "src.transcribers.deepgram_transcriber:whisper_forcealign_hybrid_timestamps",
+        word_timestamps=True, max_file_mb=25, languages=("en",), cost_per_minute=0.006, latency_sec_per_min=26.0,
+        requires_modules=("openai", "forcealign"), requires_env=("OPENAI_API_KEY",)),
+    TranscriberBackend(
+        "deepgram", "Deepgram (native word timings)", "deepgram",
+        "src.transcribers.deepgram_transcriber:transcribe_with_deepgram_words",
+        word_timestamps=True, max_file_mb=2000, languages=("en",), cost_per_minute=0.0043, latency_sec_per_min=2.0,
+        requires_modules=("requests",), requires_env=("DEEPGRAM_API_KEY",)),
+    TranscriberBackend(
+        "deepgram_forcealign", "Deepgram + ForceAlign (Hybrid)", "deepgram+forcealign",
+        "src.transcribers.deepgram_transcriber:hybrid_deepgram_forcealign_timestamps",
+        word_timestamps=True, max_file_mb=2000, languages=("en",), cost_per_minute=0.0043, latency_sec_per_min=22.0,
+        requires_modules=("forcealign",), requires_env=("DEEPGRAM_API_KEY",)),
+):
+    register_backend(_backend)
@@ -0,0 +1,203 @@
+"""
+Silence trimming - Upload only the speech, then map word timestamps back
+Long non-speech gaps found by the local voice activity detector are cut out
+(leaving TRIM_KEEP_SEC of silence at each cut so words are not run together) and
+the remaining speech is concatenated into one 16 kHz mono FLAC. The trimmed
+upload is only used when it is smaller than the original file, and backends are
+chosen on the size actually uploaded. An OffsetMap records where each kept span
+sits in the original recording, so the words a transcriber returns for the
+trimmed audio are moved back onto the original timeline before any analyzer
+sees them.
+"""
+
+from typing import Any, Callable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from config import TARGET_SAMPLE_RATE, TRIM_KEEP_SEC, TRIM_MIN_SAVING, TRIM_MIN_SILENCE_SEC
+from src.analyzers.voice_activity import detect_voice_activity
+from src.utils.audio_input import AudioInput, AudioSource, DecodedAudio
+from src.utils.frame_features import iter_mono_chunks
+from src.utils.tracing import span
+from src.utils.word_table import WordTable
+
+
+class OffsetMap:
+    """
+    Kept spans of the original audio, in order.
+
+    Attributes:
+        original_starts (np.ndarray): Span starts in the original audio (seconds)
+        trimmed_starts (np.ndarray): Span starts in the trimmed audio (seconds)
+        lengths (np.ndarray): Span lengths (seconds)
+    """
+
+    __slots__ = ("original_starts", "trimmed_starts", "lengths")
+
+    def __init__(self, spans: Sequence[Tuple[float, float]]):
+        spans = np.asarray(spans, dtype=np.float64).reshape(-1, 2)
+        self.original_starts = spans[:, 0]
+        self.lengths = spans[:, 1] - spans[:, 0]
+        self.trimmed_starts = np.concatenate(([0.0], np.cumsum(self.lengths)[:-1]))
+
+    @property
+    def trimmed_duration(self) -> float:
+        return float(np.sum(self.lengths))
+
+    def to_original(self, times, at_end: bool = False) -> np.ndarray:
+        """
+        Map trimmed-audio times to the original timeline. A time exactly on a cut
+        belongs to the following span, or to the preceding one when at_end is True
+        (so a word ending at a cut does not absorb the removed silence).
+        """
+        times = np.asarray(times, dtype=np.float64)
+        index = np.searchsorted(self.trimmed_starts, times, side="left" if at_end else "right") - 1
+        index = np.clip(index, 0, len(self.trimmed_starts) - 1)
+        return self.original_starts[index] + (times - self.trimmed_starts[index])
+
+    def map_words(self, words):
+        """
+        Words with 'start'/'end' moved to the original timeline: a WordTable gets
+        new time arrays, a list of word dicts gets copies of the dicts.
+        """
+        if not words:
+            return words
+        if isinstance(words, WordTable):
+            starts = self.to_original(words.start)
+            return words.with_times(starts, np.maximum(self.to_original(words.end, at_end=True), starts))
+        starts = self.to_original([w["start"] for w in words])
+        ends = np.maximum(self.to_original([w["end"] for w in words], at_end=True), starts)
+        return [dict(word, start=float(start), end=float(end)) for word, start, end in zip(words, starts, ends)]
+
+    def map_result(self, result: Any) -> Any:
+        """Remap a transcriber result: words (list or WordTable), or a dict carrying them under 'word_timestamps'."""
+        if isinstance(result, (list, WordTable)):
+            return self.map_words(result)
+        if isinstance(result, dict) and result.get("word_timestamps"):
+            return dict(result, word_timestamps=self.map_words(result["word_timestamps"]))
+        return result
+
+
+class TrimmedAudio:
+    """Speech-only audio plus the map back to the original recording."""
+
+    __slots__ = ("source", "offsets", "original_duration")
+
+    def __init__(self, source: AudioSource, offsets: OffsetMap, original_duration: float):
+        self.source = source
+        self.offsets = offsets
+        self.original_duration = original_duration
+
+    @property
+    def removed_seconds(self) -> float:
+        return self.original_duration - self.offsets.trimmed_duration
+
+
+def kept_spans(gaps: Sequence[Tuple[float, float]], duration: float,
+               keep_sec: float = TRIM_KEEP_SEC) -> List[Tuple[float, float]]:
+    """Spans left after cutting each gap, keeping keep_sec of it next to speech."""
+    spans = []
+    position = 0.0
+    for gap_start, gap_end in gaps:
+        cut_start = gap_start + keep_sec if gap_start > 0 else 0.0
+        cut_end = gap_end - keep_sec if gap_end < duration else duration
+        if cut_end <= cut_start:
+            continue
+        if cut_start > position:
+            spans.append((position, cut_start))
+        position = cut_end
+    if position < duration:
+        spans.append((position, duration))
+    return spans
+
+
+def _concatenate_spans(source: AudioSource, sample_spans: List[Tuple[int, int]]) -> np.ndarray:
+    """Decode once, keeping only the samples inside the (ascending) spans."""
+    pieces = []
+    span_index = 0
+    position = 0
+    for chunk in iter_mono_chunks(source):
+        chunk_end = position + len(chunk)
+        while span_index < len(sample_spans) and sample_spans[span_index][0] < chunk_end:
+            start, end = sample_spans[span_index]
+            pieces.append(chunk[max(start - position, 0):min(end, chunk_end) - position])
+            if end > chunk_end:
+                break
+            span_index += 1
+        position = chunk_end
+    return np.concatenate(pieces).astype(np.float32) if pieces else np.zeros(0, dtype=np.float32)
+
+
+def trim_silences(source: AudioInput,
+                  min_silence_sec: float = TRIM_MIN_SILENCE_SEC,
+                  keep_sec: float = TRIM_KEEP_SEC,
+                  min_saving: float = TRIM_MIN_SAVING) -> Optional[TrimmedAudio]:
+    """
+    Cut non-speech gaps of at least min_silence_sec out of the audio.
+
+    Returns:
+        TrimmedAudio, or None when there is no speech, trimming would remove less
+        than min_saving of the duration, or the encoded speech is not smaller than
+        the original file (the original should be uploaded)
+    """
+    source = AudioSource.of(source)
+    with span("trim_silence"):
+        activity = detect_voice_activity(source)
+        if not len(activity.starts) or not activity.duration:
+            return None
+
+        gaps = activity.non_speech(min_silence_sec)
+        spans = kept_spans(gaps, activity.duration, keep_sec)
+        # Cut on whole samples so the offsets are exact
+        sample_spans = [(int(round(start * TARGET_SAMPLE_RATE)), int(round(end * TARGET_SAMPLE_RATE)))
+                        for start, end in spans]
+        sample_spans = [(start, end) for start, end in sample_spans if end > start]
+        kept = sum(end - start for start, end in sample_spans) / TARGET_SAMPLE_RATE
+        if activity.duration - kept < min_saving * activity.duration:
+            return None
+
+        samples = _concatenate_spans(source, sample_spans)
+        stem = source.name.rsplit(".", 1)[0]
+        # Uncompressed 16 kHz speech (~1.9 MB/min) can outweigh a compressed original
+        encoded = DecodedAudio(samples, TARGET_SAMPLE_RATE).to_flac_bytes()
+        if len(encoded) >= source.size_bytes:
+            print(f"✂️ Speech-only upload ({len(encoded) / 1e6:.1f} MB) is not smaller than the original "
+                  f"({source.size_bytes / 1e6:.1f} MB); uploading the original")
+            return None
+        trimmed = AudioSource(data=encoded, name=f"{stem}_speech.flac")
+        offsets = OffsetMap([(start / TARGET_SAMPLE_RATE, end / TARGET_SAMPLE_RATE) for start, end in sample_spans])
+    return TrimmedAudio(trimmed, offsets, activity.duration)
+
+
+def prepare_upload(source: AudioInput, trim: bool = True) -> Tuple[AudioSource, Optional[OffsetMap]]:
+    """
+    The audio to send to a transcriber and the map back to the original timeline
+    (None when the original is sent). Select the backend on the returned source's
+    size_bytes: that is what gets uploaded.
+    """
+    source = AudioSource.of(source)
+    trimmed = trim_silences(source) if trim else None
+    if trimmed is None:
+        return source, None
+
+    print(f"✂️ Trimmed {trimmed.removed_seconds:.1f}s of silence before transcription "
+          f"({trimmed.offsets.trimmed_duration:.1f}s of {trimmed.original_duration:.1f}s uploaded, "
+          f"{trimmed.source.size_bytes / 1e6:.1f} MB instead of {source.size_bytes / 1e6:.1f} MB)")
+    return trimmed.source, trimmed.offsets
+
+
+def transcribe_upload(transcribe: Callable, upload: AudioSource, offsets: Optional[OffsetMap], *args, **kwargs):
+    """Call transcribe(upload, *args, **kwargs), with word timestamps mapped back through offsets."""
+    result = transcribe(upload, *args, **kwargs)
+    return offsets.map_result(result) if offsets is not None else result
+
+
+def transcribe_trimmed(transcribe: Callable, source: AudioInput, *args, trim: bool = True, **kwargs):
+    """
+    Call transcribe(source, *args, **kwargs) on the speech-only audio and return its
+    result with word timestamps on the original timeline. Transcribers returning a
+    list of words and those returning a dict with 'word_timestamps' are supported;
+    with trim=False (or nothing worth cutting) the original audio is transcribed.
+    """
+    upload, offsets = prepare_upload(source, trim)
+    return transcribe_upload(transcribe, upload, offsets, *args, **kwargs)
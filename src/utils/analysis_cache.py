@@ -0,0 +1,70 @@
+"""
+Analysis cache - Streamlit-level caching of single-file analysis results
+Results are keyed by the upload's content hash plus the analysis parameters, so a
+rerun triggered by an unrelated widget (or returning to earlier slider values)
+reuses the earlier result instead of decoding and transcribing again.
+
+Heavy resources (API clients, CMU dictionary, stores) are cached per process in
+src/utils/resources.py and the storage modules; clear_caches() resets both layers.
+"""
+
+import json
+import os
+from typing import Any, Dict
+
+import streamlit as st
+
+from config import ANALYSIS_CACHE_MAX_ENTRIES, ANALYSIS_CACHE_TTL_SECONDS
+from src.services.runners import ANALYSIS_RUNNERS, result_succeeded
+from src.utils import resources
+from src.utils.audio_input import AudioSource
+from src.utils.hashing import bytes_sha256
+
+
+class _UncachedResult(Exception):
+    """Carries a failed result out of the cached function so it is not stored."""
+
+    def __init__(self, result: Dict[str, Any]):
+        super().__init__("analysis failed")
+        self.result = result
+
+
+@st.cache_data(max_entries=ANALYSIS_CACHE_MAX_ENTRIES, ttl=ANALYSIS_CACHE_TTL_SECONDS, show_spinner=False)
+def _cached_analysis(analysis: str, file_hash: str, params_key: str, suffix: str, _audio_bytes: bytes) -> Dict[str, Any]:
+    # _audio_bytes is excluded from Streamlit's cache key; file_hash stands in for it
+    source = AudioSource(data=_audio_bytes, name=f"upload{suffix}")
+    result = ANALYSIS_RUNNERS[analysis](source, **json.loads(params_key))
+
+    if not result_succeeded(result):
+        raise _UncachedResult(result)
+    return result
+
+
+def run_cached_analysis(analysis: str, uploaded_file, **params) -> Dict[str, Any]:
+    """
+    Run an analysis on an uploaded file, reusing a cached result when the same
+    content was analyzed with the same parameters.
+
+    Args:
+        analysis (str): Key of ANALYSIS_RUNNERS ("volume_velocity", "pause", "stretch")
+        uploaded_file: Streamlit UploadedFile (anything with .name and .getvalue())
+        **params: Analysis parameters, part of the cache key
+
+    Returns:
+        dict: The analyzer's result (a copy; failed results are never cached)
+    """
+    audio_bytes = uploaded_file.getvalue()
+    suffix = os.path.splitext(uploaded_file.name)[1] or ".wav"
+    params_key = json.dumps(params, sort_keys=True)
+    try:
+        return _cached_analysis(analysis, bytes_sha256(audio_bytes), params_key, suffix, audio_bytes)
+    except _UncachedResult as failed:
+        return failed.result
+
+
+def clear_caches():
+    """Drop cached analysis results and the per-process API clients / dictionaries."""
+    _cached_analysis.clear()
+    resources.get_openai_client.cache_clear()
+    resources.get_deepgram_session.cache_clear()
+    resources.get_cmu_dict.cache_clear()
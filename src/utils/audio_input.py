@@ -0,0 +1,221 @@
+"""
+Audio input - One representation for everything the analyzers accept
+Analyzers and transcribers take a file path, encoded bytes, a binary file-like
+object (e.g. a Streamlit UploadedFile) or already decoded samples. Uploads are
+analyzed straight from memory; a temporary file is only written for backends
+that insist on a path (ForceAlign).
+"""
+
+import io
+import os
+import tempfile
+import threading
+import wave
+from contextlib import contextmanager
+from typing import BinaryIO, Iterator, Optional, Tuple, Union
+
+import numpy as np
+
+DEFAULT_NAME = "audio.wav"
+
+
+class DecodedAudio:
+    """Decoded PCM: float32 samples in [-1, 1], shaped (n,) or (n, channels), plus the sample rate."""
+
+    __slots__ = ("samples", "sample_rate")
+
+    def __init__(self, samples: np.ndarray, sample_rate: int):
+        samples = np.asarray(samples)
+        if samples.dtype.kind in "iu":
+            samples = samples.astype(np.float32) / float(np.iinfo(samples.dtype).max + 1)
+        self.samples = samples.astype(np.float32, copy=False)
+        self.sample_rate = int(sample_rate)
+
+    @property
+    def channels(self) -> int:
+        return 1 if self.samples.ndim == 1 else self.samples.shape[1]
+
+    @property
+    def duration(self) -> float:
+        return len(self.samples) / self.sample_rate if self.sample_rate else 0.0
+
+    def mono(self) -> np.ndarray:
+        return self.samples if self.samples.ndim == 1 else self.samples.mean(axis=1)
+
+    def to_int16(self) -> np.ndarray:
+        return np.clip(np.round(self.samples * 32767), -32768, 32767).astype(np.int16)
+
+    def to_wav_bytes(self) -> bytes:
+        buffer = io.BytesIO()
+        with wave.open(buffer, "wb") as wav_file:
+            wav_file.setnchannels(self.channels)
+            wav_file.setsampwidth(2)
+            wav_file.setframerate(self.sample_rate)
+            wav_file.writeframes(self.to_int16().astype("<i2").tobytes())
+        return buffer.getvalue()
+
+    def to_flac_bytes(self) -> bytes:
+        """16-bit FLAC (lossless, typically about half the size of the WAV for speech)."""
+        import soundfile as sf
+
+        buffer = io.BytesIO()
+        sf.write(buffer, self.to_int16(), self.sample_rate, format="FLAC", subtype="PCM_16")
+        return buffer.getvalue()
+
+
+class AudioSource:
+    """
+    Normalized analyzer input. Exactly one of `path`, `data` (encoded file bytes)
+    or `decoded` is set; `name` carries the original file name (its extension is
+    the format hint for decoders and transcription APIs). `memo` holds values
+    derived from the audio (e.g. frame features) so analyzers sharing a source
+    compute them once; guard it with `memo_lock`.
+    """
+
+    __slots__ = ("path", "data", "decoded", "memo", "memo_lock", "_name")
+
+    def __init__(self, path: Optional[str] = None, data: Optional[bytes] = None,
+                 decoded: Optional[DecodedAudio] = None, name: Optional[str] = None):
+        if sum(value is not None for value in (path, data, decoded)) != 1:
+            raise ValueError("AudioSource needs exactly one of path, data or decoded")
+        self.path = path
+        self.data = data
+        self.decoded = decoded
+        self.memo = {}
+        # Re-entrant: memoized values may be built from other memoized values
+        self.memo_lock = threading.RLock()
+        self._name = name
+
+    @classmethod
+    def of(cls, source: "AudioInput") -> "AudioSource":
+        """
+        Wrap any supported input. File-like objects are read once here, so the
+        result can be shared by analyses running on several threads.
+
+        Raises:
+            TypeError: Unsupported input type
+        """
+        if isinstance(source, AudioSource):
+            return source
+        if isinstance(source, (str, os.PathLike)):
+            return cls(path=os.fspath(source))
+        if isinstance(source, (bytes, bytearray, memoryview)):
+            return cls(data=bytes(source))
+        if isinstance(source, DecodedAudio):
+            return cls(decoded=source)
+        if isinstance(source, tuple) and len(source) == 2 and isinstance(source[0], np.ndarray):
+            return cls(decoded=DecodedAudio(*source))
+        if hasattr(source, "read"):
+            name = os.path.basename(getattr(source, "name", "") or "") or None
+            if hasattr(source, "getvalue"):
+                return cls(data=source.getvalue(), name=name)
+            return cls(data=source.read(), name=name)
+        raise TypeError(f"Unsupported audio input: {type(source).__name__}")
+
+    @property
+    def name(self) -> str:
+        if self.path is not None:
+            return os.path.basename(self.path)
+        return self._name or DEFAULT_NAME
+
+    @property
+    def format(self) -> Optional[str]:
+        """File extension without the dot (None for decoded audio)."""
+        if self.decoded is not None:
+            return None
+        extension = os.path.splitext(self.name)[1].lstrip(".").lower()
+        return extension or None
+
+    def __str__(self) -> str:
+        return self.path if self.path is not None else f"<in-memory {self.name}>"
+
+    @property
+    def size_bytes(self) -> int:
+        """Encoded size (what an upload would send; decoded audio counts as 16-bit WAV)."""
+        if self.data is not None:
+            return len(self.data)
+        if self.decoded is not None:
+            return 44 + 2 * self.decoded.samples.size
+        return os.path.getsize(self.path)
+
+    def read_bytes(self) -> bytes:
+        """Encoded file bytes (decoded audio is encoded as 16-bit WAV)."""
+        if self.data is not None:
+            return self.data
+        if self.decoded is not None:
+            return self.decoded.to_wav_bytes()
+        with open(self.path, "rb") as f:
+            return f.read()
+
+    @contextmanager
+    def open_binary(self) -> Iterator[BinaryIO]:
+        """Binary file object named like the original file (for upload APIs)."""
+        if self.path is not None:
+            with open(self.path, "rb") as f:
+                yield f
+            return
+        buffer = io.BytesIO(self.read_bytes())
+        buffer.name = self.name if self.data is not None else DEFAULT_NAME
+        yield buffer
+
+    @contextmanager
+    def as_path(self) -> Iterator[str]:
+        """A real file path; in-memory audio is written to a temporary file for the duration."""
+        if self.path is not None:
+            yield self.path
+            return
+        suffix = os.path.splitext(self.name)[1] if self.data is not None else ".wav"
+        with tempfile.NamedTemporaryFile(delete=False, suffix=suffix or ".wav") as tmp_file:
+            tmp_file.write(self.read_bytes())
+            temp_path = tmp_file.name
+        try:
+            yield temp_path
+        finally:
+            os.unlink(temp_path)
+
+    def to_segment(self):
+        """Decode to a pydub AudioSegment (in-memory inputs are piped to ffmpeg, not written to disk)."""
+        from pydub import AudioSegment
+
+        if self.path is not None:
+            return AudioSegment.from_file(self.path)
+        if self.data is not None:
+            return AudioSegment.from_file(io.BytesIO(self.data), format=self.format)
+        decoded = self.decoded
+        return AudioSegment(data=decoded.to_int16().astype("<i2").tobytes(), sample_width=2,
+                            frame_rate=decoded.sample_rate, channels=decoded.channels)
+
+    def load(self, sr: Optional[int] = None) -> Tuple[np.ndarray, int]:
+        """
+        Mono float32 samples, like librosa.load(path, sr=sr).
+
+        Returns:
+            tuple: (samples, sample_rate)
+        """
+        import librosa
+
+        if self.path is not None:
+            return librosa.load(self.path, sr=sr)
+
+        if self.decoded is not None:
+            y, native_sr = self.decoded.mono(), self.decoded.sample_rate
+        else:
+            try:
+                import soundfile as sf
+                samples, native_sr = sf.read(io.BytesIO(self.data), dtype="float32", always_2d=True)
+                y = samples.mean(axis=1)
+            except Exception:
+                # Compressed formats libsndfile cannot read (e.g. m4a) go through ffmpeg
+                segment = self.to_segment()
+                native_sr = segment.frame_rate
+                samples = np.array(segment.get_array_of_samples(), dtype=np.float32).reshape(-1, segment.channels)
+                y = samples.mean(axis=1) / float(1 << (8 * segment.sample_width - 1))
+
+        y = np.ascontiguousarray(y, dtype=np.float32)
+        if sr is not None and sr != native_sr:
+            y = librosa.resample(y, orig_sr=native_sr, target_sr=sr)
+            native_sr = sr
+        return y, native_sr
+
+
+AudioInput = Union[str, os.PathLike, bytes, BinaryIO, DecodedAudio, Tuple[np.ndarray, int], AudioSource]
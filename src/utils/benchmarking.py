@@ -0,0 +1,99 @@
+"""
+Benchmarking helpers - Time callables and compare against a stored baseline
+"""
+
+import json
+import os
+import platform
+import statistics
+import time
+from typing import Any, Callable, Dict, List
+
+import numpy as np
+
+STATUS_OK = "ok"
+STATUS_REGRESSION = "regression"
+STATUS_FASTER = "faster"
+STATUS_NEW = "new"
+
+
+def time_callable(func: Callable[[], Any], repeat: int = 5, warmup: int = 1) -> Dict[str, float]:
+    """
+    Run `func` `warmup + repeat` times and summarize the timed runs.
+
+    Returns:
+        dict: median_ms, min_ms, max_ms and repeat
+    """
+    for _ in range(warmup):
+        func()
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        samples.append((time.perf_counter() - start) * 1000)
+    return {
+        "median_ms": round(statistics.median(samples), 3),
+        "min_ms": round(min(samples), 3),
+        "max_ms": round(max(samples), 3),
+        "repeat": repeat
+    }
+
+
+def environment_info() -> Dict[str, str]:
+    """Machine/interpreter details stored with a baseline; timings only compare on like hardware."""
+    return {
+        "python": platform.python_version(),
+        "numpy": np.__version__,
+        "machine": platform.machine(),
+        "processor": platform.processor() or platform.machine(),
+        "system": platform.system()
+    }
+
+
+def load_baseline(path: str) -> Dict[str, Any]:
+    if not os.path.exists(path):
+        return {}
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def save_baseline(path: str, benchmarks: Dict[str, Dict[str, float]]) -> None:
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    payload = {"created_at": time.time(), "environment": environment_info(), "benchmarks": benchmarks}
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(payload, f, indent=2, sort_keys=True)
+
+
+def compare_to_baseline(benchmarks: Dict[str, Dict[str, float]],
+                        baseline: Dict[str, Any],
+                        tolerance: float = 0.25,
+                        min_delta_ms: float = 1.0) -> List[Dict[str, Any]]:
+    """
+    Compare median timings against a baseline.
+
+    A benchmark regresses when it is more than `tolerance` (fractional) slower than
+    the baseline and the absolute slowdown exceeds `min_delta_ms` (to ignore noise
+    on sub-millisecond cases).
+
+    Returns:
+        list: One row per benchmark with name, baseline_ms, current_ms, ratio and status
+    """
+    baseline_benchmarks = baseline.get("benchmarks", {})
+    rows = []
+    for name, stats in benchmarks.items():
+        current = stats["median_ms"]
+        previous = baseline_benchmarks.get(name, {}).get("median_ms")
+        if previous is None:
+            rows.append({"name": name, "baseline_ms": None, "current_ms": current, "ratio": None, "status": STATUS_NEW})
+            continue
+        ratio = current / previous if previous > 0 else float("inf")
+        if ratio > 1 + tolerance and current - previous > min_delta_ms:
+            status = STATUS_REGRESSION
+        elif ratio < 1 - tolerance and previous - current > min_delta_ms:
+            status = STATUS_FASTER
+        else:
+            status = STATUS_OK
+        rows.append({"name": name, "baseline_ms": previous, "current_ms": current, "ratio": round(ratio, 3), "status": status})
+    return rows
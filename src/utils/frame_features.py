@@ -0,0 +1,343 @@
+"""
+Frame features - Per-file energy (and optional zero-crossing) blocks computed once
+The file is decoded once to mono at TARGET_SAMPLE_RATE (PCM WAV is streamed in
+chunks, other formats are decoded with pydub) and reduced to per-block
+sums of squares at a small base hop (FEATURE_HOP_MS). Every coarser view the
+analyzers need (50 ms volume frames, 25/10 ms boundary frames, sliding silence
+windows) is derived from those sums with cumulative sums, never by another pass
+over the samples.
+
+Derived frame and hop lengths are rounded to whole base blocks, so timings are
+exact to within one base hop.
+"""
+
+import io
+import wave
+from typing import Iterable, Iterator, List, Optional, Tuple
+
+import numpy as np
+
+from config import FEATURE_HOP_MS, TARGET_SAMPLE_RATE
+from src.utils.audio_input import AudioInput, AudioSource
+
+# Blocks converted to float64 at a time (~10 s of 16 kHz audio at a 5 ms hop)
+_CHUNK_BLOCKS = 2048
+# Seconds of audio decoded at a time when streaming
+_CHUNK_SECONDS = 10.0
+
+
+class FrameFeatures:
+    """
+    Block energy of one decoded file.
+
+    Attributes:
+        sample_rate (int): Rate the blocks were computed at
+        base_ms (int): Block length in ms
+        block_sumsq (np.ndarray): float64 sum of squared, full-scale normalized samples per block
+        block_counts (np.ndarray): Samples per block (the last block may be partial)
+        block_crossings (np.ndarray | None): Sign changes per block when computed with zcr=True
+        duration_ms (int): Length in ms (as pydub reports it)
+    """
+
+    __slots__ = ("sample_rate", "base_ms", "block_sumsq", "block_counts", "block_crossings", "duration_ms")
+
+    def __init__(self, sample_rate: int, base_ms: int, block_sumsq: np.ndarray, block_counts: np.ndarray,
+                 duration_ms: int, block_crossings: Optional[np.ndarray] = None):
+        self.sample_rate = sample_rate
+        self.base_ms = base_ms
+        self.block_sumsq = block_sumsq
+        self.block_counts = block_counts
+        self.block_crossings = block_crossings
+        self.duration_ms = duration_ms
+
+    @classmethod
+    def from_samples(cls, samples: np.ndarray, sample_rate: int, base_ms: int = FEATURE_HOP_MS,
+                     full_scale: float = 1.0, zcr: bool = False, duration_ms: Optional[int] = None) -> "FrameFeatures":
+        """
+        Args:
+            samples: Mono samples (any numeric dtype)
+            sample_rate (int): Sample rate of `samples`
+            base_ms (int): Block length in ms (must give a whole number of samples)
+            full_scale (float): Amplitude that maps to 0 dBFS (32768 for int16)
+            zcr (bool): Also count zero crossings per block
+            duration_ms (int): Override for the reported length (defaults to len(samples) in ms)
+        """
+        x = np.asarray(samples)
+        accumulator = _BlockAccumulator(sample_rate, base_ms, full_scale, zcr)
+        # Work through the signal in chunks so only one chunk is ever held as float64
+        chunk_len = _CHUNK_BLOCKS * accumulator.block_len
+        for start in range(0, len(x), chunk_len):
+            accumulator.feed(x[start:start + chunk_len])
+        return accumulator.finish(duration_ms)
+
+    @classmethod
+    def from_segment(cls, segment, base_ms: int = FEATURE_HOP_MS, zcr: bool = False) -> "FrameFeatures":
+        """Blocks for a pydub AudioSegment (mixed to mono at TARGET_SAMPLE_RATE first)."""
+        segment = segment.set_channels(1).set_frame_rate(TARGET_SAMPLE_RATE)
+        samples = np.array(segment.get_array_of_samples())
+        return cls.from_samples(samples, segment.frame_rate, base_ms, float(segment.max_possible_amplitude),
+                                zcr=zcr, duration_ms=len(segment))
+
+    @classmethod
+    def from_chunks(cls, chunks: Iterable[np.ndarray], sample_rate: int = TARGET_SAMPLE_RATE,
+                    base_ms: int = FEATURE_HOP_MS, zcr: bool = False) -> "FrameFeatures":
+        """Blocks for a stream of full-scale normalized mono chunks (e.g. from iter_mono_chunks)."""
+        accumulator = _BlockAccumulator(sample_rate, base_ms, 1.0, zcr)
+        for chunk in chunks:
+            accumulator.feed(chunk)
+        return accumulator.finish()
+
+    def _blocks(self, length_ms: int) -> int:
+        return max(1, int(round(length_ms / self.base_ms)))
+
+    @property
+    def _full_blocks(self) -> int:
+        """Number of complete blocks (only the last block can be partial)."""
+        block_len = self.sample_rate * self.base_ms // 1000
+        n_blocks = len(self.block_counts)
+        return n_blocks - 1 if n_blocks and self.block_counts[-1] < block_len else n_blocks
+
+    @property
+    def duration(self) -> float:
+        return self.duration_ms / 1000.0
+
+    def frame_rms(self, frame_ms: int, hop_ms: Optional[int] = None) -> np.ndarray:
+        """
+        Full-scale RMS (0..1) of frames `frame_ms` long starting every `hop_ms`
+        (non-overlapping when hop_ms is None). Only complete frames are returned.
+        """
+        frame_blocks = self._blocks(frame_ms)
+        hop_blocks = self._blocks(hop_ms) if hop_ms else frame_blocks
+        n_full = self._full_blocks
+        if n_full < frame_blocks:
+            return np.zeros(0)
+
+        sumsq = np.concatenate(([0.0], np.cumsum(self.block_sumsq[:n_full])))
+        counts = np.concatenate(([0], np.cumsum(self.block_counts[:n_full])))
+        starts = np.arange(0, n_full - frame_blocks + 1, hop_blocks)
+        ends = starts + frame_blocks
+        return np.sqrt(np.maximum(sumsq[ends] - sumsq[starts], 0.0) / (counts[ends] - counts[starts]))
+
+    def frame_dbfs(self, frame_ms: int) -> np.ndarray:
+        """
+        dBFS of consecutive `frame_ms` frames covering the first duration_ms // frame_ms
+        frames (pydub semantics: integer RMS, digital silence is NaN).
+        """
+        n_frames = self.duration_ms // frame_ms
+        rms = np.zeros(n_frames)
+        computed = self.frame_rms(frame_ms)[:n_frames]
+        # pydub's AudioSegment.rms is an integer 16-bit sample value
+        rms[:len(computed)] = np.floor(computed * 32768.0 + 1e-9) / 32768.0
+        dbfs = np.full(n_frames, np.nan)
+        valid = rms > 0
+        dbfs[valid] = 20 * np.log10(rms[valid])
+        return dbfs
+
+    def frame_times(self, frame_ms: int, hop_ms: Optional[int] = None) -> np.ndarray:
+        """Centre time in seconds of each frame returned by frame_rms(frame_ms, hop_ms)."""
+        frame_blocks = self._blocks(frame_ms)
+        hop_blocks = self._blocks(hop_ms) if hop_ms else frame_blocks
+        count = len(self.frame_rms(frame_ms, hop_ms))
+        return (np.arange(count) * hop_blocks + frame_blocks / 2) * self.base_ms / 1000.0
+
+    def zero_crossing_rate(self, frame_ms: int, hop_ms: Optional[int] = None) -> np.ndarray:
+        """Zero crossings per sample for the frames of frame_rms(frame_ms, hop_ms)."""
+        if self.block_crossings is None:
+            raise ValueError("Zero crossings were not computed; build the features with zcr=True")
+        frame_blocks = self._blocks(frame_ms)
+        hop_blocks = self._blocks(hop_ms) if hop_ms else frame_blocks
+        count = len(self.frame_rms(frame_ms, hop_ms))
+        crossings = np.concatenate(([0], np.cumsum(self.block_crossings)))
+        samples = np.concatenate(([0], np.cumsum(self.block_counts)))
+        starts = np.arange(count) * hop_blocks
+        ends = starts + frame_blocks
+        return (crossings[ends] - crossings[starts]) / (samples[ends] - samples[starts])
+
+    def silent_ranges(self, min_silence_ms: float, silence_thresh_db: float) -> List[List[int]]:
+        """
+        Equivalent of pydub.silence.detect_silence with seek_step = base hop.
+
+        Returns:
+            list: [start_ms, end_ms] pairs of silence at least min_silence_ms long
+        """
+        if self.duration_ms < min_silence_ms:
+            return []
+        window_blocks = self._blocks(min_silence_ms)
+        window_ms = window_blocks * self.base_ms
+        rms = self.frame_rms(window_ms, self.base_ms)
+        if not len(rms):
+            return []
+
+        # pydub compares the integer RMS against the threshold amplitude
+        full_scale = 32768.0
+        threshold = 10 ** (silence_thresh_db / 20) * full_scale
+        silent = np.flatnonzero(np.floor(rms * full_scale + 1e-9) <= threshold)
+        if not len(silent):
+            return []
+
+        # Windows closer together than one window length merge into one range
+        starts_ms = silent * self.base_ms
+        breaks = np.flatnonzero(np.diff(starts_ms) > window_ms)
+        range_starts = np.concatenate(([starts_ms[0]], starts_ms[breaks + 1]))
+        range_ends = np.concatenate((starts_ms[breaks], [starts_ms[-1]])) + window_ms
+        return [[int(start), int(min(end, self.duration_ms))] for start, end in zip(range_starts, range_ends)]
+
+
+class _BlockAccumulator:
+    """Reduces a stream of mono sample chunks to per-block sums of squares (and crossings)."""
+
+    def __init__(self, sample_rate: int, base_ms: int, full_scale: float, zcr: bool):
+        block_len = sample_rate * base_ms // 1000
+        if block_len <= 0 or block_len * 1000 != sample_rate * base_ms:
+            raise ValueError(f"{base_ms} ms is not a whole number of samples at {sample_rate} Hz")
+        self.sample_rate = sample_rate
+        self.base_ms = base_ms
+        self.block_len = block_len
+        self.full_scale = full_scale
+        self.zcr = zcr
+        self.n_samples = 0
+        self._sumsq: List[np.ndarray] = []
+        self._crossings: List[np.ndarray] = []
+        self._carry = np.zeros(0)
+        self._last_sign: Optional[bool] = None
+
+    def feed(self, chunk: np.ndarray):
+        self.n_samples += len(chunk)
+        x = np.concatenate((self._carry, chunk)) if len(self._carry) else chunk
+        n_full = len(x) // self.block_len
+        if n_full:
+            self._process(x[:n_full * self.block_len])
+        self._carry = x[n_full * self.block_len:]
+
+    def _process(self, x: np.ndarray):
+        """Add the blocks of x; only the final block may be partial."""
+        n_blocks = -(-len(x) // self.block_len)
+        padded = np.zeros(n_blocks * self.block_len)
+        padded[:len(x)] = x.astype(np.float64) / self.full_scale
+        blocks = padded.reshape(n_blocks, self.block_len)
+        self._sumsq.append(np.einsum("ij,ij->i", blocks, blocks))
+
+        if self.zcr:
+            # A crossing is counted in the block of the sample after it, across chunk edges too
+            signs = np.signbit(x)
+            changes = np.zeros(n_blocks * self.block_len, dtype=np.int8)
+            changes[1:len(x)] = signs[1:] != signs[:-1]
+            if self._last_sign is not None:
+                changes[0] = signs[0] != self._last_sign
+            self._crossings.append(changes.reshape(n_blocks, self.block_len).sum(axis=1, dtype=np.int64))
+            self._last_sign = bool(signs[-1])
+
+    def finish(self, duration_ms: Optional[int] = None) -> FrameFeatures:
+        if len(self._carry):
+            self._process(self._carry)
+            self._carry = np.zeros(0)
+        block_sumsq = np.concatenate(self._sumsq) if self._sumsq else np.zeros(0)
+        block_counts = np.full(len(block_sumsq), self.block_len, dtype=np.int64)
+        if len(block_counts) and self.n_samples % self.block_len:
+            block_counts[-1] = self.n_samples % self.block_len
+        block_crossings = None
+        if self.zcr:
+            block_crossings = np.concatenate(self._crossings) if self._crossings else np.zeros(0, dtype=np.int64)
+        if duration_ms is None:
+            duration_ms = int(round(self.n_samples * 1000 / self.sample_rate))
+        return FrameFeatures(self.sample_rate, self.base_ms, block_sumsq, block_counts, duration_ms, block_crossings)
+
+
+def select_percentile(values: np.ndarray, q: float) -> float:
+    """
+    np.percentile(values, q) (linear interpolation) by selection: only the two
+    neighbouring order statistics are placed, the values are never fully sorted.
+    """
+    position = (len(values) - 1) * q / 100.0
+    lower = int(np.floor(position))
+    upper = min(lower + 1, len(values) - 1)
+    selected = np.partition(values, (lower, upper))
+    return float(selected[lower] + (selected[upper] - selected[lower]) * (position - lower))
+
+
+def _open_pcm_wav(source: AudioSource) -> Optional[wave.Wave_read]:
+    """A reader for 16-bit mono/stereo PCM WAV input (None for anything pydub must decode)."""
+    if source.decoded is not None or source.format not in (None, "wav"):
+        return None
+    try:
+        reader = wave.open(source.path if source.path is not None else io.BytesIO(source.data), "rb")
+    except (wave.Error, EOFError):
+        return None
+    if reader.getsampwidth() != 2 or reader.getnchannels() not in (1, 2):
+        reader.close()
+        return None
+    return reader
+
+
+def _decoded_mono(source: AudioSource) -> Tuple[np.ndarray, float]:
+    """
+    (samples, full_scale) of a non-WAV source, mono at TARGET_SAMPLE_RATE as pydub
+    decodes it; memoized so VAD, frame features, trimming and plots share one decode.
+    """
+    with source.memo_lock:
+        decoded = source.memo.get("mono_samples")
+        if decoded is None:
+            segment = source.to_segment().set_channels(1).set_frame_rate(TARGET_SAMPLE_RATE)
+            decoded = (np.array(segment.get_array_of_samples()), float(segment.max_possible_amplitude))
+            source.memo["mono_samples"] = decoded
+        return decoded
+
+
+def iter_mono_chunks(source: AudioInput, chunk_seconds: float = _CHUNK_SECONDS) -> Iterator[np.ndarray]:
+    """
+    Decode audio to float64 mono at TARGET_SAMPLE_RATE, full-scale normalized, in chunks.
+
+    PCM WAV is read chunk by chunk and mixed/resampled with the same audioop calls
+    pydub makes (the resampler state is carried across chunks), so the samples are
+    identical to a full pydub decode but the native-rate signal is never held in
+    memory. Other formats are decoded with pydub once per source (the mono samples
+    are memoized on it) and then sliced.
+    """
+    from pydub.utils import audioop
+
+    source = AudioSource.of(source)
+    reader = _open_pcm_wav(source)
+    if reader is None:
+        samples, full_scale = _decoded_mono(source)
+        chunk_len = int(chunk_seconds * TARGET_SAMPLE_RATE)
+        for start in range(0, len(samples), chunk_len):
+            yield samples[start:start + chunk_len] / full_scale
+        return
+
+    with reader:
+        channels, rate = reader.getnchannels(), reader.getframerate()
+        chunk_frames = int(chunk_seconds * rate)
+        ratecv_state = None
+        while True:
+            data = reader.readframes(chunk_frames)
+            if not data:
+                break
+            if channels == 2:
+                data = audioop.tomono(data, 2, 0.5, 0.5)
+            if rate != TARGET_SAMPLE_RATE:
+                data, ratecv_state = audioop.ratecv(data, 2, 1, rate, TARGET_SAMPLE_RATE, ratecv_state)
+            yield np.frombuffer(data, dtype="<i2") / 32768.0
+
+
+def load_mono(source: AudioInput) -> np.ndarray:
+    """The whole signal as float64 mono at TARGET_SAMPLE_RATE (the samples iter_mono_chunks yields)."""
+    chunks = list(iter_mono_chunks(source))
+    return np.concatenate(chunks) if chunks else np.zeros(0)
+
+
+def _compute_features(source: AudioSource, zcr: bool) -> FrameFeatures:
+    return FrameFeatures.from_chunks(iter_mono_chunks(source), zcr=zcr)
+
+
+def get_frame_features(source: AudioInput, zcr: bool = False) -> FrameFeatures:
+    """
+    Frame features of an audio source, computed on first use and memoized on the
+    AudioSource so every analyzer given the same source shares one decode and one pass.
+    """
+    source = AudioSource.of(source)
+    with source.memo_lock:
+        features = source.memo.get("frame_features")
+        if features is None or (zcr and features.block_crossings is None):
+            features = _compute_features(source, zcr)
+            source.memo["frame_features"] = features
+        return features
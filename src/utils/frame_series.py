@@ -0,0 +1,110 @@
+"""
+Frame series - Compact per-frame volume values
+Frame loudness is stored as int16 centi-dB (0.01 dB resolution, the same precision
+as the previous rounded float lists) with a small time header, instead of a Python
+list of floats: 2 bytes per frame rather than ~30.
+"""
+
+import base64
+from typing import Any, Dict, Iterable, Iterator, List
+
+import numpy as np
+
+# Raw value marking a frame with no signal (rms == 0); such frames have no dBFS value
+SILENT_FRAME = np.iinfo(np.int16).min
+
+# Marker key identifying a serialized frame series
+SERIES_MARKER = "__frame_series__"
+
+
+class FrameSeries:
+    """
+    Fixed-rate series of frame loudness values in dBFS.
+
+    Frame i covers [offset_ms + i * frame_ms, offset_ms + (i + 1) * frame_ms).
+    Silent frames keep their slot so the time axis stays implicit, but they are
+    excluded from `values`, `len()` and iteration, matching the analyzer's old output.
+    """
+
+    __slots__ = ("centi_db", "frame_ms", "offset_ms")
+
+    def __init__(self, centi_db: np.ndarray, frame_ms: int, offset_ms: int = 0):
+        self.centi_db = np.asarray(centi_db, dtype=np.int16)
+        self.frame_ms = int(frame_ms)
+        self.offset_ms = int(offset_ms)
+
+    @classmethod
+    def from_dbfs(cls, dbfs: Iterable[float], frame_ms: int, offset_ms: int = 0) -> "FrameSeries":
+        """Build a series from dBFS floats; NaN or -inf entries become silent frames."""
+        dbfs = np.asarray(dbfs, dtype=np.float64)
+        centi_db = np.full(dbfs.shape, SILENT_FRAME, dtype=np.int16)
+        finite = np.isfinite(dbfs)
+        centi_db[finite] = np.clip(np.round(dbfs[finite] * 100), SILENT_FRAME + 1, np.iinfo(np.int16).max)
+        return cls(centi_db, frame_ms, offset_ms)
+
+    @property
+    def valid_mask(self) -> np.ndarray:
+        return self.centi_db != SILENT_FRAME
+
+    @property
+    def values(self) -> np.ndarray:
+        """dBFS values of the non-silent frames (float32)."""
+        return self.centi_db[self.valid_mask].astype(np.float32) / np.float32(100)
+
+    def times_ms(self) -> np.ndarray:
+        """Start time (ms) of every non-silent frame."""
+        return self.offset_ms + np.flatnonzero(self.valid_mask) * self.frame_ms
+
+    @property
+    def nbytes(self) -> int:
+        return self.centi_db.nbytes
+
+    def __len__(self) -> int:
+        return int(np.count_nonzero(self.valid_mask))
+
+    def __iter__(self) -> Iterator[float]:
+        return iter(self.values.tolist())
+
+    def __array__(self, dtype=None, copy=None):
+        values = self.values
+        return values if dtype is None else values.astype(dtype)
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, FrameSeries):
+            return NotImplemented
+        return (self.frame_ms == other.frame_ms and self.offset_ms == other.offset_ms
+                and np.array_equal(self.centi_db, other.centi_db))
+
+    def __repr__(self) -> str:
+        return f"FrameSeries(frames={len(self.centi_db)}, valid={len(self)}, frame_ms={self.frame_ms}, offset_ms={self.offset_ms})"
+
+    def tolist(self) -> List[float]:
+        """Non-silent values as rounded Python floats (legacy list form)."""
+        return [round(v, 2) for v in self.values.tolist()]
+
+    def to_dict(self) -> Dict[str, Any]:
+        """JSON-safe form: header plus base64 of the little-endian int16 buffer."""
+        return {
+            SERIES_MARKER: 1,
+            "frame_ms": self.frame_ms,
+            "offset_ms": self.offset_ms,
+            "centi_db": base64.b64encode(self.centi_db.astype("<i2").tobytes()).decode("ascii")
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "FrameSeries":
+        centi_db = np.frombuffer(base64.b64decode(data["centi_db"]), dtype="<i2").astype(np.int16)
+        return cls(centi_db, data["frame_ms"], data.get("offset_ms", 0))
+
+
+def frame_values_array(frame_values) -> np.ndarray:
+    """dBFS values of a FrameSeries or a legacy list as a float array."""
+    if isinstance(frame_values, FrameSeries):
+        return frame_values.values
+    return np.asarray(frame_values if frame_values is not None else [], dtype=np.float32)
+
+
+def concat_frame_values(series: Iterable) -> np.ndarray:
+    """Concatenate the non-silent values of several series into one float32 array."""
+    arrays = [frame_values_array(s) for s in series]
+    return np.concatenate(arrays) if arrays else np.empty(0, dtype=np.float32)
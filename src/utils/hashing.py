@@ -0,0 +1,21 @@
+"""
+Hashing helpers - Content hashes used to identify audio files across runs
+"""
+
+import hashlib
+
+HASH_CHUNK_BYTES = 1024 * 1024
+
+
+def file_sha256(file_path: str) -> str:
+    """Hash a file in fixed-size chunks so large recordings are never fully loaded."""
+    digest = hashlib.sha256()
+    with open(file_path, "rb") as f:
+        for chunk in iter(lambda: f.read(HASH_CHUNK_BYTES), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def bytes_sha256(data: bytes) -> str:
+    """Hash an in-memory payload (e.g. an uploaded file's bytes)."""
+    return hashlib.sha256(data).hexdigest()
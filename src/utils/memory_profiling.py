@@ -0,0 +1,266 @@
+"""
+Memory profiling - Opt-in per-stage memory tracking for the analysis pipeline
+When enabled, every tracing span also records Python heap allocation (tracemalloc)
+and process RSS (sampled in the background), so a stage that blows up memory on
+long files shows up next to its timings under result["timings"].
+
+Heap numbers are process-wide: with several files analyzed concurrently, a stage's
+peak includes allocations made by the other workers. Profile with one worker for
+clean per-stage attribution.
+"""
+
+import json
+import os
+import threading
+import time
+import tracemalloc
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, List, Optional
+
+from config import MEMORY_PROFILING, MEMORY_SAMPLE_INTERVAL_MS
+
+MEMORY_KEY = "memory"
+MB = 1024 * 1024
+
+_lock = threading.Lock()
+_enabled_count = 0
+_started_tracemalloc = False
+
+
+def _read_rss_bytes() -> Optional[int]:
+    try:
+        import psutil
+        return psutil.Process().memory_info().rss
+    except ImportError:
+        pass
+    try:
+        with open("/proc/self/statm", "r") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError):
+        return None
+
+
+def current_rss_bytes() -> Optional[int]:
+    """Resident set size of this process, or None where it cannot be read."""
+    return _read_rss_bytes()
+
+
+def is_enabled() -> bool:
+    return _enabled_count > 0
+
+
+def enable():
+    """Start memory profiling (calls nest; tracemalloc is started if not already running)."""
+    global _enabled_count, _started_tracemalloc
+    with _lock:
+        if _enabled_count == 0 and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            _started_tracemalloc = True
+        _enabled_count += 1
+
+
+def disable():
+    """Undo one enable(); tracemalloc is stopped when the last caller disables it."""
+    global _enabled_count, _started_tracemalloc
+    with _lock:
+        if _enabled_count == 0:
+            return
+        _enabled_count -= 1
+        if _enabled_count == 0 and _started_tracemalloc:
+            tracemalloc.stop()
+            _started_tracemalloc = False
+
+
+@contextmanager
+def memory_profiling(enabled: bool = True) -> Iterator[None]:
+    """Profile memory for the duration of the block (no-op when enabled is False)."""
+    if not enabled:
+        yield
+        return
+    enable()
+    try:
+        yield
+    finally:
+        disable()
+
+
+class _RssSampler:
+    """Background thread sampling RSS while at least one probe is active."""
+
+    def __init__(self, interval_sec: float):
+        self.interval_sec = interval_sec
+        self._probes = set()
+        self._lock = threading.Lock()
+        self._wakeup = threading.Condition(self._lock)
+        self._thread: Optional[threading.Thread] = None
+
+    def register(self, probe: "MemoryProbe"):
+        with self._lock:
+            self._probes.add(probe)
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="rss-sampler", daemon=True)
+                self._thread.start()
+            self._wakeup.notify()
+
+    def unregister(self, probe: "MemoryProbe"):
+        with self._lock:
+            self._probes.discard(probe)
+
+    def _run(self):
+        while True:
+            with self._lock:
+                while not self._probes:
+                    self._wakeup.wait()
+                probes = list(self._probes)
+            rss = current_rss_bytes()
+            if rss is None:
+                return
+            for probe in probes:
+                probe.note_rss(rss)
+            time.sleep(self.interval_sec)
+
+
+_sampler = _RssSampler(MEMORY_SAMPLE_INTERVAL_MS / 1000)
+
+
+class MemoryProbe:
+    """
+    Memory usage of one span.
+
+    tracemalloc only keeps a single global peak, so each probe resets it on start
+    and hands the peak seen so far to its parent first; on finish the child's peak
+    is folded back into the parent. That keeps nested stages from hiding each
+    other's peaks.
+    """
+
+    __slots__ = ("parent", "heap_start", "heap_peak", "heap_net", "rss_start", "rss_peak", "rss_end")
+
+    def __init__(self, parent: Optional["MemoryProbe"] = None):
+        self.parent = parent
+        self.heap_start = 0
+        self.heap_peak = 0
+        self.heap_net = 0
+        self.rss_start = None
+        self.rss_peak = None
+        self.rss_end = None
+
+    def note_heap_peak(self, peak: int):
+        with _lock:
+            self.heap_peak = max(self.heap_peak, peak)
+
+    def note_rss(self, rss: int):
+        with _lock:
+            self.rss_peak = rss if self.rss_peak is None else max(self.rss_peak, rss)
+
+    def start(self):
+        current, peak = tracemalloc.get_traced_memory()
+        if self.parent is not None:
+            self.parent.note_heap_peak(peak)
+        tracemalloc.reset_peak()
+        self.heap_start = self.heap_peak = current
+        self.rss_start = self.rss_peak = current_rss_bytes()
+        if self.rss_start is not None:
+            _sampler.register(self)
+
+    def finish(self):
+        current, peak = tracemalloc.get_traced_memory()
+        self.note_heap_peak(peak)
+        self.heap_net = current - self.heap_start
+        if self.parent is not None:
+            self.parent.note_heap_peak(self.heap_peak)
+        _sampler.unregister(self)
+        self.rss_end = current_rss_bytes()
+        if self.rss_end is not None:
+            self.note_rss(self.rss_end)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Sizes in MB: heap peak above the stage's starting heap, net heap change, RSS."""
+        data = {
+            "heap_peak_mb": round((self.heap_peak - self.heap_start) / MB, 3),
+            "heap_net_mb": round(self.heap_net / MB, 3)
+        }
+        if self.rss_start is not None and self.rss_end is not None:
+            data["rss_start_mb"] = round(self.rss_start / MB, 1)
+            data["rss_peak_mb"] = round(self.rss_peak / MB, 1)
+            data["rss_end_mb"] = round(self.rss_end / MB, 1)
+        return data
+
+
+def stage_memory_rows(timings: Optional[Dict[str, Any]], filename: str = "") -> List[Dict[str, Any]]:
+    """One row per profiled span in a span tree (depth-first), tagged with the file name."""
+    rows = []
+
+    def visit(node: Dict[str, Any], path: str):
+        stage = f"{path}/{node['name']}" if path else node["name"]
+        memory = node.get(MEMORY_KEY)
+        if memory:
+            rows.append(dict(memory, filename=filename, stage=stage, wall_ms=node["wall_ms"]))
+        for child in node.get("children", []):
+            visit(child, stage)
+
+    if timings:
+        visit(timings, "")
+    return rows
+
+
+def batch_memory_report(outcomes: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    Summarize per-stage memory across a batch of run_journaled_batch outcomes.
+
+    Returns:
+        dict: files (root span memory per file, largest heap peak first),
+        stages (per stage path: file count, max/mean heap peak, max heap net, max RSS peak)
+        and the overall max heap and RSS peaks
+    """
+    files = []
+    by_stage: Dict[str, List[Dict[str, Any]]] = {}
+    for outcome in outcomes:
+        result = outcome.get("result") or {}
+        if outcome.get("from_checkpoint"):
+            continue
+        rows = stage_memory_rows(result.get("timings"), outcome.get("filename", ""))
+        if not rows:
+            continue
+        files.append(rows[0])
+        for row in rows:
+            by_stage.setdefault(row["stage"], []).append(row)
+
+    stages = []
+    for stage, rows in by_stage.items():
+        heap_peaks = [row["heap_peak_mb"] for row in rows]
+        rss_peaks = [row["rss_peak_mb"] for row in rows if "rss_peak_mb" in row]
+        worst = max(rows, key=lambda row: row["heap_peak_mb"])
+        stages.append({
+            "stage": stage,
+            "files": len(rows),
+            "heap_peak_mb_max": max(heap_peaks),
+            "heap_peak_mb_mean": round(sum(heap_peaks) / len(heap_peaks), 3),
+            "heap_net_mb_max": max(row["heap_net_mb"] for row in rows),
+            "rss_peak_mb_max": max(rss_peaks) if rss_peaks else None,
+            "worst_file": worst["filename"]
+        })
+    stages.sort(key=lambda row: row["heap_peak_mb_max"], reverse=True)
+    files.sort(key=lambda row: row["heap_peak_mb"], reverse=True)
+
+    rss_values = [row["rss_peak_mb"] for row in files if "rss_peak_mb" in row]
+    return {
+        "created_at": time.time(),
+        "profiled_files": len(files),
+        "max_heap_peak_mb": files[0]["heap_peak_mb"] if files else None,
+        "max_rss_peak_mb": max(rss_values) if rss_values else None,
+        "files": files,
+        "stages": stages
+    }
+
+
+def write_memory_report(path: str, report: Dict[str, Any]) -> str:
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2)
+    return path
+
+
+if MEMORY_PROFILING:
+    enable()
@@ -0,0 +1,20 @@
+"""
+Numeric helpers - Array operations shared by the analyzers and scoring
+"""
+
+import numpy as np
+
+
+def round_values(values, ndigits: int) -> np.ndarray:
+    """
+    Element-wise round(value, ndigits) with Python's exact semantics. np.round
+    scales before rounding, so values printed as a tie (e.g. 21.885) can round
+    the other way; only those near-ties are re-rounded in Python.
+    """
+    values = np.asarray(values, dtype=np.float64)
+    scaled = values * 10.0 ** ndigits
+    rounded = np.round(scaled) / 10.0 ** ndigits
+    near_tie = np.abs(np.abs(scaled - np.floor(scaled)) - 0.5) < 1e-6
+    if near_tie.any():
+        rounded[near_tie] = [round(value, ndigits) for value in values[near_tie].tolist()]
+    return rounded
@@ -0,0 +1,80 @@
+"""
+Shared Resources - API clients, dictionaries and models created once per process
+instead of once per analysis call.
+"""
+
+import functools
+import os
+
+from config import OPENAI_API_KEY, OPENAI_BASE_URL, PIPELINE_PREFETCH_WORKERS
+
+
+@functools.lru_cache(maxsize=4)
+def get_openai_client(api_key: str = None):
+    """Return a reusable OpenAI client (keeps its HTTP connection pool warm)."""
+    import openai
+    return openai.OpenAI(api_key=api_key or OPENAI_API_KEY, base_url=OPENAI_BASE_URL)
+
+
+@functools.lru_cache(maxsize=4)
+def get_deepgram_session(api_key: str = None):
+    """
+    Return a reusable HTTP session for the Deepgram REST API, or None if the key
+    is missing. Its connection pool holds one keep-alive connection per batch
+    prefetch worker, so concurrent uploads from those threads share them.
+    """
+    api_key = api_key or os.getenv("DEEPGRAM_API_KEY")
+    if not api_key:
+        return None
+
+    import requests
+
+    session = requests.Session()
+    adapter = requests.adapters.HTTPAdapter(pool_connections=1, pool_maxsize=PIPELINE_PREFETCH_WORKERS)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    session.headers["Authorization"] = f"Token {api_key}"
+    return session
+
+
+@functools.lru_cache(maxsize=1)
+def get_cmu_dict() -> dict:
+    """Load the CMU pronunciation dictionary (downloading it on first use)."""
+    try:
+        import nltk
+        from nltk.corpus import cmudict
+
+        try:
+            nltk.data.find('corpora/cmudict')
+        except LookupError:
+            nltk.download('cmudict')
+
+        return cmudict.dict()
+    except Exception:
+        return {}
+
+
+def warm_up_resources(include_forcealign: bool = True) -> dict:
+    """
+    Load every heavy resource up front (e.g. at service startup).
+
+    Returns:
+        dict: Which resources are ready, for health reporting
+    """
+    status = {
+        "cmudict": bool(get_cmu_dict()),
+        "openai_client": False,
+        "deepgram_client": get_deepgram_session() is not None,
+        "forcealign": False
+    }
+
+    if OPENAI_API_KEY:
+        get_openai_client()
+        status["openai_client"] = True
+
+    if include_forcealign:
+        # Importing the module loads the aligner backend into this process
+        from src.transcribers.forcealign_transcriber import check_forcealign_availability
+        status["forcealign"] = check_forcealign_availability()
+
+    return status
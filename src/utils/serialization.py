@@ -0,0 +1,69 @@
+"""
+Serialization helpers - Convert analysis results into JSON-safe structures
+"""
+
+import json
+import numpy as np
+import pandas as pd
+
+from src.utils.frame_series import SERIES_MARKER, FrameSeries
+from src.utils.volume_histogram import HISTOGRAM_MARKER, VolumeHistogram
+
+# Keys that are only useful for on-screen display and are dropped when persisting
+DISPLAY_ONLY_KEYS = ("plot_image",)
+
+# Result keys holding per-word DataFrames (pause and stretch analyzers)
+DATAFRAME_KEYS = ("word_pause_table", "word_table")
+
+
+def to_jsonable(obj, drop_display_keys: bool = True):
+    """
+    Recursively convert an analysis result into plain Python types.
+
+    Args:
+        obj: Result dict (or any nested value) returned by an analyzer
+        drop_display_keys (bool): Drop keys such as base64 plot images
+
+    Returns:
+        Structure made only of dict/list/str/int/float/bool/None.
+        FrameSeries and VolumeHistogram become their compact dict forms.
+    """
+    if isinstance(obj, dict):
+        return {
+            str(key): to_jsonable(value, drop_display_keys)
+            for key, value in obj.items()
+            if not (drop_display_keys and key in DISPLAY_ONLY_KEYS)
+        }
+    if isinstance(obj, (list, tuple)):
+        return [to_jsonable(value, drop_display_keys) for value in obj]
+    if isinstance(obj, (FrameSeries, VolumeHistogram)):
+        return obj.to_dict()
+    if isinstance(obj, pd.DataFrame):
+        return to_jsonable(obj.to_dict(orient="records"), drop_display_keys)
+    if isinstance(obj, np.ndarray):
+        return obj.tolist()
+    if isinstance(obj, np.generic):
+        return obj.item()
+    return obj
+
+
+def dumps_result(result, drop_display_keys: bool = True) -> str:
+    """Serialize an analysis result to a JSON string."""
+    return json.dumps(to_jsonable(result, drop_display_keys), ensure_ascii=False, default=str)
+
+
+def _restore_compact(obj: dict):
+    if SERIES_MARKER in obj:
+        return FrameSeries.from_dict(obj)
+    if HISTOGRAM_MARKER in obj:
+        return VolumeHistogram.from_dict(obj)
+    return obj
+
+
+def loads_result(payload: str) -> dict:
+    """Deserialize a stored result, restoring word tables as DataFrames and compact volume data."""
+    result = json.loads(payload, object_hook=_restore_compact)
+    for key in DATAFRAME_KEYS:
+        if isinstance(result.get(key), list):
+            result[key] = pd.DataFrame(result[key])
+    return result
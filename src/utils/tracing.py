@@ -0,0 +1,164 @@
+"""
+Tracing - Lightweight nested timing spans for the analysis pipeline
+Each span records wall time and the CPU time of the thread that ran it, so a slow
+file can be broken down into decoding, API waits, alignment, boundary detection
+and plotting. The outermost traced analysis attaches its span tree to the result
+under "timings". With memory profiling enabled, spans also carry heap/RSS usage.
+"""
+
+import contextvars
+import functools
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterator, List, Optional
+
+from src.utils import memory_profiling
+
+TIMINGS_KEY = "timings"
+
+_current_span: contextvars.ContextVar[Optional["Span"]] = contextvars.ContextVar("current_span", default=None)
+
+
+class Span:
+    """One timed stage; children are stages that ran inside it (possibly on other threads)."""
+
+    __slots__ = ("name", "attrs", "children", "wall_ms", "cpu_ms", "memory", "_wall_start", "_cpu_start", "_lock")
+
+    def __init__(self, name: str, **attrs):
+        self.name = name
+        self.attrs = attrs
+        self.children: List["Span"] = []
+        self.wall_ms = 0.0
+        self.cpu_ms = 0.0
+        self.memory: Optional[memory_profiling.MemoryProbe] = None
+        self._lock = threading.Lock()
+
+    def _start(self, parent: Optional["Span"] = None):
+        if memory_profiling.is_enabled():
+            self.memory = memory_profiling.MemoryProbe(parent.memory if parent is not None else None)
+            self.memory.start()
+        self._wall_start = time.perf_counter()
+        self._cpu_start = time.thread_time()
+
+    def _finish(self):
+        self.wall_ms = (time.perf_counter() - self._wall_start) * 1000
+        self.cpu_ms = (time.thread_time() - self._cpu_start) * 1000
+        if self.memory is not None:
+            self.memory.finish()
+
+    def _add_child(self, child: "Span"):
+        with self._lock:
+            self.children.append(child)
+
+    def to_dict(self) -> Dict[str, Any]:
+        data = {
+            "name": self.name,
+            "wall_ms": round(self.wall_ms, 2),
+            "cpu_ms": round(self.cpu_ms, 2),
+            "children": [child.to_dict() for child in self.children]
+        }
+        if self.attrs:
+            data["attrs"] = dict(self.attrs)
+        if self.memory is not None:
+            data[memory_profiling.MEMORY_KEY] = self.memory.to_dict()
+        return data
+
+
+@contextmanager
+def span(name: str, **attrs) -> Iterator[Span]:
+    """Time a stage as a child of the current span (or as a new root)."""
+    parent = _current_span.get()
+    current = Span(name, **attrs)
+    token = _current_span.set(current)
+    current._start(parent)
+    try:
+        yield current
+    finally:
+        current._finish()
+        _current_span.reset(token)
+        if parent is not None:
+            parent._add_child(current)
+
+
+def traced(name: Optional[str] = None) -> Callable:
+    """
+    Decorator wrapping a function in a span.
+
+    When the function is the outermost traced call and returns a dict, the span
+    tree is attached to it under TIMINGS_KEY.
+    """
+    def decorator(func: Callable) -> Callable:
+        span_name = name or func.__name__
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            is_root = _current_span.get() is None
+            with span(span_name) as current:
+                result = func(*args, **kwargs)
+            if is_root and isinstance(result, dict):
+                result[TIMINGS_KEY] = current.to_dict()
+            return result
+        return wrapper
+    return decorator
+
+
+def submit_in_context(executor, func: Callable, *args, **kwargs):
+    """executor.submit that carries the current span into the worker thread."""
+    context = contextvars.copy_context()
+    return executor.submit(context.run, func, *args, **kwargs)
+
+
+def flatten_timings(timings: Optional[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """
+    Flatten a span tree into rows for tables.
+
+    Returns:
+        list: Rows with stage (indented by depth), depth, wall_ms, cpu_ms and
+        percent of the root's wall time, in depth-first order. Profiled spans add
+        heap_peak_mb, heap_net_mb and rss_peak_mb.
+    """
+    if not timings:
+        return []
+    total = timings.get("wall_ms") or 0.0
+    rows = []
+
+    def visit(node: Dict[str, Any], depth: int):
+        row = {
+            "stage": "  " * depth + node["name"],
+            "depth": depth,
+            "wall_ms": node["wall_ms"],
+            "cpu_ms": node["cpu_ms"],
+            "percent": round(node["wall_ms"] / total * 100, 1) if total else 0.0
+        }
+        memory = node.get(memory_profiling.MEMORY_KEY)
+        if memory:
+            row["heap_peak_mb"] = memory["heap_peak_mb"]
+            row["heap_net_mb"] = memory["heap_net_mb"]
+            row["rss_peak_mb"] = memory.get("rss_peak_mb")
+        rows.append(row)
+        for child in node.get("children", []):
+            visit(child, depth + 1)
+
+    visit(timings, 0)
+    return rows
+
+
+def format_timings(timings: Optional[Dict[str, Any]]) -> str:
+    """Plain-text stage breakdown for console output."""
+    rows = flatten_timings(timings)
+    if not rows:
+        return "(no timings recorded)"
+    width = max(len(row["stage"]) for row in rows)
+    with_memory = "heap_peak_mb" in rows[0]
+    header = f"{'stage'.ljust(width)}  {'wall ms':>10}  {'cpu ms':>10}  {'%':>6}"
+    if with_memory:
+        header += f"  {'heap pk MB':>10}  {'heap net MB':>11}  {'rss pk MB':>9}"
+    lines = [header]
+    for row in rows:
+        line = f"{row['stage'].ljust(width)}  {row['wall_ms']:>10.1f}  {row['cpu_ms']:>10.1f}  {row['percent']:>6.1f}"
+        if with_memory and "heap_peak_mb" in row:
+            rss = f"{row['rss_peak_mb']:>9.1f}" if row["rss_peak_mb"] is not None else f"{'-':>9}"
+            line += f"  {row['heap_peak_mb']:>10.2f}  {row['heap_net_mb']:>11.2f}  {rss}"
+        lines.append(line)
+    return "\n".join(lines)
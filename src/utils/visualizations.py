@@ -1,14 +1,18 @@
 """
 Visualization Module - Charts for Volume and Velocity Analysis
 Adapted from SBF project chart.py module
+
+matplotlib and plotly are imported inside the plotting functions so that importing
+this module (and the pages using it) stays cheap.
 """
 
-import matplotlib.pyplot as plt
 import numpy as np
 import streamlit as st
-import plotly.graph_objects as go
 import pandas as pd
 
+from src.utils.frame_series import frame_values_array
+from src.utils.tracing import TIMINGS_KEY, flatten_timings
+
 # Constants for visualization
 VOLUME_TARGET_RANGE = (-30, -10)  # Standard volume range in dBFS
 VELOCITY_TARGET_RANGE = (2.0, 3.5)  # Standard WPS range
@@ -18,15 +22,14 @@ def plot_volume_histogram_individual(result, filename):
     Plot individual file histogram with compact design for multiple files display.
 
     Args:
-        result (dict): Contains 'frame_values' list of volume measurements in dBFS
+        result (dict): Contains 'frame_values' (FrameSeries or list) of volume measurements in dBFS
         filename (str): Name of the file for title
     """
-    if 'frame_values' not in result or not result["frame_values"]:
+    values = frame_values_array(result.get("frame_values"))
+    if not len(values):
         st.warning(f"No volume data available for {filename}")
         return
 
-    values = result["frame_values"]
-
     # Remove outliers using IQR method
     Q1 = np.percentile(values, 25)
     Q3 = np.percentile(values, 75)
@@ -35,18 +38,18 @@ def plot_volume_histogram_individual(result, filename):
     upper_bound = Q3 + 1.5 * IQR
 
     # Filter valid values
-    valid_values = [v for v in values if lower_bound <= v <= upper_bound]
+    valid_values = values[(values >= lower_bound) & (values <= upper_bound)]
 
-    if not valid_values:
+    if not len(valid_values):
         st.warning(f"No valid volume data for {filename}")
         return
 
     # Calculate statistics
-    user_min = min(valid_values)
-    user_max = max(valid_values)
     user_avg = np.mean(valid_values)
 
     # Create compact histogram
+    import matplotlib.pyplot as plt
+
     fig, ax = plt.subplots(figsize=(6, 3))
     ax.hist(valid_values, bins=20, color="#cccccc", edgecolor="black", alpha=0.8)
 
@@ -68,6 +71,35 @@ def plot_volume_histogram_individual(result, filename):
     plt.close(fig)  # Free memory
 
 
+def show_stage_timings(result):
+    """
+    Show the per-stage timing breakdown recorded for one analysis result.
+
+    Args:
+        result (dict): Analysis result, optionally containing 'timings' (span tree)
+    """
+    rows = flatten_timings(result.get(TIMINGS_KEY))
+    if not rows:
+        st.info("No stage timings recorded for this result")
+        return
+
+    df = pd.DataFrame(rows).drop(columns=["depth"])
+    st.dataframe(
+        df,
+        use_container_width=True,
+        hide_index=True,
+        column_config={
+            "stage": st.column_config.TextColumn("Stage", width="medium"),
+            "wall_ms": st.column_config.NumberColumn("Wall (ms)", format="%.1f"),
+            "cpu_ms": st.column_config.NumberColumn("CPU (ms)", format="%.1f"),
+            "percent": st.column_config.NumberColumn("% of total", format="%.1f"),
+            "heap_peak_mb": st.column_config.NumberColumn("Heap peak (MB)", format="%.2f"),
+            "heap_net_mb": st.column_config.NumberColumn("Heap net (MB)", format="%.2f"),
+            "rss_peak_mb": st.column_config.NumberColumn("RSS peak (MB)", format="%.1f")
+        }
+    )
+
+
 def plot_velocity_gauge(velocity_result, filename):
     """
     Create gauge chart showing speaking speed relative to target range.
@@ -82,6 +114,8 @@ def plot_velocity_gauge(velocity_result, filename):
 
     wps = velocity_result['wps']
 
+    import plotly.graph_objects as go
+
     fig = go.Figure(go.Indicator(
         mode="gauge+number",
         value=wps,
@@ -127,6 +161,8 @@ def plot_velocity_dot_strip(velocity_results, filenames):
         st.warning("No velocity data available for dot strip plot")
         return
 
+    import matplotlib.pyplot as plt
+
     fig, ax = plt.subplots(figsize=(10, 3))
     ax.set_facecolor('white')
 
@@ -239,6 +275,8 @@ def create_volume_summary_chart(volume_results, filenames):
         return
 
     # Create subplot with 2 charts
+    import matplotlib.pyplot as plt
+
     fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(12, 4))
 
     # Chart 1: Min/Avg/Max comparison
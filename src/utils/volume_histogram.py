@@ -0,0 +1,136 @@
+"""
+Volume histogram - Mergeable fixed-bin dBFS histogram sketch
+Each volume result carries a 0.1 dB histogram of its frame values; batch-wide
+quantiles, IQR filtering, coverage and scoring are computed from the merged
+histogram in constant memory instead of concatenating every frame.
+Quantiles and min/max/avg are accurate to within one bin (0.1 dB).
+"""
+
+from typing import Any, Dict, Iterable, Optional
+
+import numpy as np
+
+from src.utils.frame_series import frame_values_array
+
+HIST_MIN_DB = -100.0
+HIST_MAX_DB = 0.0
+HIST_BIN_DB = 0.1
+HIST_BINS = int(round((HIST_MAX_DB - HIST_MIN_DB) / HIST_BIN_DB))
+
+# Marker key identifying a serialized histogram
+HISTOGRAM_MARKER = "__volume_histogram__"
+
+# Bin lower edges in centi-dB (integers, so bin assignment is exact for 0.01 dB values)
+_CENTI_MIN = int(round(HIST_MIN_DB * 100))
+_CENTI_BIN = int(round(HIST_BIN_DB * 100))
+_LOWER_EDGES = HIST_MIN_DB + np.arange(HIST_BINS) * HIST_BIN_DB
+_CENTERS = _LOWER_EDGES + HIST_BIN_DB / 2
+
+
+class VolumeHistogram:
+    """Counts of frame dBFS values in fixed 0.1 dB bins over [-100, 0] dBFS."""
+
+    __slots__ = ("counts",)
+
+    def __init__(self, counts: Optional[np.ndarray] = None):
+        self.counts = np.zeros(HIST_BINS, dtype=np.int64) if counts is None else np.asarray(counts, dtype=np.int64)
+
+    @classmethod
+    def from_values(cls, values) -> "VolumeHistogram":
+        """Build a histogram from dBFS values (FrameSeries, array or list); out-of-range values are clamped."""
+        centi = np.round(frame_values_array(values).astype(np.float64) * 100).astype(np.int64)
+        bins = np.clip((centi - _CENTI_MIN) // _CENTI_BIN, 0, HIST_BINS - 1)
+        return cls(np.bincount(bins, minlength=HIST_BINS))
+
+    @classmethod
+    def merge_all(cls, histograms: Iterable["VolumeHistogram"]) -> "VolumeHistogram":
+        merged = cls()
+        for histogram in histograms:
+            merged.counts += histogram.counts
+        return merged
+
+    def __add__(self, other: "VolumeHistogram") -> "VolumeHistogram":
+        return VolumeHistogram(self.counts + other.counts)
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, VolumeHistogram):
+            return NotImplemented
+        return np.array_equal(self.counts, other.counts)
+
+    def __repr__(self) -> str:
+        return f"VolumeHistogram(total={self.total})"
+
+    @property
+    def total(self) -> int:
+        return int(self.counts.sum())
+
+    def quantile(self, q: float) -> float:
+        """Approximate q-quantile (0..1), interpolating linearly inside the bin."""
+        total = self.total
+        if total == 0:
+            raise ValueError("quantile of an empty histogram")
+        cumulative = np.cumsum(self.counts)
+        target = max(q * total, np.finfo(float).tiny)  # q=0 lands on the first occupied bin
+        index = int(np.searchsorted(cumulative, target, side="left"))
+        index = min(max(index, 0), HIST_BINS - 1)
+        before = cumulative[index] - self.counts[index]
+        fraction = (target - before) / self.counts[index] if self.counts[index] else 0.0
+        return float(_LOWER_EDGES[index] + min(max(fraction, 0.0), 1.0) * HIST_BIN_DB)
+
+    def clip(self, low: float, high: float) -> "VolumeHistogram":
+        """Histogram restricted to bins whose center lies in [low, high]."""
+        keep = (_CENTERS >= low) & (_CENTERS <= high)
+        return VolumeHistogram(np.where(keep, self.counts, 0))
+
+    def coverage(self, low: float, high: float) -> float:
+        """Percentage of frames with values in [low, high] dBFS (bin resolution)."""
+        total = self.total
+        if total == 0:
+            return 0.0
+        eps = HIST_BIN_DB / 1000
+        inside = (_LOWER_EDGES >= low - eps) & (_LOWER_EDGES <= high + eps)
+        return float(self.counts[inside].sum()) / total * 100
+
+    def volume_summary(self, target_min: float = -30, target_max: float = -10) -> Dict[str, float]:
+        """Min/max/avg/range/coverage in the shape calculate_volume_score expects."""
+        nonzero = np.flatnonzero(self.counts)
+        if not len(nonzero):
+            raise ValueError("summary of an empty histogram")
+        volume_min = float(_CENTERS[nonzero[0]])
+        volume_max = float(_CENTERS[nonzero[-1]])
+        return {
+            "volume_min": round(volume_min, 2),
+            "volume_max": round(volume_max, 2),
+            "volume_avg": round(float(np.dot(self.counts, _CENTERS) / self.total), 2),
+            "volume_range": round(volume_max - volume_min, 2),
+            "coverage_vs_target": round(self.coverage(target_min, target_max), 2)
+        }
+
+    def to_dict(self) -> Dict[str, Any]:
+        """JSON-safe sparse form: counts trimmed to the occupied bin span."""
+        nonzero = np.flatnonzero(self.counts)
+        start = int(nonzero[0]) if len(nonzero) else 0
+        stop = int(nonzero[-1]) + 1 if len(nonzero) else 0
+        return {
+            HISTOGRAM_MARKER: 1,
+            "bin_db": HIST_BIN_DB,
+            "min_db": HIST_MIN_DB,
+            "start": start,
+            "counts": self.counts[start:stop].tolist()
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "VolumeHistogram":
+        counts = np.zeros(HIST_BINS, dtype=np.int64)
+        start = data.get("start", 0)
+        values = np.asarray(data.get("counts", []), dtype=np.int64)
+        counts[start:start + len(values)] = values
+        return cls(counts)
+
+
+def histogram_for(volume_result: Dict[str, Any]) -> VolumeHistogram:
+    """Histogram carried by a volume result, rebuilt from frame_values for older results."""
+    histogram = volume_result.get("histogram")
+    if isinstance(histogram, VolumeHistogram):
+        return histogram
+    return VolumeHistogram.from_values(volume_result.get("frame_values"))
@@ -4,11 +4,69 @@ Volume Scoring Module - Scoring and grading system for volume analysis
 
 import numpy as np
 
+from src.utils.numeric import round_values
+
 # Normal range constants
 NORMAL_MIN = -30  # dBFS
 NORMAL_MAX = -10  # dBFS
 OPTIMAL_RANGE = (-25, -15)  # Best range for clear speech
 
+# Grade bands: (minimum total score, grade, status), best first
+GRADE_BANDS = (
+    (90, "A+ Xuất sắc", "🟢"),
+    (80, "A Tốt", "🟢"),
+    (70, "B+ Khá tốt", "🟡"),
+    (60, "B Trung bình khá", "🟡"),
+    (50, "C+ Cần cải thiện", "🟠"),
+    (40, "C Yếu", "🟠"),
+    (float("-inf"), "D Rất yếu", "🔴"),
+)
+
+VOLUME_COLUMNS = ("volume_min", "volume_max", "volume_avg", "volume_range", "coverage_vs_target")
+
+
+def volume_recommendations(volume_avg: float, coverage_percent: float, volume_range: float) -> list:
+    """
+    Friendly recommendations focusing on volume levels.
+
+    Args:
+        volume_avg (float): Average volume (dBFS)
+        coverage_percent (float): Time in the normal range (%)
+        volume_range (float): Max - min volume (dB)
+
+    Returns:
+        list: Recommendation strings, most important first
+    """
+    recommendations = []
+
+    # Analyze volume level patterns
+    if volume_avg < -35:
+        if coverage_percent < 40:
+            recommendations.append("🔊 Bạn có xu hướng nói với **âm thanh nhỏ** và thường xuyên ở mức âm thấp. Hãy thử điều chỉnh để đưa âm thanh lên **mức trung bình** - điều này sẽ giúp người nghe dễ chịu hơn!")
+        else:
+            recommendations.append("🎯 Âm thanh của bạn ở **mức nhỏ** nhưng khá ổn định. Thử nâng lên **mức trung bình** để tăng độ rõ ràng khi giao tiếp.")
+    elif volume_avg > -8:
+        recommendations.append("⚠️ Bạn có xu hướng nói với **âm thanh lớn**, có thể gây khó chịu cho người nghe. Hãy thử điều chỉnh xuống **mức trung bình** để tạo sự thoải mái.")
+    elif OPTIMAL_RANGE[0] <= volume_avg <= OPTIMAL_RANGE[1]:
+        recommendations.append("🌟 Tuyệt vời! Âm thanh của bạn ở **mức trung bình tối ưu** và rất dễ nghe. Hãy duy trì mức âm thanh này!")
+    elif NORMAL_MIN <= volume_avg <= NORMAL_MAX:
+        recommendations.append("👍 Âm thanh của bạn ở **mức trung bình**, khá phù hợp cho giao tiếp tự nhiên.")
+
+    if coverage_percent < 50:
+        recommendations.append("📈 Bạn nên tập luyện duy trì **âm thanh ở mức ổn định** trong vùng trung bình để tăng độ rõ ràng.")
+    elif coverage_percent < 70:
+        recommendations.append("💪 Bạn đã khá ổn trong việc duy trì **mức âm thanh phù hợp**! Hãy tiếp tục luyện tập.")
+
+    if volume_range > 35:
+        recommendations.append("🎚️ **Mức âm thanh** của bạn biến động từ nhỏ đến lớn khá nhiều. Thử tập giữ **âm thanh ổn định** ở một mức để tạo cảm giác thoải mái.")
+    elif volume_range > 25:
+        recommendations.append("🔄 **Âm thanh** của bạn có chút biến động giữa các mức. Hãy chú ý giữ **mức âm đều đặn** trong suốt quá trình nói.")
+
+    if not recommendations:
+        recommendations.append("🏆 Xuất sắc! **Mức âm thanh** của bạn ở **mức trung bình chuẩn**, ổn định và rất dễ nghe. Hãy tiếp tục duy trì!")
+
+    return recommendations
+
 
 def calculate_volume_score(result: dict) -> dict:
     """
@@ -79,59 +137,13 @@ def calculate_volume_score(result: dict) -> dict:
     )
 
     # Determine grade
-    if total_score >= 90:
-        grade = "A+ Xuất sắc"
-        status = "🟢"
-    elif total_score >= 80:
-        grade = "A Tốt"
-        status = "🟢"
-    elif total_score >= 70:
-        grade = "B+ Khá tốt"
-        status = "🟡"
-    elif total_score >= 60:
-        grade = "B Trung bình khá"
-        status = "🟡"
-    elif total_score >= 50:
-        grade = "C+ Cần cải thiện"
-        status = "🟠"
-    elif total_score >= 40:
-        grade = "C Yếu"
-        status = "🟠"
-    else:
-        grade = "D Rất yếu"
-        status = "🔴"
+    grade, status = next(((grade, status) for threshold, grade, status in GRADE_BANDS if total_score >= threshold),
+                         GRADE_BANDS[-1][1:])
 
     # Check if in normal range
     in_normal_range = NORMAL_MIN <= volume_avg <= NORMAL_MAX
 
-    # Generate friendly recommendations focusing on volume levels
-    recommendations = []
-
-    # Analyze volume level patterns
-    if volume_avg < -35:
-        if coverage_percent < 40:
-            recommendations.append("🔊 Bạn có xu hướng nói với **âm thanh nhỏ** và thường xuyên ở mức âm thấp. Hãy thử điều chỉnh để đưa âm thanh lên **mức trung bình** - điều này sẽ giúp người nghe dễ chịu hơn!")
-        else:
-            recommendations.append("🎯 Âm thanh của bạn ở **mức nhỏ** nhưng khá ổn định. Thử nâng lên **mức trung bình** để tăng độ rõ ràng khi giao tiếp.")
-    elif volume_avg > -8:
-        recommendations.append("⚠️ Bạn có xu hướng nói với **âm thanh lớn**, có thể gây khó chịu cho người nghe. Hãy thử điều chỉnh xuống **mức trung bình** để tạo sự thoải mái.")
-    elif OPTIMAL_RANGE[0] <= volume_avg <= OPTIMAL_RANGE[1]:
-        recommendations.append("🌟 Tuyệt vời! Âm thanh của bạn ở **mức trung bình tối ưu** và rất dễ nghe. Hãy duy trì mức âm thanh này!")
-    elif NORMAL_MIN <= volume_avg <= NORMAL_MAX:
-        recommendations.append("👍 Âm thanh của bạn ở **mức trung bình**, khá phù hợp cho giao tiếp tự nhiên.")
-
-    if coverage_percent < 50:
-        recommendations.append("📈 Bạn nên tập luyện duy trì **âm thanh ở mức ổn định** trong vùng trung bình để tăng độ rõ ràng.")
-    elif coverage_percent < 70:
-        recommendations.append("💪 Bạn đã khá ổn trong việc duy trì **mức âm thanh phù hợp**! Hãy tiếp tục luyện tập.")
-
-    if volume_range > 35:
-        recommendations.append("🎚️ **Mức âm thanh** của bạn biến động từ nhỏ đến lớn khá nhiều. Thử tập giữ **âm thanh ổn định** ở một mức để tạo cảm giác thoải mái.")
-    elif volume_range > 25:
-        recommendations.append("🔄 **Âm thanh** của bạn có chút biến động giữa các mức. Hãy chú ý giữ **mức âm đều đặn** trong suốt quá trình nói.")
-
-    if not recommendations:
-        recommendations.append("🏆 Xuất sắc! **Mức âm thanh** của bạn ở **mức trung bình chuẩn**, ổn định và rất dễ nghe. Hãy tiếp tục duy trì!")
+    recommendations = volume_recommendations(volume_avg, coverage_percent, volume_range)
 
     # Add scoring details to result
     enhanced_result = result.copy()
@@ -159,35 +171,113 @@ def calculate_volume_score(result: dict) -> dict:
     return enhanced_result
 
 
-def create_results_table_data(results_per_file: list, file_labels: list) -> list:
+def _round1(values: np.ndarray) -> np.ndarray:
+    # np.round scales first and can differ from round() on ties (112.45 -> 112.4);
+    # round_values only falls back to Python for those near-ties, like the scalar path
+    return round_values(values, 1)
+
+
+def score_volume_batch(volume_min, volume_max, volume_avg, volume_range, coverage_vs_target) -> dict:
+    """
+    Score many volume results at once; columnar equivalent of calculate_volume_score.
+
+    Args:
+        volume_min, volume_max, volume_avg, volume_range, coverage_vs_target:
+            Array-likes of equal length N (one entry per file)
+
+    Returns:
+        dict: Arrays of length N - score (rounded to 0.1), grade, status, in_normal_range,
+        user_vs_normal and the four component scores (coverage/avg/range/boundary_score)
+    """
+    volume_min = np.asarray(volume_min, dtype=np.float64)
+    volume_max = np.asarray(volume_max, dtype=np.float64)
+    volume_avg = np.asarray(volume_avg, dtype=np.float64)
+    volume_range = np.asarray(volume_range, dtype=np.float64)
+    coverage_percent = np.asarray(coverage_vs_target, dtype=np.float64)
+
+    coverage_score = np.minimum(100, coverage_percent * 1.2)
+
+    optimal_center = (OPTIMAL_RANGE[0] + OPTIMAL_RANGE[1]) / 2
+    max_distance = max(abs(NORMAL_MIN - optimal_center), abs(NORMAL_MAX - optimal_center))
+    in_optimal = (volume_avg >= OPTIMAL_RANGE[0]) & (volume_avg <= OPTIMAL_RANGE[1])
+    in_normal_range = (volume_avg >= NORMAL_MIN) & (volume_avg <= NORMAL_MAX)
+    outside_distance = np.where(volume_avg < NORMAL_MIN, NORMAL_MIN - volume_avg, volume_avg - NORMAL_MAX)
+    avg_score = np.select(
+        [in_optimal, in_normal_range],
+        [100.0, np.maximum(70, 100 - (np.abs(volume_avg - optimal_center) / max_distance) * 30)],
+        np.maximum(0, 70 - outside_distance * 2)
+    )
+
+    range_score = np.select(
+        [volume_range <= 15, volume_range <= 25, volume_range <= 35],
+        [100.0, 85.0, 70.0],
+        np.maximum(0, 70 - (volume_range - 35) * 2)
+    )
+
+    boundary_score = (100
+                      - np.where(volume_min < -50, (np.abs(volume_min) - 50) * 2, 0)
+                      - np.where(volume_max > -5, (np.abs(volume_max) - 5) * 3, 0))
+    boundary_score = np.maximum(0, boundary_score)
+
+    total_score = coverage_score * 0.4 + avg_score * 0.3 + range_score * 0.2 + boundary_score * 0.1
+
+    band = np.select([total_score >= threshold for threshold, _, _ in GRADE_BANDS], np.arange(len(GRADE_BANDS)))
+    grades = np.array([grade for _, grade, _ in GRADE_BANDS], dtype=object)
+    statuses = np.array([status for _, _, status in GRADE_BANDS], dtype=object)
+
+    return {
+        "score": _round1(total_score),
+        "grade": grades[band],
+        "status": statuses[band],
+        "in_normal_range": in_normal_range,
+        "user_vs_normal": np.where(in_normal_range, "Âm thanh mức trung bình",
+                                   np.where(volume_avg < NORMAL_MIN, "Âm thanh mức nhỏ", "Âm thanh mức lớn")).astype(object),
+        "coverage_score": _round1(coverage_score),
+        "avg_score": _round1(avg_score),
+        "range_score": _round1(range_score),
+        "boundary_score": _round1(boundary_score)
+    }
+
+
+def score_volume_results(results: list) -> dict:
+    """Run score_volume_batch over a list of volume result dicts."""
+    columns = {key: [result[key] for result in results] for key in VOLUME_COLUMNS}
+    return score_volume_batch(**columns)
+
+
+def create_results_table_data(results_per_file: list, file_labels: list, scores: dict = None) -> list:
     """
     Create comprehensive table data for multiple files with scoring.
 
     Args:
         results_per_file (list): List of volume analysis results
         file_labels (list): List of filenames
+        scores (dict): score_volume_results output for results_per_file, if already computed
 
     Returns:
         list: List of dictionaries for table display
     """
-    table_data = []
+    if not results_per_file:
+        return []
 
-    for i, (result, filename) in enumerate(zip(results_per_file, file_labels)):
-        # Calculate score for this file
-        scored_result = calculate_volume_score(result)
+    # Score every file in one vectorized pass
+    if scores is None:
+        scores = score_volume_results(results_per_file)
 
+    table_data = []
+    for i, (result, filename) in enumerate(zip(results_per_file, file_labels)):
         table_data.append({
             "STT": i + 1,
             "Tên file": filename,
-            "Min (dBFS)": f"{scored_result['volume_min']:.1f}",
-            "Max (dBFS)": f"{scored_result['volume_max']:.1f}",
-            "Avg (dBFS)": f"{scored_result['volume_avg']:.1f}",
-            "Range (dB)": f"{scored_result['volume_range']:.1f}",
-            "Coverage (%)": f"{scored_result['coverage_vs_target']:.1f}%",
-            "Điểm": f"{scored_result['score']:.1f}",
-            "Xếp loại": scored_result['grade'],
-            "Trạng thái": scored_result['status'],
-            "So với chuẩn": scored_result['comparison']['user_vs_normal']
+            "Min (dBFS)": f"{result['volume_min']:.1f}",
+            "Max (dBFS)": f"{result['volume_max']:.1f}",
+            "Avg (dBFS)": f"{result['volume_avg']:.1f}",
+            "Range (dB)": f"{result['volume_range']:.1f}",
+            "Coverage (%)": f"{result['coverage_vs_target']:.1f}%",
+            "Điểm": f"{scores['score'][i]:.1f}",
+            "Xếp loại": scores['grade'][i],
+            "Trạng thái": scores['status'][i],
+            "So với chuẩn": scores['user_vs_normal'][i]
         })
 
-    return table_data
\ No newline at end of file
+    return table_data
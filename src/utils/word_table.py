@@ -0,0 +1,144 @@
+"""
+Word table - Columnar word timestamps
+Transcribers return words as a list of {"word", "start", "end"} dicts. A WordTable
+holds the same data as parallel float64 start/end arrays plus int32 codes into an
+interned vocabulary, so analyzers filter, measure and tabulate words with NumPy
+instead of walking dicts, and per-token work (syllable counts, filled-pause
+checks) runs once per distinct word.
+"""
+
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Sequence
+
+import numpy as np
+
+
+class WordTable:
+    """
+    Words in transcript order.
+
+    Attributes:
+        start (np.ndarray): Word start times in seconds (float64)
+        end (np.ndarray): Word end times in seconds (float64)
+        codes (np.ndarray): Index of each word in `vocabulary` (int32)
+        vocabulary (np.ndarray): Distinct tokens (object array of str)
+        confidence (np.ndarray): Per-word confidence, or None when the transcriber gives none
+    """
+
+    __slots__ = ("start", "end", "codes", "vocabulary", "confidence")
+
+    def __init__(self, codes: np.ndarray, vocabulary: Sequence[str], start: np.ndarray, end: np.ndarray,
+                 confidence: Optional[np.ndarray] = None):
+        self.codes = np.asarray(codes, dtype=np.int32)
+        self.vocabulary = np.asarray(vocabulary, dtype=object)
+        self.start = np.asarray(start, dtype=np.float64)
+        self.end = np.asarray(end, dtype=np.float64)
+        self.confidence = None if confidence is None else np.asarray(confidence, dtype=np.float64)
+
+    @classmethod
+    def from_words(cls, words: Iterable[Dict[str, Any]]) -> "WordTable":
+        """Build a table from transcriber word dicts (missing times count as 0.0)."""
+        index: Dict[str, int] = {}
+        codes, starts, ends, confidences = [], [], [], []
+        for word in words:
+            codes.append(index.setdefault(word["word"], len(index)))
+            starts.append(word.get("start", 0.0))
+            ends.append(word.get("end", 0.0))
+            confidences.append(word.get("confidence"))
+        has_confidence = bool(confidences) and all(c is not None for c in confidences)
+        return cls(np.array(codes, dtype=np.int32), np.array(list(index), dtype=object),
+                   np.array(starts, dtype=np.float64), np.array(ends, dtype=np.float64),
+                   np.array(confidences, dtype=np.float64) if has_confidence else None)
+
+    @classmethod
+    def coerce(cls, words) -> "WordTable":
+        """A WordTable for a table, a list of word dicts or None."""
+        if isinstance(words, WordTable):
+            return words
+        return cls.from_words(words or [])
+
+    @property
+    def duration(self) -> np.ndarray:
+        return self.end - self.start
+
+    @property
+    def tokens(self) -> np.ndarray:
+        """Word text per row (object array; the strings are shared with the vocabulary)."""
+        return self.vocabulary[self.codes]
+
+    @property
+    def nbytes(self) -> int:
+        extra = self.confidence.nbytes if self.confidence is not None else 0
+        return self.codes.nbytes + self.start.nbytes + self.end.nbytes + extra
+
+    def __len__(self) -> int:
+        return len(self.codes)
+
+    def __getitem__(self, key):
+        """An int gives that word as a dict; a slice, index array or mask gives a sub-table."""
+        if isinstance(key, (int, np.integer)):
+            word = {"word": self.vocabulary[self.codes[key]], "start": float(self.start[key]),
+                    "end": float(self.end[key])}
+            if self.confidence is not None:
+                word["confidence"] = float(self.confidence[key])
+            return word
+        return WordTable(self.codes[key], self.vocabulary, self.start[key], self.end[key],
+                         None if self.confidence is None else self.confidence[key])
+
+    def __iter__(self) -> Iterator[Dict[str, Any]]:
+        return iter(self.tolist())
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, WordTable):
+            return NotImplemented
+        return (np.array_equal(self.tokens, other.tokens) and np.array_equal(self.start, other.start)
+                and np.array_equal(self.end, other.end))
+
+    def __repr__(self) -> str:
+        return f"WordTable(words={len(self)}, vocabulary={len(self.vocabulary)})"
+
+    def tolist(self) -> List[Dict[str, Any]]:
+        """Legacy list of word dicts."""
+        return [self[i] for i in range(len(self))]
+
+    def with_times(self, start: np.ndarray, end: np.ndarray) -> "WordTable":
+        """Same words with new start/end arrays (codes and vocabulary are shared)."""
+        return WordTable(self.codes, self.vocabulary, start, end, self.confidence)
+
+    def token_mask(self, predicate: Callable[[str], bool]) -> np.ndarray:
+        """Rows whose token satisfies predicate (evaluated once per distinct token)."""
+        per_token = np.fromiter((bool(predicate(token)) for token in self.vocabulary), dtype=bool,
+                                count=len(self.vocabulary))
+        return per_token[self.codes]
+
+    def isin(self, tokens: Iterable[str]) -> np.ndarray:
+        """Rows whose token is one of tokens."""
+        tokens = set(tokens)
+        return self.token_mask(tokens.__contains__)
+
+    def map_tokens(self, func: Callable[[str], Any], dtype=np.float64) -> np.ndarray:
+        """func applied per row, evaluated once per distinct token."""
+        per_token = np.fromiter((func(token) for token in self.vocabulary), dtype=dtype, count=len(self.vocabulary))
+        return per_token[self.codes]
+
+    def text(self) -> str:
+        """Tokens joined by spaces (the transcript)."""
+        return " ".join(self.tokens.tolist())
+
+    def to_frame(self, columns: Optional[Dict[str, str]] = None):
+        """
+        DataFrame of the table. Numeric columns wrap the table's arrays without a copy.
+
+        Args:
+            columns: Column names for "word", "start", "end", "duration" and
+                "confidence"; columns mapped to None (or absent when a mapping is
+                given) are left out
+        """
+        import pandas as pd
+
+        if columns is None:
+            columns = {"word": "word", "start": "start", "end": "end", "duration": "duration",
+                       "confidence": "confidence"}
+        values = {"word": self.tokens, "start": self.start, "end": self.end, "duration": self.duration,
+                  "confidence": self.confidence}
+        data = {name: values[key] for key, name in columns.items() if name and values[key] is not None}
+        return pd.DataFrame(data, copy=False)
@@ -0,0 +1,61 @@
+"""
+Tests for the Streamlit result cache used by the single-file pages
+"""
+
+import pytest
+
+from src.services import runners
+from src.utils.analysis_cache import clear_caches, run_cached_analysis
+from src.utils.audio_input import AudioSource
+
+
+class _Upload:
+    def __init__(self, name, data):
+        self.name = name
+        self._data = data
+
+    def getvalue(self):
+        return self._data
+
+
+@pytest.fixture
+def calls(monkeypatch):
+    calls = []
+
+    def fake_pause(file_path, silence_db=-38.0, min_pause_sec=0.5):
+        data = AudioSource.of(file_path).read_bytes()
+        calls.append((data, silence_db))
+        if data == b"broken":
+            return {"success": False, "error": "decode failed"}
+        return {"success": True, "silence_db": silence_db}
+
+    monkeypatch.setitem(runners.ANALYSIS_RUNNERS, "pause", fake_pause)
+    clear_caches()
+    yield calls
+    clear_caches()
+
+
+def test_same_content_and_params_are_served_from_cache(calls):
+    first = run_cached_analysis("pause", _Upload("a.wav", b"audio"), silence_db=-38.0)
+    # Renamed upload with identical content still hits the cache
+    second = run_cached_analysis("pause", _Upload("renamed.wav", b"audio"), silence_db=-38.0)
+    assert first == second == {"success": True, "silence_db": -38.0}
+    assert len(calls) == 1
+
+    run_cached_analysis("pause", _Upload("a.wav", b"audio"), silence_db=-40.0)
+    run_cached_analysis("pause", _Upload("a.wav", b"other audio"), silence_db=-38.0)
+    assert len(calls) == 3
+
+
+def test_failed_results_are_not_cached(calls):
+    for _ in range(2):
+        result = run_cached_analysis("pause", _Upload("bad.wav", b"broken"))
+        assert result["error"] == "decode failed"
+    assert len(calls) == 2
+
+
+def test_clear_caches_forces_reanalysis(calls):
+    run_cached_analysis("pause", _Upload("a.wav", b"audio"))
+    clear_caches()
+    run_cached_analysis("pause", _Upload("a.wav", b"audio"))
+    assert len(calls) == 2
@@ -0,0 +1,79 @@
+"""
+Tests for in-memory analyzer inputs (paths, bytes, file-like objects, decoded arrays)
+"""
+
+import io
+import os
+
+import numpy as np
+import pytest
+
+from src.analyzers.speech_boundary_detector import detect_speech_boundaries
+from src.analyzers.volume_analyzer import analyze_volume
+from src.utils.audio_input import AudioSource, DecodedAudio
+from src.utils.synthetic_audio import generate_speech_like, write_wav
+
+
+@pytest.fixture
+def wav_path(tmp_path):
+    samples, _ = generate_speech_like(6.0, sample_rate=16000, seed=3)
+    return write_wav(str(tmp_path / "talk.wav"), samples, 16000)
+
+
+def _upload(path):
+    with open(path, "rb") as f:
+        upload = io.BytesIO(f.read())
+    upload.name = "talk.wav"
+    return upload
+
+
+def test_of_normalizes_every_input_kind(wav_path):
+    with open(wav_path, "rb") as f:
+        data = f.read()
+
+    assert AudioSource.of(wav_path).path == wav_path
+    assert AudioSource.of(data).read_bytes() == data
+    upload = AudioSource.of(_upload(wav_path))
+    assert upload.read_bytes() == data and upload.name == "talk.wav" and upload.format == "wav"
+    decoded = AudioSource.of((np.zeros(160, dtype=np.int16), 16000))
+    assert decoded.decoded.duration == 0.01
+    source = AudioSource.of(wav_path)
+    assert AudioSource.of(source) is source
+    with pytest.raises(TypeError):
+        AudioSource.of(42)
+
+
+def test_in_memory_sources_decode_like_the_file(wav_path):
+    y_path, sr_path = AudioSource.of(wav_path).load()
+    y_mem, sr_mem = AudioSource.of(_upload(wav_path)).load()
+    assert sr_mem == sr_path == 16000
+    np.testing.assert_allclose(y_mem, y_path, atol=1e-4)
+
+    segment = AudioSource(decoded=DecodedAudio(y_path, sr_path)).to_segment()
+    assert segment.frame_rate == 16000 and abs(len(segment) - 6000) <= 1
+
+
+def test_as_path_only_writes_for_in_memory_audio(wav_path):
+    with AudioSource.of(wav_path).as_path() as path:
+        assert path == wav_path
+    with AudioSource.of(_upload(wav_path)).as_path() as path:
+        assert path.endswith(".wav") and os.path.getsize(path) == os.path.getsize(wav_path)
+    assert not os.path.exists(path)
+
+
+def test_open_binary_keeps_upload_name(wav_path):
+    with AudioSource.of(_upload(wav_path)).open_binary() as f:
+        assert f.name == "talk.wav"
+
+
+def test_analyzers_match_between_path_and_upload(wav_path):
+    from_path = analyze_volume(wav_path)
+    from_upload = analyze_volume(_upload(wav_path))
+    assert "error" not in from_path
+    assert from_upload["volume_avg"] == from_path["volume_avg"]
+    assert from_upload["frame_values"] == from_path["frame_values"]
+
+    boundaries_path = detect_speech_boundaries(wav_path)
+    boundaries_upload = detect_speech_boundaries(_upload(wav_path))
+    assert boundaries_upload["speech_start"] == boundaries_path["speech_start"]
+    assert boundaries_upload["speech_end"] == boundaries_path["speech_end"]
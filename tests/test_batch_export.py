@@ -0,0 +1,97 @@
+"""
+Tests for the columnar batch export: typed summary, word and frame datasets
+written as Parquet / Arrow IPC
+"""
+
+import io
+import zipfile
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.analyzers.pause_word_analyzer import match_pauses_to_words
+from src.analyzers.stretch_analyzer import analyze_stretch
+from src.storage.batch_export import batch_datasets, export_batch_zip, write_datasets
+from src.transcribers.registry import TranscriberBackend, backend_override
+from src.utils.frame_series import FrameSeries
+from src.utils.synthetic_audio import generate_speech_like, synthetic_words, write_wav
+from src.utils.word_table import WordTable
+
+pytest.importorskip("pyarrow")
+
+WORDS = [
+    {"word": "so", "start": 0.5, "end": 0.8},
+    {"word": "um", "start": 1.0, "end": 1.3},
+    {"word": "so", "start": 2.2, "end": 2.5},
+]
+
+
+def _pause_result():
+    return {"success": True, "transcript": "so um so",
+            "summary": {"total_pauses": 2, "words_with_pauses": 3, "audio_duration": 3.0, "total_words": 3},
+            "word_pause_table": match_pauses_to_words(WordTable.from_words(WORDS), [(1.35, 2.15), (0.85, 0.95)])}
+
+
+def _volume_result(offset_ms=0):
+    frames = FrameSeries.from_dbfs([-20.0, np.nan, -18.5, -30.25], frame_ms=50, offset_ms=offset_ms)
+    return {"volume_analysis": {"volume_min": -30.25, "volume_max": -18.5, "volume_avg": -22.9, "volume_range": 11.75,
+                                "coverage_vs_target": 50.0, "score": 80.0, "frame_values": frames},
+            "velocity_analysis": {"wps": 2.5, "velocity_level": "Normal", "transcript": "so um so"}}
+
+
+def test_pause_words_are_typed():
+    datasets = batch_datasets("pause", [("a.wav", _pause_result()), ("b.wav", _pause_result())])
+    assert set(datasets) == {"summary", "words"}
+
+    words = datasets["words"]
+    assert len(words) == 6
+    assert words["filename"].dtype == "category" and words["word"].dtype == "category"
+    assert words["has_pause"].dtype == bool
+    assert words["pause_before"].iloc[:3].tolist()[1:] == [0.1, 0.8] and np.isnan(words["pause_before"].iloc[0])
+    assert datasets["summary"]["total_pauses"].tolist() == [2, 2]
+
+
+def test_volume_frames_keep_their_times():
+    frames = batch_datasets("volume_velocity", [("a.wav", _volume_result()), ("b.wav", _volume_result(1000))])["frames"]
+    assert frames["time_ms"].tolist() == [0, 100, 150, 1000, 1100, 1150]
+    assert frames["dbfs"].dtype == np.float32
+    assert frames["dbfs"].tolist()[:3] == [-20.0, -18.5, -30.25]
+
+
+def test_stretch_words_carry_scores_and_classes(tmp_path):
+    samples, silences = generate_speech_like(6.0, seed=3)
+    path = write_wav(str(tmp_path / "a.wav"), samples, 16000)
+    stub = TranscriberBackend("whisper_forcealign", "Stub hybrid", "openai+forcealign",
+                              lambda audio, transcript=None: {"success": True,
+                                                              "word_timestamps": synthetic_words(6.0, silences)})
+    with backend_override(stub):
+        result = analyze_stretch(path, method="whisper_forcealign")
+
+    words = batch_datasets("stretch", [("a.wav", result)])["words"]
+    assert len(words) == result["summary"]["total_words"]
+    assert words["stretch_score"].tolist() == result["word_table"]["Stretch Score"].tolist()
+    assert set(words["classification"].cat.categories) <= {"Stretched", "Normal"}
+
+
+@pytest.mark.parametrize("fmt, reader", [("parquet", pd.read_parquet), ("arrow", pd.read_feather)])
+def test_datasets_round_trip(tmp_path, fmt, reader):
+    datasets = batch_datasets("pause", [("a.wav", _pause_result())])
+    paths = write_datasets(datasets, str(tmp_path), fmt)
+
+    assert sorted(p.rsplit("/", 1)[-1] for p in paths) == sorted(f"{name}.{fmt}" for name in datasets)
+    for name, frame in datasets.items():
+        pd.testing.assert_frame_equal(reader(str(tmp_path / f"{name}.{fmt}")), frame)
+
+
+def test_zip_holds_one_file_per_dataset():
+    data = export_batch_zip("volume_velocity", [("a.wav", _volume_result())])
+    with zipfile.ZipFile(io.BytesIO(data)) as archive:
+        assert sorted(archive.namelist()) == ["volume_velocity_frames.parquet", "volume_velocity_summary.parquet"]
+        summary = pd.read_parquet(io.BytesIO(archive.read("volume_velocity_summary.parquet")))
+    assert summary["volume_score"].tolist() == [80.0]
+
+
+def test_unknown_format_is_rejected(tmp_path):
+    with pytest.raises(ValueError):
+        write_datasets({}, str(tmp_path), "csv")
@@ -0,0 +1,154 @@
+"""
+Tests for two-stage batches: a prefetch stage (API transcription) feeding the
+analysis stage (alignment) through a bounded queue
+"""
+
+import threading
+import time
+
+import pytest
+
+from src.analyzers.stretch_analyzer import analyze_stretch
+from src.services.batch_runner import run_journaled_batch
+from src.storage.job_journal import JobJournal
+from src.transcribers.registry import TranscriberBackend, backend_override
+from src.utils.synthetic_audio import generate_speech_like, synthetic_words, write_wav
+
+# A crash in any pipeline thread fails the test instead of passing as a warning
+pytestmark = pytest.mark.filterwarnings("error::pytest.PytestUnhandledThreadExceptionWarning")
+
+
+def _items(names):
+    return [(f"hash-{name}", name, name) for name in names]
+
+
+def test_network_and_alignment_overlap(tmp_path):
+    journal = JobJournal(str(tmp_path / "jobs.db"))
+    names = [f"{i}.wav" for i in range(6)]
+    aligning = threading.Event()
+    both_aligning = threading.Barrier(2, timeout=5)
+    overlapped = []
+
+    def fetch_transcript(name):
+        if name != names[0]:
+            # Later transcripts are still being fetched while the first file aligns
+            overlapped.append(aligning.wait(5))
+        return {"success": True, "transcript": f"words of {name}"}
+
+    def align(name, prefetched):
+        aligning.set()
+        if name in names[:2]:
+            # The default pipeline aligns two files at once
+            both_aligning.wait()
+        return {"success": True, "transcript": prefetched["transcript"]}
+
+    batch = run_journaled_batch(journal, "stretch", {}, _items(names), align, prefetch=fetch_transcript,
+                                prefetch_workers=3)
+
+    assert overlapped and all(overlapped)
+    assert [o["result"]["transcript"] for o in batch["outcomes"]] == [f"words of {name}" for name in names]
+    assert journal.list_jobs()[0]["status"] == "completed"
+
+
+def test_warmup_runs_while_the_first_files_are_fetched(tmp_path):
+    journal = JobJournal(str(tmp_path / "jobs.db"))
+    fetching = threading.Event()
+    events = []
+
+    def warmup():
+        events.append(("warm", fetching.wait(5)))
+
+    def fetch(name):
+        fetching.set()
+        return name
+
+    def analyze(name, prefetched):
+        events.append(("analyze", name))
+        return {"success": True}
+
+    run_journaled_batch(journal, "stretch", {}, _items(["a.wav", "b.wav"]), analyze, prefetch=fetch, warmup=warmup)
+    assert events[0] == ("warm", True)
+    assert sorted(events[1:]) == [("analyze", "a.wav"), ("analyze", "b.wav")]
+
+
+def test_prefetch_runs_at_most_a_queue_ahead(tmp_path):
+    journal = JobJournal(str(tmp_path / "jobs.db"))
+    lock = threading.Lock()
+    counts = {"fetched": 0, "analyzed": 0, "max_ahead": 0}
+
+    def fetch(name):
+        with lock:
+            counts["fetched"] += 1
+            counts["max_ahead"] = max(counts["max_ahead"], counts["fetched"] - counts["analyzed"])
+        return name
+
+    def analyze(name, prefetched):
+        time.sleep(0.02)
+        with lock:
+            counts["analyzed"] += 1
+        return {"success": True}
+
+    run_journaled_batch(journal, "pause", {}, _items([f"{i}.wav" for i in range(20)]), analyze, prefetch=fetch,
+                        prefetch_workers=2, queue_size=3, max_workers=2)
+    # Queued files, plus one held by each blocked fetcher and the ones being analyzed
+    assert counts["max_ahead"] <= 3 + 2 + 2
+    assert counts["analyzed"] == 20
+
+
+def test_failed_prefetch_is_the_result_and_only_transient_errors_retry(tmp_path):
+    journal = JobJournal(str(tmp_path / "jobs.db"))
+    fetches, analyzed = [], []
+
+    def fetch(name):
+        fetches.append(name)
+        if name == "big.wav":
+            return {"success": False, "error": "Deepgram transcription failed: HTTP 413: payload too large"}
+        if name == "flaky.wav" and fetches.count(name) == 1:
+            raise RuntimeError("HTTP 503: overloaded")
+        if name == "down.wav":
+            return {"success": False, "error": "Request timed out."}
+        return name.upper()
+
+    def analyze(name, prefetched):
+        analyzed.append(name)
+        return {"success": True, "prefetched": prefetched}
+
+    batch = run_journaled_batch(journal, "stretch", {}, _items(["a.wav", "big.wav", "flaky.wav", "down.wav"]),
+                                analyze, prefetch=fetch, prefetch_retries=2, retry_backoff_sec=0)
+    a, big, flaky, down = batch["outcomes"]
+
+    assert sorted(analyzed) == ["a.wav", "flaky.wav"]  # failed files never reach the full hybrid
+    assert fetches.count("big.wav") == 1  # permanent errors are not retried
+    assert big["error"].endswith("HTTP 413: payload too large") and big["result"]["success"] is False
+    assert fetches.count("flaky.wav") == 2 and flaky["result"]["prefetched"] == "FLAKY.WAV"
+    assert fetches.count("down.wav") == 3 and down["error"] == "Request timed out."
+    assert journal.list_jobs()[0]["status"] == "partial"
+
+
+def test_stage_errors_stop_and_join_every_thread(tmp_path):
+    journal = JobJournal(str(tmp_path / "jobs.db"))
+
+    class BrokenStore:
+        def save_result(self, *args):
+            raise OSError("disk full")
+
+    with pytest.raises(OSError):
+        run_journaled_batch(journal, "stretch", {}, _items([f"{i}.wav" for i in range(8)]),
+                            lambda name, prefetched: {"success": True}, prefetch=lambda name: name,
+                            queue_size=1, result_store=BrokenStore())
+    assert not [thread.name for thread in threading.enumerate() if thread.name.startswith("batch-")]
+
+
+def test_stretch_with_a_known_transcript_only_aligns(tmp_path):
+    samples, silences = generate_speech_like(6.0, seed=3)
+    path = write_wav(str(tmp_path / "a.wav"), samples, 16000)
+    calls = []
+
+    def hybrid(audio, transcript=None):
+        calls.append(transcript)
+        return {"success": True, "word_timestamps": synthetic_words(6.0, silences)}
+
+    with backend_override(TranscriberBackend("whisper_forcealign", "Stub hybrid", "openai+forcealign", hybrid)):
+        result = analyze_stretch(path, method="whisper_forcealign", transcript="so okay today")
+    assert result["success"], result.get("error")
+    assert calls == ["so okay today"]
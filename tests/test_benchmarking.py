@@ -0,0 +1,34 @@
+"""
+Tests for the synthetic audio generator and benchmark baseline comparison
+"""
+
+from pydub import AudioSegment
+from pydub.silence import detect_silence
+
+from src.utils.benchmarking import STATUS_FASTER, STATUS_NEW, STATUS_OK, STATUS_REGRESSION, compare_to_baseline
+from src.utils.synthetic_audio import generate_speech_like, synthetic_words, write_wav
+
+
+def test_synthetic_audio_has_the_requested_silences(tmp_path):
+    samples, silences = generate_speech_like(10.0, sample_rate=22050, channels=2)
+    assert samples.shape == (220500, 2)
+
+    sound = AudioSegment.from_file(write_wav(str(tmp_path / "synthetic.wav"), samples, 22050))
+    detected = [(start / 1000, end / 1000) for start, end in detect_silence(sound, min_silence_len=300, silence_thresh=-40)]
+    assert len(detected) == len(silences)
+    for (start, end), (expected_start, expected_end) in zip(detected, silences):
+        assert abs(start - expected_start) < 0.1 and abs(end - expected_end) < 0.1
+
+    words = synthetic_words(10.0, silences)
+    assert words and all(not (s < w["end"] and w["start"] < e) for w in words for s, e in silences)
+
+
+def test_baseline_comparison_flags_regressions():
+    baseline = {"benchmarks": {"a": {"median_ms": 100.0}, "b": {"median_ms": 100.0},
+                               "c": {"median_ms": 100.0}, "tiny": {"median_ms": 0.1}}}
+    current = {"a": {"median_ms": 140.0}, "b": {"median_ms": 110.0}, "c": {"median_ms": 60.0},
+               "tiny": {"median_ms": 0.5}, "d": {"median_ms": 5.0}}
+
+    statuses = {row["name"]: row["status"] for row in compare_to_baseline(current, baseline, tolerance=0.25)}
+    assert statuses == {"a": STATUS_REGRESSION, "b": STATUS_OK, "c": STATUS_FASTER,
+                        "tiny": STATUS_OK, "d": STATUS_NEW}
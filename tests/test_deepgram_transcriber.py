@@ -0,0 +1,109 @@
+"""
+Tests for the Deepgram REST path against the local mock server: streamed uploads,
+the pooled session and concurrent transcription
+"""
+
+import concurrent.futures
+import sys
+import threading
+
+import pytest
+
+from src.analyzers.stretch_analyzer import analyze_stretch
+from src.services.mock_transcription import MockProfile, create_mock_server, mock_words
+from src.transcribers import deepgram_transcriber
+from src.transcribers.deepgram_transcriber import (compare_transcription_methods, hybrid_deepgram_forcealign_timestamps,
+                                                   transcribe_with_deepgram, transcribe_with_deepgram_words)
+from src.utils import resources
+from src.utils.audio_input import AudioSource
+from src.utils.synthetic_audio import generate_speech_like, write_wav
+from src.utils.tracing import TIMINGS_KEY, flatten_timings
+
+
+@pytest.fixture
+def mock_deepgram(monkeypatch):
+    def start(profile):
+        server = create_mock_server("127.0.0.1", 0, profile)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        monkeypatch.setattr(deepgram_transcriber, "DEEPGRAM_BASE_URL", f"http://127.0.0.1:{server.server_address[1]}")
+        servers.append(server)
+        return server
+
+    servers = []
+    monkeypatch.setenv("DEEPGRAM_API_KEY", "mock")
+    resources.get_deepgram_session.cache_clear()
+    yield start
+    for server in servers:
+        server.shutdown()
+    resources.get_deepgram_session.cache_clear()
+
+
+@pytest.fixture
+def speech_wav(tmp_path):
+    samples, _ = generate_speech_like(4.0)
+    return write_wav(str(tmp_path / "speech.wav"), samples, 16000)
+
+
+def test_path_is_streamed_not_read_into_memory(mock_deepgram, speech_wav, monkeypatch):
+    mock_deepgram(MockProfile(latency_ms=1, latency_sigma=0))
+    monkeypatch.setattr(AudioSource, "read_bytes", lambda self: pytest.fail("upload buffered the file"))
+
+    result = transcribe_with_deepgram(speech_wav)
+    assert result["success"], result
+    assert result["transcript"]
+
+
+def test_error_status_is_reported(mock_deepgram, speech_wav):
+    mock_deepgram(MockProfile(latency_ms=1, latency_sigma=0, failure_prob=1.0))
+    result = transcribe_with_deepgram(speech_wav)
+    assert not result["success"]
+    assert "HTTP 500" in result["error"]
+
+
+def test_threaded_uploads_overlap_on_the_shared_session(mock_deepgram, tmp_path):
+    server = mock_deepgram(MockProfile(latency_ms=150, latency_sigma=0, per_audio_second_ms=0))
+    paths = []
+    for i, duration in enumerate([3.0, 6.0, 4.0, 5.0]):
+        samples, _ = generate_speech_like(duration, seed=i)
+        paths.append(write_wav(str(tmp_path / f"speech_{i}.wav"), samples, 16000))
+
+    # As the batch prefetch workers do: one upload per thread on the shared session
+    with concurrent.futures.ThreadPoolExecutor(max_workers=4) as executor:
+        results = list(executor.map(transcribe_with_deepgram, paths))
+    assert [result["transcript"] for result in results] == \
+           [transcribe_with_deepgram(path)["transcript"] for path in paths]
+    assert server.snapshot_stats()["peak_in_flight"] > 1
+
+
+def test_native_word_timings_come_from_a_single_request(mock_deepgram, speech_wav):
+    server = mock_deepgram(MockProfile(latency_ms=1, latency_sigma=0))
+    result = transcribe_with_deepgram_words(speech_wav)
+
+    assert result["success"] and result["method"] == "deepgram"
+    with open(speech_wav, "rb") as f:
+        _, expected = mock_words(f.read())
+    assert [(w["word"], w["start"], w["end"]) for w in result["word_timestamps"]] == \
+           [(w["word"], w["start"], w["end"]) for w in expected]
+    assert all(w["confidence"] == 0.99 for w in result["word_timestamps"])
+    assert server.snapshot_stats()["requests"] == 1
+    assert "No word timestamps" not in compare_transcription_methods()["deepgram_only"]["cons"]
+
+
+def test_stretch_analysis_runs_without_a_local_model(mock_deepgram, speech_wav, monkeypatch):
+    mock_deepgram(MockProfile(latency_ms=1, latency_sigma=0))
+    # Importing forcealign now fails, so any local alignment would surface as an error
+    monkeypatch.setitem(sys.modules, "forcealign", None)
+
+    result = analyze_stretch(speech_wav, method="deepgram")
+    assert result["success"], result.get("error")
+    assert result["parameters_used"]["transcriber"] == "deepgram"
+    assert result["summary"]["total_words"] > 0
+
+
+def test_hybrid_entry_point_is_traced(mock_deepgram, speech_wav, monkeypatch):
+    mock_deepgram(MockProfile(latency_ms=1, latency_sigma=0))
+    monkeypatch.setitem(sys.modules, "forcealign", None)
+
+    result = hybrid_deepgram_forcealign_timestamps(speech_wav)
+    stages = [row["stage"].strip() for row in flatten_timings(result[TIMINGS_KEY])]
+    assert stages[:2] == ["deepgram_forcealign_hybrid", "deepgram_words"]
@@ -0,0 +1,94 @@
+"""
+Tests for the shared per-file frame features (block energies at a base hop)
+"""
+
+import librosa
+import numpy as np
+import pytest
+from pydub import AudioSegment
+from pydub.silence import detect_silence
+
+from config import FEATURE_HOP_MS
+from src.analyzers.pause_word_analyzer import create_pause_word_plot
+from src.analyzers.speech_boundary_detector import detect_speech_boundaries
+from src.analyzers.voice_activity import detect_voice_activity
+from src.analyzers.volume_analyzer import analyze_volume
+from src.transcribers.silence_trimming import trim_silences
+from src.utils import frame_features
+from src.utils.audio_input import AudioSource
+from src.utils.frame_features import FrameFeatures, get_frame_features, load_mono
+from src.utils.synthetic_audio import generate_speech_like, write_wav
+
+
+@pytest.fixture(scope="module")
+def segment():
+    samples, _ = generate_speech_like(12.0, sample_rate=16000, seed=5)
+    return AudioSegment(samples.tobytes(), sample_width=2, frame_rate=16000, channels=1)
+
+
+def test_volume_frames_match_pydub_frame_loop(segment):
+    features = FrameFeatures.from_segment(segment)
+    expected = []
+    for i in range(len(segment) // 50):
+        rms = segment[i * 50:(i + 1) * 50].rms
+        expected.append(20 * np.log10(rms / 32768) if rms > 0 else np.nan)
+    np.testing.assert_array_equal(features.frame_dbfs(50), np.array(expected))
+
+
+@pytest.mark.parametrize("min_silence_ms, thresh_db", [(300, -40), (500, -38), (120, -50)])
+def test_silent_ranges_match_pydub_within_one_hop(segment, min_silence_ms, thresh_db):
+    expected = detect_silence(segment, min_silence_len=min_silence_ms, silence_thresh=thresh_db)
+    got = FrameFeatures.from_segment(segment).silent_ranges(min_silence_ms, thresh_db)
+    assert len(got) == len(expected)
+    for (start, end), (exp_start, exp_end) in zip(got, expected):
+        assert abs(start - exp_start) <= FEATURE_HOP_MS
+        assert abs(end - exp_end) <= FEATURE_HOP_MS
+
+
+def test_overlapping_frames_match_librosa_rms(segment):
+    features = FrameFeatures.from_segment(segment)
+    y = np.array(segment.get_array_of_samples(), dtype=np.float32) / 32768
+    reference = librosa.feature.rms(y=y, frame_length=400, hop_length=160, center=False)[0]
+    rms = features.frame_rms(25, 10)
+    assert len(rms) == len(reference)
+    np.testing.assert_allclose(rms, reference, atol=1e-5)
+    assert features.frame_times(25, 10)[0] == pytest.approx(0.0125)
+
+
+def test_zero_crossing_rate_counts_sign_changes():
+    t = np.arange(16000) / 16000
+    tone = (np.sin(2 * np.pi * 100 * t) * 10000).astype(np.int16)
+    features = FrameFeatures.from_samples(tone, 16000, full_scale=32768, zcr=True)
+    # 100 Hz crosses zero 200 times a second
+    assert features.zero_crossing_rate(100).mean() * 16000 == pytest.approx(200, rel=0.02)
+    with pytest.raises(ValueError):
+        FrameFeatures.from_samples(tone, 16000).zero_crossing_rate(100)
+
+
+def test_analyzers_share_one_feature_pass(tmp_path, monkeypatch):
+    samples, _ = generate_speech_like(5.0, seed=2)
+    source = AudioSource.of(write_wav(str(tmp_path / "a.wav"), samples, 16000))
+    passes = []
+    original = frame_features._compute_features
+    monkeypatch.setattr(frame_features, "_compute_features", lambda *args: passes.append(1) or original(*args))
+
+    assert "error" not in analyze_volume(source)
+    assert detect_speech_boundaries(source)["success"]
+    assert get_frame_features(source) is source.memo["frame_features"]
+    assert len(passes) == 1
+
+
+def test_non_wav_input_is_decoded_once(monkeypatch):
+    samples, _ = generate_speech_like(8.0, seed=4)
+    # Decoded input has no PCM WAV to stream, so it takes the pydub path like mp3/m4a
+    source = AudioSource.of((samples, 16000))
+    decodes = []
+    original = AudioSource.to_segment
+    monkeypatch.setattr(AudioSource, "to_segment", lambda self: decodes.append(1) or original(self))
+
+    detect_voice_activity(source)
+    get_frame_features(source)
+    trim_silences(source, min_saving=0.0)
+    create_pause_word_plot([], [], source)
+    assert len(decodes) == 1
+    assert len(load_mono(source)) == len(samples)
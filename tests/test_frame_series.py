@@ -0,0 +1,34 @@
+"""
+Tests for the compact FrameSeries representation of frame_values
+"""
+
+import numpy as np
+
+from src.utils.frame_series import FrameSeries, concat_frame_values
+from src.utils.serialization import dumps_result, loads_result
+
+
+def test_series_matches_legacy_rounded_list():
+    dbfs = np.array([-20.1234, np.nan, -35.5, -9.994, np.nan])
+    series = FrameSeries.from_dbfs(dbfs, frame_ms=50)
+
+    assert len(series) == 3
+    assert series.tolist() == [-20.12, -35.5, -9.99]
+    assert list(series.times_ms()) == [0, 100, 150]
+    assert series.nbytes == 2 * len(dbfs)
+    assert np.percentile(series, 50) == np.float32(-20.12)
+
+
+def test_series_survives_result_serialization():
+    series = FrameSeries.from_dbfs([-20.0, np.nan, -25.25], frame_ms=50, offset_ms=1000)
+    result = {"volume_analysis": {"volume_avg": -22.6, "frame_values": series}}
+
+    restored = loads_result(dumps_result(result))
+    assert restored["volume_analysis"]["frame_values"] == series
+    assert restored["volume_analysis"]["frame_values"].offset_ms == 1000
+
+
+def test_concat_accepts_series_and_legacy_lists():
+    values = concat_frame_values([FrameSeries.from_dbfs([-20.0, -21.0], 50), [-22.5]])
+    assert values.dtype == np.float32
+    assert values.tolist() == [-20.0, -21.0, -22.5]
@@ -0,0 +1,42 @@
+"""
+Import-time budget for the app's pages: heavy audio/ML/API libraries must only be
+imported when an analysis actually runs
+"""
+
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+
+# Imported by the analyzers/transcribers at the point of use
+HEAVY_MODULES = ["pydub", "librosa", "nltk", "matplotlib", "plotly.graph_objects", "openai", "deepgram",
+                 "forcealign", "soundfile", "torch"]
+
+# Seconds to import all pages on top of streamlit/pandas/numpy (measured well under 0.1s)
+IMPORT_BUDGET_SEC = 1.0
+
+_PROBE = """
+import json, sys, time
+import numpy, pandas, streamlit
+preloaded = set(sys.modules)
+start = time.perf_counter()
+import src.pages.batch_analysis, src.pages.pause_page, src.pages.stretch_page, src.services.runners
+elapsed = time.perf_counter() - start
+print(json.dumps({"elapsed": elapsed, "loaded": sorted(set(sys.modules) - preloaded)}))
+"""
+
+
+def _probe_imports():
+    output = subprocess.run([sys.executable, "-c", _PROBE], cwd=REPO_ROOT, capture_output=True, text=True, check=True)
+    return json.loads(output.stdout.strip().splitlines()[-1])
+
+
+def test_pages_do_not_import_heavy_libraries():
+    loaded = set(_probe_imports()["loaded"])
+    assert [name for name in HEAVY_MODULES if name in loaded] == []
+
+
+def test_pages_import_within_budget():
+    assert _probe_imports()["elapsed"] < IMPORT_BUDGET_SEC
@@ -0,0 +1,94 @@
+"""
+Tests for the local HTTP job API with stubbed analysis runners (no API calls)
+"""
+
+import json
+import threading
+import time
+import urllib.error
+import urllib.request
+
+import pytest
+
+from src.services import job_api
+from src.services.job_api import JobManager, create_server
+from src.utils.audio_input import AudioSource
+
+
+@pytest.fixture
+def server(monkeypatch):
+    def fake_pause(file_path, silence_db=-38.0, min_pause_sec=0.5):
+        size = len(AudioSource.of(file_path).read_bytes())
+        return {"success": True, "bytes": size, "silence_db": silence_db}
+
+    monkeypatch.setitem(job_api.ANALYSIS_RUNNERS, "pause", fake_pause)
+
+    manager = JobManager(max_workers=2)
+    httpd = create_server("127.0.0.1", 0, manager)
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{httpd.server_address[1]}"
+    httpd.shutdown()
+    httpd.server_close()
+    manager.shutdown()
+
+
+def _request(url, data=None):
+    request = urllib.request.Request(url, data=data, method="POST" if data is not None else "GET")
+    try:
+        with urllib.request.urlopen(request) as response:
+            return response.status, json.loads(response.read())
+    except urllib.error.HTTPError as e:
+        return e.code, json.loads(e.read())
+
+
+def test_submit_poll_and_fetch_result(server):
+    status, body = _request(f"{server}/jobs?analysis=pause&filename=a.wav&silence_db=-40", data=b"x" * 128)
+    assert status == 202
+    job_id = body["job_id"]
+
+    deadline = time.time() + 5
+    while time.time() < deadline:
+        status, job = _request(f"{server}/jobs/{job_id}")
+        if job["status"] == "succeeded":
+            break
+        time.sleep(0.02)
+
+    status, body = _request(f"{server}/jobs/{job_id}/result")
+    assert status == 200
+    assert body["result"] == {"success": True, "bytes": 128, "silence_db": -40.0}
+
+
+def test_rejects_bad_requests(server):
+    assert _request(f"{server}/jobs?analysis=unknown", data=b"x")[0] == 400
+    assert _request(f"{server}/jobs?analysis=pause&bogus=1", data=b"x")[0] == 400
+    assert _request(f"{server}/jobs/does-not-exist")[0] == 404
+    assert _request(f"{server}/health")[1]["status"] == "ok"
+
+
+def test_full_queue_is_rejected_with_503(monkeypatch):
+    release = threading.Event()
+    monkeypatch.setitem(job_api.ANALYSIS_RUNNERS, "pause", lambda file_path: release.wait(5) and {"success": True})
+
+    manager = JobManager(max_workers=1, max_pending=1)
+    httpd = create_server("127.0.0.1", 0, manager)
+    threading.Thread(target=httpd.serve_forever, daemon=True).start()
+    url = f"http://127.0.0.1:{httpd.server_address[1]}/jobs?analysis=pause"
+    try:
+        running = _request(url, data=b"x")[1]["job_id"]
+        deadline = time.time() + 5
+        while manager.status(running)["status"] != "running" and time.time() < deadline:
+            time.sleep(0.01)
+
+        assert _request(url, data=b"x")[0] == 202
+        status, body = _request(url, data=b"x")
+        assert status == 503 and "queued" in body["error"]
+        assert manager.counts()["queued"] == 1
+    finally:
+        release.set()
+        httpd.shutdown()
+        httpd.server_close()
+        manager.shutdown()
+
+    # Queued jobs free their slot once a worker picks them up
+    assert manager.counts()["succeeded"] == 2
@@ -0,0 +1,89 @@
+"""
+Tests for checkpointed, resumable batch jobs (job journal + journaled batch runner)
+"""
+
+import pandas as pd
+
+from src.services.batch_runner import run_journaled_batch
+from src.storage.job_journal import JobJournal
+
+
+def _items(names):
+    return [(f"hash-{name}", name, name) for name in names]
+
+
+def test_resume_skips_completed_and_retries_failed(tmp_path):
+    journal = JobJournal(str(tmp_path / "jobs.db"))
+    calls = []
+    flaky = {"b.wav"}
+
+    def analyze(name):
+        calls.append(name)
+        if name in flaky:
+            raise RuntimeError("network dropped")
+        return {"success": True, "word_table": pd.DataFrame([{"Word": name, "Stretch Score": 0.4}])}
+
+    first = run_journaled_batch(journal, "stretch", {"stretch_threshold": 0.38}, _items(["a.wav", "b.wav", "c.wav"]), analyze)
+    assert not first["resumed"]
+    assert [o["error"] is None for o in first["outcomes"]] == [True, False, True]
+    assert journal.list_jobs()[0]["status"] == "partial"
+
+    flaky.clear()
+    calls.clear()
+    second = run_journaled_batch(journal, "stretch", {"stretch_threshold": 0.38}, _items(["a.wav", "b.wav", "c.wav"]), analyze)
+    assert second["resumed"]
+    assert second["job_id"] == first["job_id"]
+    assert second["skipped"] == 2
+    assert calls == ["b.wav"]  # only the failed file is analyzed again
+    restored = second["outcomes"][0]
+    assert restored["from_checkpoint"]
+    assert isinstance(restored["result"]["word_table"], pd.DataFrame)
+    assert journal.list_jobs()[0]["status"] == "completed"
+
+
+def test_different_parameters_start_a_new_job(tmp_path):
+    journal = JobJournal(str(tmp_path / "jobs.db"))
+    analyze = lambda name: {"success": True}
+
+    first = run_journaled_batch(journal, "pause", {"silence_db": -38.0}, _items(["a.wav"]), analyze)
+    second = run_journaled_batch(journal, "pause", {"silence_db": -40.0}, _items(["a.wav"]), analyze)
+    assert first["job_id"] != second["job_id"]
+    assert not second["resumed"]
+
+
+def test_duplicate_uploads_are_analyzed_once(tmp_path):
+    journal = JobJournal(str(tmp_path / "jobs.db"))
+    calls = []
+
+    def analyze(name):
+        calls.append(name)
+        return {"success": True}
+
+    items = [("same-hash", "a.wav", "a.wav"), ("same-hash", "copy_of_a.wav", "copy_of_a.wav")]
+    batch = run_journaled_batch(journal, "pause", {}, items, analyze, max_workers=2)
+    assert calls == ["a.wav"]
+    assert [o["filename"] for o in batch["outcomes"]] == ["a.wav", "copy_of_a.wav"]
+
+
+def test_completed_files_are_reused_across_jobs(tmp_path):
+    journal = JobJournal(str(tmp_path / "jobs.db"))
+    calls = []
+
+    def analyze(name):
+        calls.append(name)
+        return {"success": True, "transcript": name}
+
+    first = run_journaled_batch(journal, "stretch", {"stretch_threshold": 0.38}, _items(["a.wav", "b.wav"]), analyze)
+    calls.clear()
+    superset = run_journaled_batch(journal, "stretch", {"stretch_threshold": 0.38},
+                                   _items(["a.wav", "b.wav", "c.wav"]), analyze)
+    subset = run_journaled_batch(journal, "stretch", {"stretch_threshold": 0.38}, _items(["b.wav"]), analyze)
+
+    assert len({first["job_id"], superset["job_id"], subset["job_id"]}) == 3
+    assert calls == ["c.wav"]  # only the new file is analyzed
+    assert superset["skipped"] == 2 and subset["skipped"] == 1
+    assert subset["outcomes"][0]["result"]["transcript"] == "b.wav"
+    assert journal.list_jobs()[0]["status"] == "completed"
+
+    run_journaled_batch(journal, "stretch", {"stretch_threshold": 0.5}, _items(["a.wav"]), analyze)
+    assert calls == ["c.wav", "a.wav"]  # different parameters are not reused
@@ -0,0 +1,79 @@
+"""
+Tests for opt-in per-stage memory profiling and the per-batch memory report
+"""
+
+import json
+
+import numpy as np
+
+from src.services import batch_runner
+from src.services.batch_runner import run_journaled_batch
+from src.storage.job_journal import JobJournal
+from src.utils import memory_profiling
+from src.utils.memory_profiling import batch_memory_report, memory_profiling as profiled
+from src.utils.tracing import TIMINGS_KEY, flatten_timings, format_timings, span, traced
+
+MB = 1024 * 1024
+
+
+@traced("analysis")
+def _analysis(size_mb=8):
+    with span("allocate"):
+        block = np.ones(size_mb * MB, dtype=np.uint8)
+        del block
+    with span("keep"):
+        kept = np.ones(MB, dtype=np.uint8)
+    return {"success": True, "kept": kept}
+
+
+def test_spans_have_no_memory_by_default():
+    result = _analysis()
+    assert "memory" not in result[TIMINGS_KEY]
+    assert "heap_peak_mb" not in flatten_timings(result[TIMINGS_KEY])[0]
+
+
+def test_nested_peaks_are_attributed_to_stage_and_parent():
+    with profiled():
+        result = _analysis()
+    assert not memory_profiling.is_enabled()
+
+    timings = result[TIMINGS_KEY]
+    allocate, keep = timings["children"]
+    assert allocate["memory"]["heap_peak_mb"] >= 7.9
+    assert abs(allocate["memory"]["heap_net_mb"]) < 0.5
+    assert 0.9 < keep["memory"]["heap_net_mb"] < 1.5
+    # The child's peak is not hidden from the parent by tracemalloc.reset_peak()
+    assert timings["memory"]["heap_peak_mb"] >= allocate["memory"]["heap_peak_mb"]
+    assert "rss_peak_mb" in timings["memory"]
+    assert "heap pk MB" in format_timings(timings)
+
+
+def test_batch_report_is_written_when_profiling(tmp_path, monkeypatch):
+    monkeypatch.setattr(batch_runner, "MEMORY_REPORT_DIR", str(tmp_path / "reports"))
+    journal = JobJournal(str(tmp_path / "jobs.db"))
+    items = [(f"hash-{name}", name, size) for name, size in [("small.wav", 2), ("large.wav", 12)]]
+
+    plain = run_journaled_batch(journal, "pause", {"x": 1}, items, _analysis)
+    assert "memory_report" not in plain
+
+    with profiled():
+        batch = run_journaled_batch(journal, "pause", {"x": 2}, items, _analysis)
+    report = batch["memory_report"]
+    assert report["profiled_files"] == 2
+    assert report["files"][0]["filename"] == "large.wav"
+    stages = {row["stage"]: row for row in report["stages"]}
+    assert stages["analysis/allocate"]["worst_file"] == "large.wav"
+    assert stages["analysis/allocate"]["files"] == 2
+
+    with open(batch["memory_report_path"], encoding="utf-8") as f:
+        assert json.load(f)["job_id"] == batch["job_id"]
+
+
+def test_report_skips_checkpointed_and_unprofiled_results():
+    outcomes = [
+        {"filename": "a.wav", "result": {"timings": {"name": "analysis", "wall_ms": 1.0, "children": []}}, "from_checkpoint": False},
+        {"filename": "b.wav", "result": None, "from_checkpoint": False},
+    ]
+    report = batch_memory_report(outcomes)
+    assert report["profiled_files"] == 0
+    assert report["max_heap_peak_mb"] is None
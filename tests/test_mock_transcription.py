@@ -0,0 +1,71 @@
+"""
+Tests for the local mock transcription server (OpenAI and Deepgram subsets)
+"""
+
+import json
+import threading
+import urllib.error
+import urllib.request
+
+import pytest
+
+from src.services.mock_transcription import MockProfile, create_mock_server
+from src.utils.synthetic_audio import generate_speech_like, write_wav
+
+
+def _start(profile):
+    server = create_mock_server("127.0.0.1", 0, profile)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, f"http://127.0.0.1:{server.server_address[1]}"
+
+
+@pytest.fixture
+def wav_bytes(tmp_path):
+    samples, _ = generate_speech_like(6.0)
+    path = write_wav(str(tmp_path / "speech.wav"), samples, 16000)
+    with open(path, "rb") as f:
+        return f.read()
+
+
+def _post(url, data):
+    request = urllib.request.Request(url, data=data, method="POST", headers={"Content-Type": "audio/wav"})
+    try:
+        with urllib.request.urlopen(request) as response:
+            return response.status, json.loads(response.read())
+    except urllib.error.HTTPError as e:
+        return e.code, json.loads(e.read())
+
+
+def test_openai_client_gets_deterministic_word_timestamps(wav_bytes, tmp_path):
+    openai = pytest.importorskip("openai")
+    server, base_url = _start(MockProfile(latency_ms=1, latency_sigma=0))
+    client = openai.OpenAI(api_key="mock", base_url=f"{base_url}/v1", max_retries=0)
+
+    responses = []
+    for _ in range(2):
+        with open(tmp_path / "speech.wav", "rb") as audio_file:
+            responses.append(client.audio.transcriptions.create(
+                model="whisper-1", file=audio_file, response_format="verbose_json",
+                language="en", timestamp_granularities=["word"]
+            ))
+    server.shutdown()
+
+    words = [(w.word, w.start, w.end) for w in responses[0].words]
+    assert words and words == [(w.word, w.start, w.end) for w in responses[1].words]
+    # No word is placed inside the leading silence of the synthetic file
+    assert words[0][1] >= 0.5
+
+
+def test_deepgram_endpoint_and_simulated_rate_limits(wav_bytes):
+    server, base_url = _start(MockProfile(latency_ms=1, latency_sigma=0))
+    status, body = _post(f"{base_url}/v1/listen?model=nova-2", wav_bytes)
+    assert status == 200
+    alternative = body["results"]["channels"][0]["alternatives"][0]
+    assert alternative["transcript"] == " ".join(w["word"] for w in alternative["words"])
+    server.shutdown()
+
+    limited, base_url = _start(MockProfile(latency_ms=1, latency_sigma=0, rate_limit_prob=1.0))
+    status, body = _post(f"{base_url}/v1/listen", wav_bytes)
+    assert status == 429 and body["err_code"] == "TOO_MANY_REQUESTS"
+    assert limited.snapshot_stats()["rate_limited"] == 1
+    limited.shutdown()
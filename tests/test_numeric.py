@@ -0,0 +1,12 @@
+"""
+Tests for the shared numeric helpers
+"""
+
+import numpy as np
+
+from src.utils.numeric import round_values
+
+
+def test_rounding_matches_python_round():
+    values = np.array([21.885, 2.675, 1.005, 0.125, 3.14159, -0.015])
+    assert round_values(values, 2).tolist() == [round(v, 2) for v in values.tolist()]
@@ -0,0 +1,91 @@
+"""
+Tests for the queryable result store
+"""
+
+import numpy as np
+import pandas as pd
+
+from src.services.batch_runner import run_journaled_batch
+from src.storage.job_journal import JobJournal
+from src.storage.result_store import ResultStore
+
+WEEK = 7 * 24 * 3600
+
+
+def _volume_velocity_result(wps):
+    return {
+        "success": True,
+        "volume_analysis": {
+            "volume_min": -40.0, "volume_max": -10.0, "volume_avg": np.float64(-20.0),
+            "volume_range": 30.0, "coverage_vs_target": 80.0, "score": 8
+        },
+        "velocity_analysis": {
+            "word_count_total": np.int64(12), "word_count_clean": 10, "duration_spoken": 4.0,
+            "wps": wps, "wpm": wps * 60, "velocity_level": "Normal", "transcript": "hello"
+        }
+    }
+
+
+def test_average_wps_per_week(tmp_path):
+    store = ResultStore(str(tmp_path / "results.db"))
+    base = 1_700_000_000.0
+    store.save_result("h1", "a.wav", "volume_velocity", {}, _volume_velocity_result(2.0), created_at=base)
+    store.save_result("h2", "b.wav", "volume_velocity", {}, _volume_velocity_result(3.0), created_at=base + 60)
+    store.save_result("h3", "c.wav", "volume_velocity", {}, _volume_velocity_result(4.0), created_at=base + WEEK)
+
+    weekly = store.average_wps_per_week()
+    assert list(weekly["files"]) == [2, 1]
+    assert list(weekly["avg_wps"]) == [2.5, 4.0]
+
+    report = store.volume_report()
+    assert len(report) == 3
+    assert report["grade"].notna().all()
+
+    latest = store.latest_result("h1", "volume_velocity", {})
+    assert latest["volume_score"] == 8
+    assert latest["word_count_total"] == 12
+
+
+def test_stretched_words_and_pauses_are_queryable(tmp_path):
+    store = ResultStore(str(tmp_path / "results.db"))
+    word_table = pd.DataFrame([
+        {"Word #": 1, "Word": "so", "Start": 0.0, "End": 0.9, "Duration": 0.9,
+         "Syllables": 1, "Stretch Score": 0.9, "Classification": "🔴 Stretched"},
+        {"Word #": 2, "Word": "okay", "Start": 1.0, "End": 1.5, "Duration": 0.5,
+         "Syllables": 2, "Stretch Score": 0.25, "Classification": "✅ Normal"},
+    ])
+    store.save_result("h1", "a.wav", "stretch", {"stretch_threshold": 0.38},
+                      {"success": True, "summary": {"total_words": 2}, "word_table": word_table})
+
+    pause_table = pd.DataFrame([
+        {"Word #": 1, "Word": "well", "Word Start": 0.0, "Word End": 0.4,
+         "Pause Before": "-", "Pause After": "0.80s", "Has Pause": "Yes"},
+        {"Word #": 2, "Word": "then", "Word Start": 1.2, "Word End": 1.5,
+         "Pause Before": "0.80s", "Pause After": "-", "Has Pause": "Yes"},
+        {"Word #": 3, "Word": "go", "Word Start": 1.5, "Word End": 1.7,
+         "Pause Before": "-", "Pause After": "-", "Has Pause": "No"},
+    ])
+    store.save_result("h2", "b.wav", "pause", {"silence_db": -38.0},
+                      {"success": True, "summary": {"total_pauses": 1}, "word_pause_table": pause_table})
+
+    stretched = store.stretched_words(min_score=0.5)
+    assert list(stretched["word"]) == ["so"]
+    assert stretched["filename"].iloc[0] == "a.wav"
+
+    pauses = store.word_pauses(min_pause=0.5)
+    assert list(pauses["word"]) == ["well", "then"]
+    assert pauses["pause_after"].iloc[0] == 0.8
+
+
+def test_journaled_batch_writes_new_results_to_store(tmp_path):
+    journal = JobJournal(str(tmp_path / "jobs.db"))
+    store = ResultStore(str(tmp_path / "results.db"))
+    analyze = lambda name: _volume_velocity_result(2.5)
+    items = [("hash-a", "a.wav", "a.wav"), ("hash-b", "b.wav", "b.wav")]
+
+    run_journaled_batch(journal, "volume_velocity", {}, items, analyze, result_store=store)
+    # Resumed files come from the journal and are not stored twice
+    run_journaled_batch(journal, "volume_velocity", {}, items, analyze, result_store=store)
+
+    rows = store.query("SELECT filename, wps FROM analysis_results ORDER BY filename")
+    assert list(rows["filename"]) == ["a.wav", "b.wav"]
@@ -0,0 +1,127 @@
+"""
+Tests for speech-only uploads and mapping word timestamps back to the original timeline
+"""
+
+import numpy as np
+import pytest
+
+from src.analyzers.voice_activity import detect_voice_activity
+from src.analyzers.pause_word_analyzer import detect_pauses_between_words
+from src.transcribers.registry import TranscriberBackend, backend_override
+from src.transcribers.silence_trimming import OffsetMap, kept_spans, transcribe_trimmed, trim_silences
+from src.utils.audio_input import AudioSource, DecodedAudio
+from src.utils.synthetic_audio import generate_speech_like
+
+SR = 16000
+# 40% silence: long leading/trailing silence and two long internal pauses
+SILENCES = [(0.0, 2.0), (5.0, 7.5), (10.0, 11.0), (12.0, 15.0)]
+
+
+@pytest.fixture(scope="module")
+def recording():
+    samples, _ = generate_speech_like(15.0, silences=SILENCES, seed=4)
+    return samples
+
+
+def _segments_as_words(source):
+    """Stand-in transcriber: one 'word' per detected speech segment of whatever audio it is sent."""
+    # Decoded with soundfile, so the FLAC upload needs no ffmpeg here
+    decoded = AudioSource.of(AudioSource.of(source).load())
+    return [{"word": f"w{i}", "start": start, "end": end}
+            for i, (start, end) in enumerate(detect_voice_activity(decoded, hangover_ms=0, onset_pad_ms=0).segments)]
+
+
+def test_offset_map_round_trip():
+    offsets = OffsetMap([(0.5, 3.0), (4.0, 6.0)])
+    assert offsets.trimmed_duration == pytest.approx(4.5)
+    np.testing.assert_allclose(offsets.to_original([0.0, 1.0, 2.5, 3.0]), [0.5, 1.5, 4.0, 4.5])
+    # A word ending on the cut keeps its end before the removed silence
+    assert offsets.to_original(2.5, at_end=True) == pytest.approx(3.0)
+
+    words = offsets.map_words([{"word": "a", "start": 2.0, "end": 2.5}, {"word": "b", "start": 2.4, "end": 2.8}])
+    assert (words[0]["start"], words[0]["end"]) == pytest.approx((2.5, 3.0))
+    # A word straddling a cut spans the removed silence on the original timeline
+    assert (words[1]["start"], words[1]["end"]) == pytest.approx((2.9, 4.3))
+
+    hybrid = offsets.map_result({"success": True, "word_timestamps": [{"word": "c", "start": 3.0, "end": 3.5}]})
+    assert hybrid["word_timestamps"][0]["start"] == pytest.approx(4.5)
+
+
+def test_kept_spans_leave_padding_around_cuts():
+    spans = kept_spans([(0.0, 2.0), (5.0, 7.5), (12.0, 15.0)], duration=15.0, keep_sec=0.25)
+    assert spans == [(1.75, 5.25), (7.25, 12.25)]
+
+
+def test_trimming_removes_silence_and_keeps_the_samples(recording):
+    source = AudioSource.of((recording, SR))
+    trimmed = trim_silences(source, min_silence_sec=0.9, keep_sec=0.25)
+
+    assert trimmed.removed_seconds > 0.3 * 15.0
+    assert trimmed.source.format == "flac" and trimmed.source.size_bytes < source.size_bytes / 2
+    trimmed_samples, rate = trimmed.source.load()
+    assert rate == SR
+    assert len(trimmed_samples) / SR == pytest.approx(trimmed.offsets.trimmed_duration)
+    # Every trimmed sample is the original sample at its mapped time (FLAC is lossless at 16 bits)
+    trimmed_index = np.arange(0, len(trimmed_samples), 997)
+    original_index = np.round(trimmed.offsets.to_original(trimmed_index / SR) * SR).astype(int)
+    np.testing.assert_allclose(trimmed_samples[trimmed_index], recording[original_index] / 32768.0, atol=2 / 32768)
+
+
+def test_transcribed_words_land_on_the_original_timeline(recording):
+    source = AudioSource.of((recording, SR))
+    direct = _segments_as_words(source)
+    mapped = transcribe_trimmed(_segments_as_words, source, trim=True)
+
+    assert len(mapped) == len(direct)
+    for word, reference in zip(mapped, direct):
+        assert word["start"] == pytest.approx(reference["start"], abs=0.02)
+        assert word["end"] == pytest.approx(reference["end"], abs=0.02)
+
+
+def test_untrimmed_when_disabled_or_not_worth_it(recording):
+    calls = []
+
+    def transcribe(source, model=None):
+        calls.append((source, model))
+        return []
+
+    source = AudioSource.of((recording, SR))
+    transcribe_trimmed(transcribe, source, model="whisper-1", trim=False)
+    assert calls[-1] == (source, "whisper-1")
+
+    continuous, _ = generate_speech_like(6.0, silences=[], seed=1)
+    assert trim_silences((continuous, SR)) is None
+    assert trim_silences((np.zeros(SR, dtype=np.int16), SR)) is None
+
+
+def test_original_is_uploaded_when_the_speech_is_not_smaller(recording, monkeypatch):
+    source = AudioSource(data=DecodedAudio(recording, SR).to_wav_bytes(), name="talk.wav")
+    monkeypatch.setattr(DecodedAudio, "to_flac_bytes", lambda self: b"\0" * source.size_bytes)
+    assert trim_silences(source, min_silence_sec=0.9, keep_sec=0.25) is None
+
+
+def test_backend_is_chosen_on_the_uploaded_size(recording):
+    uploads = []
+
+    def transcribe(upload):
+        uploads.append(upload)
+        return []
+
+    source = AudioSource(data=DecodedAudio(recording, SR).to_wav_bytes(), name="talk.wav")
+    # The 0.48 MB WAV is over the limit; its speech-only FLAC is not
+    stub = TranscriberBackend("whisper-1", "Stub", "openai", transcribe, word_timestamps=True, max_file_mb=0.3)
+    with backend_override(stub):
+        untrimmed = detect_pauses_between_words(source, trim_silence=False)
+        detect_pauses_between_words(source, trim_silence=True)
+
+    assert "limit 0.3 MB" in untrimmed["error"]
+    assert [upload.name for upload in uploads] == ["talk_speech.flac"]
+
+
+def test_trim_flag_is_an_accepted_analysis_parameter():
+    from src.services.runners import parse_analysis_params
+
+    assert parse_analysis_params("pause", {"trim_silence": "true"}) == {"trim_silence": True}
+    assert parse_analysis_params("stretch", {"trim_silence": "0"}) == {"trim_silence": False}
+    with pytest.raises(ValueError):
+        parse_analysis_params("volume_velocity", {"trim_silence": "maybe"})
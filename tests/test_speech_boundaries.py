@@ -0,0 +1,103 @@
+"""
+Tests for the streaming speech boundary detection against the original
+native-rate librosa implementation
+"""
+
+import io
+import threading
+import wave
+
+import librosa
+import numpy as np
+import pytest
+from pydub import AudioSegment
+
+from src.analyzers import speech_boundary_detector
+from src.analyzers.speech_boundary_detector import detect_speech_boundaries
+from src.analyzers.stretch_analyzer import analyze_stretch
+from src.transcribers.registry import TranscriberBackend, backend_override
+from src.utils.audio_input import AudioSource
+from src.utils.frame_features import FrameFeatures, iter_mono_chunks, select_percentile
+from src.utils.synthetic_audio import generate_speech_like, synthetic_words, write_wav
+
+HOP_SEC = 0.010
+
+
+def _librosa_boundaries(path, energy_percentile=20):
+    """The detector as it was before frame features: native-rate load, centred librosa frames."""
+    y, sr = librosa.load(path, sr=None)
+    hop_length = int(0.010 * sr)
+    rms = librosa.feature.rms(y=y, frame_length=int(0.025 * sr), hop_length=hop_length)[0]
+    times = librosa.frames_to_time(np.arange(len(rms)), sr=sr, hop_length=hop_length)
+    speech = np.flatnonzero(rms > np.percentile(rms, energy_percentile))
+    return times[speech[0]], times[speech[-1]]
+
+
+def _stereo_wav_bytes(samples, sample_rate):
+    buffer = io.BytesIO()
+    with wave.open(buffer, "wb") as wav_file:
+        wav_file.setnchannels(2)
+        wav_file.setsampwidth(2)
+        wav_file.setframerate(sample_rate)
+        wav_file.writeframes(np.stack([samples, samples // 3], axis=1).astype("<i2").tobytes())
+    return buffer.getvalue()
+
+
+@pytest.mark.parametrize("sample_rate", [16000, 22050, 44100])
+def test_boundaries_match_librosa_within_one_hop(tmp_path, sample_rate):
+    speech, _ = generate_speech_like(6.0, sample_rate=sample_rate, seed=3)
+    silence = np.zeros(int(sample_rate * 0.6), dtype=speech.dtype)
+    path = write_wav(str(tmp_path / "padded.wav"), np.concatenate([silence, speech, silence]), sample_rate)
+
+    result = detect_speech_boundaries(path)
+    expected_start, expected_end = _librosa_boundaries(path)
+    assert result["success"]
+    assert abs(result["speech_start"] - expected_start) <= HOP_SEC
+    assert abs(result["speech_end"] - expected_end) <= HOP_SEC
+
+
+def test_streamed_wav_matches_pydub_decode():
+    speech, _ = generate_speech_like(25.0, sample_rate=44100, seed=1)
+    data = _stereo_wav_bytes(speech, 44100)
+
+    streamed = FrameFeatures.from_chunks(iter_mono_chunks(AudioSource(data=data)), zcr=True)
+    decoded = FrameFeatures.from_segment(AudioSegment.from_file(io.BytesIO(data), format="wav"), zcr=True)
+    np.testing.assert_array_equal(streamed.block_sumsq, decoded.block_sumsq)
+    np.testing.assert_array_equal(streamed.block_counts, decoded.block_counts)
+    np.testing.assert_array_equal(streamed.block_crossings, decoded.block_crossings)
+    assert streamed.duration_ms == decoded.duration_ms
+
+
+@pytest.mark.parametrize("size", [1, 2, 7, 1001])
+def test_selection_percentile_matches_numpy(size):
+    values = np.random.default_rng(size).random(size)
+    for q in (0, 20, 33.3, 50, 100):
+        assert select_percentile(values, q) == pytest.approx(np.percentile(values, q), abs=1e-15)
+
+
+def test_too_short_audio_reports_no_speech():
+    result = detect_speech_boundaries((np.zeros(160, dtype=np.float32), 16000))
+    assert not result["success"]
+    assert result["total_duration"] == pytest.approx(0.01)
+
+
+def test_stretch_detects_boundaries_while_transcribing(tmp_path, monkeypatch):
+    samples, silences = generate_speech_like(6.0, seed=4)
+    path = write_wav(str(tmp_path / "a.wav"), samples, 16000)
+    detected = threading.Event()
+
+    def detect(audio_path, **kwargs):
+        result = detect_speech_boundaries(audio_path, **kwargs)
+        detected.set()
+        return result
+
+    def transcribe(audio):
+        # Only returns words once boundary detection has finished on the other thread
+        assert detected.wait(timeout=10), "boundary detection did not run during transcription"
+        return synthetic_words(6.0, silences)
+
+    monkeypatch.setattr(speech_boundary_detector, "detect_speech_boundaries", detect)
+    with backend_override(TranscriberBackend("whisper-1", "Stub whisper", "openai", transcribe)):
+        result = analyze_stretch(path, method="openai", trim_silence=False)
+    assert result["success"], result.get("error")
+    assert result["parameters_used"]["timing_method"] in ("energy_corrected", "transcription_based")
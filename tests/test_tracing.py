@@ -0,0 +1,49 @@
+"""
+Tests for nested timing spans and their attachment to analysis results
+"""
+
+import concurrent.futures
+import time
+
+from src.utils.tracing import TIMINGS_KEY, flatten_timings, format_timings, span, submit_in_context, traced
+
+
+@traced("inner_stage")
+def _inner():
+    with span("sleep"):
+        time.sleep(0.02)
+    return {"success": True}
+
+
+@traced("analysis")
+def _analysis():
+    with span("decode"):
+        sum(range(20000))
+    with concurrent.futures.ThreadPoolExecutor(max_workers=2) as executor:
+        futures = [submit_in_context(executor, _inner) for _ in range(2)]
+        inner_results = [future.result() for future in futures]
+    return {"success": True, "inner": inner_results}
+
+
+def test_outermost_call_attaches_span_tree():
+    result = _analysis()
+    timings = result[TIMINGS_KEY]
+
+    assert timings["name"] == "analysis"
+    assert sorted(child["name"] for child in timings["children"]) == ["decode", "inner_stage", "inner_stage"]
+    # Nested traced calls record spans but do not attach their own timings
+    assert all(TIMINGS_KEY not in inner for inner in result["inner"])
+
+    inner = next(child for child in timings["children"] if child["name"] == "inner_stage")
+    assert inner["children"][0]["wall_ms"] >= 15
+    assert inner["children"][0]["cpu_ms"] < inner["children"][0]["wall_ms"]  # sleeping is not CPU time
+
+
+def test_flattened_rows_and_console_format():
+    timings = _analysis()[TIMINGS_KEY]
+    rows = flatten_timings(timings)
+
+    assert rows[0]["percent"] == 100.0
+    assert {row["depth"] for row in rows} == {0, 1, 2}
+    assert "  decode" in format_timings(timings)
+    assert flatten_timings(None) == []
@@ -0,0 +1,80 @@
+"""
+Tests for transcriber backend selection by capability
+"""
+
+import pytest
+
+from src.analyzers.stretch_analyzer import analyze_stretch
+from src.transcribers import registry
+from src.transcribers.registry import (BackendUnavailable, TranscriberBackend, TranscriptionFailed, backend_name,
+                                       backend_override, get_backend, select_backend)
+from src.utils.synthetic_audio import generate_speech_like, synthetic_words, write_wav
+
+
+def _stub(name, provider, words=(), **capabilities):
+    calls = []
+
+    def transcribe(audio, **options):
+        calls.append(options)
+        return [dict(w) for w in words]
+
+    backend = TranscriberBackend(name, f"Stub {name}", provider, transcribe, **capabilities)
+    return backend, calls
+
+
+def test_builtin_backends_declare_capabilities():
+    assert get_backend("whisper-1").word_timestamps
+    assert not get_backend("gpt-4o-transcribe").word_timestamps
+    assert get_backend("forcealign").local and get_backend("forcealign").cost_per_minute == 0
+    assert get_backend("whisper-1").describe()["max_file_mb"] == 25
+    assert backend_name("openai", "gpt-4o-transcribe") == "gpt-4o-transcribe"
+    assert backend_name("forcealign") == "forcealign"
+
+
+def test_text_only_model_is_routed_to_a_word_timestamp_model_up_front():
+    words_backend, words_calls = _stub("whisper-1", "openai", cost_per_minute=0.006)
+    text_backend, text_calls = _stub("gpt-4o-transcribe", "openai", word_timestamps=False)
+    with backend_override(words_backend), backend_override(text_backend):
+        assert select_backend("gpt-4o-transcribe", word_timestamps=True) is words_backend
+        assert select_backend("gpt-4o-transcribe") is text_backend
+    assert text_calls == [] and words_calls == []
+    # The built-in backends are back afterwards
+    assert get_backend("whisper-1").target.endswith(":transcribe_with_openai_timestamps")
+
+
+def test_unservable_requests_fail_before_any_call():
+    local, calls = _stub("tiny-local", "tiny", languages=("en",), max_file_mb=1)
+    with backend_override(local):
+        with pytest.raises(BackendUnavailable, match="language vi"):
+            select_backend("tiny-local", language="vi")
+        with pytest.raises(BackendUnavailable, match="limit 1 MB"):
+            select_backend("tiny-local", file_mb=3.0)
+    with pytest.raises(BackendUnavailable, match="Unknown transcriber backend"):
+        select_backend("nope")
+    missing = TranscriberBackend("needs-key", "Needs key", "x", lambda audio: [], requires_env=("NO_SUCH_KEY_SET",))
+    with backend_override(missing), pytest.raises(BackendUnavailable, match="NO_SUCH_KEY_SET"):
+        select_backend("needs-key")
+    assert calls == []
+
+
+def test_hybrid_results_are_unwrapped_or_raised():
+    ok = TranscriberBackend("h", "Hybrid", "x", lambda audio: {"success": True, "word_timestamps": [{"word": "a"}]})
+    failed = TranscriberBackend("f", "Hybrid", "x", lambda audio: {"success": False, "error": "boom"})
+    assert ok.transcribe(b"").tokens.tolist() == ["a"]
+    with pytest.raises(TranscriptionFailed, match="boom"):
+        failed.transcribe(b"")
+
+
+def test_a_plugged_in_local_backend_serves_stretch_analysis(tmp_path):
+    samples, silences = generate_speech_like(6.0, seed=2)
+    path = write_wav(str(tmp_path / "a.wav"), samples, 16000)
+    local, calls = _stub("my-local", "mine", words=synthetic_words(6.0, silences), local=True)
+
+    registry.register_backend(local)
+    try:
+        result = analyze_stretch(path, method="my-local")
+    finally:
+        registry.unregister_backend("my-local")
+    assert result["success"], result.get("error")
+    assert result["parameters_used"]["transcriber"] == "my-local"
+    assert len(calls) == 1
@@ -0,0 +1,74 @@
+"""
+Tests for the NumPy voice activity detector
+"""
+
+import numpy as np
+import pytest
+
+from src.analyzers.voice_activity import VoiceActivity, detect_voice_activity, smooth_decisions
+from src.utils.audio_input import AudioSource
+from src.utils.synthetic_audio import generate_speech_like, write_wav
+
+SR = 16000
+
+
+def _noisy_speech(duration=15.0, seed=0):
+    """Speech-like signal over a -50 dBFS noise floor, with a loud white-noise burst inside one pause."""
+    samples, silences = generate_speech_like(duration, seed=seed)
+    rng = np.random.default_rng(seed)
+    x = samples / 32768.0 + 10 ** (-50 / 20) * rng.standard_normal(len(samples))
+    x[int(6.05 * SR):int(6.55 * SR)] += 10 ** (-25 / 20) * rng.standard_normal(int(0.5 * SR))
+    return x.astype(np.float32), silences
+
+
+def test_segments_follow_the_pauses():
+    x, silences = _noisy_speech()
+    activity = detect_voice_activity((x, SR))
+
+    internal = silences[1:-1]
+    assert len(activity.segments) == len(internal) + 1
+    for (_, end), (gap_start, gap_end) in zip(activity.segments, internal):
+        # Speech ends within the hangover after the pause starts
+        assert gap_start <= end <= gap_start + 0.25
+    for (start, _), (_, gap_end) in zip(activity.segments[1:], internal):
+        assert gap_end - 0.1 <= start <= gap_end
+    assert activity.duration == pytest.approx(15.0)
+
+
+def test_flat_noise_is_not_speech():
+    x, _ = _noisy_speech()
+    activity = detect_voice_activity((x, SR))
+    assert not activity.is_speech(6.4)
+    assert activity.speech_overlap(6.25, 6.5) == 0.0
+
+
+def test_queries():
+    activity = VoiceActivity([0.5, 2.0], [1.5, 3.0], duration=4.0)
+    np.testing.assert_array_equal(activity.is_speech([0.2, 0.5, 1.49, 1.5, 2.5, 3.5]),
+                                  [False, True, True, False, True, False])
+    assert activity.speech_duration == pytest.approx(2.0)
+    assert activity.speech_overlap(1.0, 2.5) == pytest.approx(1.0)
+    assert activity.non_speech(min_duration=0.6) == [(3.0, 4.0)]
+    assert activity.non_speech() == [(0.0, 0.5), (1.5, 2.0), (3.0, 4.0)]
+    assert activity.to_dict()["speech_ratio"] == 0.5
+    assert VoiceActivity([], [], 1.0).is_speech(0.5) is False
+
+
+def test_hangover_and_onset_pad():
+    raw = np.zeros(20, dtype=bool)
+    raw[[5, 6, 12]] = True
+    smoothed = smooth_decisions(raw, hangover_frames=3, onset_frames=1)
+    assert np.flatnonzero(smoothed).tolist() == [4, 5, 6, 7, 8, 9, 11, 12, 13, 14, 15]
+
+
+def test_digital_silence_has_no_speech():
+    activity = detect_voice_activity((np.zeros(SR * 2, dtype=np.float32), SR))
+    assert activity.segments == []
+    assert activity.non_speech() == [(0.0, 2.0)]
+
+
+def test_result_is_memoized_per_source(tmp_path):
+    samples, _ = generate_speech_like(4.0, seed=1)
+    source = AudioSource.of(write_wav(str(tmp_path / "a.wav"), samples, SR))
+    assert detect_voice_activity(source) is detect_voice_activity(source)
+    assert detect_voice_activity(source, hangover_ms=0) is not detect_voice_activity(source)
@@ -0,0 +1,39 @@
+"""
+Tests for the mergeable volume histogram used by batch summaries
+"""
+
+import numpy as np
+
+from src.utils.frame_series import FrameSeries
+from src.utils.serialization import dumps_result, loads_result
+from src.utils.volume_histogram import VolumeHistogram, histogram_for
+
+
+def test_merged_histogram_matches_exact_batch_summary():
+    rng = np.random.default_rng(0)
+    files = [np.round(rng.normal(-22 + i, 6, size=4000), 2) for i in range(5)]
+    merged = VolumeHistogram.merge_all(VolumeHistogram.from_values(values) for values in files)
+    exact = np.concatenate(files)
+
+    assert merged.total == len(exact)
+    for q in (0.25, 0.5, 0.75):
+        assert abs(merged.quantile(q) - np.percentile(exact, q * 100)) < 0.1
+
+    q1, q3 = np.percentile(exact, [25, 75])
+    iqr = q3 - q1
+    kept = exact[(exact >= q1 - 1.5 * iqr) & (exact <= q3 + 1.5 * iqr)]
+    summary = merged.clip(merged.quantile(0.25) - 1.5 * iqr, merged.quantile(0.75) + 1.5 * iqr).volume_summary()
+    assert abs(summary["volume_avg"] - kept.mean()) < 0.1
+    assert abs(summary["volume_min"] - kept.min()) < 0.2
+    assert abs(summary["coverage_vs_target"] - np.mean((kept >= -30) & (kept <= -10)) * 100) < 1.0
+
+
+def test_histogram_round_trips_and_falls_back_to_frame_values():
+    series = FrameSeries.from_dbfs([-20.0, -20.05, -35.5, np.nan], frame_ms=50)
+    histogram = VolumeHistogram.from_values(series)
+    restored = loads_result(dumps_result({"histogram": histogram}))["histogram"]
+    assert restored == histogram
+    assert len(dumps_result({"histogram": histogram})) < 2000
+
+    # Results stored before histograms existed still merge via their frame values
+    assert histogram_for({"frame_values": series}) == histogram
@@ -0,0 +1,65 @@
+"""
+Parity tests for vectorized volume scoring against calculate_volume_score
+"""
+
+import numpy as np
+import pytest
+
+from src.utils.volume_scoring import (VOLUME_COLUMNS, calculate_volume_score, create_results_table_data, score_volume_results,
+                                      volume_recommendations)
+
+
+def _random_results(n, seed=0):
+    rng = np.random.default_rng(seed)
+    results = []
+    for _ in range(n):
+        low = round(float(rng.uniform(-80, -10)), 2)
+        high = round(float(rng.uniform(low, 2)), 2)
+        results.append({
+            "volume_min": low,
+            "volume_max": high,
+            "volume_avg": round(float(rng.uniform(low, high)), 2),
+            "volume_range": round(high - low, 2),
+            "coverage_vs_target": round(float(rng.uniform(0, 100)), 2)
+        })
+    # Exact branch boundaries
+    for avg in (-30, -25, -15, -10, -35, -8):
+        for volume_range in (15, 25, 35):
+            results.append({"volume_min": -50, "volume_max": -5, "volume_avg": avg,
+                            "volume_range": volume_range, "coverage_vs_target": 100 / 1.2})
+    return results
+
+
+def test_batch_scores_match_scalar_function():
+    results = _random_results(2000)
+    batch = score_volume_results(results)
+
+    for i, result in enumerate(results):
+        scalar = calculate_volume_score(result)
+        assert batch["score"][i] == scalar["score"]
+        assert batch["grade"][i] == scalar["grade"]
+        assert batch["status"][i] == scalar["status"]
+        assert batch["in_normal_range"][i] == scalar["in_normal_range"]
+        assert batch["user_vs_normal"][i] == scalar["comparison"]["user_vs_normal"]
+        for key, value in scalar["score_breakdown"].items():
+            assert batch[key][i] == value
+        assert volume_recommendations(result["volume_avg"], result["coverage_vs_target"],
+                                      result["volume_range"]) == scalar["recommendations"]
+
+
+def test_results_table_uses_batch_scores():
+    results = _random_results(5, seed=1)
+    table = create_results_table_data(results, [f"f{i}.wav" for i in range(len(results))])
+    for row, result in zip(table, results):
+        scalar = calculate_volume_score({key: result[key] for key in VOLUME_COLUMNS})
+        assert row["Điểm"] == f"{scalar['score']:.1f}"
+        assert row["Xếp loại"] == scalar["grade"]
+
+
+def test_results_table_reuses_precomputed_scores(monkeypatch):
+    results = _random_results(4, seed=2)
+    scores = score_volume_results(results)
+    monkeypatch.setattr("src.utils.volume_scoring.score_volume_results",
+                        lambda _: pytest.fail("results were scored twice"))
+    table = create_results_table_data(results, [f"f{i}.wav" for i in range(len(results))], scores=scores)
+    assert [row["Xếp loại"] for row in table] == list(scores["grade"])
@@ -0,0 +1,165 @@
+"""
+Tests for the watch-folder daemon using a stub analysis runner (no API calls)
+"""
+
+import os
+import threading
+import time
+
+from src.services.watch_folder import WatchFolderDaemon
+from src.storage.result_store import ResultStore
+
+
+def _write(path, data=b"RIFF0000WAVE"):
+    with open(path, "wb") as f:
+        f.write(data)
+
+
+def _make_daemon(watch_dir, db_path, runner, **kwargs):
+    return WatchFolderDaemon(
+        str(watch_dir),
+        analysis="volume_velocity",
+        db_path=str(db_path),
+        settle_seconds=0.0,
+        runner=runner,
+        result_store=ResultStore(str(db_path) + ".results"),
+        **kwargs
+    )
+
+
+def test_files_are_processed_once_and_survive_restart(tmp_path):
+    watch_dir = tmp_path / "incoming"
+    watch_dir.mkdir()
+    db_path = tmp_path / "ingest.db"
+    for i in range(3):
+        _write(watch_dir / f"rec_{i}.wav", f"audio-{i}".encode())
+    _write(watch_dir / "notes.txt")
+
+    calls = []
+
+    def runner(path):
+        calls.append(os.path.basename(path))
+        return {"success": True, "path": path}
+
+    daemon = _make_daemon(watch_dir, db_path, runner)
+    daemon.scan_once()  # first sighting - files still settling
+    assert daemon.scan_once() == 3
+    daemon.drain()
+    assert daemon.scan_once() == 0
+    daemon.stop()
+    assert sorted(calls) == ["rec_0.wav", "rec_1.wav", "rec_2.wav"]
+
+    # A new daemon on the same ledger must not redo completed files
+    restarted = _make_daemon(watch_dir, db_path, runner)
+    restarted.scan_once()
+    assert restarted.scan_once() == 0
+    restarted.drain()
+    restarted.stop()
+    assert len(calls) == 3
+
+
+def test_burst_is_bounded_by_worker_and_pending_slots(tmp_path):
+    watch_dir = tmp_path / "incoming"
+    watch_dir.mkdir()
+    for i in range(40):
+        _write(watch_dir / f"rec_{i:02d}.wav", f"audio-{i}".encode())
+
+    release = threading.Event()
+    active = []
+    peak = [0]
+    lock = threading.Lock()
+
+    def runner(path):
+        with lock:
+            active.append(path)
+            peak[0] = max(peak[0], len(active))
+        release.wait(5)
+        with lock:
+            active.remove(path)
+        return {"success": True}
+
+    daemon = _make_daemon(watch_dir, tmp_path / "ingest.db", runner, max_workers=2, max_pending=3)
+    daemon.scan_once()
+    assert daemon.scan_once() == 5
+    assert daemon.scan_once() == 0
+    release.set()
+
+    deadline = time.time() + 10
+    while daemon.ledger.status_counts().get("done", 0) < 40 and time.time() < deadline:
+        daemon.scan_once()
+        time.sleep(0.01)
+    daemon.drain()
+    daemon.stop()
+    assert peak[0] <= 2
+
+
+def test_failed_files_are_retried_until_max_attempts(tmp_path):
+    watch_dir = tmp_path / "incoming"
+    watch_dir.mkdir()
+    _write(watch_dir / "broken.wav")
+    calls = []
+
+    def runner(path):
+        calls.append(path)
+        return {"success": False, "error": "decode failed"}
+
+    daemon = _make_daemon(watch_dir, tmp_path / "ingest.db", runner, max_attempts=2, retry_backoff_sec=0.0)
+    daemon.scan_once()
+    for _ in range(5):
+        daemon.scan_once()
+        daemon.drain()
+    daemon.stop()
+    assert len(calls) == 2
+
+
+def test_failed_files_wait_out_their_backoff(tmp_path):
+    watch_dir = tmp_path / "incoming"
+    watch_dir.mkdir()
+    db_path = tmp_path / "ingest.db"
+    _write(watch_dir / "broken.wav")
+    calls = []
+
+    def runner(path):
+        calls.append(path)
+        return {"success": False, "error": "HTTP 500"}
+
+    daemon = _make_daemon(watch_dir, db_path, runner, max_attempts=5, retry_backoff_sec=0.3)
+    daemon.scan_once()
+    for _ in range(5):
+        daemon.scan_once()
+        daemon.drain()
+    assert len(calls) == 1
+    daemon.stop()
+
+    # The attempt time is in the ledger, so a restart does not retry early either
+    restarted = _make_daemon(watch_dir, db_path, runner, max_attempts=5, retry_backoff_sec=0.3)
+    restarted.scan_once()
+    restarted.scan_once()
+    restarted.drain()
+    assert len(calls) == 1
+
+    time.sleep(0.35)
+    restarted.scan_once()
+    restarted.drain()
+    restarted.stop()
+    assert len(calls) == 2
+
+
+def test_changed_params_reanalyze_completed_files(tmp_path):
+    watch_dir = tmp_path / "incoming"
+    watch_dir.mkdir()
+    db_path = tmp_path / "ingest.db"
+    _write(watch_dir / "rec.wav")
+    calls = []
+
+    def runner(path, **params):
+        calls.append(params)
+        return {"success": True}
+
+    for params in ({"silence_db": -40}, {"silence_db": -40}, {"silence_db": -35}):
+        daemon = _make_daemon(watch_dir, db_path, runner, analysis_params=params)
+        daemon.scan_once()
+        daemon.scan_once()
+        daemon.drain()
+        daemon.stop()
+    assert calls == [{"silence_db": -40}, {"silence_db": -35}]
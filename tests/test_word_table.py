@@ -0,0 +1,67 @@
+"""
+Tests for the columnar word table and the analyzers operating on it
+"""
+
+import numpy as np
+
+from config import FILLED_PAUSES
+from src.analyzers.pause_word_analyzer import match_pauses_to_words
+from src.transcribers.silence_trimming import OffsetMap
+from src.utils.word_table import WordTable
+
+WORDS = [
+    {"word": "so", "start": 0.5, "end": 0.8},
+    {"word": "um", "start": 1.0, "end": 1.3},
+    {"word": "so", "start": 2.2, "end": 2.5},
+    {"word": "it's", "start": 2.6, "end": 3.0},
+]
+
+
+def test_tokens_are_interned_and_rows_round_trip():
+    table = WordTable.from_words(WORDS)
+    assert len(table) == 4
+    assert table.vocabulary.tolist() == ["so", "um", "it's"]
+    assert table.codes.tolist() == [0, 1, 0, 2]
+    assert table.tolist() == WORDS
+    assert table[-1] == WORDS[-1]
+    assert table.text() == "so um so it's"
+    assert np.allclose(table.duration, [0.3, 0.3, 0.3, 0.4])
+
+
+def test_masks_are_evaluated_per_token():
+    table = WordTable.from_words(WORDS)
+    calls = []
+
+    def is_alpha(token):
+        calls.append(token)
+        return token.isalpha()
+
+    clean = table[~table.isin(FILLED_PAUSES) & table.token_mask(is_alpha)]
+    assert sorted(calls) == ["it's", "so", "um"]
+    assert clean.tokens.tolist() == ["so", "so"]
+    assert clean.start.tolist() == [0.5, 2.2]
+
+
+def test_frame_shares_the_time_arrays():
+    table = WordTable.from_words([dict(w, confidence=0.9) for w in WORDS])
+    frame = table.to_frame()
+    assert list(frame.columns) == ["word", "start", "end", "duration", "confidence"]
+    assert np.shares_memory(frame["start"].to_numpy(), table.start)
+    assert list(table.to_frame({"word": "Word", "end": "End"}).columns) == ["Word", "End"]
+
+
+def test_offset_map_moves_table_times():
+    offsets = OffsetMap([(0.0, 1.0), (3.0, 5.0)])
+    table = WordTable.from_words([{"word": "a", "start": 0.2, "end": 1.0}, {"word": "b", "start": 1.5, "end": 2.0}])
+    mapped = offsets.map_words(table)
+    assert isinstance(mapped, WordTable)
+    assert mapped.start.tolist() == [0.2, 3.5] and mapped.end.tolist() == [1.0, 4.0]
+    assert mapped.codes is table.codes
+
+
+def test_pauses_are_matched_to_neighbouring_words():
+    table = match_pauses_to_words(WordTable.from_words(WORDS), [(1.35, 2.15), (0.85, 0.95)])
+    assert table["Pause Before"].tolist() == ["-", "0.1s", "0.8s", "-"]
+    assert table["Pause After"].tolist() == ["0.1s", "0.8s", "-", "-"]
+    assert table["Has Pause"].tolist() == ["Yes", "Yes", "Yes", "No"]
+